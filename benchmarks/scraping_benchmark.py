@@ -0,0 +1,300 @@
+'''
+This module is a scraping benchmark for the iterators. It runs each iterator (backend), in each of its modes, against
+the local fixture server (see fixtures/youtube_fixture_server.py) at several scales (the number of comments scraped)
+and shapes (flat comment sections with no replies, and reply-heavy ones), and reports for each case:
+
+    comments_per_second - the number of comments (including replies) scraped per second, after the first comment
+    time_to_first_comment - the number of seconds from creating the iterator (starting Chrome included) to the first comment
+    commands_per_comment - the number of WebDriver commands sent per comment scraped
+    peak_python_rss, peak_browser_rss - the peak resident memory (in bytes) of this process, and of chromedriver and
+                                        Chrome together (read from /proc, so they are None on systems without it)
+
+The results are written as JSON, and compared with a baseline (a results file saved earlier with --save-baseline). A
+case is flagged as a regression if a metric is worse than the baseline by more than the tolerance, and the script
+exits with an error code of 1 if there are regressions. It also exits with an error code of 1 (before running anything)
+if there is no baseline, and if none of the cases run are in the baseline, so a run is never taken for a pass when
+nothing was compared.
+
+Usage: python -m benchmarks.scraping_benchmark [--scales SCALES ...] [--shapes {flat,replies} ...] [--backends BACKENDS ...]
+                                               [--output OUTPUT] [--baseline BASELINE] [--save-baseline] [--tolerance TOLERANCE]
+'''
+import argparse
+import json
+import os
+import platform
+import sys
+import threading
+import time
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(PROJECT_DIR, 'benchmarks', 'scraping_baseline.json')
+DEFAULT_SCALES = (100, 10000, 100000)
+# The fixture options for each shape of comment section (the number of comment threads is set from the scale)
+SHAPES = {
+    'flat': {'replies': 'none'},
+    'replies': {'replies': 'heavy', 'max_replies': 20},
+}
+# The keyword arguments passed to the iterators for each of their modes
+MODES = {
+    'regular': {'default': {}, 'html': {'extraction': 'html'}, 'fast_start': {'fast_start': True}},
+    'shorts': {'default': {}, 'html': {'extraction': 'html'}, 'fast_start': {'fast_start': True}},
+}
+# The metrics compared with the baseline, and whether a higher value is better
+COMPARED_METRICS = {
+    'comments_per_second': True,
+    'time_to_first_comment': False,
+    'commands_per_comment': False,
+    'peak_python_rss': False,
+    'peak_browser_rss': False,
+}
+DEFAULT_TOLERANCE = 0.1
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+MEMORY_SAMPLE_INTERVAL = 0.5
+
+
+def process_rss(pid):
+    '''
+        process_rss(pid) -> (anyOf Int None)
+        return the resident memory (in bytes) of the process, or None if it cannot be read from /proc
+    '''
+    try:
+        with open(f'/proc/{pid}/statm') as statm:
+            return int(statm.read().split()[1]) * PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def child_processes(pid):
+    '''
+        child_processes(pid) -> List
+        return the ids of all of the descendants of the process (i.e. chromedriver and the Chrome processes it starts)
+    '''
+    parents = {}
+    try:
+        pids = [int(entry) for entry in os.listdir('/proc') if entry.isdigit()]
+    except OSError:
+        return []
+    for other_pid in pids:
+        try:
+            with open(f'/proc/{other_pid}/stat') as stat:
+                # the process name (in parentheses) can contain spaces, so the fields are read from after it
+                fields = stat.read().rsplit(')', 1)[1].split()
+            parents.setdefault(int(fields[1]), []).append(other_pid)
+        except (OSError, IndexError, ValueError):
+            continue
+    descendants = []
+    to_visit = list(parents.get(pid, []))
+    while to_visit:
+        child = to_visit.pop()
+        descendants.append(child)
+        to_visit.extend(parents.get(child, []))
+    return descendants
+
+
+class MemorySampler:
+    '''
+        MemorySampler(interval=MEMORY_SAMPLE_INTERVAL) -> MemorySampler
+        Samples the resident memory of this process and of its child processes (the browser) on a background thread
+        every interval seconds, and keeps the peaks. Use it as a context manager around the code being measured.
+    '''
+    def __init__(self, interval=MEMORY_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak_python_rss = None
+        self.peak_browser_rss = None
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, name='memory-sampler', daemon=True)
+
+
+    def sample(self):
+        python_rss = process_rss(os.getpid())
+        if python_rss is None:
+            return
+        browser_rss = sum(rss for rss in (process_rss(child) for child in child_processes(os.getpid())) if rss is not None)
+        self.peak_python_rss = max(self.peak_python_rss or 0, python_rss)
+        self.peak_browser_rss = max(self.peak_browser_rss or 0, browser_rss)
+
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+
+    def __enter__(self):
+        self.sample()
+        self.thread.start()
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stopped.set()
+        self.thread.join()
+        self.sample()
+
+
+def iterator_class(backend):
+    if backend == 'regular':
+        from iterators.implementations.comment_iterator import CommentIterator
+        return CommentIterator
+    from iterators.implementations.youtube_shorts_iterator import YoutubeShortsIterator
+    return YoutubeShortsIterator
+
+
+def fixture_options(scale, shape, latency):
+    '''
+        fixture_options(scale, shape, latency) -> Dict
+        return the fixture server options for a video with at least scale comments in the given shape
+    '''
+    options = dict(SHAPES[shape], latency=latency)
+    if options['replies'] == 'heavy':
+        # heavy threads have at least max_replies / 2 replies, so this many threads always holds enough comments
+        options['comments'] = max(1, scale // (1 + (options['max_replies'] // 2)) + 1)
+    else:
+        options['comments'] = scale
+    return options
+
+
+def run_case(server, backend, mode, scale, shape, latency=0.0, seconds=0):
+    '''
+        run_case(server, backend, mode, scale, shape, latency=0.0, seconds=0) -> Dict
+        scrape scale comments with the iterator for backend (in the given mode) from a fixture video of the given
+        shape, and return the measurements. If seconds is not 0, it is passed on to the iterator as a time limit.
+    '''
+    video_id = f'{backend}-{shape}-{scale}'
+    options = fixture_options(scale, shape, latency)
+    url = server.video_url(video_id, **options) if backend == 'regular' else server.shorts_url(video_id, **options)
+    comments = 0
+    threads = 0
+    first_comment_time = None
+    with MemorySampler() as sampler:
+        started = time.perf_counter()
+        iterator = iterator_class(backend)(url, limit=scale, seconds=seconds, **MODES[backend][mode])
+        for thread in iterator:
+            if first_comment_time is None:
+                first_comment_time = time.perf_counter()
+            threads += 1
+            if thread is not None:
+                comments += 1 + len(thread['children'])
+        finished = time.perf_counter()
+    commands = iterator.metrics.total('webdriver_commands_total')
+    scraping_time = (finished - first_comment_time) if first_comment_time is not None else None
+    return {
+        'backend': backend,
+        'mode': mode,
+        'scale': scale,
+        'shape': shape,
+        'comments': comments,
+        'threads': threads,
+        'seconds': finished - started,
+        # the first comment is left out, so that starting Chrome is only counted in time_to_first_comment
+        'comments_per_second': ((comments - 1) / scraping_time) if scraping_time else None,
+        'time_to_first_comment': (first_comment_time - started) if first_comment_time is not None else None,
+        'commands_per_comment': (commands / comments) if comments else None,
+        'peak_python_rss': sampler.peak_python_rss,
+        'peak_browser_rss': sampler.peak_browser_rss,
+    }
+
+
+def case_key(case):
+    return f'{case["backend"]}/{case["mode"]}/{case["shape"]}/{case["scale"]}'
+
+
+def compare_with_baseline(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    '''
+        compare_with_baseline(results, baseline, tolerance=DEFAULT_TOLERANCE) -> List
+        return a message for every metric in the results that is worse than the same metric of the same case in the
+        baseline by more than tolerance (a fraction of the baseline value). Cases and metrics missing from either side
+        are skipped.
+    '''
+    baseline_cases = {case_key(case): case for case in baseline.get('cases', [])}
+    regressions = []
+    for case in results['cases']:
+        baseline_case = baseline_cases.get(case_key(case))
+        if baseline_case is None:
+            continue
+        for (metric, higher_is_better) in COMPARED_METRICS.items():
+            (value, baseline_value) = (case.get(metric), baseline_case.get(metric))
+            if (value is None) or (not baseline_value):
+                continue
+            change = (value - baseline_value) / baseline_value
+            if (higher_is_better and (change < -tolerance)) or ((not higher_is_better) and (change > tolerance)):
+                regressions.append(f'{case_key(case)}: {metric} went from {baseline_value:.4g} to {value:.4g} ({change:+.1%})')
+    return regressions
+
+
+def compared_cases(results, baseline):
+    '''
+        compared_cases(results, baseline) -> List
+        return the keys of the cases in the results that are also in the baseline (the cases compare_with_baseline checks)
+    '''
+    baseline_keys = {case_key(case) for case in baseline.get('cases', [])}
+    return [case_key(case) for case in results['cases'] if case_key(case) in baseline_keys]
+
+
+def run_benchmark(scales=DEFAULT_SCALES, shapes=tuple(SHAPES), backends=tuple(MODES), latency=0.0, seconds=0):
+    '''
+        run_benchmark(scales, shapes, backends, latency=0.0, seconds=0) -> Dict
+        run every combination of backend, mode, shape and scale against a fixture server, and return the results
+    '''
+    from fixtures.youtube_fixture_server import FixtureServer
+    results = {
+        'environment': {'python': platform.python_version(), 'platform': platform.platform(), 'latency': latency},
+        'cases': [],
+    }
+    with FixtureServer() as server:
+        for backend in backends:
+            for mode in MODES[backend]:
+                for shape in shapes:
+                    for scale in scales:
+                        case = run_case(server, backend, mode, scale, shape, latency=latency, seconds=seconds)
+                        print(json.dumps(case), file=sys.stderr)
+                        results['cases'].append(case)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the throughput, latency, round-trips and memory use of the iterators.')
+    parser.add_argument(
+        '--scales', type=int, nargs='+', default=list(DEFAULT_SCALES),
+        help='The numbers of comments to scrape. Defaults to {}.'.format(' '.join(str(scale) for scale in DEFAULT_SCALES))
+    )
+    parser.add_argument('--shapes', nargs='+', default=list(SHAPES), choices=list(SHAPES), help='The shapes of comment sections to scrape. Defaults to all of them.')
+    parser.add_argument('--backends', nargs='+', default=list(MODES), choices=list(MODES), help='The iterators to benchmark. Defaults to all of them.')
+    parser.add_argument('--latency', type=float, default=0.0, help='The number of seconds each continuation request takes. Defaults to 0.')
+    parser.add_argument('--seconds', type=int, default=0, help='A time limit (in seconds) for each case. Defaults to no time limit.')
+    parser.add_argument('--output', type=str, default='scraping_benchmark.json', help='The file the results are written to. Defaults to scraping_benchmark.json.')
+    parser.add_argument('--baseline', type=str, default=DEFAULT_BASELINE, help='The baseline results to compare with. Defaults to benchmarks/scraping_baseline.json.')
+    parser.add_argument('--save-baseline', action='store_true', help='Save the results as the new baseline instead of comparing with it.')
+    parser.add_argument(
+        '--tolerance', type=float, default=DEFAULT_TOLERANCE,
+        help=f'The fraction a metric may be worse than the baseline before it is flagged. Defaults to {DEFAULT_TOLERANCE}.'
+    )
+    arguments = parser.parse_args()
+    if not (arguments.save_baseline or os.path.exists(arguments.baseline)):
+        print(
+            f'There is no baseline at {arguments.baseline} to compare the results with. Save one with --save-baseline first. '
+            'Exiting with an error code of 1.', file=sys.stderr
+        )
+        exit(1)
+    results = run_benchmark(arguments.scales, arguments.shapes, arguments.backends, arguments.latency, arguments.seconds)
+    if arguments.save_baseline:
+        with open(arguments.baseline, 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=4)
+    else:
+        with open(arguments.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        results['compared_cases'] = compared_cases(results, baseline)
+        results['regressions'] = compare_with_baseline(results, baseline, arguments.tolerance)
+    with open(arguments.output, 'w') as output_file:
+        json.dump(results, output_file, indent=4)
+    for regression in results.get('regressions', []):
+        print(f'Regression: {regression}', file=sys.stderr)
+    if results.get('regressions'):
+        exit(1)
+    if (not arguments.save_baseline) and (not results['compared_cases']):
+        print(f'None of the cases run are in the baseline at {arguments.baseline}, so nothing was compared. Exiting with an error code of 1.', file=sys.stderr)
+        exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+'''
+This module is a startup benchmark for main.py. It checks that the short-lived invocations of main.py ("--help", and
+arguments that fail validation) do not import Selenium or the iterator implementations, and that the time spent
+importing main.py (measured with "python -X importtime") stays within IMPORT_TIME_BUDGET_MS. It also reports the
+wall-clock time it takes to spawn "python main.py --help", which includes the startup of the interpreter itself.
+
+Usage: python -m benchmarks.startup_benchmark [--runs RUNS] [--budget BUDGET_MS]
+The script exits with an error code of 1 if a check fails.
+'''
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# The maximum number of milliseconds that importing main.py (and everything it imports) may take
+IMPORT_TIME_BUDGET_MS = 25
+# Modules that must not be imported unless a scrape actually starts
+FORBIDDEN_MODULE_PREFIXES = (
+    'selenium',
+    'iterators.implementations.comment_iterator',
+    'iterators.implementations.youtube_shorts_iterator',
+)
+# The argument lists for the invocations that exit before scraping
+SHORT_LIVED_INVOCATIONS = (
+    ['--help'],
+    ['--limit', '0', '--url', 'https://www.youtube.com/watch?v=abc'],
+    ['--hours', '-1', '--url', 'https://www.youtube.com/watch?v=abc'],
+    [],
+)
+# Runs main.py the way "python main.py <arguments>" would, and prints the modules that were imported
+MODULE_LISTING_SCRIPT = '''
+import contextlib, io, json, runpy, sys
+sys.argv = ['main.py'] + json.loads(sys.argv[1])
+with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+    try:
+        runpy.run_path('main.py', run_name='__main__')
+    except SystemExit:
+        pass
+print(json.dumps(sorted(sys.modules)))
+'''
+
+
+def run_python(*arguments):
+    '''
+        run_python(*arguments) -> subprocess.CompletedProcess
+        run the current python interpreter with the arguments from the project directory, and return the result
+    '''
+    return subprocess.run(
+        [sys.executable] + list(arguments), cwd=PROJECT_DIR, capture_output=True, text=True
+    )
+
+
+def imported_modules(arguments):
+    '''
+        imported_modules(arguments) -> List
+        return the names of all modules imported by running main.py with the list of arguments passed in
+    '''
+    result = run_python('-c', MODULE_LISTING_SCRIPT, json.dumps(arguments))
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def forbidden_imports(arguments):
+    '''
+        forbidden_imports(arguments) -> List
+        return the modules imported by running main.py with the arguments that should not have been imported
+    '''
+    return [
+        module for module in imported_modules(arguments)
+        if any((module == prefix) or module.startswith(f'{prefix}.') for prefix in FORBIDDEN_MODULE_PREFIXES)
+    ]
+
+
+def import_time_ms():
+    '''
+        import_time_ms() -> Float
+        return the cumulative time (in milliseconds) spent importing main.py, as reported by "python -X importtime"
+    '''
+    result = run_python('-X', 'importtime', '-c', 'import main')
+    for line in result.stderr.splitlines():
+        # lines look like "import time:  self [us] | cumulative | imported package"
+        fields = [field.strip() for field in line.split('|')]
+        if (len(fields) == 3) and (fields[2] == 'main'):
+            return int(fields[1]) / 1000
+    raise Exception('main.py was not listed in the output of "python -X importtime":\n{}'.format(result.stderr))
+
+
+def spawn_time_ms(runs):
+    '''
+        spawn_time_ms(runs) -> List
+        return the wall-clock time (in milliseconds) of each of the given number of runs of "python main.py --help"
+    '''
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run_python('main.py', '--help')
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def run_benchmark(runs=10, budget=IMPORT_TIME_BUDGET_MS):
+    '''
+        run_benchmark(runs, budget) -> Dict
+        run all of the checks and measurements, and return the results. The "passed" key is False if a check failed.
+    '''
+    results = {'forbidden_imports': {}, 'budget_ms': budget}
+    for arguments in SHORT_LIVED_INVOCATIONS:
+        modules = forbidden_imports(arguments)
+        if modules:
+            results['forbidden_imports'][' '.join(arguments) or '(no arguments)'] = modules
+    # the import time is noisy, so the best of several measurements is compared to the budget
+    results['import_time_ms'] = min(import_time_ms() for _ in range(max(1, min(runs, 5))))
+    spawn_times = spawn_time_ms(runs)
+    results['spawn_time_ms'] = {
+        'median': statistics.median(spawn_times), 'min': min(spawn_times), 'max': max(spawn_times)
+    }
+    results['passed'] = (not results['forbidden_imports']) and (results['import_time_ms'] <= budget)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check and measure how quickly main.py starts up.')
+    parser.add_argument('--runs', type=int, default=10, help='The number of times main.py is spawned. Defaults to 10.')
+    parser.add_argument(
+        '--budget', type=float, default=IMPORT_TIME_BUDGET_MS,
+        help=f'The maximum number of milliseconds importing main.py may take. Defaults to {IMPORT_TIME_BUDGET_MS}.'
+    )
+    arguments = parser.parse_args()
+    results = run_benchmark(runs=arguments.runs, budget=arguments.budget)
+    print(json.dumps(results, indent=4))
+    if results['forbidden_imports']:
+        print('Selenium or the iterator implementations were imported before a scrape started.', file=sys.stderr)
+    if results['import_time_ms'] > results['budget_ms']:
+        print(f'Importing main.py took {results["import_time_ms"]}ms, which is over the budget of {results["budget_ms"]}ms.', file=sys.stderr)
+    if not results['passed']:
+        exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,782 @@
+'''
+This module is a local fixture server that serves synthetic YouTube-like pages, so that the iterators can be tested and
+benchmarked offline and deterministically. The pages reproduce the parts of the YouTube DOM that the iterators use
+(ytd-comment-thread-renderer, the #more-replies/#less-replies buttons, the continuation items for comments and replies,
+and the Shorts player controls, comments button and engagement panel), so CommentIterator and YoutubeShortsIterator run
+against them unchanged. Like on YouTube, comment threads and replies are loaded in pages through continuation requests
+(when the end of the comments comes into view, and when a replies button is clicked).
+
+The pages are served at:
+
+    /watch?v=VIDEO_ID&OPTIONS     a regular video (for CommentIterator)
+    /shorts/VIDEO_ID?OPTIONS      a YouTube Short (for YoutubeShortsIterator)
+    /@CHANNEL/videos?OPTIONS      the videos tab of a channel (for ChannelIterator)
+    /playlist?list=ID&OPTIONS     a playlist (for ChannelIterator)
+
+where OPTIONS sets up the comments on the video (any option that is left out takes the default of the server):
+
+    comments - the number of comment threads
+    replies - the distribution of the number of replies per thread: none, sparse (a tenth of the threads have replies),
+              uniform (between 0 and max_replies replies) or heavy (between max_replies / 2 and max_replies replies)
+    max_replies - the maximum number of replies a thread can have
+    page_size - the number of comment threads loaded per continuation
+    reply_page_size - the number of replies loaded per continuation
+    latency - the number of seconds each continuation request takes
+    comment_length - the (approximate) number of characters in each comment
+    seed - the seed for the generated comments. The same seed and options always give the same comments.
+
+Like on YouTube, a link to a comment (with the "lc" parameter, i.e. /watch?v=VIDEO_ID&lc=COMMENT_ID) shows the thread
+of that comment first, ahead of the other threads. Shorts are shown in a feed: the next button (#navigation-button-down)
+moves on to the next Short in the feed (the Short after VIDEO_ID-N is VIDEO_ID-(N+1), and the one after VIDEO_ID is
+VIDEO_ID-1) without loading a new page, and so does going to another /shorts/ path with history.pushState followed by a
+popstate event. The comments of the new Short are loaded into the same engagement panel.
+
+Channels and playlists take two more options, and pass the options above on to the links of their videos:
+
+    videos - the number of videos in the channel or playlist (the ids of the videos are LIST_ID-1, LIST_ID-2, ...)
+    video_page_size - the number of videos loaded per continuation
+
+Usage: python -m fixtures.youtube_fixture_server [--host HOST] [--port PORT] [--comments COMMENTS] [--replies REPLIES] ...
+'''
+import argparse
+import functools
+import html
+import random
+import re
+import threading
+import time
+from urllib.parse import urlencode
+
+from flask import Flask, abort, jsonify, request
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+
+REPLY_DISTRIBUTIONS = ('none', 'sparse', 'uniform', 'heavy')
+DEFAULT_OPTIONS = {
+    'comments': 100,
+    'replies': 'sparse',
+    'max_replies': 30,
+    'page_size': 20,
+    'reply_page_size': 10,
+    'latency': 0.0,
+    'comment_length': 80,
+    'seed': 0,
+}
+OPTION_TYPES = {
+    'comments': int,
+    'replies': str,
+    'max_replies': int,
+    'page_size': int,
+    'reply_page_size': int,
+    'latency': float,
+    'comment_length': int,
+    'seed': int,
+}
+WORDS = (
+    'the', 'video', 'great', 'music', 'first', 'love', 'this', 'part', 'best', 'who', 'still', 'watching', 'in', 'year',
+    'amazing', 'song', 'minute', 'when', 'he', 'she', 'they', 'said', 'funny', 'wow', 'really', 'nice', 'edit', 'lol',
+)
+STYLE = '''
+body { margin: 0; font-family: sans-serif; }
+ytd-comments, ytd-comment-thread-renderer, ytd-comment-renderer, ytd-comment-replies-renderer, ytd-expander,
+ytd-continuation-item-renderer, ytd-button-renderer, yt-button-shape, yt-touch-feedback-shape, ytd-shorts-player-controls,
+yt-icon-button, ytd-reel-video-renderer, ytd-rich-item-renderer, ytd-playlist-video-renderer { display: block; }
+ytd-rich-item-renderer, ytd-playlist-video-renderer { padding: 40px 16px; border-bottom: 1px solid #ddd; }
+ytd-comment-thread-renderer { padding: 8px 16px; border-bottom: 1px solid #ddd; }
+ytd-comment-replies-renderer ytd-comment-renderer { padding: 4px 0 4px 40px; }
+#player { height: 240px; background: #000; }
+.yt-spec-touch-feedback-shape__fill { display: block; min-width: 140px; height: 24px; line-height: 24px; color: #065fd4; cursor: pointer; }
+[hidden] { display: none !important; }
+#shorts-container { display: flex; }
+#shorts-player { width: 320px; height: 560px; background: #000; }
+#watch-while-engagement-panel { width: 480px; }
+#watch-while-engagement-panel ytd-comments > #contents { height: 520px; overflow-y: auto; }
+'''
+DEFAULT_LIST_OPTIONS = {
+    'videos': 10,
+    'video_page_size': 30,
+}
+# Loads the comment threads and replies through continuation requests, and handles the buttons on the page
+SCRIPT = '''
+(function () {
+    var page = document.getElementById('fixture-page');
+    var threads = document.querySelector('.fixture-threads');
+    var sentinel = threads.querySelector(':scope > ytd-continuation-item-renderer');
+    var nextPage = 0;
+    var loading = false;
+    // bumped when another Short is shown, so that the responses for the comments of the old one are dropped
+    var generation = 0;
+
+    function apiUrl(path, extra) {
+        var params = new URLSearchParams(location.search);
+        params.set('v', page.dataset.videoId);
+        Object.keys(extra).forEach(function (key) { params.set(key, extra[key]); });
+        return path + '?' + params.toString();
+    }
+
+    var observer = new IntersectionObserver(function (entries) {
+        if (entries.some(function (entry) { return entry.isIntersecting; })) {
+            loadThreads();
+        }
+    }, {root: (page.dataset.kind === 'shorts') ? threads : null, rootMargin: '0px 0px 600px 0px'});
+
+    function loadThreads() {
+        if (loading) {
+            return;
+        }
+        loading = true;
+        var requested = generation;
+        fetch(apiUrl('/fixture/comments', {page: nextPage})).then(function (response) {
+            return response.json();
+        }).then(function (data) {
+            if (requested !== generation) {
+                return;
+            }
+            sentinel.insertAdjacentHTML('beforebegin', data.html);
+            nextPage += 1;
+            loading = false;
+            // observing the continuation item again checks it straight away, in case it is still in view
+            observer.unobserve(sentinel);
+            if (data.has_more) {
+                observer.observe(sentinel);
+            } else {
+                sentinel.remove();
+            }
+        });
+    }
+
+    function loadReplies(thread, contents, replyPage) {
+        var params = {thread: thread.dataset.thread, page: replyPage};
+        fetch(apiUrl('/fixture/replies', params)).then(function (response) {
+            return response.json();
+        }).then(function (data) {
+            var continuation = contents.querySelector(':scope > ytd-continuation-item-renderer');
+            if (continuation) {
+                continuation.remove();
+            }
+            contents.insertAdjacentHTML('beforeend', data.html);
+        });
+    }
+
+    function showShort(videoId) {
+        fetch(apiUrl('/fixture/short', {v: videoId})).then(function (response) {
+            return response.json();
+        }).then(function (data) {
+            generation += 1;
+            loading = false;
+            nextPage = 0;
+            page.dataset.videoId = videoId;
+            page.dataset.nextVideoId = data.next_video_id;
+            document.querySelector('ytd-reel-video-renderer[is-active]').outerHTML = data.html;
+            document.getElementById('watch-while-engagement-panel').hidden = true;
+            threads.querySelectorAll(':scope > ytd-comment-thread-renderer').forEach(function (thread) { thread.remove(); });
+            observer.unobserve(sentinel);
+            sentinel.remove();
+            threads.insertAdjacentHTML('beforeend', '<ytd-continuation-item-renderer></ytd-continuation-item-renderer>');
+            sentinel = threads.querySelector(':scope > ytd-continuation-item-renderer');
+            observer.observe(sentinel);
+        });
+    }
+
+    window.addEventListener('popstate', function () {
+        var match = location.pathname.match(/^\/shorts\/([^\/]+)/);
+        if (match && (match[1] !== page.dataset.videoId)) {
+            showShort(decodeURIComponent(match[1]));
+        }
+    });
+
+    document.addEventListener('click', function (event) {
+        var target = event.target;
+        var thread = target.closest('ytd-comment-thread-renderer');
+        if (target.closest('#navigation-button-down')) {
+            var nextVideoId = page.dataset.nextVideoId;
+            // the comment linked from the old Short is not on the next one
+            var params = new URLSearchParams(location.search);
+            params.delete('lc');
+            history.pushState({}, '', '/shorts/' + encodeURIComponent(nextVideoId) + '?' + params.toString());
+            showShort(nextVideoId);
+            return;
+        }
+        if (target.closest('#more-replies') && thread) {
+            var replies = thread.querySelector('#replies');
+            var contents = replies.querySelector('#expander-contents #contents');
+            replies.querySelector('#more-replies').hidden = true;
+            replies.querySelector('#less-replies').hidden = false;
+            replies.querySelector('#expander-contents').hidden = false;
+            if (!contents.dataset.loaded) {
+                contents.dataset.loaded = 'true';
+                loadReplies(thread, contents, 0);
+            }
+        } else if (target.closest('#less-replies') && thread) {
+            var replies = thread.querySelector('#replies');
+            replies.querySelector('#more-replies').hidden = false;
+            replies.querySelector('#less-replies').hidden = true;
+            replies.querySelector('#expander-contents').hidden = true;
+        } else if (target.closest('#replies ytd-continuation-item-renderer') && thread) {
+            var continuation = target.closest('ytd-continuation-item-renderer');
+            // like on YouTube, the continuation shows a spinner until the replies have loaded
+            if (!continuation.querySelector('tp-yt-paper-spinner[active]')) {
+                continuation.insertAdjacentHTML('beforeend', '<tp-yt-paper-spinner id="spinner" active></tp-yt-paper-spinner>');
+                loadReplies(thread, continuation.parentElement, continuation.dataset.page);
+            }
+        } else if (target.closest('#comments-button')) {
+            document.getElementById('watch-while-engagement-panel').hidden = false;
+        } else if (target.closest('ytd-shorts-player-controls button')) {
+            var button = target.closest('button');
+            var labels = (button.dataset.labels || '').split('|');
+            button.setAttribute('aria-label', (button.getAttribute('aria-label') === labels[0]) ? labels[1] : labels[0]);
+        }
+    });
+
+    observer.observe(sentinel);
+})();
+'''
+# Loads the videos of a channel or playlist through continuation requests
+LIST_SCRIPT = '''
+(function () {
+    var page = document.getElementById('fixture-page');
+    var sentinel = document.querySelector('.fixture-videos > ytd-continuation-item-renderer');
+    var nextPage = 0;
+    var loading = false;
+
+    var observer = new IntersectionObserver(function (entries) {
+        if ((!loading) && entries.some(function (entry) { return entry.isIntersecting; })) {
+            loading = true;
+            var params = new URLSearchParams(location.search);
+            params.set('kind', page.dataset.kind);
+            params.set('id', page.dataset.listId);
+            params.set('page', nextPage);
+            fetch('/fixture/videos?' + params.toString()).then(function (response) {
+                return response.json();
+            }).then(function (data) {
+                sentinel.insertAdjacentHTML('beforebegin', data.html);
+                nextPage += 1;
+                loading = false;
+                observer.unobserve(sentinel);
+                if (data.has_more) {
+                    observer.observe(sentinel);
+                } else {
+                    sentinel.remove();
+                }
+            });
+        }
+    }, {rootMargin: '0px 0px 600px 0px'});
+
+    observer.observe(sentinel);
+})();
+'''
+
+
+def short_count(number):
+    '''
+        short_count(number) -> Str
+        return the number the way YouTube shows it on buttons (i.e. 987, 1.2K or 3.4M)
+    '''
+    for (suffix, size) in (('M', 1000000), ('K', 1000)):
+        if number >= size:
+            return f'{number / size:.1f}'.rstrip('0').rstrip('.') + suffix
+    return str(number)
+
+
+class FixtureVideo:
+    '''
+        FixtureVideo(video_id, comments=100, replies='sparse', max_replies=30, page_size=20, reply_page_size=10, latency=0.0,
+                     comment_length=80, seed=0) -> FixtureVideo
+        The generated comments on one fixture video (see the module docstring for the parameters). The comments are
+        generated from the seed, the video id and the position of the comment, so they are the same on every run.
+    '''
+    def __init__(self, video_id, comments=100, replies='sparse', max_replies=30, page_size=20, reply_page_size=10, latency=0.0,
+                 comment_length=80, seed=0):
+        if replies not in REPLY_DISTRIBUTIONS:
+            raise Exception('Unknown reply distribution {}, expected one of {}'.format(replies, ', '.join(REPLY_DISTRIBUTIONS)))
+        if (comments < 0) or (max_replies < 0) or (page_size <= 0) or (reply_page_size <= 0) or (latency < 0):
+            raise Exception('Invalid fixture options for video {}'.format(video_id))
+        self.video_id = video_id
+        self.comments = comments
+        self.replies = replies
+        self.max_replies = max_replies
+        self.page_size = page_size
+        self.reply_page_size = reply_page_size
+        self.latency = latency
+        self.comment_length = comment_length
+        self.seed = seed
+        self.reply_counts = self.generate_reply_counts()
+        self.total_comments = self.comments + sum(self.reply_counts)
+
+
+    @classmethod
+    def from_options(cls, video_id, options, defaults=None):
+        '''
+            from_options(cls, video_id, options, defaults=None) -> FixtureVideo
+            create a FixtureVideo from a mapping of option names to strings (i.e. the query string of a request), using
+            defaults (or DEFAULT_OPTIONS) for the options that are left out
+        '''
+        settings = dict(DEFAULT_OPTIONS, **(defaults or {}))
+        for (name, option_type) in OPTION_TYPES.items():
+            if name in options:
+                settings[name] = option_type(options[name])
+        return cls(video_id, **settings)
+
+
+    def generate_reply_counts(self):
+        generator = random.Random(f'{self.seed}:{self.video_id}:replies')
+        reply_counts = []
+        for _ in range(self.comments):
+            if (self.replies == 'none') or (self.max_replies == 0):
+                reply_counts.append(0)
+            elif self.replies == 'sparse':
+                reply_counts.append(generator.randint(1, self.max_replies) if generator.random() < 0.1 else 0)
+            elif self.replies == 'uniform':
+                reply_counts.append(generator.randint(0, self.max_replies))
+            else:
+                reply_counts.append(generator.randint(max(1, self.max_replies // 2), self.max_replies))
+        return reply_counts
+
+
+    def text(self, generator, prefix):
+        words = [prefix]
+        length = len(prefix)
+        while length < self.comment_length:
+            word = generator.choice(WORDS)
+            words.append(word)
+            length += len(word) + 1
+        return ' '.join(words)
+
+
+    def comment_id(self, thread_number, reply_number=None):
+        if reply_number is None:
+            return f'Ugx{self.seed}{thread_number:08d}'
+        return f'Ugx{self.seed}{thread_number:08d}.{reply_number:04d}'
+
+
+    def thread(self, thread_number):
+        '''
+            thread(self, thread_number) -> Dict
+            return the comment thread at the 1-based position thread_number, as a dictionary with the keys 'id',
+            'commenter', 'comment content' and 'children' (a list of dictionaries with the keys 'id', 'commenter'
+            and 'comment content')
+        '''
+        generator = random.Random(f'{self.seed}:{self.video_id}:{thread_number}')
+        children = []
+        for reply_number in range(1, self.reply_counts[thread_number - 1] + 1):
+            children.append({
+                'id': self.comment_id(thread_number, reply_number),
+                'commenter': f'fixture-user-{generator.randrange(1000000)}',
+                'comment content': self.text(generator, f'reply {reply_number} to thread {thread_number}:'),
+            })
+        return {
+            'id': self.comment_id(thread_number),
+            'commenter': f'fixture-user-{generator.randrange(1000000)}',
+            'comment content': self.text(generator, f'thread {thread_number}:'),
+            'children': children,
+        }
+
+
+    def thread_number_for(self, comment_id):
+        '''
+            thread_number_for(self, comment_id) -> (anyOf Int None)
+            return the position of the thread the comment (a thread or a reply) with the given id belongs to, or None if
+            there is no such comment on this video
+        '''
+        prefix = f'Ugx{self.seed}'
+        if not (comment_id or '').startswith(prefix):
+            return None
+        try:
+            thread_number = int(comment_id[len(prefix):].partition('.')[0])
+        except ValueError:
+            return None
+        return thread_number if 1 <= thread_number <= self.comments else None
+
+
+    def link(self, comment_id, base_url=''):
+        return f'{base_url}/watch?v={self.video_id}&lc={comment_id}'
+
+
+    def expected_comments(self, base_url, limit=None):
+        '''
+            expected_comments(self, base_url, limit=None) -> Generator
+            yield the comment threads in the form returned by the iterators (for the first limit threads, or all of
+            them if limit is None). base_url is the URL of the fixture server (i.e. http://127.0.0.1:8000), which the
+            links to the comments start with.
+        '''
+        for thread_number in range(1, min(self.comments, limit or self.comments) + 1):
+            thread = self.thread(thread_number)
+            yield {
+                'commenter': thread['commenter'],
+                'comment content': thread['comment content'],
+                'link': self.link(thread['id'], base_url),
+                'children': [
+                    {'commenter': child['commenter'], 'comment content': child['comment content'], 'link': self.link(child['id'], base_url)}
+                    for child in thread['children']
+                ],
+            }
+
+
+    def render_comment(self, comment, is_reply=False):
+        name = html.escape(comment['commenter'])
+        return (
+            ('<ytd-comment-renderer>' if is_reply else '<ytd-comment-renderer id="comment">') +
+            '<div id="body"><div id="main"><div id="header"><div id="header-author">'
+            f'<h3><a id="author-text" href="/@{name}"><yt-formatted-string>@{name}</yt-formatted-string></a></h3>'
+            f'<yt-formatted-string class="published-time-text"><a href="{html.escape(self.link(comment["id"]))}">1 day ago</a></yt-formatted-string>'
+            '</div></div><div id="comment-content"><ytd-expander id="expander"><div id="content">'
+            f'<yt-formatted-string id="content-text">{html.escape(comment["comment content"])}</yt-formatted-string>'
+            '</div></ytd-expander></div></div></div></ytd-comment-renderer>'
+        )
+
+
+    def render_thread(self, thread_number):
+        thread = self.thread(thread_number)
+        replies = ''
+        if thread['children']:
+            replies = (
+                '<ytd-comment-replies-renderer><div id="expander">'
+                '<div id="more-replies"><yt-button-shape><button><yt-touch-feedback-shape><div>'
+                f'<div class="yt-spec-touch-feedback-shape__fill">{len(thread["children"])} replies</div>'
+                '</div></yt-touch-feedback-shape></button></yt-button-shape></div>'
+                '<div id="less-replies" hidden><yt-button-shape><button><yt-touch-feedback-shape><div>'
+                '<div class="yt-spec-touch-feedback-shape__fill">Hide replies</div>'
+                '</div></yt-touch-feedback-shape></button></yt-button-shape></div>'
+                '<div id="expander-contents" hidden><div id="contents"></div></div>'
+                '</div></ytd-comment-replies-renderer>'
+            )
+        return (
+            f'<ytd-comment-thread-renderer data-thread="{thread_number}">'
+            f'{self.render_comment(thread)}<div id="replies">{replies}</div>'
+            '</ytd-comment-thread-renderer>'
+        )
+
+
+    def threads_page(self, page):
+        '''
+            threads_page(self, page) -> (tupleof Str Bool)
+            return the HTML for the comment threads on the given (0-based) continuation page, and whether there are
+            more pages after it
+        '''
+        first = (page * self.page_size) + 1
+        last = min(self.comments, first + self.page_size - 1)
+        threads = ''.join(self.render_thread(thread_number) for thread_number in range(first, last + 1))
+        return (threads, last < self.comments)
+
+
+    def replies_page(self, thread_number, page):
+        '''
+            replies_page(self, thread_number, page) -> (tupleof Str Bool)
+            return the HTML for the replies on the given (0-based) continuation page of a comment thread (ending with a
+            continuation item if there are more replies), and whether there are more pages after it
+        '''
+        if not (1 <= thread_number <= self.comments):
+            return ('', False)
+        children = self.thread(thread_number)['children']
+        first = page * self.reply_page_size
+        replies = ''.join(self.render_comment(child, is_reply=True) for child in children[first:first + self.reply_page_size])
+        has_more = (first + self.reply_page_size) < len(children)
+        if has_more:
+            replies += (
+                f'<ytd-continuation-item-renderer data-page="{page + 1}"><div id="button"><ytd-button-renderer>'
+                '<yt-button-shape><button><yt-touch-feedback-shape><div>'
+                '<div class="yt-spec-touch-feedback-shape__fill">Show more replies</div>'
+                '</div></yt-touch-feedback-shape></button></yt-button-shape></ytd-button-renderer></div>'
+                '</ytd-continuation-item-renderer>'
+            )
+        return (replies, has_more)
+
+
+    def render_page(self, kind, body, next_video_id=''):
+        return (
+            f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>Fixture video {html.escape(self.video_id)}</title>'
+            f'<style>{STYLE}</style></head><body>'
+            f'<div id="fixture-page" data-kind="{kind}" data-video-id="{html.escape(self.video_id)}"'
+            f' data-next-video-id="{html.escape(next_video_id)}">{body}</div>'
+            f'<script>{SCRIPT}</script></body></html>'
+        )
+
+
+    def threads_container(self, highlighted=None):
+        thread_number = self.thread_number_for(highlighted)
+        highlighted_thread = self.render_thread(thread_number) if thread_number else ''
+        return (
+            f'<div id="contents" class="fixture-threads">{highlighted_thread}'
+            '<ytd-continuation-item-renderer></ytd-continuation-item-renderer></div>'
+        )
+
+
+    def watch_page(self, highlighted=None):
+        return self.render_page('watch', (
+            '<div id="player"></div>'
+            f'<div id="title"><h1><yt-formatted-string>Fixture video {html.escape(self.video_id)}</yt-formatted-string></h1></div>'
+            '<ytd-comments id="comments"><div id="sections">'
+            f'<div id="count"><yt-formatted-string><span>{self.total_comments:,}</span><span> Comments</span></yt-formatted-string></div>'
+            f'{self.threads_container(highlighted)}</div></ytd-comments>'
+        ))
+
+
+    def reel(self):
+        return (
+            '<ytd-reel-video-renderer is-active><div id="shorts-player"></div>'
+            '<ytd-shorts-player-controls>'
+            '<yt-icon-button><button aria-label="Play (k)" data-labels="Play (k)|Pause (k)"></button></yt-icon-button>'
+            '<yt-icon-button><button aria-label="Unmute" data-labels="Unmute|Mute"></button></yt-icon-button>'
+            '</ytd-shorts-player-controls>'
+            f'<div id="comments-button"><ytd-button-renderer><yt-button-shape><label>'
+            f'<button aria-label="View {self.total_comments:,} comments">{short_count(self.total_comments)}</button>'
+            '</label></yt-button-shape></ytd-button-renderer></div></ytd-reel-video-renderer>'
+        )
+
+
+    def shorts_page(self, highlighted=None):
+        return self.render_page('shorts', (
+            f'<div id="shorts-container">{self.reel()}'
+            '<div id="navigation-button-down"><ytd-button-renderer><yt-button-shape>'
+            '<button aria-label="Next video">Next</button></yt-button-shape></ytd-button-renderer></div>'
+            '<div id="watch-while-engagement-panel" hidden><div id="contents"><ytd-comments>'
+            f'{self.threads_container(highlighted)}</ytd-comments></div></div></div>'
+        ), next_video_id=next_short_id(self.video_id))
+
+
+def next_short_id(video_id):
+    '''
+        next_short_id(video_id) -> Str
+        return the id of the Short after video_id in the fixture feed
+    '''
+    match = re.match(r'^(.*)-(\d+)$', video_id)
+    if match:
+        return f'{match.group(1)}-{int(match.group(2)) + 1}'
+    return f'{video_id}-1'
+
+
+class FixtureVideoList:
+    '''
+        FixtureVideoList(kind, list_id, videos=10, video_page_size=30, video_options=None) -> FixtureVideoList
+        The videos of a fixture channel (kind='channel') or playlist (kind='playlist'). The links to the videos carry
+        video_options (the options of the fixture videos, see the module docstring) in their query strings.
+    '''
+    def __init__(self, kind, list_id, videos=10, video_page_size=30, video_options=None):
+        if (videos < 0) or (video_page_size <= 0):
+            raise Exception('Invalid fixture options for {} {}'.format(kind, list_id))
+        self.kind = kind
+        self.list_id = list_id
+        self.videos = videos
+        self.video_page_size = video_page_size
+        self.video_options = dict(video_options or {})
+
+
+    @classmethod
+    def from_options(cls, kind, list_id, options):
+        settings = {name: int(options.get(name, default)) for (name, default) in DEFAULT_LIST_OPTIONS.items()}
+        video_options = {name: value for (name, value) in options.items() if name in OPTION_TYPES}
+        return cls(kind, list_id, video_options=video_options, **settings)
+
+
+    def video_ids(self):
+        return [f'{self.list_id}-{number}' for number in range(1, self.videos + 1)]
+
+
+    def video_path(self, video_id, index):
+        query = dict(v=video_id, **self.video_options)
+        if self.kind == 'playlist':
+            query.update(list=self.list_id, index=index)
+        return f'/watch?{urlencode(query)}'
+
+
+    def videos_page(self, page):
+        '''
+            videos_page(self, page) -> (Str, Bool)
+            return the HTML of the videos in the (0-based) continuation page, and whether there are more pages after it
+        '''
+        start = page * self.video_page_size
+        video_ids = self.video_ids()[start:start + self.video_page_size]
+        items = []
+        for (offset, video_id) in enumerate(video_ids):
+            path = html.escape(self.video_path(video_id, start + offset + 1))
+            if self.kind == 'playlist':
+                items.append(f'<ytd-playlist-video-renderer><a id="video-title" href="{path}">Fixture video {video_id}</a></ytd-playlist-video-renderer>')
+            else:
+                items.append(f'<ytd-rich-item-renderer><a id="video-title-link" href="{path}">Fixture video {video_id}</a></ytd-rich-item-renderer>')
+        return (''.join(items), (start + self.video_page_size) < self.videos)
+
+
+    def list_page(self):
+        return (
+            f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>Fixture {self.kind} {html.escape(self.list_id)}</title>'
+            f'<style>{STYLE}</style></head><body>'
+            f'<div id="fixture-page" data-kind="{self.kind}" data-list-id="{html.escape(self.list_id)}">'
+            '<div id="contents" class="fixture-videos"><ytd-continuation-item-renderer></ytd-continuation-item-renderer></div>'
+            f'</div><script>{LIST_SCRIPT}</script></body></html>'
+        )
+
+
+def create_app(**defaults):
+    '''
+        create_app(**defaults) -> flask.Flask
+        create the fixture server application. The keyword arguments replace the values in DEFAULT_OPTIONS for the
+        options that are not given in the URL of a request.
+    '''
+    app = Flask(__name__)
+
+    @functools.lru_cache(maxsize=64)
+    def cached_video(video_id, options):
+        return FixtureVideo.from_options(video_id, dict(options), defaults)
+
+    def current_video(video_id):
+        options = tuple(sorted((name, value) for (name, value) in request.args.items() if name in OPTION_TYPES))
+        try:
+            return cached_video(video_id, options)
+        except Exception as err:
+            abort(400, str(err))
+
+    @app.route('/watch')
+    def watch():
+        return current_video(request.args.get('v', 'fixture')).watch_page(request.args.get('lc'))
+
+    @app.route('/shorts/<video_id>')
+    def shorts(video_id):
+        return current_video(video_id).shorts_page(request.args.get('lc'))
+
+    def current_list(kind, list_id):
+        try:
+            return FixtureVideoList.from_options(kind, list_id, request.args)
+        except Exception as err:
+            abort(400, str(err))
+
+    @app.route('/@<channel>/videos')
+    def channel(channel):
+        return current_list('channel', channel).list_page()
+
+    @app.route('/playlist')
+    def playlist():
+        return current_list('playlist', request.args.get('list', 'fixture')).list_page()
+
+    @app.route('/fixture/videos')
+    def videos():
+        video_list = current_list(request.args.get('kind', 'channel'), request.args.get('id', 'fixture'))
+        (items, has_more) = video_list.videos_page(request.args.get('page', 0, type=int))
+        return jsonify(html=items, has_more=has_more)
+
+    @app.route('/fixture/short')
+    def short():
+        video = current_video(request.args.get('v', 'fixture'))
+        return jsonify(html=video.reel(), next_video_id=next_short_id(video.video_id))
+
+    @app.route('/fixture/comments')
+    def comments():
+        video = current_video(request.args.get('v', 'fixture'))
+        time.sleep(video.latency)
+        (threads, has_more) = video.threads_page(request.args.get('page', 0, type=int))
+        return jsonify(html=threads, has_more=has_more)
+
+    @app.route('/fixture/replies')
+    def replies():
+        video = current_video(request.args.get('v', 'fixture'))
+        time.sleep(video.latency)
+        (replies, has_more) = video.replies_page(request.args.get('thread', 0, type=int), request.args.get('page', 0, type=int))
+        return jsonify(html=replies, has_more=has_more)
+
+    return app
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    '''
+        QuietRequestHandler -> WSGIRequestHandler
+        a request handler that does not log every request, so that the output of tests and benchmarks stays readable
+    '''
+    def log_request(self, code='-', size='-'):
+        pass
+
+
+class FixtureServer:
+    '''
+        FixtureServer(host='127.0.0.1', port=0, **defaults) -> FixtureServer
+        Runs the fixture server on a background thread (port 0 picks a free port). The keyword arguments are passed on
+        to create_app. The server can be used as a context manager, which starts it and stops it.
+    '''
+    def __init__(self, host='127.0.0.1', port=0, **defaults):
+        self.defaults = defaults
+        self.server = make_server(host, port, create_app(**defaults), threaded=True, request_handler=QuietRequestHandler)
+        self.thread = None
+
+
+    @property
+    def url(self):
+        return f'http://{self.server.host}:{self.server.port}'
+
+
+    def video(self, video_id='fixture', **options):
+        '''
+            video(self, video_id='fixture', **options) -> FixtureVideo
+            return the comments the server generates for the video with the given id and options
+        '''
+        return FixtureVideo.from_options(video_id, options, self.defaults)
+
+
+    def video_url(self, video_id='fixture', **options):
+        return f'{self.url}/watch?{urlencode(dict(v=video_id, **options))}'
+
+
+    def shorts_url(self, video_id='fixture', **options):
+        query = f'?{urlencode(options)}' if options else ''
+        return f'{self.url}/shorts/{video_id}{query}'
+
+
+    def shorts_feed(self, video_id='fixture', count=3):
+        '''
+            shorts_feed(self, video_id='fixture', count=3) -> List
+            return the ids of the first count Shorts of the fixture feed starting at video_id
+        '''
+        video_ids = [video_id]
+        while len(video_ids) < count:
+            video_ids.append(next_short_id(video_ids[-1]))
+        return video_ids
+
+
+    def channel_url(self, channel='fixture', **options):
+        query = f'?{urlencode(options)}' if options else ''
+        return f'{self.url}/@{channel}/videos{query}'
+
+
+    def playlist_url(self, list_id='fixture', **options):
+        return f'{self.url}/playlist?{urlencode(dict(list=list_id, **options))}'
+
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, name='fixture-server', daemon=True)
+        self.thread.start()
+        return self
+
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self.thread is not None:
+            self.thread.join()
+
+
+    def __enter__(self):
+        return self.start()
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve synthetic YouTube-like pages for offline tests and benchmarks.')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='The host to listen on. Defaults to 127.0.0.1.')
+    parser.add_argument('--port', type=int, default=8000, help='The port to listen on. Defaults to 8000.')
+    for (name, option_type) in OPTION_TYPES.items():
+        parser.add_argument(
+            '--' + name.replace('_', '-'), type=option_type, default=DEFAULT_OPTIONS[name], dest=name,
+            help=f'The default value of the {name} option (see the module docstring). Defaults to {DEFAULT_OPTIONS[name]}.'
+        )
+    arguments = vars(parser.parse_args())
+    (host, port) = (arguments.pop('host'), arguments.pop('port'))
+    server = FixtureServer(host, port, **arguments)
+    print(f'Serving fixture videos at {server.video_url()} and {server.shorts_url()}')
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
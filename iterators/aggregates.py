@@ -0,0 +1,223 @@
+'''
+This module keeps aggregate statistics about the comments of a video while they are scraped, without keeping the
+comments themselves: the top commenters, the most frequent keywords, the number of comments at each reply depth, and
+histograms of comment lengths and of the number of replies per thread. The memory used does not grow with the number of
+comments. The top commenters and keywords are found with the Space-Saving algorithm, which tracks a fixed number of
+candidates, keyword counts are estimated with a count-min sketch, and the histograms have fixed buckets. AggregateSink
+plugs the statistics into the write-behind writer (see iterators/sinks.py) and writes a compact summary per video as
+JSON when it is closed.
+'''
+import hashlib
+import json
+import re
+
+from iterators.metrics import Histogram
+from iterators.sinks import Sink
+
+
+# upper bounds (in characters) of the buckets used for the length of comments
+COMMENT_LENGTH_BUCKETS = (10, 25, 50, 100, 200, 500, 1000, 2000, 5000)
+# upper bounds of the buckets used for the number of replies to a comment thread
+REPLY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+WORD_PATTERN = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)?")
+MIN_KEYWORD_LENGTH = 3
+# common English words that would otherwise crowd out the keywords
+STOPWORDS = frozenset('''
+    about after again all also and any are because been before being but can could did does doing don for from had has
+    have her here him his how its just like more most not now off only other our out over own same she should some such
+    than that the their them then there these they this those through too under very was were what when where which while
+    who why will with would you your can't didn't don't i'm i've isn't it's that's there's you're
+'''.split())
+
+
+class SpaceSaving:
+    '''
+        SpaceSaving(capacity) -> SpaceSaving
+        Finds the most frequent items of a stream while keeping at most capacity of them (the Space-Saving algorithm).
+        When a new item arrives and there is no room left, it replaces the item with the lowest count and takes over
+        that count, which is recorded as its error. Any item seen more than (number of items added / capacity) times is
+        guaranteed to be kept, and the count of a kept item is never more than its error above its real count.
+    '''
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise Exception('The capacity of a SpaceSaving counter must be at least 1, not {}'.format(capacity))
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+
+
+    def add(self, item, count=1):
+        if item in self.counts:
+            self.counts[item] += count
+            return
+        error = 0
+        if len(self.counts) >= self.capacity:
+            smallest = min(self.counts, key=self.counts.__getitem__)
+            error = self.counts.pop(smallest)
+            del self.errors[smallest]
+        self.counts[item] = error + count
+        self.errors[item] = error
+
+
+    def top(self, count):
+        '''
+            top(self, count) -> List
+            return the count items with the highest counts, as (item, count, error) tuples in descending order of count
+        '''
+        items = sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))[:count]
+        return [(item, item_count, self.errors[item]) for (item, item_count) in items]
+
+
+class CountMinSketch:
+    '''
+        CountMinSketch(width=2048, depth=4) -> CountMinSketch
+        Estimates how many times each item of a stream was seen, with depth rows of width counters. An item adds to one
+        counter in every row, and its estimate is the smallest of those counters, so it is never below the real count and
+        is above it by at most (2 / width) times the number of items added, with a probability of 1 - (1 / 2 ** depth).
+    '''
+    def __init__(self, width=2048, depth=4):
+        if (width < 1) or (depth < 1):
+            raise Exception('The width and depth of a count-min sketch must be at least 1, not {} and {}'.format(width, depth))
+        self.width = width
+        self.depth = depth
+        self.rows = [[0] * width for _ in range(depth)]
+        self.total = 0
+
+
+    def positions(self, item):
+        '''
+            positions(self, item) -> Generator
+            yield the position of item in every row. One hash is split into two, and the rows combine them differently
+            (h1 + row * h2), which is as good as a separate hash per row.
+        '''
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        for row in range(self.depth):
+            yield (first + (row * second)) % self.width
+
+
+    def add(self, item, count=1):
+        for (row, position) in zip(self.rows, self.positions(item)):
+            row[position] += count
+        self.total += count
+
+
+    def estimate(self, item):
+        return min(row[position] for (row, position) in zip(self.rows, self.positions(item)))
+
+
+def keywords_in(text):
+    '''
+        keywords_in(text) -> Generator
+        yield the lowercase words in text that are at least MIN_KEYWORD_LENGTH letters long and are not stopwords
+    '''
+    for word in WORD_PATTERN.findall(text.lower()):
+        if (len(word) >= MIN_KEYWORD_LENGTH) and (word not in STOPWORDS):
+            yield word
+
+
+class CommentAggregates:
+    '''
+        CommentAggregates(video=None, top=10, tracked_keywords=None, candidates=None, sketch_width=2048, sketch_depth=4) -> CommentAggregates
+        The aggregate statistics of the comment threads of one video, updated one thread at a time with add. top is the
+        number of commenters and keywords in the summary, and candidates (10 times top by default) is the number of
+        commenters and keywords tracked to find them. The counts of the keywords in tracked_keywords are always in the
+        summary, estimated with the count-min sketch, whether or not they are among the top keywords.
+    '''
+    def __init__(self, video=None, top=10, tracked_keywords=None, candidates=None, sketch_width=2048, sketch_depth=4):
+        self.video = video
+        self.top = top
+        self.tracked_keywords = [keyword.lower() for keyword in (tracked_keywords or [])]
+        self.commenters = SpaceSaving(candidates or (top * 10))
+        self.keywords = SpaceSaving(candidates or (top * 10))
+        self.keyword_sketch = CountMinSketch(width=sketch_width, depth=sketch_depth)
+        self.comment_lengths = Histogram(COMMENT_LENGTH_BUCKETS)
+        self.replies_per_thread = Histogram(REPLY_COUNT_BUCKETS)
+        self.depths = [0, 0]
+
+
+    def add_comment(self, comment, depth):
+        '''
+            add_comment(self, comment, depth) -> None
+            add a single comment (a thread at depth 0, or one of its replies at depth 1) to the statistics
+        '''
+        content = comment.get('comment content') or ''
+        if comment.get('commenter'):
+            self.commenters.add(comment['commenter'])
+        for word in keywords_in(content):
+            self.keywords.add(word)
+            self.keyword_sketch.add(word)
+        self.comment_lengths.observe(len(content))
+        self.depths[depth] += 1
+
+
+    def add(self, thread):
+        children = thread.get('children') or []
+        self.add_comment(thread, 0)
+        for child in children:
+            self.add_comment(child, 1)
+        self.replies_per_thread.observe(len(children))
+
+
+    def summary(self):
+        '''
+            summary(self) -> Dict
+            return the statistics as a dictionary that can be written as JSON. The count of a keyword is the lower of its
+            Space-Saving count and its count-min estimate, since both can only overestimate it.
+        '''
+        return {
+            'video': self.video,
+            'comments': sum(self.depths),
+            'threads': self.depths[0],
+            'replies': self.depths[1],
+            'depths': {str(depth): count for (depth, count) in enumerate(self.depths)},
+            'top_commenters': [
+                {'commenter': commenter, 'count': count, 'error': error}
+                for (commenter, count, error) in self.commenters.top(self.top)
+            ],
+            'top_keywords': [
+                {'keyword': keyword, 'count': min(count, self.keyword_sketch.estimate(keyword))}
+                for (keyword, count, _) in self.keywords.top(self.top)
+            ],
+            'tracked_keywords': {keyword: self.keyword_sketch.estimate(keyword) for keyword in self.tracked_keywords},
+            'comment_length': self.comment_lengths.to_dict(),
+            'replies_per_thread': self.replies_per_thread.to_dict(),
+        }
+
+
+class AggregateSink(Sink):
+    '''
+        AggregateSink(filename, video=None, **kwargs) -> Sink
+        A sink that keeps the aggregate statistics (see CommentAggregates, which the keyword arguments are passed on to)
+        of the comment threads written to it, and writes a summary of them to filename as JSON when it is closed. Threads
+        are grouped by their "video url" or "short id" key (set by ChannelIterator and by Shorts feeds), and threads
+        without either belong to video. Threads that did not match the regular expression (i.e. None values) are skipped.
+    '''
+    def __init__(self, filename, video=None, **kwargs):
+        self.filename = filename
+        self.video = video
+        self.kwargs = kwargs
+        self.videos = {}
+
+
+    def aggregates_for(self, thread):
+        video = thread.get('video url') or thread.get('short id') or self.video
+        if video not in self.videos:
+            self.videos[video] = CommentAggregates(video=video, **self.kwargs)
+        return self.videos[video]
+
+
+    def write_batch(self, items):
+        for item in items:
+            if item is not None:
+                self.aggregates_for(item).add(item)
+
+
+    def summary(self):
+        return {'videos': [aggregates.summary() for aggregates in self.videos.values()]}
+
+
+    def close(self):
+        with open(self.filename, 'w') as summary_file:
+            json.dump(self.summary(), summary_file, indent=4)
@@ -0,0 +1,148 @@
+'''
+This module lets asyncio applications iterate over comment threads with async for, without blocking the event loop.
+Everything the iterators do goes through Selenium, which blocks, so AsyncIteratorAdapter runs the iterator (creating it
+included, since that starts Chrome) on a thread of its own, and the event loop only awaits the result of each step.
+Each adapter has a single thread, so its browser session is only ever used from one thread, and many adapters can run
+from one event loop at the same time. Passing a BrowserSessionPool (see iterators/browser.py) caps the number of
+browsers running at once: an adapter borrows a session when it starts and gives it back when it is done.
+
+Cancelling a task that is iterating over an adapter (or leaving the async for loop early) closes the adapter: the step
+that is running on its thread is let finish (WebDriver commands cannot be interrupted safely), and the driver is quit
+(or given back to the pool) right after it, without the event loop waiting on it.
+'''
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+
+# returned by the thread of an adapter once the iterator has nothing left (StopIteration cannot be passed through a future)
+END_OF_ITERATION = object()
+
+
+class AsyncIteratorAdapter:
+    '''
+        AsyncIteratorAdapter(factory, pool=None) -> AsyncIteratorAdapter
+        An asynchronous iterator over the comment threads of the iterator returned by factory, which is called with a
+        session borrowed from pool (a BrowserSessionPool), or with None if there is no pool, on the adapter's own thread
+        the first time a comment thread is asked for. Use it with async for, or as an async context manager so that it
+        is closed when the block is left. Iterators also have __aiter__, which wraps an iterator that already exists.
+    '''
+    def __init__(self, factory, pool=None):
+        self.factory = factory
+        self.pool = pool
+        self.iterator = None
+        self.driver = None
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='async-iterator')
+        self.done = False
+
+
+    def open(self):
+        '''
+            open(self) -> Iterator
+            create the iterator (borrowing a session from the pool first) if it has not been created yet, and return it.
+            Runs on the adapter's thread.
+        '''
+        if self.iterator is None:
+            if self.pool is not None:
+                self.driver = self.pool.acquire()
+            self.iterator = self.factory(self.driver)
+        return self.iterator
+
+
+    def next_thread(self):
+        '''
+            next_thread(self) -> (anyOf Dict None object)
+            return the next comment thread, or END_OF_ITERATION (after finishing) once there are none left. Runs on the
+            adapter's thread.
+        '''
+        try:
+            return next(self.open())
+        except StopIteration:
+            self.finish()
+            return END_OF_ITERATION
+
+
+    def finish(self):
+        '''
+            finish(self) -> None
+            close the iterator (quitting its driver and closing its logger), then give the borrowed session back to the
+            pool. Runs on the adapter's thread.
+        '''
+        iterator = self.iterator
+        try:
+            if (iterator is not None) and hasattr(iterator, 'close'):
+                iterator.close()
+        finally:
+            if self.driver is not None:
+                (driver, self.driver) = (self.driver, None)
+                self.pool.release(driver)
+
+
+    def close_in_background(self):
+        '''
+            close_in_background(self) -> None
+            finish on the adapter's thread once the step running on it (if any) is done, without waiting for it
+        '''
+        if not self.done:
+            self.done = True
+            self.executor.submit(self.finish)
+            self.executor.shutdown(wait=False)
+
+
+    async def aclose(self):
+        '''
+            aclose(self) -> None
+            close the adapter and wait until the driver has been quit (or given back to the pool)
+        '''
+        if not self.done:
+            self.done = True
+            try:
+                await asyncio.get_running_loop().run_in_executor(self.executor, self.finish)
+            finally:
+                self.executor.shutdown(wait=False)
+
+
+    def __aiter__(self):
+        return self
+
+
+    async def __anext__(self):
+        if self.done:
+            raise StopAsyncIteration
+        try:
+            thread = await asyncio.get_running_loop().run_in_executor(self.executor, self.next_thread)
+        except asyncio.CancelledError:
+            self.close_in_background()
+            raise
+        except BaseException:
+            await self.aclose()
+            raise
+        if thread is END_OF_ITERATION:
+            self.done = True
+            self.executor.shutdown(wait=False)
+            raise StopAsyncIteration
+        return thread
+
+
+    async def __aenter__(self):
+        return self
+
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+        return False
+
+
+def async_iterator(url, pool=None, **kwargs):
+    '''
+        async_iterator(url, pool=None, **kwargs) -> AsyncIteratorAdapter
+        return an asynchronous iterator over the comment threads at url, using the iterator IteratorFactory picks for
+        it (which is created with the keyword arguments on the adapter's thread, so starting Chrome does not block the
+        event loop). With a pool, the iterator uses a session borrowed from it instead of starting Chrome.
+    '''
+    from iterators.factory import IteratorFactory
+
+    def create_iterator(driver):
+        if driver is None:
+            return IteratorFactory(url, **kwargs)
+        return IteratorFactory(url, driver=driver, **kwargs)
+    return AsyncIteratorAdapter(create_iterator, pool=pool)
@@ -0,0 +1,271 @@
+'''
+This module creates the Chrome WebDriver sessions used by the YouTube comment iterators, so that the options passed to
+Chrome are set up in one place for every iterator, along with the checks for a browser session that has died.
+
+Chrome can be started with a persistent profile directory, so the cookies (i.e. the answer to YouTube's consent page) and
+the HTTP cache of one run are there for the next. A profile can only be used by one Chrome at a time, so a browser that
+finds the profile in use takes the first free one of profile_dir-2, profile_dir-3 and so on, each of which warms up in
+the same way. In fast start mode, Chrome is started maximized, with autoplay blocked and sound muted for every site, and
+the page load returns as soon as the document is parsed, so the iterators can skip maximizing the window and pausing and
+muting videos, and go straight to the comments.
+
+BrowserSessionPool keeps a fixed number of Chrome sessions that iterators borrow one after another (i.e. iterators run
+from an asyncio event loop, see iterators/async_iterator.py), so starting Chrome is paid once per session rather than
+once per video.
+'''
+import os
+import socket
+import threading
+from urllib.parse import urlsplit
+
+from selenium import webdriver
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException
+
+try:
+    from urllib3.exceptions import MaxRetryError, ProtocolError
+except ImportError:
+    MaxRetryError = ProtocolError = None
+
+from iterators.rate_limiter import locked_file
+
+
+# The categories of Chrome's own trace events recorded in trace mode (the same ones the DevTools performance panel records)
+TRACE_CATEGORIES = 'devtools.timeline,disabled-by-default-devtools.timeline,blink.user_timing,loading,v8.execute'
+# The settings of the profile in fast start mode (sound is muted for every site), kept in the profile directory if there is one
+FAST_START_PREFS = {'profile.default_content_setting_values.sound': 2}
+# The cookie YouTube sets once its consent page has been answered (this value turns down the optional cookies), so that
+# pages open straight away instead of on the consent page
+CONSENT_COOKIE = {'name': 'SOCS', 'value': 'CAI', 'domain': '.youtube.com', 'path': '/', 'secure': True}
+# The number of profile directories (profile_dir, then profile_dir-2 and so on) tried before giving up on finding a free one
+MAX_PROFILE_SLOTS = 32
+
+
+def chrome_options(trace=False, profile_dir=None, fast_start=False):
+    '''
+        chrome_options(trace=False, profile_dir=None, fast_start=False) -> selenium.webdriver.ChromeOptions
+        return the options Chrome is started with. If trace is True, Chrome's performance log is turned on, with the
+        network and page events along with the DevTools timeline trace events (see iterators/tracing.py). If profile_dir
+        is given, Chrome keeps its profile there. If fast_start is True, Chrome is started maximized with autoplay
+        blocked and sound muted, and page loads return once the document has been parsed.
+    '''
+    options = webdriver.ChromeOptions()
+    if profile_dir:
+        options.add_argument(f'--user-data-dir={os.path.abspath(profile_dir)}')
+    if fast_start:
+        options.page_load_strategy = 'eager'
+        options.add_argument('--start-maximized')
+        options.add_argument('--autoplay-policy=user-gesture-required')
+        options.add_experimental_option('prefs', FAST_START_PREFS)
+    if trace:
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        options.add_experimental_option('perfLoggingPrefs', {
+            'enableNetwork': True,
+            'enablePage': True,
+            'traceCategories': TRACE_CATEGORIES,
+        })
+    return options
+
+
+def profile_in_use(profile_dir):
+    '''
+        profile_in_use(profile_dir) -> Bool
+        return True if a running Chrome holds the lock on the profile in profile_dir. A lock left behind by a Chrome that
+        is no longer running (on this host) does not count, since Chrome takes over such locks.
+    '''
+    singleton_lock = os.path.join(profile_dir, 'SingletonLock')
+    if os.path.islink(singleton_lock):
+        # the lock is a symbolic link to "hostname-pid"
+        (host, _, pid) = os.readlink(singleton_lock).rpartition('-')
+        if host != socket.gethostname():
+            return True
+        try:
+            os.kill(int(pid), 0)
+        except (ValueError, ProcessLookupError):
+            return False
+        except PermissionError:
+            return True
+        return True
+    lockfile = os.path.join(profile_dir, 'lockfile')
+    if os.path.exists(lockfile):
+        # on Windows, the lock file cannot be removed while Chrome has it open
+        try:
+            os.remove(lockfile)
+        except OSError:
+            return True
+    return False
+
+
+def free_profile_dir(profile_dir):
+    '''
+        free_profile_dir(profile_dir) -> Str
+        return profile_dir if no running Chrome is using it, and otherwise the first of profile_dir-2, profile_dir-3 and
+        so on that is free. An exception is raised if MAX_PROFILE_SLOTS of them are in use.
+    '''
+    profile_dir = profile_dir.rstrip(os.sep)
+    for slot in range(1, MAX_PROFILE_SLOTS + 1):
+        directory = profile_dir if slot == 1 else f'{profile_dir}-{slot}'
+        if not profile_in_use(directory):
+            return directory
+    raise Exception('All {} profile directories for {} are in use'.format(MAX_PROFILE_SLOTS, profile_dir))
+
+
+def create_driver(trace=False, profile_dir=None, fast_start=False):
+    '''
+        create_driver(trace=False, profile_dir=None, fast_start=False) -> selenium.webdriver.Chrome
+        start a new Chrome session with the options from chrome_options. With a profile_dir, the profile directory is
+        picked and Chrome started while holding a lock on profile_dir + '.lock', so browsers starting at the same time
+        (in this process or others) never pick the same one.
+    '''
+    if not profile_dir:
+        return webdriver.Chrome(options=chrome_options(trace=trace, fast_start=fast_start))
+    os.makedirs(profile_dir, exist_ok=True)
+    with locked_file(profile_dir.rstrip(os.sep) + '.lock'):
+        return webdriver.Chrome(options=chrome_options(trace=trace, profile_dir=free_profile_dir(profile_dir), fast_start=fast_start))
+
+
+def set_consent_cookie(driver, url):
+    '''
+        set_consent_cookie(driver, url) -> None
+        if url is on YouTube, set the cookie YouTube keeps the answer to its consent page in (see CONSENT_COOKIE) in the
+        browser, with one DevTools command and without opening a page first
+    '''
+    host = urlsplit(url).hostname or ''
+    if (host == 'youtube.com') or host.endswith('.youtube.com'):
+        driver.execute_cdp_cmd('Network.setCookie', CONSENT_COOKIE)
+
+
+# parts of the messages of the errors WebDriver raises once the browser or its tab is gone
+SESSION_LOST_MESSAGES = (
+    'invalid session id', 'no such session', 'session deleted', 'chrome not reachable', 'tab crashed', 'page crash',
+    'disconnected', 'target window already closed', 'no such window', 'target frame detached',
+)
+
+
+def is_session_lost_error(err):
+    '''
+        is_session_lost_error(err) -> Bool
+        return True if err is an error raised because the browser session is gone (Chrome or chromedriver died, or the
+        renderer of the tab crashed), rather than an error on the page
+    '''
+    if isinstance(err, (ConnectionError, InvalidSessionIdException, NoSuchWindowException)):
+        return True
+    if (MaxRetryError is not None) and isinstance(err, (MaxRetryError, ProtocolError)):
+        return True
+    message = str(getattr(err, 'msg', None) or err).lower()
+    return any(part in message for part in SESSION_LOST_MESSAGES)
+
+
+def session_alive(driver):
+    '''
+        session_alive(driver) -> Bool
+        return False if the browser session of driver is gone, checked with one round-trip to the browser
+    '''
+    try:
+        driver.execute_script('return 1;')
+    except Exception as err:
+        return not is_session_lost_error(err)
+    return True
+
+
+class BrowserSessionPool:
+    '''
+        BrowserSessionPool(size, trace=False, profile_dir=None, fast_start=False) -> BrowserSessionPool
+        A pool of at most size Chrome sessions (started with create_driver and the options passed in) that are lent out
+        with acquire and given back with release. Sessions are only started when they are needed, a session that is
+        given back is pointed at a blank page (so the video stops playing) and lent out again, and a session that died
+        while it was lent out is dropped and replaced by a new one on the next acquire. The pool is thread-safe.
+    '''
+    def __init__(self, size, trace=False, profile_dir=None, fast_start=False):
+        if size < 1:
+            raise Exception('A browser session pool needs room for at least one session, but size was {}'.format(size))
+        self.size = size
+        self.trace = trace
+        self.profile_dir = profile_dir
+        self.fast_start = fast_start
+        self.condition = threading.Condition()
+        self.idle = []
+        self.sessions = 0
+        self.closed = False
+
+
+    def acquire(self, timeout=None):
+        '''
+            acquire(self, timeout=None) -> selenium.webdriver.Chrome
+            return a free session, starting a new one if there is room in the pool, and waiting up to timeout seconds
+            (forever if it is None) for one to be released otherwise
+        '''
+        while True:
+            with self.condition:
+                if not self.condition.wait_for(lambda: self.closed or self.idle or (self.sessions < self.size), timeout):
+                    raise Exception('No browser session was released within {} seconds'.format(timeout))
+                if self.closed:
+                    raise Exception('The browser session pool is closed')
+                driver = self.idle.pop() if self.idle else None
+                if driver is None:
+                    self.sessions += 1
+            if driver is None:
+                try:
+                    return create_driver(trace=self.trace, profile_dir=self.profile_dir, fast_start=self.fast_start)
+                except BaseException:
+                    self.discard(None)
+                    raise
+            if session_alive(driver):
+                return driver
+            self.discard(driver)
+
+
+    def release(self, driver):
+        '''
+            release(self, driver) -> None
+            give a session back to the pool. A session that is no longer alive (or is released after the pool was closed)
+            is quit instead.
+        '''
+        alive = (not self.closed) and session_alive(driver)
+        if alive:
+            try:
+                driver.get('about:blank')
+            except Exception:
+                alive = False
+        with self.condition:
+            if alive and (not self.closed):
+                self.idle.append(driver)
+                self.condition.notify()
+                return
+        self.discard(driver)
+
+
+    def discard(self, driver):
+        '''
+            discard(self, driver) -> None
+            quit a session (if there is one) and make room in the pool for a new one
+        '''
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        with self.condition:
+            self.sessions -= 1
+            self.condition.notify()
+
+
+    def close(self):
+        '''
+            close(self) -> None
+            quit the sessions that are not lent out, and the others as they are released
+        '''
+        with self.condition:
+            self.closed = True
+            (idle, self.idle) = (self.idle, [])
+            self.condition.notify_all()
+        for driver in idle:
+            self.discard(driver)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
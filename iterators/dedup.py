@@ -0,0 +1,274 @@
+'''
+This module finds near-duplicate comments (i.e. the thousands of copies of the same spam comment under a bot video) in
+the stream of comment threads returned by an iterator, and tags them or leaves them out of the output. Comparing every
+comment with every comment before it would take quadratic time, so each comment is reduced to a MinHash signature of
+its character shingles, and the signatures are kept in a locality-sensitive hashing (LSH) index: the signature is cut
+into bands, and two comments are only compared if one of their bands is the same, which is very likely if they are
+similar and very unlikely if they are not. Each comment costs a fixed amount of work, and the index keeps at most
+max_clusters groups of duplicates (dropping the ones used least recently), so memory stays bounded on videos with a
+million comments.
+'''
+import json
+import random
+import re
+import zlib
+from array import array
+from collections import OrderedDict
+
+
+TAG = 'tag'
+COLLAPSE = 'collapse'
+MODES = (TAG, COLLAPSE)
+SHINGLE_LENGTH = 5
+# a Mersenne prime larger than every hash value, for the hash functions that stand in for permutations
+MERSENNE_PRIME = (1 << 61) - 1
+NON_WORD_PATTERN = re.compile(r'\W+')
+# the maximum number of exact copies (by their text) recorded per cluster, so a cluster of many variants stays small
+MAX_EXACT_KEYS = 64
+
+
+def normalize(text):
+    '''
+        normalize(text) -> Str
+        return the text in lowercase, with punctuation and runs of whitespace replaced by single spaces
+    '''
+    return NON_WORD_PATTERN.sub(' ', text.lower()).strip()
+
+
+def shingles(text, length=SHINGLE_LENGTH):
+    '''
+        shingles(text, length=SHINGLE_LENGTH) -> Set
+        return the set of substrings of text that are length characters long (or the text itself if it is shorter)
+    '''
+    if len(text) <= length:
+        return {text}
+    return {text[start:start + length] for start in range(len(text) - length + 1)}
+
+
+class MinHasher:
+    '''
+        MinHasher(num_perm=64, seed=1) -> MinHasher
+        Computes MinHash signatures of num_perm values. The fraction of positions where the signatures of two sets are
+        equal is an estimate of the Jaccard similarity of the sets. Each position uses a hash function of the form
+        (a * x + b) mod p in place of a random permutation, applied to the CRC-32 of each item (which, unlike hash, is the
+        same in every process, so the same comments always get the same signatures).
+    '''
+    def __init__(self, num_perm=64, seed=1):
+        generator = random.Random(seed)
+        self.num_perm = num_perm
+        self.permutations = [
+            (generator.randrange(1, MERSENNE_PRIME), generator.randrange(0, MERSENNE_PRIME)) for _ in range(num_perm)
+        ]
+
+
+    def signature(self, items):
+        hashes = [zlib.crc32(item.encode('utf-8')) for item in items]
+        return array('Q', [min((a * value + b) % MERSENNE_PRIME for value in hashes) for (a, b) in self.permutations])
+
+
+def similarity(first, second):
+    '''
+        similarity(first, second) -> Float
+        return the estimated Jaccard similarity of the sets two MinHash signatures were computed from
+    '''
+    return sum(1 for (a, b) in zip(first, second) if a == b) / len(first)
+
+
+class DuplicateCluster:
+    '''
+        DuplicateCluster(key, video, link, content, signature, keys) -> DuplicateCluster
+        A group of near-duplicate comments on one video. link and content are those of the first comment in the
+        group, count is the number of comments in it so far, and keys are the entries of the LSH index that point to it.
+    '''
+    def __init__(self, key, video, link, content, signature, keys):
+        self.key = key
+        self.video = video
+        self.link = link
+        self.content = content
+        self.signature = signature
+        self.keys = keys
+        self.count = 1
+
+
+class NearDuplicateIndex:
+    '''
+        NearDuplicateIndex(threshold=0.6, num_perm=64, bands=16, max_clusters=10000, min_length=20) -> NearDuplicateIndex
+        An LSH index of MinHash signatures that groups comments into clusters of near-duplicates. Two comments are in the
+        same cluster if the estimated Jaccard similarity of their shingles is at least threshold. The signature of
+        num_perm values is cut into bands of (num_perm / bands) values; with the defaults, comments that are 80% similar
+        share a band more than 99.9% of the time, comments that are 60% similar about 89% of the time, and comments that
+        are 30% similar about 12% of the time (those are then rejected by comparing their signatures). At most
+        max_clusters clusters are kept, and the cluster used least recently is dropped to make room. Comments shorter
+        than min_length characters (after normalizing) are never treated as duplicates, since short comments like
+        "first" or "nice video" are often written independently.
+    '''
+    def __init__(self, threshold=0.6, num_perm=64, bands=16, max_clusters=10000, min_length=20):
+        if num_perm % bands:
+            raise Exception('The number of permutations ({}) must be a multiple of the number of bands ({})'.format(num_perm, bands))
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_clusters = max_clusters
+        self.min_length = min_length
+        self.clusters = OrderedDict()
+        self.buckets = {}
+        self.cluster_count = 0
+        self.evicted = 0
+
+
+    def find_cluster(self, keys, signature):
+        for key in keys:
+            cluster = self.clusters.get(self.buckets.get(key))
+            if (cluster is not None) and ((signature is None) or (similarity(signature, cluster.signature) >= self.threshold)):
+                return cluster
+        return None
+
+
+    def add(self, content, link=None, video=None):
+        '''
+            add(self, content, link=None, video=None) -> DuplicateCluster
+            add a comment on video to the index and return the cluster it joined if it is a near-duplicate of an earlier
+            comment (the count of the cluster includes it), or None if it is not
+        '''
+        text = normalize(content or '')
+        if len(text) < self.min_length:
+            return None
+        # exact copies are found without computing a signature
+        exact_key = (video, hash(text))
+        cluster = self.find_cluster([exact_key], None)
+        if cluster is None:
+            signature = self.hasher.signature(shingles(text))
+            band_keys = [
+                (video, band, hash(tuple(signature[band * self.rows:(band + 1) * self.rows]))) for band in range(self.bands)
+            ]
+            cluster = self.find_cluster(band_keys, signature)
+            if cluster is None:
+                self.new_cluster(video, link, content, signature, [exact_key] + band_keys)
+                return None
+            if len(cluster.keys) < (self.bands + MAX_EXACT_KEYS):
+                self.buckets[exact_key] = cluster.key
+                cluster.keys.append(exact_key)
+        cluster.count += 1
+        self.clusters.move_to_end(cluster.key)
+        return cluster
+
+
+    def new_cluster(self, video, link, content, signature, keys):
+        self.cluster_count += 1
+        cluster = DuplicateCluster(self.cluster_count, video, link, content, signature, keys)
+        self.clusters[cluster.key] = cluster
+        for key in keys:
+            self.buckets[key] = cluster.key
+        while len(self.clusters) > self.max_clusters:
+            (_, evicted) = self.clusters.popitem(last=False)
+            self.evicted += 1
+            for key in evicted.keys:
+                if self.buckets.get(key) == evicted.key:
+                    del self.buckets[key]
+
+
+    def largest_clusters(self, count=10):
+        '''
+            largest_clusters(self, count=10) -> List
+            return the count clusters (still in the index) with the most comments, largest first
+        '''
+        return sorted((cluster for cluster in self.clusters.values() if cluster.count > 1), key=lambda cluster: -cluster.count)[:count]
+
+
+class NearDuplicateFilter:
+    '''
+        NearDuplicateFilter(iterator, mode='tag', metrics=None, **kwargs) -> NearDuplicateFilter
+        Wraps an iterator of comment threads and finds near-duplicate comments (both the main comments of threads and
+        replies) with a NearDuplicateIndex (the keyword arguments are passed on to it). Comments are compared with the
+        other comments of the same video (threads with a "video url" or "short id" key are grouped by it).
+
+        With mode "tag", every near-duplicate gets a "duplicate of" key with the link of the first comment of its
+        cluster, and a "duplicate count" key with the number of comments in the cluster so far. With mode "collapse",
+        near-duplicates are left out (threads that are near-duplicates are left out along with their replies), so only
+        the first comment of every cluster is returned, and the size of each cluster can be read from largest_clusters
+        or written to a file with write_report afterwards. If metrics (a PerformanceMetrics instance from iterators/metrics.py) is passed in,
+        the number of near-duplicates is counted in near_duplicate_comments_total, and the time spent finding them is
+        recorded as the "deduplication" phase.
+    '''
+    def __init__(self, iterator, mode=TAG, metrics=None, **kwargs):
+        if mode not in MODES:
+            raise Exception('The deduplication mode must be one of {}, not {}'.format(', '.join(MODES), mode))
+        self.iterator = iter(iterator)
+        self.mode = mode
+        self.metrics = metrics
+        self.index = NearDuplicateIndex(**kwargs)
+        self.duplicates = 0
+
+
+    def check(self, comment, video):
+        '''
+            check(self, comment, video) -> Bool
+            add the comment to the index and tag it if it is a near-duplicate. Returns whether it is one.
+        '''
+        cluster = self.index.add(comment.get('comment content'), link=comment.get('link'), video=video)
+        if cluster is None:
+            return False
+        self.duplicates += 1
+        if self.metrics is not None:
+            self.metrics.increment('near_duplicate_comments_total')
+        if self.mode == TAG:
+            comment['duplicate of'] = cluster.link
+            comment['duplicate count'] = cluster.count
+        return True
+
+
+    def process(self, thread):
+        '''
+            process(self, thread) -> Dict
+            return the thread with its near-duplicates tagged or left out, or None if the whole thread is left out
+        '''
+        video = thread.get('video url') or thread.get('short id')
+        if self.check(thread, video) and (self.mode == COLLAPSE):
+            return None
+        children = thread.get('children') or []
+        if children:
+            kept = [child for child in children if not self.check(child, video)]
+            if self.mode == COLLAPSE:
+                thread['children'] = kept
+        return thread
+
+
+    def largest_clusters(self, count=10):
+        return self.index.largest_clusters(count)
+
+
+    def report(self):
+        '''
+            report(self) -> Dict
+            return the number of near-duplicates found, and every cluster of near-duplicates still in the index (largest
+            first) with the video, link and content of its first comment and the number of comments in it
+        '''
+        return {
+            'mode': self.mode,
+            'near duplicates': self.duplicates,
+            'clusters dropped': self.index.evicted,
+            'clusters': [
+                {'video': cluster.video, 'link': cluster.link, 'comment content': cluster.content, 'count': cluster.count}
+                for cluster in self.index.largest_clusters(len(self.index.clusters))
+            ],
+        }
+
+
+    def write_report(self, filename):
+        with open(filename, 'w') as report_file:
+            json.dump(self.report(), report_file, indent=4)
+
+
+    def __iter__(self):
+        for thread in self.iterator:
+            if thread is None:
+                yield None
+                continue
+            if self.metrics is None:
+                thread = self.process(thread)
+            else:
+                with self.metrics.phase('deduplication'):
+                    thread = self.process(thread)
+            if thread is not None:
+                yield thread
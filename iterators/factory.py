@@ -1,29 +1,140 @@
 import re
-from pkgutil import iter_modules
-from importlib import import_module
-from inspect import isclass
+import threading
 from iterators.implementations.abstract_base import ABCIterator
 import iterators.implementations as impl
 
 
-class IteratorFactory:
+# The entry point group that third-party packages register their own iterator classes under, i.e. in pyproject.toml:
+# [project.entry-points."youtube_comment_scraper.iterators"]
+# my_site = "my_package.my_module:MyIterator"
+ENTRY_POINT_GROUP = 'youtube_comment_scraper.iterators'
 
-    def __new__(cls, url, *args, **kwargs):
+
+class IteratorRegistry:
+    '''
+        IteratorRegistry() -> IteratorRegistry
+        The classes that IteratorFactory can create, along with the compiled regular expression (from the regex_pattern
+        method) that each class is matched against. The classes are found the first time they are needed and kept from
+        then on, so the implementation modules are only scanned and imported once per process. Building the registry
+        is guarded by a lock, so it is safe to create iterators from several threads at once.
+    '''
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.loaded = False
+        self.iterators = {}
+        self.patterns = []
+
+
+    def find_implementations(self):
+        '''
+            find_implementations(self) -> Dict
+            return a dictionary mapping class names to the subclasses of ABCIterator in the iterators/implementations/
+            folder, and the classes registered by other packages under the ENTRY_POINT_GROUP entry point group.
+        '''
         # This code dynamically imports all classes from the iterators/implementations/ folder, and puts all imported
-        # subclasses from ABCIterator in the iterators dictionary. This dictionary is iterated over and the url is matched
-        # with the regex pattern respective to that class (by running re.match with the regex returned by the regex_pattern method).
+        # subclasses from ABCIterator in the iterators dictionary.
         # Here is a link to the article where I found the code snippet to go off of:
         # https://julienharbulot.com/python-dynamical-import.html
+        # The modules used for the scan are imported here rather than at the top of the module, since they are only
+        # needed once per process, and importing them slows down the startup of main.py.
+        from pkgutil import iter_modules
+        from importlib import import_module
         iterators = {}
         for (_, module_name, _) in iter_modules(impl.__path__):
             module = import_module(f"iterators.implementations.{module_name}")
             for attribute_name in dir(module):
                 attribute = getattr(module, attribute_name)
                 if (not (attribute is ABCIterator)) and \
-                    (isclass(attribute) and issubclass(attribute, ABCIterator)):
+                    (isinstance(attribute, type) and issubclass(attribute, ABCIterator)):
                     iterators[attribute.__name__] = attribute
-        for category in iterators:
-            if re.match(iterators[category].regex_pattern(), url):
-                return iterators[category](url, *args, **kwargs)
-        raise Exception('The link "{}" is for a site/post/video that does not have an iterator to support scraping it.'.format(url))
+        for entry_point in self.entry_points():
+            attribute = entry_point.load()
+            if isinstance(attribute, type) and issubclass(attribute, ABCIterator):
+                iterators.setdefault(attribute.__name__, attribute)
+        return iterators
+
+
+    @staticmethod
+    def entry_points():
+        '''
+            entry_points() -> List
+            return the entry points registered under ENTRY_POINT_GROUP by installed packages
+        '''
+        from importlib.metadata import entry_points
+        try:
+            return list(entry_points(group=ENTRY_POINT_GROUP))
+        except TypeError:
+            # Python versions before 3.10 return a dictionary of groups instead
+            return list(entry_points().get(ENTRY_POINT_GROUP, []))
+
+
+    def load(self):
+        '''
+            load(self) -> None
+            find and compile the iterator classes if that has not been done yet
+        '''
+        if self.loaded:
+            return
+        with self.lock:
+            if self.loaded:
+                return
+            for iterator_class in self.find_implementations().values():
+                self.add(iterator_class)
+            self.loaded = True
+
+
+    def add(self, iterator_class):
+        '''
+            add(self, iterator_class) -> None
+            add the iterator class to the registry. Classes added later are matched after the classes added before them.
+        '''
+        self.iterators[iterator_class.__name__] = iterator_class
+        self.patterns = [
+            (pattern, existing_class) for (pattern, existing_class) in self.patterns if existing_class.__name__ != iterator_class.__name__
+        ]
+        self.patterns.append((re.compile(iterator_class.regex_pattern()), iterator_class))
+
+
+    def register(self, iterator_class):
+        '''
+            register(self, iterator_class) -> type
+            register an iterator class that is not in the iterators/implementations/ folder and is not registered through
+            an entry point. Returns the class, so this can be used as a class decorator.
+        '''
+        if not (isinstance(iterator_class, type) and issubclass(iterator_class, ABCIterator)):
+            raise Exception('Only subclasses of ABCIterator can be registered, and {} is not one.'.format(iterator_class))
+        self.load()
+        with self.lock:
+            self.add(iterator_class)
+        return iterator_class
+
+
+    def iterator_class_for(self, url):
+        '''
+            iterator_class_for(self, url) -> (anyOf type None)
+            return the iterator class whose regular expression matches the url, or None if no class matches it
+        '''
+        self.load()
+        for (pattern, iterator_class) in self.patterns:
+            if pattern.match(url):
+                return iterator_class
+        return None
+
+
+registry = IteratorRegistry()
+
+
+class IteratorFactory:
+
+    def __new__(cls, url, *args, **kwargs):
+        # The iterator classes are found the first time an iterator is created (see IteratorRegistry above). The url is
+        # matched with the compiled regex pattern of each class, and an instance of the first matching class is returned.
+        iterator_class = registry.iterator_class_for(url)
+        if iterator_class is None:
+            raise Exception('The link "{}" is for a site/post/video that does not have an iterator to support scraping it.'.format(url))
+        return iterator_class(url, *args, **kwargs)
+
 
+    @staticmethod
+    def register(iterator_class):
+        return registry.register(iterator_class)
@@ -19,6 +19,32 @@ class ABCIterator(ABC):
             "You should not see this exception message. Just in case, the problem is that the __next__ method has not been implemented"
         )
 
+    def close(self):
+        # quit the driver and close the logger of the iterator (both of which are safe to call more than once)
+        for method_name in ('quit_driver', 'close_logger'):
+            method = getattr(self, method_name, None)
+            if method is not None:
+                method()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def __del__(self):
+        # an iterator that was never closed (or iterated to the end) would otherwise leave its browser running
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def __aiter__(self):
+        # the iterator is run on a thread of its own, so async for does not block the event loop (see iterators/async_iterator.py)
+        from iterators.async_iterator import AsyncIteratorAdapter
+        return AsyncIteratorAdapter(lambda driver: self)
+
     @staticmethod
     @abstractmethod
     def regex_pattern():
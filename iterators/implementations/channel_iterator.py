@@ -0,0 +1,357 @@
+'''
+This module provides an interface to iterate over the comments on every video of a YouTube channel (the /@name/videos,
+/@name/shorts and /@name/streams tabs) or playlist (playlist?list=...).
+'''
+import os
+import queue
+import threading
+import time
+import traceback
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from iterators.implementations.abstract_base import ABCIterator
+from iterators.metrics import PerformanceMetrics, instrument_driver
+from iterators.progress import ProgressTracker
+from iterators.job_logging import JobLogger
+from iterators.browser import create_driver
+
+
+# the links to the videos on the tabs of a channel (videos and streams, and Shorts) and in a playlist
+VIDEO_LINK_SELECTOR = (
+    'ytd-rich-item-renderer a#video-title-link, ytd-rich-item-renderer a[href*="/shorts/"], '
+    'ytd-playlist-video-renderer a#video-title'
+)
+CONTINUATION_SELECTOR = 'ytd-continuation-item-renderer'
+# Returns the links to videos from position arguments[1] on, and scrolls to the continuation item (or the last video)
+# so that the next page of videos is loaded
+DISCOVERY_SCRIPT = '''
+var links = document.querySelectorAll(arguments[0]);
+var urls = [];
+for (var i = arguments[1]; i < links.length; i++) {
+    urls.push(links[i].href);
+}
+var continuation = document.querySelector(arguments[2]);
+if (continuation) {
+    continuation.scrollIntoView();
+} else if (links.length) {
+    links[links.length - 1].scrollIntoView();
+}
+return {urls: urls, count: links.length, has_more: continuation !== null};
+'''
+# the query parameters that tie a video link to its place in a playlist or to a time in the video
+PLAYLIST_PARAMETERS = ('list', 'index', 'pp', 't', 'start_radio')
+# the files asked for with these iterator options get one file per video, named after the video
+PER_VIDEO_FILE_OPTIONS = ('trace_file', 'snapshot_file')
+
+
+def normalize_video_url(url):
+    '''
+        normalize_video_url(url) -> Str
+        return the link to a video without the query parameters that tie it to a playlist or a time in the video, so that
+        the same video is only scraped once
+    '''
+    parts = urlsplit(url)
+    query = [(name, value) for (name, value) in parse_qsl(parts.query, keep_blank_values=True) if name not in PLAYLIST_PARAMETERS]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ''))
+
+
+def video_id_for(video_url):
+    '''
+        video_id_for(video_url) -> Str
+        return the id of the video at video_url (the v parameter of a watch link, or the last part of the path)
+    '''
+    parts = urlsplit(video_url)
+    video_id = dict(parse_qsl(parts.query)).get('v') or parts.path.rstrip('/').rsplit('/', 1)[-1]
+    return ''.join(character if (character.isalnum() or character in '-_') else '_' for character in video_id)
+
+
+def per_video_filename(filename, video_url):
+    '''
+        per_video_filename(filename, video_url) -> Str
+        return filename with the id of the video added before its extension, i.e. trace.json -> trace-VIDEO_ID.json
+    '''
+    (stem, extension) = os.path.splitext(filename)
+    return f'{stem}-{video_id_for(video_url)}{extension}'
+
+
+def discover_video_urls(driver, url, max_videos=None, timeout=10, poll_interval=0.5, before_continuation=None):
+    '''
+        discover_video_urls(driver, url, max_videos=None, timeout=10, poll_interval=0.5, before_continuation=None) -> Generator
+        load the channel tab or playlist at url and yield the links to its videos as they are found. More videos are
+        loaded (by scrolling to the continuation item) only when the videos found so far have been taken, and the
+        search ends once there is no continuation item left, max_videos videos were found, or no new videos were
+        found for timeout seconds. before_continuation is called before every wait for more videos (i.e. to rate limit
+        the continuation requests).
+    '''
+    driver.get(url)
+    seen = set()
+    position = 0
+    last_found = time.monotonic()
+    while True:
+        result = driver.execute_script(DISCOVERY_SCRIPT, VIDEO_LINK_SELECTOR, position, CONTINUATION_SELECTOR)
+        position = result['count']
+        found = False
+        for link in result['urls']:
+            video_url = normalize_video_url(link)
+            if video_url in seen:
+                continue
+            seen.add(video_url)
+            found = True
+            yield video_url
+            if max_videos and (len(seen) >= max_videos):
+                return
+        if found:
+            last_found = time.monotonic()
+        elif ((not result['has_more']) and (position > 0)) or ((time.monotonic() - last_found) > timeout):
+            return
+        if result['has_more'] and (before_continuation is not None):
+            before_continuation()
+        if not found:
+            time.sleep(poll_interval)
+
+
+class ChannelIterator(ABCIterator):
+    '''
+        ChannelIterator(list_url, workers=2, max_videos=None, iterator_class=None, queue_size=1000, enabled_logging=False, logfile='debug.log', progress_callback=None, rate_limiter=None, **iterator_kwargs) -> Iterator
+        A class that provides an interface to iterate over the comments on every video of a channel or playlist. The
+        links to the videos are found by one browser (loading more of them as they are needed), and handed straight to
+        the scrape workers, each with its own browser and iterator (from IteratorFactory, or iterator_class if it is
+        given), so the first videos are scraped while the rest are still being found. The comment threads are returned
+        as soon as the workers scrape them, so the threads of different videos are interleaved. Every comment thread is
+        a dictionary with the same keys as the threads from the iterator for the video, plus:
+            'video url' - the link to the video the comment thread is on
+
+        Parameters:
+
+            list_url - the link to the channel tab (i.e. https://www.youtube.com/@name/videos) or playlist
+
+            workers - the number of videos scraped at once. The default is 2.
+
+            max_videos - the maximum number of videos to scrape. By default, every video is scraped.
+
+            iterator_class - the iterator class used for every video. By default, the class is picked by IteratorFactory.
+
+            queue_size - the maximum number of comment threads scraped but not yet returned. The workers wait when this
+                    many are waiting. The default is 1000.
+
+            enabled_logging, logfile - as for the other iterators (and passed on to them)
+
+            progress_callback - an optional function that is called with the progress attribute after every comment thread
+
+            rate_limiter - an optional RateLimiter (see iterators/rate_limiter.py) shared by the search for videos and by
+                    the iterators of every video
+
+            iterator_kwargs - all other keyword arguments (i.e. limit, pattern, hours or extraction) are passed on to the
+                    iterator of every video, so limit and the time limits apply to each video. trace_file and
+                    snapshot_file get the id of each video added to their names.
+
+        The state of every video found ('queued', 'scraping', 'done' or 'failed', the number of comment threads
+        returned, and the error if it failed) is kept in the videos attribute, a dictionary keyed by the video links.
+    '''
+    def __init__(self, list_url, workers=2, max_videos=None, iterator_class=None, queue_size=1000, enabled_logging=False, logfile='debug.log',
+                 progress_callback=None, rate_limiter=None, **iterator_kwargs):
+        if workers < 1:
+            raise Exception('A channel needs at least one worker, but workers was {}'.format(workers))
+        if iterator_kwargs.get('driver') is not None:
+            raise Exception('A channel scrapes its videos in browsers of its own, so it cannot be given a driver')
+        self.list_url = list_url
+        self.workers = workers
+        self.max_videos = max_videos
+        self.iterator_class = iterator_class
+        self.enabled_logging = enabled_logging
+        self.log_file = logfile
+        self.rate_limiter = rate_limiter
+        self.iterator_kwargs = dict(iterator_kwargs, enabled_logging=enabled_logging, logfile=logfile, rate_limiter=rate_limiter)
+        self.metrics = PerformanceMetrics()
+        self.progress = ProgressTracker(callback=progress_callback)
+        self.video_urls = queue.Queue()
+        self.results = queue.Queue(maxsize=queue_size)
+        self.stopped = threading.Event()
+        self.threads = []
+        self.finished_workers = 0
+        self.videos = {}
+        self.videos_lock = threading.Lock()
+        self.comment_thread_count = 0
+        self.total_comments_parsed = 0
+        self.started_yet = False
+        self.job_logger = None
+        # every worker puts this in the results when it has no videos left to scrape
+        self.worker_done = object()
+
+
+    @staticmethod
+    def regex_pattern():
+        return r'^https://www\.youtube\.com/((@|c/|channel/|user/)[^/\s?]+/(videos|shorts|streams)/?|playlist\?([^\s]*&)?list=[^\s&]+[^\s]*)$'
+
+
+    def throttle(self, action):
+        '''
+            throttle(self, action) -> None
+            wait for the rate limiter (if there is one) before a request to YouTube, and record the time spent waiting
+            for the action in the metrics
+        '''
+        if self.rate_limiter is not None:
+            waited = self.rate_limiter.acquire(self.list_url)
+            self.metrics.observe('rate_limit_wait_seconds', waited, action=action)
+
+
+    def startup(self):
+        '''
+            startup(self) -> None
+            start the search for videos and the scrape workers
+        '''
+        if self.started_yet:
+            return
+        self.started_yet = True
+        self.job_logger = JobLogger(self.log_file, self.enabled_logging, name=__name__)
+        self.logger = self.job_logger.logger
+        self.progress.start()
+        self.threads = [threading.Thread(target=self.discover, name='channel-discovery', daemon=True)]
+        self.threads += [
+            threading.Thread(target=self.scrape_videos, name=f'channel-worker-{number}', daemon=True) for number in range(self.workers)
+        ]
+        for thread in self.threads:
+            thread.start()
+
+
+    def discover(self):
+        '''
+            discover(self) -> None
+            find the videos of the channel or playlist with a browser of its own, and queue them for the workers as
+            they are found
+        '''
+        driver = None
+        try:
+            with self.metrics.phase('discover'):
+                driver = instrument_driver(create_driver(profile_dir=self.iterator_kwargs.get('profile_dir')), self.metrics)
+                self.throttle('navigation')
+                for video_url in discover_video_urls(driver, self.list_url, self.max_videos, before_continuation=lambda: self.throttle('continuation')):
+                    if self.stopped.is_set():
+                        break
+                    with self.videos_lock:
+                        self.videos[video_url] = {'status': 'queued', 'comment threads': 0, 'error': None}
+                    self.metrics.increment('videos_discovered_total')
+                    self.video_urls.put(video_url)
+        except Exception as err:
+            self.logger.error('failed to find the videos of %s: %s', self.list_url, err)
+        finally:
+            if driver is not None:
+                try:
+                    driver.quit()
+                except Exception as err:
+                    self.logger.exception(err)
+            for _ in range(self.workers):
+                self.video_urls.put(None)
+
+
+    def put_result(self, item):
+        '''
+            put_result(self, item) -> Bool
+            wait for room in the results queue and put the item in it. Returns False if the iterator was stopped first.
+        '''
+        while not self.stopped.is_set():
+            try:
+                self.results.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+    def iterator_for(self, video_url):
+        kwargs = dict(self.iterator_kwargs)
+        for option in PER_VIDEO_FILE_OPTIONS:
+            if kwargs.get(option):
+                kwargs[option] = per_video_filename(kwargs[option], video_url)
+        if self.iterator_class is not None:
+            return self.iterator_class(video_url, **kwargs)
+        from iterators.factory import IteratorFactory
+        return IteratorFactory(video_url, **kwargs)
+
+
+    def scrape_videos(self):
+        '''
+            scrape_videos(self) -> None
+            the loop of a scrape worker: scrape the queued videos one at a time, and put their comment threads (tagged
+            with the link to the video) in the results
+        '''
+        try:
+            while not self.stopped.is_set():
+                video_url = self.video_urls.get()
+                if video_url is None:
+                    break
+                self.scrape_video(video_url)
+        finally:
+            self.put_result(self.worker_done)
+
+
+    def scrape_video(self, video_url):
+        with self.videos_lock:
+            self.videos[video_url]['status'] = 'scraping'
+        iterator = None
+        try:
+            with self.metrics.phase('scrape_video'):
+                iterator = self.iterator_for(video_url)
+                for thread in iterator:
+                    if thread is not None:
+                        thread['video url'] = video_url
+                    if not self.put_result(thread):
+                        break
+        except Exception as err:
+            self.logger.error('failed to scrape %s: %s', video_url, err)
+            self.logger.debug('%s', traceback.format_exc())
+            with self.videos_lock:
+                self.videos[video_url].update(status='failed', error=str(err))
+            self.metrics.increment('videos_scraped_total', status='failed')
+            return
+        finally:
+            if (iterator is not None) and hasattr(iterator, 'close'):
+                try:
+                    iterator.close()
+                except Exception as err:
+                    self.logger.exception(err)
+        with self.videos_lock:
+            self.videos[video_url]['status'] = 'done'
+        self.metrics.increment('videos_scraped_total', status='done')
+
+
+    def close_logger(self):
+        if self.job_logger is not None:
+            self.job_logger.close()
+
+
+    def quit_driver(self):
+        '''
+            quit_driver(self) -> None
+            stop the search for videos and the workers (each worker quits its browser after the comment thread it is on),
+            and wait for them to finish
+        '''
+        self.stopped.set()
+        for thread in self.threads:
+            if thread is not threading.current_thread():
+                thread.join()
+        self.threads = []
+
+
+    def __iter__(self):
+        return self
+
+
+    def __next__(self):
+        if self.stopped.is_set():
+            raise StopIteration
+        self.startup()
+        while self.finished_workers < self.workers:
+            item = self.results.get()
+            if item is self.worker_done:
+                self.finished_workers += 1
+                continue
+            self.comment_thread_count += 1
+            if item is not None:
+                self.total_comments_parsed += 1 + len(item.get('children', []))
+                with self.videos_lock:
+                    self.videos[item['video url']]['comment threads'] += 1
+            self.progress.update(self.total_comments_parsed, self.comment_thread_count)
+            return item
+        self.quit_driver()
+        self.close_logger()
+        raise StopIteration
@@ -1,7 +1,6 @@
 '''
 This module provides an interface to iterate over Youtube Comments for regular YouTube videos (not YouTube shorts).
 '''
-from selenium import webdriver
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
@@ -10,20 +9,56 @@ import re
 import time
 import json
 import datetime
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import TimeoutException
 from functools import wraps
 import logging
 import traceback
 from iterators.implementations.abstract_base import ABCIterator
+from iterators.metrics import PerformanceMetrics, instrument_driver, timed_phase
+from iterators.progress import ProgressTracker
+from iterators.job_logging import BoundedRepr, JobLogger
+from iterators.browser import create_driver, set_consent_cookie
+from iterators.tracing import TraceRecorder
+from iterators.snapshot import HTMLCommentReader, capture_snapshot
+from iterators.thread_failures import DEFAULT_RETRY_ATTEMPTS, FailedThreads, ThreadRetries
+from iterators.output_index import comment_id
+from iterators.session_recovery import DEFAULT_MAX_RESTARTS, SessionRecovery
+from iterators.thread_state import probe_thread_state
 
 
 SECONDS_PER_MINUTE = 60
 SECONDS_PER_HOUR = 3600
+# the number of seconds the fast start waits for the comments section to show the number of comments
+FAST_START_TIMEOUT = 20
+# Scrolls the comments section into view (which is what makes YouTube load it) until the element with the number of
+# comments (arguments[0]) shows up, then calls back with it and the distance scrolled, or with null after arguments[1] seconds
+COMMENTS_SECTION_SCRIPT = '''
+var countSelector = arguments[0];
+var deadline = Date.now() + (arguments[1] * 1000);
+var done = arguments[arguments.length - 1];
+(function poll() {
+    var comments = document.querySelector('ytd-comments#comments');
+    if (comments) {
+        comments.scrollIntoView();
+        window.scrollBy(0, -100);
+    }
+    var count = document.querySelector(countSelector);
+    if (count) {
+        done([count, window.scrollY]);
+        return;
+    }
+    if (Date.now() > deadline) {
+        done(null);
+        return;
+    }
+    setTimeout(poll, 100);
+})();
+'''
 
 
-class CommentIterator(ABCIterator):
+class CommentIterator(SessionRecovery, ThreadRetries, ABCIterator):
     '''
-        CommentIterator(video_url, limit=10, pattern=None, hours=0, minutes=0, seconds=0, enabled_logging=False, logfile='debug.log') -> Iterator
+        CommentIterator(video_url, limit=10, pattern=None, hours=0, minutes=0, seconds=0, enabled_logging=False, logfile='debug.log', progress_callback=None, trace_file=None, extraction='webdriver', snapshot_file=None, rate_limiter=None, retry_attempts=DEFAULT_RETRY_ATTEMPTS, max_restarts=DEFAULT_MAX_RESTARTS, profile_dir=None, fast_start=False, defer_processing=False, driver=None) -> Iterator
         A class that provides an interface to iterate over youtube comments.
         When iterating over an instance of the CommentIterator class, information for one comment
         thread is gathered and returned to you in the form of a dictionary. The dictionary has the following keys:
@@ -66,8 +101,59 @@ class CommentIterator(ABCIterator):
             enabled_logging - when set to true, the logger level is set to the DEBUG level. All logger.debug calls are made.
 
             logfile - the name of the logfile that you want to use to log messages to. By default, the log file name is 'debug.log'
+
+            progress_callback - an optional function that is called with the progress attribute (see below) after every comment thread.
+
+            trace_file - the name of a file to write a trace of the scrape to (see iterators/tracing.py). When it is set, Chrome is
+                    started with its performance log turned on, and the trace (the WebDriver commands, the phases of the scrape, and the
+                    network, page and timeline events in the browser) is written to the file when the driver is quit. By default, no trace is recorded.
+
+            extraction - how the comments are read from the page. With 'webdriver' (the default), the elements of every comment are
+                    found and read through WebDriver. With 'html', the HTML of the newly loaded comment threads is read with a single
+                    script call and parsed in Python (see iterators/snapshot.py), which takes far fewer round-trips to the browser.
+
+            snapshot_file - the name of a file to save a snapshot of the comments section to (the HTML of the element holding the
+                    comment threads) when the driver is quit. Snapshots can be read back without a browser with iterators/snapshot.py.
+
+            rate_limiter - an optional RateLimiter (see iterators/rate_limiter.py) that is consulted before the page is loaded,
+                    before waiting for the next page of comment threads, and before replies are expanded, so that several
+                    iterators (in this process or others) can share a global and per-host request rate. By default, requests are not limited.
+
+            retry_attempts - the number of times a comment thread that failed to scrape is retried (see iterators/thread_failures.py).
+                    A thread that fails is skipped without ending the scrape, and the failed threads are retried through their links
+                    once there are no threads left. The default is 2.
+
+            max_restarts - the number of times a new browser is started when the browser dies during the scrape (see
+                    iterators/session_recovery.py). The video is opened again and fast-forwarded to the last comment thread returned,
+                    so the iteration carries on where it was. The default is 3.
+
+            profile_dir - a directory for Chrome to keep its profile in (see iterators/browser.py), so that the cookies and the HTTP
+                    cache of one scrape are there for the next. By default, every scrape starts with a new profile.
+
+            fast_start - when set to True, Chrome is started maximized with autoplay blocked and sound muted, the consent cookie
+                    is set before the video is opened, the page load returns once the document has been parsed, and the page
+                    is scrolled to the comments section with a single script call, which cuts the time to the first comment.
+
+            defer_processing - when set to True, the pattern is not matched by the iterator, and every comment thread is
+                    returned, so that the matching can be done off the thread driving the browser by a Pipeline (see
+                    iterators/pipeline.py) created with the same pattern.
+
+            driver - a WebDriver session to use instead of starting a new Chrome (i.e. one from a BrowserSessionPool, see
+                    iterators/browser.py). A session passed in is not quit by the iterator, since it belongs to the caller.
+
+        The performance metrics for the scrape (the number and latency of WebDriver commands, and the time spent in each phase
+        of the scrape) are kept in the metrics attribute (see iterators/metrics.py). The progress of the scrape (throughput, the
+        fraction of comments scraped, the estimated time left and the time left on the time limit) is kept in the progress
+        attribute (see iterators/progress.py). The comment threads that failed to scrape, and whether they were recovered or
+        lost, are kept in the failed_threads attribute (failed_threads.stats() sums them up).
     '''
-    def __init__(self, youtube_url, limit=None, pattern=None, hours=0, minutes=0, seconds=0, enabled_logging=False, logfile='debug.log'):
+    def __init__(self, youtube_url, limit=None, pattern=None, hours=0, minutes=0, seconds=0, enabled_logging=False, logfile='debug.log',
+                 progress_callback=None, trace_file=None, extraction='webdriver', snapshot_file=None, rate_limiter=None,
+                 retry_attempts=DEFAULT_RETRY_ATTEMPTS, max_restarts=DEFAULT_MAX_RESTARTS, profile_dir=None, fast_start=False, defer_processing=False, driver=None):
+        if extraction not in ('webdriver', 'html'):
+            raise Exception('Unknown extraction mode {}, expected webdriver or html'.format(extraction))
+        # the time to the first comment is counted from here, so that starting Chrome is included
+        self.created = time.perf_counter()
         self.comment_thread_count = 0
         self.reply_count = 0
         self.hours = hours
@@ -76,7 +162,17 @@ class CommentIterator(ABCIterator):
         self.total_comments_parsed = 0
         self.youtube_url = youtube_url
         self.limit = limit
-        self.driver = webdriver.Chrome()
+        self.metrics = PerformanceMetrics()
+        self.progress = ProgressTracker(callback=progress_callback)
+        self.total_comments = None
+        self.profile_dir = profile_dir
+        self.fast_start = fast_start
+        # a driver that is passed in belongs to the caller (i.e. a BrowserSessionPool), so it is not quit by the iterator
+        self.owns_driver = driver is None
+        self.driver = instrument_driver(
+            driver or create_driver(trace=bool(trace_file), profile_dir=profile_dir, fast_start=fast_start), self.metrics
+        )
+        self.tracer = TraceRecorder(trace_file, self.driver, self.metrics) if trace_file else None
         self.title_selector = '#title > h1 > yt-formatted-string'
         self.current_comment = None
         self.comment_channel_name = None
@@ -85,7 +181,9 @@ class CommentIterator(ABCIterator):
         self.current_reply = None
         self.reply_link = None
         self.reply_channel_name = None
-        self.regex_pattern = pattern
+        # with defer_processing, the pattern is matched by a Pipeline instead (see iterators/pipeline.py)
+        self.regex_pattern = None if defer_processing else pattern
+        self.defer_processing = defer_processing
         self.amount_scrolled = 0
         self.thread_has_pattern = False
         self.parent_comment = None
@@ -103,6 +201,8 @@ class CommentIterator(ABCIterator):
         self.comment_reply_link = f'#contents > ytd-comment-thread-renderer:nth-child({(self.comment_thread_count + 1)}) #replies > ytd-comment-replies-renderer #contents > ytd-comment-renderer:nth-child({(self.reply_count + 1)}) #header-author > yt-formatted-string > a'
         self.more_replies_selector = f'#contents > ytd-comment-thread-renderer:nth-child({(self.comment_thread_count + 1)}) #replies #button > ytd-button-renderer > yt-button-shape > button > yt-touch-feedback-shape > div > div.yt-spec-touch-feedback-shape__fill'
         self.first_reply_selector = f'#contents > ytd-comment-thread-renderer:nth-child({(self.comment_thread_count + 1)}) #replies > ytd-comment-replies-renderer #contents > ytd-comment-renderer:nth-child(1) #content-text'
+        self.rendered_replies_selector = f'#contents > ytd-comment-thread-renderer:nth-child({(self.comment_thread_count + 1)}) #replies > ytd-comment-replies-renderer #contents > ytd-comment-renderer'
+        self.loading_replies_selector = f'#contents > ytd-comment-thread-renderer:nth-child({(self.comment_thread_count + 1)}) #replies ytd-continuation-item-renderer tp-yt-paper-spinner[active]'
         #self.video_author_commenter_selector = f'{self.current_thread_selector} ytd-author-comment-badge-renderer #container #text-container #text'
         #self.reply_video_author_commenter_selector = f'{self.reply_selector} ytd-author-comment-badge-renderer #container #text-container #text'
         self.current_comment_json = {}
@@ -110,6 +210,22 @@ class CommentIterator(ABCIterator):
         self.log_file = logfile
         self.enabled_logging = enabled_logging
         self.driver_started = False
+        self.closed = False
+        self.job_logger = None
+        # replaced by the logger of the job when iteration starts
+        self.logger = logging.getLogger(__name__)
+        self.extraction = extraction
+        self.snapshot_file = snapshot_file
+        self.threads_selector = '#contents > ytd-comment-thread-renderer'
+        self.html_reader = None
+        self.html_threads = []
+        self.rate_limiter = rate_limiter
+        self.failed_threads = FailedThreads(max_attempts=retry_attempts)
+        self.thread_link_selector = '#header-author > yt-formatted-string > a'
+        self.max_restarts = max_restarts
+        self.restarts = 0
+        self.last_thread_link = None
+        self.last_thread_position = 0
 
 
     def log_debug_output(func):
@@ -120,7 +236,7 @@ class CommentIterator(ABCIterator):
         '''
         @wraps(func)
         def log_output(self, *args, **kwargs):
-            self.logger.debug(f'comment number: {(self.comment_thread_count + 1)}, comment info: {self.current_comment_json}')
+            self.logger.debug('comment number: %s, comment info: %s', (self.comment_thread_count + 1), BoundedRepr(self.current_comment_json))
             return func(self, *args, **kwargs)
         return log_output
 
@@ -152,36 +268,125 @@ class CommentIterator(ABCIterator):
             startup steps to start the scraping process.
         '''
         if not self.started_yet:
-            # format string taken from logging documentation: https://docs.python.org/3/library/logging.html
-            FORMAT = '%(asctime)s %(message)s'
-            logging.basicConfig(filename=self.log_file, level=logging.ERROR, format=FORMAT)
-            self.logger = logging.getLogger(__name__)
-            self.started_yet = True
-            self.driver_started = True
-            self.driver.get(self.youtube_url)
-            self.driver.maximize_window()
-            title = WebDriverWait(self.driver, timeout=10, poll_frequency=0.1).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, self.title_selector))
-            )
-            y_pos = title.location_once_scrolled_into_view['y'] - 100
-            ActionChains(self.driver).scroll_by_amount(0,y_pos).perform()
-            self.amount_scrolled += y_pos
-            comment_number = WebDriverWait(self.driver, timeout=10, poll_frequency=0.1).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, self.comment_number_selector))
-            )
-            total_comments = int(''.join(comment_number.text.strip().split(',')))
-            if self.limit == None:
-                self.limit = total_comments
-            self.set_time_limit(self.hours, self.minutes, self.seconds)
-            self.file_handler = logging.FileHandler(self.log_file)
-            self.logger.addHandler(self.file_handler)
-            if self.enabled_logging:
-                self.logger.setLevel(logging.DEBUG)
+            with self.metrics.phase('startup'):
+                self.job_logger = JobLogger(self.log_file, self.enabled_logging, name=__name__)
+                self.logger = self.job_logger.logger
+                self.started_yet = True
+                self.driver_started = True
+                comment_number = self.open_video()
+                total_comments = int(''.join(comment_number.text.strip().split(',')))
+                self.total_comments = total_comments
+                if self.limit == None:
+                    self.limit = total_comments
+                self.set_time_limit(self.hours, self.minutes, self.seconds)
+                self.progress.start(
+                    total_comments=total_comments, limit=self.limit,
+                    time_limit=(self.total_seconds if self.time_limit_exists else None)
+                )
+
+
+    def open_video(self, url=None):
+        '''
+            open_video(self, url=None) -> selenium.webdriver.remote.webelement.WebElement
+            open the video (or url, a link to one of its comments), scroll down to the comments section, and return the
+            element showing the number of comments
+        '''
+        self.throttle('navigation')
+        if self.fast_start:
+            set_consent_cookie(self.driver, url or self.youtube_url)
+        self.driver.get(url or self.youtube_url)
+        if self.fast_start:
+            return self.open_comments_section()
+        self.driver.maximize_window()
+        title = WebDriverWait(self.driver, timeout=10, poll_frequency=0.1).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, self.title_selector))
+        )
+        y_pos = title.location_once_scrolled_into_view['y'] - 100
+        ActionChains(self.driver).scroll_by_amount(0,y_pos).perform()
+        self.amount_scrolled = y_pos
+        return WebDriverWait(self.driver, timeout=10, poll_frequency=0.1).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, self.comment_number_selector))
+        )
+
+
+    def open_comments_section(self):
+        '''
+            open_comments_section(self) -> selenium.webdriver.remote.webelement.WebElement
+            scroll the page to the comments section in one script call, and return the element showing the number of
+            comments (the fast start path of open_video)
+        '''
+        shown = self.driver.execute_async_script(COMMENTS_SECTION_SCRIPT, self.comment_number_selector, FAST_START_TIMEOUT)
+        if shown is None:
+            raise TimeoutException('The number of comments was not shown within {} seconds'.format(FAST_START_TIMEOUT))
+        (comment_number, self.amount_scrolled) = shown
+        return comment_number
+
+
+    def record_first_comment(self):
+        '''
+            record_first_comment(self) -> None
+            record the time from creating the iterator (starting Chrome included) to the first comment thread, the first
+            time it is called, in the progress and in the time_to_first_comment_seconds metric
+        '''
+        if self.progress.time_to_first_comment is None:
+            seconds = time.perf_counter() - self.created
+            self.progress.record_first_comment(seconds)
+            self.metrics.set_gauge('time_to_first_comment_seconds', seconds)
+            self.logger.debug('the first comment thread was scraped %.2f seconds after the iterator was created', seconds)
+
+
+    def close_logger(self):
+        '''
+            close_logger(self) -> None
+            write out the remaining log messages for this iterator and detach its logger (see iterators/job_logging.py)
+        '''
+        if self.job_logger is not None:
+            self.job_logger.close()
+
+
+    def throttle(self, action):
+        '''
+            throttle(self, action) -> None
+            wait for the rate limiter (if there is one) before a request to YouTube, and record the time spent waiting
+            for the action (navigation, continuation or replies) in the metrics
+        '''
+        if self.rate_limiter is not None:
+            waited = self.rate_limiter.acquire(self.youtube_url)
+            self.metrics.observe('rate_limit_wait_seconds', waited, action=action)
+
+
+    def quit_driver(self):
+        '''
+            quit_driver(self) -> None
+            save the snapshot and write the trace (if they were asked for), and quit the driver if it belongs to the
+            iterator (even if iteration never started, since the browser is started when the iterator is created). Only
+            the first call does anything, and the iterator returns no more comment threads after it.
+        '''
+        if self.closed:
+            return
+        self.closed = True
+        if self.snapshot_file and self.driver_started:
+            try:
+                capture_snapshot(self.driver, self.snapshot_file, self.threads_selector, 'regular')
+            except Exception as err:
+                self.logger.exception(err)
+        if self.tracer is not None:
+            try:
+                self.tracer.save()
+            except Exception as err:
+                self.logger.exception(err)
+        if self.owns_driver:
+            try:
+                self.driver.quit()
+            except Exception as err:
+                self.logger.exception(err)
+        self.driver_started = False
 
 
     @staticmethod
     def regex_pattern():
-        return r'^https://www\.youtube\.com/(?!shorts/)[^\.\s]+$'
+        # channel tabs and playlists are left to ChannelIterator
+        return r'^https://www\.youtube\.com/(?!shorts/)(?!playlist\?)(?!(@|c/|channel/|user/)[^/\s?]+/(videos|shorts|streams)/?(\?|$))[^\.\s]+$'
 
 
     def time_to_stop_scraping(self):
@@ -195,12 +400,7 @@ class CommentIterator(ABCIterator):
         '''
         if self.total_comments_parsed >= self.limit:
             return True
-        elif self.time_limit_exists:
-            current_time = datetime.datetime.now()
-            elapsed_time = current_time - self.start_time
-            if (elapsed_time > self.total_time_limit):
-                return True
-        return False
+        return self.time_limit_passed()
 
 
     def get_attribute(self, element, attribute):
@@ -216,18 +416,6 @@ class CommentIterator(ABCIterator):
             return ''
 
 
-    def element_exists(self, css_selector):
-        '''
-            element_exists(self, css_selector) -> Bool
-            a method to check if a css selector exists, returns True if so, False otherwise
-        '''
-        try:
-            self.driver.find_element(By.CSS_SELECTOR, css_selector)
-        except NoSuchElementException:
-            return False
-        return True
-
-
     def reset_elements(self):
         '''
             reset_eleemnts(self) -> None
@@ -263,8 +451,29 @@ class CommentIterator(ABCIterator):
         self.comment_reply_link = f'#contents > ytd-comment-thread-renderer:nth-child({count}) #replies > ytd-comment-replies-renderer #contents > ytd-comment-renderer:nth-child({child_count}) #header-author > yt-formatted-string > a'
         self.more_replies_selector = f'#contents > ytd-comment-thread-renderer:nth-child({count}) #replies #button > ytd-button-renderer > yt-button-shape > button > yt-touch-feedback-shape > div > div.yt-spec-touch-feedback-shape__fill'
         self.first_reply_selector = f'#contents > ytd-comment-thread-renderer:nth-child({count}) #replies > ytd-comment-replies-renderer #contents > ytd-comment-renderer:nth-child(1) #content-text'
+        self.rendered_replies_selector = f'#contents > ytd-comment-thread-renderer:nth-child({count}) #replies > ytd-comment-replies-renderer #contents > ytd-comment-renderer'
+        self.loading_replies_selector = f'#contents > ytd-comment-thread-renderer:nth-child({count}) #replies ytd-continuation-item-renderer tp-yt-paper-spinner[active]'
 
 
+    def thread_state(self):
+        '''
+            thread_state(self) -> iterators.thread_state.ThreadState
+            read the state of the current comment thread with one script call (see iterators/thread_state.py): whether
+            the comment, its replies button, its "less replies" button, the next reply and the "more replies" continuation
+            are there (comment, replies_button, less_replies, next_reply and more_replies), whether more replies are
+            loading (loading), and how many replies have loaded (rendered_replies)
+        '''
+        return probe_thread_state(self.driver, {
+            'comment': self.comment_selector,
+            'replies_button': self.replies_button_selector,
+            'less_replies': self.less_replies_button_selector,
+            'next_reply': self.comment_reply_selector,
+            'more_replies': self.more_replies_selector,
+            'loading': self.loading_replies_selector,
+        }, {'rendered_replies': self.rendered_replies_selector})
+
+
+    @timed_phase('iterate_child')
     @log_debug_output
     def iterate_child(self):
         '''
@@ -275,13 +484,13 @@ class CommentIterator(ABCIterator):
             self.first_reply_comment = WebDriverWait(self.driver, timeout=20, poll_frequency=0.1).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, self.first_reply_selector))
             )
-            more_comments = (self.element_exists(self.comment_reply_selector) or self.element_exists(self.more_replies_selector)) \
-                            and (not self.time_to_stop_scraping())
+            state = self.thread_state()
+            more_comments = (state.next_reply or state.more_replies) and (not self.time_to_stop_scraping())
         except:
             current_comment = self.current_comments_json
             # log these errors if the logger level is set to debug
-            self.logger.debug(f'failed to find replies for comment number {(self.comment_thread_count + 1)} and css selector {self.first_reply_selector}')
-            self.logger.debug(f'comment info for comment number {(self.comment_thread_count + 1)}: {current_comment}')
+            self.logger.debug('failed to find replies for comment number %s and css selector %s', (self.comment_thread_count + 1), self.first_reply_selector)
+            self.logger.debug('comment info for comment number %s: %s', (self.comment_thread_count + 1), BoundedRepr(current_comment))
         else:
             while more_comments:
                 self.current_reply = self.driver.find_element(By.CSS_SELECTOR, self.comment_reply_selector)
@@ -306,18 +515,21 @@ class CommentIterator(ABCIterator):
                 self.reply_count += 1
                 self.total_comments_parsed += 1
                 self.update_selectors((self.comment_thread_count + 1), (self.reply_count + 1))
-                if not self.element_exists(self.comment_reply_selector):
-                    if self.element_exists(self.more_replies_selector):
+                state = self.thread_state()
+                if (not state.next_reply) and (state.more_replies or state.loading):
+                    # only wait when the next replies are loading, or are about to be
+                    if not state.loading:
                         more_replies_button = self.driver.find_element(By.CSS_SELECTOR, self.more_replies_selector)
+                        self.throttle('replies')
                         ActionChains(self.driver).move_to_element(more_replies_button).pause(0.5).click(more_replies_button).perform()
-                        try:
-                            next_comment = WebDriverWait(self.driver, timeout=20, poll_frequency=0.1).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, self.comment_reply_selector))
-                            )
-                        except TimeoutException:
-                            break
-                more_comments = (self.element_exists(self.comment_reply_selector) or self.element_exists(self.more_replies_selector)) and \
-                                (not self.time_to_stop_scraping())
+                    try:
+                        next_comment = WebDriverWait(self.driver, timeout=20, poll_frequency=0.1).until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, self.comment_reply_selector))
+                        )
+                    except TimeoutException:
+                        break
+                    state = self.thread_state()
+                more_comments = (state.next_reply or state.more_replies) and (not self.time_to_stop_scraping())
         finally:
             self.reply_count = 0
             self.comment_thread_count += 1
@@ -336,10 +548,46 @@ class CommentIterator(ABCIterator):
             return resulting_comment
 
 
+    @timed_phase('next_html_thread')
+    def next_html_thread(self):
+        '''
+            next_html_thread(self) -> (anyOf Dict None)
+            return the next comment thread when extraction is 'html'. All of the newly loaded comment threads are read as HTML
+            with one script call, and the replies of a thread are loaded and read with one more, then the HTML is parsed in
+            Python (see iterators/snapshot.py). Like go_to_next, None is returned for threads that do not match the pattern,
+            and StopIteration is raised once there is nothing left to scrape.
+        '''
+        if self.time_to_stop_scraping():
+            raise StopIteration
+        if self.html_reader is None:
+            self.html_reader = HTMLCommentReader(self.driver, self.threads_selector)
+        if not self.html_threads:
+            self.throttle('continuation')
+            self.html_threads = self.html_reader.wait_for_threads(self.comment_thread_count, timeout=20)
+            if not self.html_threads:
+                raise StopIteration
+        (resulting_comment, has_replies) = self.html_threads.pop(0)
+        if has_replies:
+            self.throttle('replies')
+            resulting_comment = self.html_reader.thread_with_replies(self.comment_thread_count) or resulting_comment
+        self.comment_thread_count += 1
+        if self.limit is not None:
+            # as in the webdriver mode, replies past the limit are not scraped
+            resulting_comment['children'] = resulting_comment['children'][:max(0, self.limit - self.total_comments_parsed - 1)]
+        self.total_comments_parsed += 1 + len(resulting_comment['children'])
+        self.logger.debug('comment number: %s, comment info: %s', self.comment_thread_count, BoundedRepr(resulting_comment))
+        if self.regex_pattern:
+            comment_texts = [resulting_comment['comment content']] + [child['comment content'] for child in resulting_comment['children']]
+            if not any(re.search(self.regex_pattern, text, re.IGNORECASE) for text in comment_texts):
+                return None
+        return resulting_comment
+
+
     def __iter__(self):
         return self
 
 
+    @timed_phase('go_to_next')
     def go_to_next(self):
         '''
             iterate_comment_threads(self) -> Dict
@@ -352,65 +600,100 @@ class CommentIterator(ABCIterator):
             that there is nothing left to iterate over.
         '''
         if self.time_to_stop_scraping():
-            self.driver.quit()
-            self.driver_started = False
             raise StopIteration
+        # the next thread not being loaded yet means the page is about to fetch more comments (only checked when
+        # requests are rate limited, since it costs a round-trip)
+        if (self.rate_limiter is not None) and (not self.thread_state().comment):
+            self.throttle('continuation')
+        try:
+            self.current_comment = WebDriverWait(self.driver, timeout=20, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, self.comment_selector))
+            )
+        except:
+            raise StopIteration
+        return self.scrape_thread()
+
+
+    def scrape_thread(self):
+        '''
+            scrape_thread(self) -> (anyOf Dict None)
+            read the comment thread at position self.comment_thread_count + 1 (whose comment element is self.current_comment),
+            expanding and reading its replies, and return it (None if it does not match the pattern)
+        '''
+        self.comment_channel_name = self.driver.find_element(By.CSS_SELECTOR, self.commenter_selector)
+        name = self.comment_channel_name.text.strip()[1:]
+        self.comment_link = self.driver.find_element(By.CSS_SELECTOR, self.comment_link_selector)
+        comment_link = self.get_attribute(self.comment_link, 'href')
+        comment_content = self.current_comment.text.strip()
+        resulting_comment = {
+            'commenter': name,
+            'comment content': comment_content,
+            'link': comment_link,
+            'children': []
+        }
+        y_pos = self.current_comment.location_once_scrolled_into_view['y'] - 100
+        ActionChains(self.driver).scroll_by_amount(0, y_pos).perform()
+        self.amount_scrolled += y_pos
+        self.total_comments_parsed += 1
+        if self.thread_state().replies_button:
+            # a replies button that cannot be clicked fails the thread, so that it is retried later with its replies
+            self.parent_comment = self.current_comment
+            self.parent_comment_pos = self.amount_scrolled
+            self.current_comments_json = resulting_comment
+            self.comment_replies_button = self.driver.find_element(By.CSS_SELECTOR, self.replies_button_selector)
+            self.throttle('replies')
+            ActionChains(self.driver).move_to_element(self.comment_replies_button).pause(0.5).click(self.comment_replies_button).perform()
+            if self.regex_pattern and (not self.thread_has_pattern):
+                comment_match = re.search(self.regex_pattern, resulting_comment['comment content'], re.IGNORECASE)
+                if comment_match:
+                    self.thread_has_pattern = True
+            return self.iterate_child()
         else:
-            try:
-                self.current_comment = WebDriverWait(self.driver, timeout=20, poll_frequency=0.1).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, self.comment_selector))
-                )
-            except:
-                self.driver.quit()
-                self.driver_started = False
-                raise StopIteration
-            self.comment_channel_name = self.driver.find_element(By.CSS_SELECTOR, self.commenter_selector)
-            name = self.comment_channel_name.text.strip()[1:]
-            self.comment_link = self.driver.find_element(By.CSS_SELECTOR, self.comment_link_selector)
-            comment_link = self.get_attribute(self.comment_link, 'href')
-            comment_content = self.current_comment.text.strip()
-            resulting_comment = {
-                'commenter': name,
-                'comment content': comment_content,
-                'link': comment_link,
-                'children': []
-            }
-            y_pos = self.current_comment.location_once_scrolled_into_view['y'] - 100
-            ActionChains(self.driver).scroll_by_amount(0, y_pos).perform()
-            self.amount_scrolled += y_pos
-            self.total_comments_parsed += 1
-            if self.element_exists(self.replies_button_selector):
-                try:
-                    self.parent_comment = self.current_comment
-                    self.parent_comment_pos = self.amount_scrolled
-                    self.current_comments_json = resulting_comment
-                    self.comment_replies_button = self.driver.find_element(By.CSS_SELECTOR, self.replies_button_selector)
-                    ActionChains(self.driver).move_to_element(self.comment_replies_button).pause(0.5).click(self.comment_replies_button).perform()
-                except:
+            self.comment_thread_count += 1
+            self.update_selectors((self.comment_thread_count + 1), (self.reply_count + 1))
+            if self.regex_pattern:
+                comment_match = re.search(self.regex_pattern, resulting_comment['comment content'], re.IGNORECASE)
+                if comment_match:
                     return resulting_comment
                 else:
-                    if self.regex_pattern and (not self.thread_has_pattern):
-                        comment_match = re.search(self.regex_pattern, resulting_comment['comment content'], re.IGNORECASE)
-                        if comment_match:
-                            self.thread_has_pattern = True
-                    return self.iterate_child()
-            else:
-                self.comment_thread_count += 1
-                self.update_selectors((self.comment_thread_count + 1), (self.reply_count + 1))
-                if self.regex_pattern:
-                    comment_match = re.search(self.regex_pattern, resulting_comment['comment content'], re.IGNORECASE)
-                    if comment_match:
-                        return resulting_comment
-                    else:
-                        return None
-                return resulting_comment
+                    return None
+            return resulting_comment
+
+
+    def scrape_next_thread(self):
+        return self.next_html_thread() if self.extraction == 'html' else self.go_to_next()
+
+
+    def scrape_linked_thread(self, link):
+        '''
+            scrape_linked_thread(self, link) -> (anyOf Dict None)
+            open link (a link to a comment, with the "lc" parameter) and scrape the comment thread YouTube shows first,
+            which is the linked one. An exception is raised if the first thread is not the linked one (i.e. it was deleted).
+        '''
+        self.open_video(link)
+        self.comment_thread_count = 0
+        self.reply_count = 0
+        self.reset_elements()
+        self.update_selectors(1, 1)
+        self.current_comment = WebDriverWait(self.driver, timeout=20, poll_frequency=0.1).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, self.comment_selector))
+        )
+        shown_link = self.get_attribute(self.driver.find_element(By.CSS_SELECTOR, self.comment_link_selector), 'href')
+        if comment_id(shown_link) != comment_id(link):
+            raise Exception('The comment linked to by {} was not shown first (the first comment is {})'.format(link, shown_link))
+        return self.scrape_thread()
+
 
     def __next__(self):
+        if self.closed:
+            raise StopIteration
         try:
             self.startup()
-            return self.go_to_next()
+            resulting_comment = self.next_thread()
         except Exception as err:
-            if self.driver_started:
-                self.driver.quit()
-            logging.shutdown()
+            self.quit_driver()
+            self.close_logger()
             raise StopIteration
+        self.record_first_comment()
+        self.progress.update(self.total_comments_parsed, self.comment_thread_count)
+        return resulting_comment
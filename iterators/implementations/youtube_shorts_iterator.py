@@ -1,8 +1,6 @@
 '''
 This module provides an interface to iterate over Youtube Comments for YouTube shorts.
 '''
-import selenium
-from selenium import webdriver
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
@@ -11,20 +9,95 @@ import re
 import time
 import json
 import datetime
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import TimeoutException
 from functools import wraps
 import logging
 import traceback
 from iterators.implementations.abstract_base import ABCIterator
+from iterators.metrics import PerformanceMetrics, instrument_driver, timed_phase
+from iterators.progress import ProgressTracker, parse_comment_count
+from iterators.job_logging import BoundedRepr, JobLogger
+from iterators.browser import create_driver, set_consent_cookie
+from iterators.tracing import TraceRecorder
+from iterators.snapshot import HTMLCommentReader, capture_snapshot
+from iterators.thread_failures import DEFAULT_RETRY_ATTEMPTS, FailedThreads, ThreadRetries, link_with_comment
+from iterators.output_index import comment_id
+from iterators.session_recovery import DEFAULT_MAX_RESTARTS, SessionRecovery
+from iterators.thread_state import probe_thread_state
 
 
 SECONDS_PER_MINUTE = 60
 SECONDS_PER_HOUR = 3600
+# the number of seconds to wait for the next Short of a feed to be shown, before a listed Short is loaded as a new page
+# instead (or, when following the feed, before the feed is taken to have ended)
+FEED_NAVIGATION_TIMEOUT = 10
+# the number of seconds to wait for the comment threads of the next Short to replace those of the last one
+FEED_THREADS_TIMEOUT = 10
+ACTIVE_SHORT_SELECTOR = 'ytd-reel-video-renderer[is-active]'
+# the number of seconds the fast start waits for the comments button and the comments panel
+FAST_START_TIMEOUT = 20
+# Clicks the comments button (arguments[0]) once it shows up, waits for the comments panel (arguments[1]) and styles its
+# scrollbar if arguments[2] is true, then calls back with the label of the button (which holds the number of comments), or
+# with null after arguments[3] seconds
+OPEN_COMMENTS_SCRIPT = '''
+var buttonSelector = arguments[0];
+var panelSelector = arguments[1];
+var stylePanel = arguments[2];
+var deadline = Date.now() + (arguments[3] * 1000);
+var done = arguments[arguments.length - 1];
+var label = null;
+(function poll() {
+    if (label === null) {
+        var button = document.querySelector(buttonSelector);
+        if (button) {
+            label = button.getAttribute('aria-label') || button.textContent;
+            button.click();
+        }
+    }
+    var panel = (label === null) ? null : document.querySelector(panelSelector);
+    if (panel) {
+        if (stylePanel) {
+            panel.style.overflowY = 'scroll';
+            panel.style.scrollbarWidth = 'auto';
+            panel.style.scrollbarColor = 'gray';
+        }
+        done(label);
+        return;
+    }
+    if (Date.now() > deadline) {
+        done(null);
+        return;
+    }
+    setTimeout(poll, 100);
+})();
+'''
+# Navigates to the Short at arguments[0] inside the page, the way YouTube moves between Shorts (the URL is pushed onto the
+# history, and the page is told about it with a popstate event), so the page is not loaded again
+NAVIGATE_SCRIPT = '''
+history.pushState({}, '', arguments[0]);
+window.dispatchEvent(new PopStateEvent('popstate', {state: {}}));
+'''
+# Returns the link of the first comment thread in the elements matching arguments[0], or null if there are none
+FIRST_THREAD_LINK_SCRIPT = '''
+var thread = document.querySelector(arguments[0]);
+var link = thread ? thread.querySelector(arguments[1]) : null;
+return link ? link.href : null;
+'''
+
+
+def short_id_for(url):
+    '''
+        short_id_for(url) -> (anyOf Str None)
+        return the id of the Short that url links to (i.e. "7uctTsKeLdM" for https://www.youtube.com/shorts/7uctTsKeLdM),
+        or None if url is not a link to a Short
+    '''
+    match = re.search(r'/shorts/([^/?#]+)', url or '')
+    return match.group(1) if match else None
 
 
-class YoutubeShortsIterator(ABCIterator):
+class YoutubeShortsIterator(SessionRecovery, ThreadRetries, ABCIterator):
     '''
-        YoutubeShortsIterator(video_url, limit=10, pattern=None, hours=0, minutes=0, seconds=0, enabled_logging=False, logfile='debug.log') -> Iterator
+        YoutubeShortsIterator(video_url, limit=10, pattern=None, hours=0, minutes=0, seconds=0, enabled_logging=False, logfile='debug.log', progress_callback=None, trace_file=None, extraction='webdriver', snapshot_file=None, rate_limiter=None, retry_attempts=DEFAULT_RETRY_ATTEMPTS, max_restarts=DEFAULT_MAX_RESTARTS, feed_urls=None, follow_feed=False, max_shorts=None, profile_dir=None, fast_start=False, defer_processing=False, driver=None) -> Iterator
         A class that provides an interface to iterate over youtube comments.
         When iterating over an instance of the CommentIterator class, information for one comment
         thread is gathered and returned to you in the form of a dictionary. The dictionary has the following keys:
@@ -67,8 +140,75 @@ class YoutubeShortsIterator(ABCIterator):
             enabled_logging - when set to true, the logger level is set to the DEBUG level. All logger.debug calls are made.
 
             logfile - the name of the logfile that you want to use to log messages to. By default, the log file name is 'debug.log'
+
+            progress_callback - an optional function that is called with the progress attribute (see below) after every comment thread.
+
+            trace_file - the name of a file to write a trace of the scrape to (see iterators/tracing.py). When it is set, Chrome is
+                    started with its performance log turned on, and the trace (the WebDriver commands, the phases of the scrape, and the
+                    network, page and timeline events in the browser) is written to the file when the driver is quit. By default, no trace is recorded.
+
+            extraction - how the comments are read from the page. With 'webdriver' (the default), the elements of every comment are
+                    found and read through WebDriver. With 'html', the HTML of the newly loaded comment threads is read with a single
+                    script call and parsed in Python (see iterators/snapshot.py), which takes far fewer round-trips to the browser.
+
+            snapshot_file - the name of a file to save a snapshot of the comments section to (the HTML of the element holding the
+                    comment threads) when the driver is quit. Snapshots can be read back without a browser with iterators/snapshot.py.
+
+            rate_limiter - an optional RateLimiter (see iterators/rate_limiter.py) that is consulted before the page is loaded,
+                    before waiting for the next page of comment threads, and before replies are expanded, so that several
+                    iterators (in this process or others) can share a global and per-host request rate. By default, requests are not limited.
+
+            retry_attempts - the number of times a comment thread that failed to scrape is retried (see iterators/thread_failures.py).
+                    A thread that fails is skipped without ending the scrape, and the failed threads are retried through their links
+                    once there are no threads left. The default is 2.
+
+            max_restarts - the number of times a new browser is started when the browser dies during the scrape (see
+                    iterators/session_recovery.py). The Short is opened again and fast-forwarded to the last comment thread returned,
+                    so the iteration carries on where it was. The default is 3.
+
+            feed_urls - a list of links to more Shorts to scrape after the one at video_url. The iterator moves on to each of them
+                    inside the same page, the way the Shorts feed does (see next_short), instead of loading a new page, and reuses
+                    the comments panel that is already open. If a Short cannot be shown that way, it is loaded as a new page.
+
+            follow_feed - when set to True, the iterator keeps moving on to the next Short in the feed (with the next video button)
+                    once the Shorts in feed_urls are done, until the feed ends, max_shorts Shorts have been scraped or the time
+                    limit has passed.
+
+            max_shorts - the maximum number of Shorts to scrape in feed mode (counting the one at video_url). By default, there
+                    is no maximum.
+
+            profile_dir - a directory for Chrome to keep its profile in (see iterators/browser.py), so that the cookies and the HTTP
+                    cache of one scrape are there for the next. By default, every scrape starts with a new profile.
+
+            fast_start - when set to True, Chrome is started maximized with autoplay blocked and sound muted, so the Short is not
+                    paused and muted, the consent cookie is set before the Short is opened, the page load returns once the
+                    document has been parsed, and the comments panel is opened and styled with a single script call, which cuts
+                    the time to the first comment.
+
+            defer_processing - when set to True, the pattern is not matched by the iterator, and every comment thread is
+                    returned, so that the matching can be done off the thread driving the browser by a Pipeline (see
+                    iterators/pipeline.py) created with the same pattern.
+
+            driver - a WebDriver session to use instead of starting a new Chrome (i.e. one from a BrowserSessionPool, see
+                    iterators/browser.py). A session passed in is not quit by the iterator, since it belongs to the caller.
+
+        In feed mode (when feed_urls or follow_feed is given), the limit applies to each Short, the time limit applies to the
+        whole feed, and each comment thread has the extra key 'short id', the id of the Short it is on (see short_id_for).
+
+        The performance metrics for the scrape (the number and latency of WebDriver commands, and the time spent in each phase
+        of the scrape) are kept in the metrics attribute (see iterators/metrics.py). The progress of the scrape (throughput, the
+        fraction of comments scraped, the estimated time left and the time left on the time limit) is kept in the progress
+        attribute (see iterators/progress.py). The comment threads that failed to scrape, and whether they were recovered or
+        lost, are kept in the failed_threads attribute (failed_threads.stats() sums them up).
     '''
-    def __init__(self, video_url, limit=None, pattern=None, hours=0, minutes=0, seconds=0, enabled_logging=False, logfile='debug.log'):
+    def __init__(self, video_url, limit=None, pattern=None, hours=0, minutes=0, seconds=0, enabled_logging=False, logfile='debug.log',
+                 progress_callback=None, trace_file=None, extraction='webdriver', snapshot_file=None, rate_limiter=None,
+                 retry_attempts=DEFAULT_RETRY_ATTEMPTS, max_restarts=DEFAULT_MAX_RESTARTS, feed_urls=None, follow_feed=False, max_shorts=None,
+                 profile_dir=None, fast_start=False, defer_processing=False, driver=None):
+        if extraction not in ('webdriver', 'html'):
+            raise Exception('Unknown extraction mode {}, expected webdriver or html'.format(extraction))
+        # the time to the first comment is counted from here, so that starting Chrome is included
+        self.created = time.perf_counter()
         self.comment_thread_count = 0
         self.reply_count = 0
         self.hours = hours
@@ -77,7 +217,17 @@ class YoutubeShortsIterator(ABCIterator):
         self.total_comments_parsed = 0
         self.video_url = video_url
         self.limit = limit
-        self.driver = webdriver.Chrome()
+        self.metrics = PerformanceMetrics()
+        self.progress = ProgressTracker(callback=progress_callback)
+        self.total_comments = None
+        self.profile_dir = profile_dir
+        self.fast_start = fast_start
+        # a driver that is passed in belongs to the caller (i.e. a BrowserSessionPool), so it is not quit by the iterator
+        self.owns_driver = driver is None
+        self.driver = instrument_driver(
+            driver or create_driver(trace=bool(trace_file), profile_dir=profile_dir, fast_start=fast_start), self.metrics
+        )
+        self.tracer = TraceRecorder(trace_file, self.driver, self.metrics) if trace_file else None
         self.title_selector = '#title > h1 > yt-formatted-string'
         self.current_comment = None
         self.comment_channel_name = None
@@ -86,7 +236,9 @@ class YoutubeShortsIterator(ABCIterator):
         self.current_reply = None
         self.reply_link = None
         self.reply_channel_name = None
-        self.regex_pattern = pattern
+        # with defer_processing, the pattern is matched by a Pipeline instead (see iterators/pipeline.py)
+        self.regex_pattern = None if defer_processing else pattern
+        self.defer_processing = defer_processing
         self.amount_scrolled = 0
         self.thread_has_pattern = False
         self.parent_comment = None
@@ -117,11 +269,44 @@ class YoutubeShortsIterator(ABCIterator):
                                     'ytd-comment-renderer:nth-child(1) #content-text'
         self.more_replies_selector = f'{self.current_thread_selector} #replies #expander #expander-contents #contents > '\
                                     'ytd-continuation-item-renderer #button ytd-button-renderer yt-button-shape button'
+        self.rendered_replies_selector = f'{self.current_thread_selector} #replies #expander #expander-contents #contents > ytd-comment-renderer'
+        self.loading_replies_selector = f'{self.current_thread_selector} #replies ytd-continuation-item-renderer tp-yt-paper-spinner[active]'
         self.current_comment_json = {}
         self.started_yet = False
         self.log_file = logfile
         self.enabled_logging = enabled_logging
         self.driver_started = False
+        self.closed = False
+        self.job_logger = None
+        # replaced by the logger of the job when iteration starts
+        self.logger = logging.getLogger(__name__)
+        self.extraction = extraction
+        self.snapshot_file = snapshot_file
+        self.threads_selector = f'{self.comment_box_selector} > ytd-comment-thread-renderer'
+        self.html_reader = None
+        self.html_threads = []
+        self.rate_limiter = rate_limiter
+        self.failed_threads = FailedThreads(max_attempts=retry_attempts)
+        self.thread_link_selector = '#body #main #header-author yt-formatted-string a'
+        self.max_restarts = max_restarts
+        self.restarts = 0
+        self.last_thread_link = None
+        self.last_thread_position = 0
+        self.feed_urls = list(feed_urls or [])
+        self.follow_feed = follow_feed
+        self.max_shorts = max_shorts
+        self.feed_mode = bool(self.feed_urls) or follow_feed
+        self.short_id = short_id_for(video_url)
+        self.shorts_scraped = 1
+        # the comments and comment threads parsed on the Shorts before the current one
+        self.short_start_comments = 0
+        self.feed_threads_parsed = 0
+        if self.feed_mode:
+            # the feed keeps the Shorts next to the one being watched on the page too
+            self.play_button_selector = f'{ACTIVE_SHORT_SELECTOR} {self.play_button_selector}'
+            self.mute_button_selector = f'{ACTIVE_SHORT_SELECTOR} {self.mute_button_selector}'
+            self.expand_comments_button = f'{ACTIVE_SHORT_SELECTOR} {self.expand_comments_button}'
+        self.next_short_button_selector = '#navigation-button-down button'
 
 
     @staticmethod
@@ -129,6 +314,54 @@ class YoutubeShortsIterator(ABCIterator):
         return r'^https://www\.youtube\.com/(shorts\/)[^\.\s]+$'
 
 
+    def close_logger(self):
+        '''
+            close_logger(self) -> None
+            write out the remaining log messages for this iterator and detach its logger (see iterators/job_logging.py)
+        '''
+        if self.job_logger is not None:
+            self.job_logger.close()
+
+
+    def throttle(self, action):
+        '''
+            throttle(self, action) -> None
+            wait for the rate limiter (if there is one) before a request to YouTube, and record the time spent waiting
+            for the action (navigation, continuation or replies) in the metrics
+        '''
+        if self.rate_limiter is not None:
+            waited = self.rate_limiter.acquire(self.video_url)
+            self.metrics.observe('rate_limit_wait_seconds', waited, action=action)
+
+
+    def quit_driver(self):
+        '''
+            quit_driver(self) -> None
+            save the snapshot and write the trace (if they were asked for), and quit the driver if it belongs to the
+            iterator (even if iteration never started, since the browser is started when the iterator is created). Only
+            the first call does anything, and the iterator returns no more comment threads after it.
+        '''
+        if self.closed:
+            return
+        self.closed = True
+        if self.snapshot_file and self.driver_started:
+            try:
+                capture_snapshot(self.driver, self.snapshot_file, self.threads_selector, 'shorts')
+            except Exception as err:
+                self.logger.exception(err)
+        if self.tracer is not None:
+            try:
+                self.tracer.save()
+            except Exception as err:
+                self.logger.exception(err)
+        if self.owns_driver:
+            try:
+                self.driver.quit()
+            except Exception as err:
+                self.logger.exception(err)
+        self.driver_started = False
+
+
     def get_selector(self, css_selector, wait_time=10):
         '''
             get_selector(self, css_selector, wait_time) -> selenium.webdriver.remote.webelement.WebElement
@@ -144,24 +377,6 @@ class YoutubeShortsIterator(ABCIterator):
         return element_to_find
 
 
-    def element_exists(self, css_selector, wait_time=5):
-        '''
-            element_exists(self, css_selector) -> Bool
-            a method to check if a css selector exists, returns True if so, False otherwise. You can
-            also specify a wait time to wait till the exception is thrown using the wait_time keyword
-            argument (default is 5 seconds).
-        '''
-        try:
-            element_to_find = WebDriverWait(self.driver, timeout=wait_time, poll_frequency=0.1).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, css_selector))
-            )
-        except (NoSuchElementException, selenium.common.exceptions.TimeoutException) as err:
-            self.logger.debug(f'element with css selector {css_selector} was not found')
-            return False
-        else:
-            return True
-
-
     def get_attribute(self, element, attribute):
         '''
             get_attribute(self, element, attribute) -> Str
@@ -236,7 +451,7 @@ class YoutubeShortsIterator(ABCIterator):
             self.driver.execute_script(f'document.querySelector("{self.comment_box_selector}").style.scrollbarWidth = "auto";')
             self.driver.execute_script(f'document.querySelector("{self.comment_box_selector}").style.scrollbarColor = "gray";')
         except Exception as err:
-            self.logger.debug('Error with javascript in change_scrollbar_style function: {err}')
+            self.logger.debug('Error with javascript in change_scrollbar_style function: %s', err)
             self.logger.exception(err)
 
 
@@ -247,30 +462,173 @@ class YoutubeShortsIterator(ABCIterator):
         '''
         @wraps(func)
         def setup_beforehand(self, *args, **kwargs):
+            if self.closed:
+                raise StopIteration
             if not self.started_yet:
-                # format string taken from logging documentation: https://docs.python.org/3/library/logging.html
-                FORMAT = '%(asctime)s %(message)s'
-                logging.basicConfig(filename=self.log_file, level=logging.ERROR, format=FORMAT)
-                self.logger = logging.getLogger(__name__)
-                self.file_handler = logging.FileHandler(self.log_file)
-                self.logger.addHandler(self.file_handler)
-                if self.enabled_logging:
-                    self.logger.setLevel(logging.DEBUG)
+                with self.metrics.phase('setup'):
+                    self.job_logger = JobLogger(self.log_file, self.enabled_logging, name=__name__)
+                    self.logger = self.job_logger.logger
                     self.logger.debug('Set logger in setup')
-                self.started_yet = True
-                self.driver_started = True
-                self.driver.get(self.video_url)
-                self.driver.maximize_window()
-                self.pause_video()
-                self.mute_video()
-                expand_comments_button = self.get_selector(self.expand_comments_button)
-                expand_comments_button.click()
-                self.change_scrollbar_style()
-                self.set_time_limit(self.hours, self.minutes, self.seconds)
+                    self.started_yet = True
+                    self.driver_started = True
+                    self.open_video()
+                    self.set_time_limit(self.hours, self.minutes, self.seconds)
+                    self.progress.start(
+                        total_comments=self.total_comments, limit=self.limit,
+                        time_limit=(self.total_seconds if self.time_limit_exists else None)
+                    )
             return func(self, *args, **kwargs)
         return setup_beforehand
 
 
+    def open_video(self, url=None):
+        '''
+            open_video(self, url=None) -> None
+            open the Short (or url, a link to it with one of its comments highlighted), pause and mute it, and open the
+            comments panel
+        '''
+        self.throttle('navigation')
+        if self.fast_start:
+            set_consent_cookie(self.driver, url or self.video_url)
+        self.driver.get(url or self.video_url)
+        if not self.fast_start:
+            self.driver.maximize_window()
+        self.open_comments()
+
+
+    def open_comments(self, style_panel=True):
+        '''
+            open_comments(self, style_panel=True) -> None
+            pause and mute the Short being shown, and open its comments panel. The scrollbar of the panel is styled if
+            style_panel is True (it keeps its style when the feed moves on to the next Short). In fast start mode, the Short
+            is already paused and muted, and the panel is opened with one script call.
+        '''
+        if self.fast_start:
+            label = self.driver.execute_async_script(
+                OPEN_COMMENTS_SCRIPT, self.expand_comments_button, self.comment_box_selector, style_panel, FAST_START_TIMEOUT
+            )
+            if label is None:
+                raise TimeoutException('The comments of {} could not be opened within {} seconds'.format(self.video_url, FAST_START_TIMEOUT))
+            self.total_comments = parse_comment_count(label)
+            return
+        self.pause_video()
+        self.mute_video()
+        expand_comments_button = self.get_selector(self.expand_comments_button)
+        # the comments button shows the (rounded) number of comments on the Short, i.e. "1.2K"
+        self.total_comments = parse_comment_count(
+            self.get_attribute(expand_comments_button, 'aria-label') or self.get_attribute(expand_comments_button, 'textContent')
+        )
+        expand_comments_button.click()
+        if style_panel:
+            self.change_scrollbar_style()
+
+
+    def next_short(self):
+        '''
+            next_short(self) -> Bool
+            move on to the next Short in feed mode, and get ready to scrape it. The Shorts in feed_urls are shown first, then
+            (if follow_feed is True) the next Shorts in the feed. Returns False if there is no next Short, the time limit has
+            passed or max_shorts Shorts have been scraped. A listed Short that cannot be shown is skipped.
+        '''
+        while self.feed_mode and not self.time_limit_passed():
+            if (self.max_shorts is not None) and (self.shorts_scraped >= self.max_shorts):
+                return False
+            if self.feed_urls:
+                url = self.feed_urls.pop(0)
+            elif self.follow_feed:
+                url = None
+            else:
+                return False
+            try:
+                with self.metrics.phase('next_short'):
+                    shown = self.show_short(url)
+            except Exception as err:
+                self.logger.exception(err)
+                shown = False
+            if shown:
+                self.start_short()
+                return True
+            if url is None:
+                self.logger.debug('the feed has no Short after %s', self.video_url)
+                return False
+            self.logger.error('the Short at %s could not be shown, so it is skipped', url)
+        return False
+
+
+    def show_short(self, url=None):
+        '''
+            show_short(self, url=None) -> Bool
+            show the Short at url (or, without a url, the next Short in the feed) and open its comments, reusing the comments
+            panel of the last one. A listed Short is loaded as a new page if it is not shown in time. Returns False if the
+            feed has no next Short.
+        '''
+        old_short = self.get_selector(ACTIVE_SHORT_SELECTOR)
+        old_link = self.driver.execute_script(FIRST_THREAD_LINK_SCRIPT, self.threads_selector, self.thread_link_selector)
+        self.throttle('navigation')
+        if url is None:
+            self.get_selector(self.next_short_button_selector).click()
+        else:
+            self.driver.execute_script(NAVIGATE_SCRIPT, url)
+        try:
+            # the Short being watched is replaced once the next one has been fetched
+            WebDriverWait(self.driver, timeout=FEED_NAVIGATION_TIMEOUT, poll_frequency=0.1).until(
+                lambda driver: driver.find_element(By.CSS_SELECTOR, ACTIVE_SHORT_SELECTOR) != old_short
+            )
+        except TimeoutException:
+            if url is None:
+                return False
+            self.logger.debug('the Short at %s was not shown in the feed, so it is loaded as a new page', url)
+            self.video_url = url
+            self.open_video()
+            return True
+        self.video_url = url or self.driver.current_url
+        self.open_comments(style_panel=False)
+        try:
+            WebDriverWait(self.driver, timeout=FEED_THREADS_TIMEOUT, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script(FIRST_THREAD_LINK_SCRIPT, self.threads_selector, self.thread_link_selector) not in (None, old_link)
+            )
+        except TimeoutException:
+            # a Short without comments (the scrape of it stops at the first thread)
+            pass
+        return True
+
+
+    def start_short(self):
+        '''
+            start_short(self) -> None
+            reset the position of the iterator (and what it remembers about the last Short) for the Short that was just shown
+        '''
+        self.short_id = short_id_for(self.video_url)
+        self.shorts_scraped += 1
+        self.metrics.increment('shorts_scraped_total')
+        self.feed_threads_parsed += self.comment_thread_count
+        self.short_start_comments = self.total_comments_parsed
+        self.comment_thread_count = 0
+        self.reply_count = 0
+        self.reset_elements()
+        self.update_selectors(1, 1)
+        self.html_reader = None
+        self.html_threads = []
+        self.last_thread_link = None
+        self.last_thread_position = 0
+        self.failed_threads.retrying = False
+        self.failed_threads.succeeded()
+        self.logger.debug('scraping Short %s (%s)', self.shorts_scraped, self.video_url)
+
+
+    def record_first_comment(self):
+        '''
+            record_first_comment(self) -> None
+            record the time from creating the iterator (starting Chrome included) to the first comment thread, the first
+            time it is called, in the progress and in the time_to_first_comment_seconds metric
+        '''
+        if self.progress.time_to_first_comment is None:
+            seconds = time.perf_counter() - self.created
+            self.progress.record_first_comment(seconds)
+            self.metrics.set_gauge('time_to_first_comment_seconds', seconds)
+            self.logger.debug('the first comment thread was scraped %.2f seconds after the iterator was created', seconds)
+
+
     def reset_elements(self):
         '''
             reset_eleemnts(self) -> None
@@ -312,10 +670,30 @@ class YoutubeShortsIterator(ABCIterator):
                                     'ytd-comment-renderer:nth-child(1) #content-text'
         self.more_replies_selector = f'{self.current_thread_selector} #replies #expander #expander-contents #contents > '\
                                     'ytd-continuation-item-renderer #button ytd-button-renderer yt-button-shape button'
+        self.rendered_replies_selector = f'{self.current_thread_selector} #replies #expander #expander-contents #contents > ytd-comment-renderer'
+        self.loading_replies_selector = f'{self.current_thread_selector} #replies ytd-continuation-item-renderer tp-yt-paper-spinner[active]'
         self.video_author_commenter_selector = f'{self.current_thread_selector} ytd-author-comment-badge-renderer #container #text-container #text'
         self.reply_video_author_commenter_selector = f'{self.reply_selector} ytd-author-comment-badge-renderer #container #text-container #text'
 
 
+    def thread_state(self):
+        '''
+            thread_state(self) -> iterators.thread_state.ThreadState
+            read the state of the current comment thread with one script call and without waiting (see
+            iterators/thread_state.py): whether the thread, its replies button, its "less replies" button, the next reply
+            and the "more replies" continuation are there (thread, replies_button, less_replies, next_reply and
+            more_replies), whether more replies are loading (loading), and how many replies have loaded (rendered_replies)
+        '''
+        return probe_thread_state(self.driver, {
+            'thread': self.current_thread_selector,
+            'replies_button': self.expand_replies_selector,
+            'less_replies': self.less_replies_selector,
+            'next_reply': self.reply_text_selector,
+            'more_replies': self.more_replies_selector,
+            'loading': self.loading_replies_selector,
+        }, {'rendered_replies': self.rendered_replies_selector})
+
+
     def time_to_stop_scraping(self):
         '''
             time_to_stop_scraping(self) -> Bool
@@ -325,15 +703,10 @@ class YoutubeShortsIterator(ABCIterator):
             time limit, then we return True (indicating we should stop scraping comments).
             Otherwise, return False.
         '''
-        if self.limit != None and self.total_comments_parsed >= self.limit:
+        if self.limit != None and (self.total_comments_parsed - self.short_start_comments) >= self.limit:
         #if self.total_comments_parsed >= 30:
             return True
-        elif self.time_limit_exists:
-            current_time = datetime.datetime.now()
-            elapsed_time = current_time - self.start_time
-            if (elapsed_time > self.total_time_limit):
-                return True
-        return False
+        return self.time_limit_passed()
 
 
     def log_debug_output(func):
@@ -344,9 +717,7 @@ class YoutubeShortsIterator(ABCIterator):
         '''
         @wraps(func)
         def log_output(self, *args, **kwargs):
-            if self.enabled_logging:
-                self.logger.setLevel(logging.DEBUG)
-            self.logger.debug(f'comment number: {(self.comment_thread_count + 1)}, comment info: {self.current_comment_json}')
+            self.logger.debug('comment number: %s, comment info: %s', (self.comment_thread_count + 1), BoundedRepr(self.current_comment_json))
             return func(self, *args, **kwargs)
         return log_output
 
@@ -359,6 +730,7 @@ class YoutubeShortsIterator(ABCIterator):
         return self.driver.execute_script(f'return document.querySelector("{self.comment_box_selector}").scrollTop;')
 
 
+    @timed_phase('scroll_to_top')
     def scroll_to_top(self, css_selector):
         '''
             scroll_to_top(self, element) -> None
@@ -381,16 +753,17 @@ class YoutubeShortsIterator(ABCIterator):
             javascript_code = f'document.querySelector("{css_selector}").scrollIntoView(true);'
             if portion_of_page_elem_location < 0.5:
                 javascript_code = f'document.querySelector("{css_selector}").scrollBy(0, {scroll_height});'
-            self.logger.debug(f'Container height: {container_height}')
-            self.logger.debug(f'Container scroll height: {scroll_height}')
-            self.logger.debug(f'Element offsetTop value: {distance_from_parent}')
-            self.logger.debug(f'JavaScript code: {javascript_code}')
+            self.logger.debug(
+                'Container height: %s, container scroll height: %s, element offsetTop value: %s, JavaScript code: %s',
+                container_height, scroll_height, distance_from_parent, javascript_code
+            )
             try:
                 self.driver.execute_script(javascript_code)
             except Exception as err:
                 self.logger.exception(err)
 
 
+    @timed_phase('iterate_child')
     def iterate_child(self):
         '''
             iterate_child(self) -> (anyOf Dict None)
@@ -399,13 +772,13 @@ class YoutubeShortsIterator(ABCIterator):
         self.total_comments_parsed += 1
         try:
             self.first_reply_comment = self.get_selector(self.first_reply_selector, wait_time=20)
-            more_comments = (self.element_exists(self.reply_selector) or self.element_exists(self.more_replies_selector)) and \
-                            (not self.time_to_stop_scraping())
+            state = self.thread_state()
+            more_comments = (state.next_reply or state.more_replies) and (not self.time_to_stop_scraping())
         except:
             current_comment = self.current_comments_json
             # log these errors if the logger level is set to debug
-            self.logger.debug(f'failed to find replies for comment number {(self.comment_thread_count + 1)} and css selector {self.first_reply_selector}')
-            self.logger.debug(f'comment info for comment number {(self.comment_thread_count + 1)}: {current_comment}')
+            self.logger.debug('failed to find replies for comment number %s and css selector %s', (self.comment_thread_count + 1), self.first_reply_selector)
+            self.logger.debug('comment info for comment number %s: %s', (self.comment_thread_count + 1), BoundedRepr(current_comment))
         else:
             while more_comments:
                 self.current_reply = self.driver.find_element(By.CSS_SELECTOR, self.reply_text_selector)
@@ -433,17 +806,19 @@ class YoutubeShortsIterator(ABCIterator):
                 self.reply_count += 1
                 self.total_comments_parsed += 1
                 self.update_selectors((self.comment_thread_count + 1), (self.reply_count + 1))
-                if not self.element_exists(self.reply_text_selector, wait_time=0.1):
-                    if self.element_exists(self.more_replies_selector, wait_time=0.1):
+                state = self.thread_state()
+                if (not state.next_reply) and (state.more_replies or state.loading):
+                    # only wait when the next replies are loading, or are about to be
+                    if not state.loading:
                         more_replies_button = self.driver.find_element(By.CSS_SELECTOR, self.more_replies_selector)
+                        self.throttle('replies')
                         ActionChains(self.driver).move_to_element(more_replies_button).pause(0.5).click(more_replies_button).perform()
-                        try:
-                            next_comment = self.get_selector(self.reply_text_selector, wait_time=20)
-                        except TimeoutException:
-                            break
-                more_comments = (self.element_exists(self.reply_text_selector, wait_time=0.1) or \
-                                self.element_exists(self.more_replies_selector, wait_time=0.1)) and \
-                                (not self.time_to_stop_scraping())
+                    try:
+                        next_comment = self.get_selector(self.reply_text_selector, wait_time=20)
+                    except TimeoutException:
+                        break
+                    state = self.thread_state()
+                more_comments = (state.next_reply or state.more_replies) and (not self.time_to_stop_scraping())
         finally:
             self.scroll_to_top(self.entire_parent_selector)
             self.comment_replies_button = self.driver.find_element(By.CSS_SELECTOR, self.less_replies_selector)
@@ -463,6 +838,7 @@ class YoutubeShortsIterator(ABCIterator):
             return resulting_comment
 
 
+    @timed_phase('iterate_comment_threads')
     def iterate_comment_threads(self):
         '''
             iterate_comment_threads(self) -> Dict
@@ -471,81 +847,138 @@ class YoutubeShortsIterator(ABCIterator):
             1) we no longer find the next element
             2) we reach a point where we have to stop scraping (i.e. we exceed the comment limit or the time limit),
                or another expected error occurs.
-            3) some other unexpected error occurs. If 3) happens we log the exception using the self.logger.exception method
-            In all 3 cases above, we raise a StopIteration exception, indicating to the method that uses this method (__next__)
-            that there is nothing left to iterate.
+            In both cases above, we raise a StopIteration exception, indicating to the method that uses this method (__next__)
+            that there is nothing left to iterate. If the next thread is there but cannot be read, the error is raised
+            instead, so that the thread is skipped and retried later (see iterators/thread_failures.py).
         '''
         if self.time_to_stop_scraping():
-            self.driver.quit()
-            self.driver_started = False
             raise StopIteration
-        else:
-            try:
-                self.current_comment = self.get_selector(self.comment_text_selector, wait_time=20)
-                current_thread = self.get_selector(self.current_thread_selector, wait_time=20)
-                current_parent_thread = self.get_selector(self.entire_parent_selector, wait_time=20)
-            except Exception as err:
-                self.driver.quit()
-                self.driver_started = False
-                if not self.element_exists(self.current_thread_selector):
-                    self.driver.quit()
-                    self.driver_started = False
-                    raise StopIteration
-                self.logger.exception(err)
+        # the next thread not being loaded yet means the panel is about to fetch more comments (only checked when
+        # requests are rate limited, since it costs a round-trip)
+        if (self.rate_limiter is not None) and (not self.thread_state().thread):
+            self.throttle('continuation')
+        try:
+            self.current_comment = self.get_selector(self.comment_text_selector, wait_time=20)
+            current_thread = self.get_selector(self.current_thread_selector, wait_time=20)
+            current_parent_thread = self.get_selector(self.entire_parent_selector, wait_time=20)
+        except Exception:
+            if not self.thread_state().thread:
                 raise StopIteration
-            try:
-                self.scroll_to_top(self.current_thread_selector)
-            except Exception as err:
-                self.logger.exception(err)
-            self.comment_channel_name = self.get_selector(self.commenter_selector)
+            raise
+        return self.scrape_thread(current_parent_thread)
+
+
+    def scrape_thread(self, current_parent_thread):
+        '''
+            scrape_thread(self, current_parent_thread) -> (anyOf Dict None)
+            read the comment thread at position self.comment_thread_count + 1 (whose comment element is self.current_comment,
+            and whose #comment element is current_parent_thread), expanding and reading its replies, and return it (None if it
+            does not match the pattern)
+        '''
+        try:
+            self.scroll_to_top(self.current_thread_selector)
+        except Exception as err:
+            self.logger.exception(err)
+        self.comment_channel_name = self.get_selector(self.commenter_selector)
+        name = self.comment_channel_name.text.strip()[1:]
+        if not name:
+            self.comment_channel_name = self.get_selector(self.video_author_commenter_selector)
             name = self.comment_channel_name.text.strip()[1:]
-            if not name:
-                self.comment_channel_name = self.get_selector(self.video_author_commenter_selector)
-                name = self.comment_channel_name.text.strip()[1:]
-            self.comment_link = self.get_selector(self.comment_link_selector)
-            comment_link = self.comment_link.get_attribute('href')
-            comment_content = self.current_comment.text.strip()
-            resulting_comment = {
-                'commenter': name,
-                'comment content': comment_content,
-                'link': comment_link,
-                'children': []
-            }
-            if self.element_exists(self.expand_replies_selector, wait_time=0.1):
-                try:
-                    self.parent_comment = current_parent_thread
-                    self.current_comments_json = resulting_comment
-                    self.comment_replies_button = self.driver.find_element(By.CSS_SELECTOR, self.expand_replies_selector)
-                    ActionChains(self.driver).move_to_element(self.comment_replies_button).pause(0.5).click(self.comment_replies_button).perform()
-                except:
-                    if self.regex_pattern:
-                        comment_match = re.search(self.regex_pattern, resulting_comment['comment content'], re.ignorecase)
-                        if comment_match:
-                            return resulting_comment
-                        else:
-                            return None
+        self.comment_link = self.get_selector(self.comment_link_selector)
+        comment_link = self.comment_link.get_attribute('href')
+        comment_content = self.current_comment.text.strip()
+        resulting_comment = {
+            'commenter': name,
+            'comment content': comment_content,
+            'link': comment_link,
+            'children': []
+        }
+        if self.thread_state().replies_button:
+            # a replies button that cannot be clicked fails the thread, so that it is retried later with its replies
+            self.parent_comment = current_parent_thread
+            self.current_comments_json = resulting_comment
+            self.comment_replies_button = self.driver.find_element(By.CSS_SELECTOR, self.expand_replies_selector)
+            self.throttle('replies')
+            ActionChains(self.driver).move_to_element(self.comment_replies_button).pause(0.5).click(self.comment_replies_button).perform()
+            if self.regex_pattern and (not self.thread_has_pattern):
+                comment_match = re.search(self.regex_pattern, resulting_comment['comment content'], re.IGNORECASE)
+                if comment_match:
+                    self.thread_has_pattern = True
+            return self.iterate_child()
+        else:
+            self.total_comments_parsed += 1
+            self.comment_thread_count += 1
+            self.reset_elements()
+            self.update_selectors((self.comment_thread_count + 1), (self.reply_count + 1))
+            if self.regex_pattern:
+                comment_match = re.search(self.regex_pattern, resulting_comment['comment content'], re.IGNORECASE)
+                if comment_match:
                     return resulting_comment
                 else:
-                    if self.regex_pattern and (not self.thread_has_pattern):
-                        comment_match = re.search(self.regex_pattern, resulting_comment['comment content'], re.IGNORECASE)
-                        if comment_match:
-                            self.thread_has_pattern = True
-                    return self.iterate_child()
-            else:
-                self.total_comments_parsed += 1
-                self.comment_thread_count += 1
-                self.reset_elements()
-                self.update_selectors((self.comment_thread_count + 1), (self.reply_count + 1))
-                if self.regex_pattern:
-                    comment_match = re.search(self.regex_pattern, resulting_comment['comment content'], re.IGNORECASE)
-                    if comment_match:
-                        return resulting_comment
-                    else:
-                        return None
-                return resulting_comment
+                    return None
             return resulting_comment
 
 
+    def scrape_next_thread(self):
+        return self.next_html_thread() if self.extraction == 'html' else self.iterate_comment_threads()
+
+
+    def scrape_linked_thread(self, link):
+        '''
+            scrape_linked_thread(self, link) -> (anyOf Dict None)
+            open the Short with the comment that link points to (with the "lc" parameter) highlighted, and scrape the comment
+            thread shown first in the comments panel, which is the linked one. An exception is raised if the first thread is
+            not the linked one (i.e. it was deleted).
+        '''
+        linked_id = comment_id(link)
+        self.open_video(link_with_comment(self.video_url, linked_id))
+        self.comment_thread_count = 0
+        self.reply_count = 0
+        self.reset_elements()
+        self.update_selectors(1, 1)
+        self.current_comment = self.get_selector(self.comment_text_selector, wait_time=20)
+        current_parent_thread = self.get_selector(self.entire_parent_selector, wait_time=20)
+        shown_link = self.get_attribute(self.get_selector(self.comment_link_selector), 'href')
+        if comment_id(shown_link) != linked_id:
+            raise Exception('The comment linked to by {} was not shown first (the first comment is {})'.format(link, shown_link))
+        return self.scrape_thread(current_parent_thread)
+
+
+    @timed_phase('next_html_thread')
+    def next_html_thread(self):
+        '''
+            next_html_thread(self) -> (anyOf Dict None)
+            return the next comment thread when extraction is 'html'. All of the newly loaded comment threads are read as HTML
+            with one script call, and the replies of a thread are loaded and read with one more, then the HTML is parsed in
+            Python (see iterators/snapshot.py). Like go_to_next, None is returned for threads that do not match the pattern,
+            and StopIteration is raised once there is nothing left to scrape.
+        '''
+        if self.time_to_stop_scraping():
+            raise StopIteration
+        if self.html_reader is None:
+            self.html_reader = HTMLCommentReader(self.driver, self.threads_selector)
+        if not self.html_threads:
+            self.throttle('continuation')
+            self.html_threads = self.html_reader.wait_for_threads(self.comment_thread_count, timeout=20)
+            if not self.html_threads:
+                raise StopIteration
+        (resulting_comment, has_replies) = self.html_threads.pop(0)
+        if has_replies:
+            self.throttle('replies')
+            resulting_comment = self.html_reader.thread_with_replies(self.comment_thread_count) or resulting_comment
+        self.comment_thread_count += 1
+        if self.limit is not None:
+            # as in the webdriver mode, replies past the limit are not scraped
+            resulting_comment['children'] = resulting_comment['children'][:max(0, self.limit - (self.total_comments_parsed - self.short_start_comments) - 1)]
+        self.total_comments_parsed += 1 + len(resulting_comment['children'])
+        self.logger.debug('comment number: %s, comment info: %s', self.comment_thread_count, BoundedRepr(resulting_comment))
+        if self.regex_pattern:
+            comment_texts = [resulting_comment['comment content']] + [child['comment content'] for child in resulting_comment['children']]
+            if not any(re.search(self.regex_pattern, text, re.IGNORECASE) for text in comment_texts):
+                return None
+        return resulting_comment
+
+
     def __iter__(self):
         return self
 
@@ -553,12 +986,22 @@ class YoutubeShortsIterator(ABCIterator):
     @setup
     def __next__(self):
         try:
-            return self.iterate_comment_threads()
+            while True:
+                try:
+                    resulting_comment = self.next_thread()
+                    break
+                except StopIteration:
+                    if not self.next_short():
+                        raise
         except:
-            if self.driver_started:
-                self.driver.quit()
-            logging.shutdown()
+            self.quit_driver()
+            self.close_logger()
             raise StopIteration
+        if self.feed_mode and (resulting_comment is not None):
+            resulting_comment['short id'] = self.short_id
+        self.record_first_comment()
+        self.progress.update(self.total_comments_parsed, self.feed_threads_parsed + self.comment_thread_count)
+        return resulting_comment
 
 
 if __name__ == '__main__':
@@ -0,0 +1,139 @@
+'''
+This module provides the loggers used by the YouTube comment iterators. Every iterator (job) gets its own logger, which
+does not propagate to the root logger, so running several iterators in one process (i.e. main.py --configfile) never
+adds handlers to a shared logger or writes a line more than once. The logger only puts records on a bounded queue, and
+a QueueListener thread writes them to the log file, so logging never waits on the disk. If the queue is full, records
+are dropped (and counted) instead of blocking the scrape.
+
+Messages should be logged with %-style arguments (i.e. logger.debug('comment number: %s', number)), so that nothing is
+formatted when the level is turned off. Large values (like the dictionary for a comment thread) should be wrapped in
+BoundedRepr, which only formats a bounded part of the value, and every message is cut off at MAX_MESSAGE_LENGTH
+characters, so the cost of logging stays the same no matter how large a comment thread gets.
+'''
+import itertools
+import logging
+import logging.handlers
+import os
+import queue
+import reprlib
+import threading
+
+
+# format string taken from logging documentation: https://docs.python.org/3/library/logging.html
+LOG_FORMAT = '%(asctime)s %(message)s'
+MAX_MESSAGE_LENGTH = 2000
+MAX_QUEUED_RECORDS = 10000
+job_numbers = itertools.count(1)
+# one listener per log file, shared by all of the jobs logging to that file: {path: [listener, number of jobs]}
+listeners = {}
+listeners_lock = threading.Lock()
+bounded_repr = reprlib.Repr()
+bounded_repr.maxlevel = 3
+bounded_repr.maxdict = 8
+bounded_repr.maxlist = 8
+bounded_repr.maxstring = 200
+bounded_repr.maxother = 200
+
+
+class BoundedRepr:
+    '''
+        BoundedRepr(value) -> BoundedRepr
+        wraps a value that is passed to a logging call as an argument. The value is only formatted if the message is
+        actually logged, and only a bounded part of it is formatted (see the limits on bounded_repr above).
+    '''
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+
+    def __str__(self):
+        return bounded_repr.repr(self.value)
+
+
+    __repr__ = __str__
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    '''
+        DroppingQueueHandler(record_queue) -> DroppingQueueHandler
+        a QueueHandler that drops records when the queue is full instead of raising an error, and cuts every message
+        below the ERROR level off at MAX_MESSAGE_LENGTH characters. The number of dropped records is kept in the dropped attribute.
+    '''
+    def __init__(self, record_queue):
+        super().__init__(record_queue)
+        self.dropped = 0
+
+
+    def prepare(self, record):
+        record = super().prepare(record)
+        # errors are kept whole, since their tracebacks are needed to debug the scraper
+        if (record.levelno < logging.ERROR) and (len(record.msg) > MAX_MESSAGE_LENGTH):
+            record.msg = record.msg[:MAX_MESSAGE_LENGTH] + '... (truncated)'
+            record.message = record.msg
+        return record
+
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class JobLogger:
+    '''
+        JobLogger(log_file, enabled_logging=False, name='iterators') -> JobLogger
+        The logger for one job, available in the logger attribute. Its level is DEBUG if enabled_logging is True, and
+        ERROR otherwise (so that exceptions are always logged). The records are written to log_file by a listener thread
+        that is shared with the other jobs logging to the same file. close must be called once the job is done, so that
+        the remaining records are written and the listener is stopped once no job is using it.
+    '''
+    def __init__(self, log_file, enabled_logging=False, name='iterators'):
+        self.log_file = os.path.abspath(log_file)
+        self.logger = logging.getLogger(f'{name}.job{next(job_numbers)}')
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG if enabled_logging else logging.ERROR)
+        self.closed = False
+        with listeners_lock:
+            if self.log_file not in listeners:
+                record_queue = queue.Queue(maxsize=MAX_QUEUED_RECORDS)
+                file_handler = logging.FileHandler(self.log_file, delay=True)
+                file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+                listener = logging.handlers.QueueListener(record_queue, file_handler)
+                listener.start()
+                listeners[self.log_file] = [listener, 0]
+            listeners[self.log_file][1] += 1
+            self.handler = DroppingQueueHandler(listeners[self.log_file][0].queue)
+        self.logger.addHandler(self.handler)
+
+
+    @property
+    def dropped(self):
+        return self.handler.dropped
+
+
+    def close(self):
+        '''
+            close(self) -> None
+            detach the logger from the listener, and stop the listener (writing all of the queued records) if no other
+            job is using it
+        '''
+        if self.closed:
+            return
+        self.closed = True
+        self.logger.removeHandler(self.handler)
+        self.logger.disabled = True
+        with listeners_lock:
+            entry = listeners.get(self.log_file)
+            if entry is None:
+                return
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del listeners[self.log_file]
+                (listener, _) = entry
+                listener.stop()
+                for handler in listener.handlers:
+                    handler.close()
+        # remove the logger from the logging module's registry, so that finished jobs are not kept in memory
+        logging.Logger.manager.loggerDict.pop(self.logger.name, None)
@@ -0,0 +1,261 @@
+'''
+This module provides the performance metrics collected by the YouTube comment iterators. Every WebDriver command sent by
+an iterator (including the commands sent through elements, ActionChains and WebDriverWait) is counted and timed, along
+with the main phases of the scrape (i.e. startup, go_to_next, iterate_child and scroll_to_top). The metrics are kept
+in counters and fixed-bucket latency histograms on the iterator (iterator.metrics), and can be exported as JSON or in
+the Prometheus text format at the end of a run.
+'''
+import json
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+
+# upper bounds (in seconds) of the buckets used for latency histograms
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# upper bounds of the buckets used for the number of WebDriver commands sent while scraping one comment thread
+COMMAND_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+METRIC_PREFIX = 'scraper_'
+
+
+class Histogram:
+    '''
+        Histogram(buckets) -> Histogram
+        A histogram with fixed buckets. buckets holds the (sorted) upper bounds of the buckets, and values above the
+        last bound are counted in an extra bucket with no upper bound. The sum, minimum and maximum of all observed
+        values are kept as well.
+    '''
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+
+
+    def observe(self, value):
+        position = len(self.buckets)
+        for (bucket_number, upper_bound) in enumerate(self.buckets):
+            if value <= upper_bound:
+                position = bucket_number
+                break
+        self.counts[position] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min,
+            'max': self.max,
+            'mean': (self.sum / self.count) if self.count else None,
+            'buckets': {
+                str(upper_bound): count for (upper_bound, count) in zip(self.buckets + ('+Inf',), self.counts)
+            },
+        }
+
+
+def label_string(labels):
+    '''
+        label_string(labels) -> Str
+        return the labels (a tuple of (name, value) pairs) in the format used by Prometheus, i.e. command="get"
+    '''
+    return ','.join(f'{name}="{value}"' for (name, value) in labels)
+
+
+class PerformanceMetrics:
+    '''
+        PerformanceMetrics() -> PerformanceMetrics
+        The counters, gauges and histograms collected for one iterator. Each metric has a name and an optional set of
+        labels (passed in as keyword arguments), like in Prometheus.
+    '''
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+        self.command_listeners = []
+        self.phase_listeners = []
+
+
+    def increment(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+
+    def set_gauge(self, name, value, **labels):
+        with self.lock:
+            self.gauges[(name, tuple(sorted(labels.items())))] = value
+
+
+    def observe(self, name, value, buckets=LATENCY_BUCKETS, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+
+    def counter_value(self, name, **labels):
+        return self.counters.get((name, tuple(sorted(labels.items()))), 0)
+
+
+    def total(self, name):
+        '''
+            total(self, name) -> Int
+            return the sum of the counter with the given name over all of its labels
+        '''
+        return sum(value for ((counter_name, _), value) in self.counters.items() if counter_name == name)
+
+
+    def record_command(self, command, started, duration):
+        '''
+            record_command(self, command, started, duration) -> None
+            record a WebDriver command (i.e. "findElement") that was sent at the time started (from time.time()) and
+            took duration seconds to complete, and pass it on to the command listeners (i.e. a trace recorder)
+        '''
+        self.increment('webdriver_commands_total', command=command)
+        self.observe('webdriver_command_seconds', duration, command=command)
+        for listener in self.command_listeners:
+            listener(command, started, duration)
+
+
+    @contextmanager
+    def phase(self, name):
+        '''
+            phase(self, name) -> ContextManager
+            time the code inside the with statement as the phase with the given name. The number of WebDriver commands
+            sent during the phase is recorded as well, and the phase is passed on to the phase listeners (which are
+            called with the name, the time the phase started from time.time(), and its duration in seconds).
+        '''
+        commands_before = self.total('webdriver_commands_total')
+        started_at = time.time()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - started
+            self.increment('phase_calls_total', phase=name)
+            self.observe('phase_seconds', duration, phase=name)
+            self.observe(
+                'phase_webdriver_commands', self.total('webdriver_commands_total') - commands_before,
+                buckets=COMMAND_COUNT_BUCKETS, phase=name
+            )
+            for listener in self.phase_listeners:
+                listener(name, started_at, duration)
+
+
+    def to_dict(self):
+        '''
+            to_dict(self) -> Dict
+            return all of the metrics as a dictionary, grouped by the kind of metric and then by name. The labels of
+            each metric are written in the Prometheus format (an empty string if there are no labels).
+        '''
+        results = {'counters': {}, 'gauges': {}, 'histograms': {}}
+        with self.lock:
+            for ((name, labels), value) in sorted(self.counters.items()):
+                results['counters'].setdefault(name, {})[label_string(labels)] = value
+            for ((name, labels), value) in sorted(self.gauges.items()):
+                results['gauges'].setdefault(name, {})[label_string(labels)] = value
+            for ((name, labels), histogram) in sorted(self.histograms.items(), key=lambda item: item[0]):
+                results['histograms'].setdefault(name, {})[label_string(labels)] = histogram.to_dict()
+        return results
+
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), indent=4)
+
+
+    def to_prometheus(self):
+        '''
+            to_prometheus(self) -> Str
+            return all of the metrics in the Prometheus text exposition format
+        '''
+        lines = []
+        with self.lock:
+            counters = sorted(self.counters.items())
+            gauges = sorted(self.gauges.items())
+            histograms = sorted(self.histograms.items(), key=lambda item: item[0])
+        for (kind, metrics) in (('counter', counters), ('gauge', gauges)):
+            declared = set()
+            for ((name, labels), value) in metrics:
+                full_name = f'{METRIC_PREFIX}{name}'
+                if full_name not in declared:
+                    declared.add(full_name)
+                    lines.append(f'# TYPE {full_name} {kind}')
+                lines.append(f'{full_name}{{{label_string(labels)}}} {value}' if labels else f'{full_name} {value}')
+        declared = set()
+        for ((name, labels), histogram) in histograms:
+            full_name = f'{METRIC_PREFIX}{name}'
+            if full_name not in declared:
+                declared.add(full_name)
+                lines.append(f'# TYPE {full_name} histogram')
+            cumulative_count = 0
+            for (upper_bound, count) in zip(histogram.buckets + ('+Inf',), histogram.counts):
+                cumulative_count += count
+                bucket_labels = label_string(labels + (('le', upper_bound),))
+                lines.append(f'{full_name}_bucket{{{bucket_labels}}} {cumulative_count}')
+            suffix = f'{{{label_string(labels)}}}' if labels else ''
+            lines.append(f'{full_name}_sum{suffix} {histogram.sum}')
+            lines.append(f'{full_name}_count{suffix} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+
+    def export(self, filename, format='json'):
+        '''
+            export(self, filename, format='json') -> None
+            write the metrics to the file, either as JSON (format='json') or in the Prometheus text format (format='prometheus')
+        '''
+        with open(filename, 'w') as metrics_file:
+            if format == 'prometheus':
+                metrics_file.write(self.to_prometheus())
+            else:
+                metrics_file.write(self.to_json())
+
+
+def instrument_driver(driver, metrics):
+    '''
+        instrument_driver(driver, metrics) -> driver
+        count and time every command the driver sends to the browser in metrics. Every WebDriver command (including
+        the ones sent by elements found through the driver, by ActionChains and by WebDriverWait) goes through the
+        execute method of the driver, so that method is wrapped on the driver instance. A driver that is used by one
+        iterator after another (i.e. from a BrowserSessionPool, see iterators/browser.py) only counts its commands in
+        the metrics of the last iterator it was instrumented for.
+    '''
+    execute = getattr(driver, 'uninstrumented_execute', driver.execute)
+    driver.uninstrumented_execute = execute
+
+    @wraps(execute)
+    def timed_execute(driver_command, params=None):
+        started = time.time()
+        start_counter = time.perf_counter()
+        try:
+            return execute(driver_command, params)
+        finally:
+            metrics.record_command(driver_command, started, time.perf_counter() - start_counter)
+
+    driver.execute = timed_execute
+    return driver
+
+
+def timed_phase(name):
+    '''
+        timed_phase(name) -> function
+        a decorator for iterator methods that times each call of the method as the phase with the given name, in the
+        metrics of the iterator (self.metrics)
+    '''
+    def decorator(func):
+        @wraps(func)
+        def run_phase(self, *args, **kwargs):
+            with self.metrics.phase(name):
+                return func(self, *args, **kwargs)
+        return run_phase
+    return decorator
@@ -0,0 +1,323 @@
+'''
+This module provides an index for the JSON files written by main.py (or by iterators.sinks.JSONFileSink), and a reader
+that uses the index to fetch individual comment threads out of the file without parsing the rest of it. The index maps
+each thread number (starting from 1, in the order the threads appear in the file) to the byte offset and length of the
+thread in the file, each comment ID (the value of the "lc" parameter in the comment link, for both main comments and
+replies) to the thread number it belongs to, and each commenter to the thread numbers they commented in.
+
+The index can be built while the file is being written (JSONFileSink(..., index_file=...), or the --index argument of
+main.py), or afterwards for an existing file with build_index (or "python -m iterators.output_index <file>").
+'''
+import json
+import mmap
+import os
+import random
+import re
+import sys
+from urllib.parse import urlparse, parse_qs
+
+
+INDEX_VERSION = 1
+# matches the characters that change the nesting of the JSON (outside of strings), and the start of a string
+STRUCTURE_PATTERN = re.compile(rb'[\[\]{}"]')
+# matches the characters that can end a string, or escape the character after it
+STRING_END_PATTERN = re.compile(rb'["\\]')
+# matches the characters that end a number, true, false or null
+SCALAR_END_PATTERN = re.compile(rb'[,\]}\s]')
+# matches whitespace and the commas between values
+SEPARATOR_PATTERN = re.compile(rb'[\s,]*')
+
+
+def index_filename_for(filename):
+    '''
+        index_filename_for(filename) -> Str
+        return the default name of the index file for the JSON file with the given name
+    '''
+    return f'{filename}.idx'
+
+
+def comment_id(link):
+    '''
+        comment_id(link) -> (anyOf Str None)
+        return the comment ID in a YouTube comment link (the value of the "lc" query parameter), or None
+        if the link does not have one
+    '''
+    if not link:
+        return None
+    values = parse_qs(urlparse(link).query).get('lc')
+    if values:
+        return values[0]
+    return None
+
+
+class OutputIndex:
+    '''
+        OutputIndex() -> OutputIndex
+        The index of one JSON output file. offsets holds a [start, length] pair for every thread (the thread number
+        is the position in the list plus one), comment_ids maps comment IDs to thread numbers, and commenters maps
+        channel names to the list of thread numbers they commented in (either the main comment or a reply).
+    '''
+    def __init__(self):
+        self.offsets = []
+        self.comment_ids = {}
+        self.commenters = {}
+
+
+    def __len__(self):
+        return len(self.offsets)
+
+
+    def add(self, start, length, item):
+        '''
+            add(self, start, length, item) -> Int
+            add the thread found at the byte offset start (with the given length in bytes) to the index, and
+            return its thread number. item is the dictionary for the thread (it can be None).
+        '''
+        self.offsets.append([start, length])
+        thread_number = len(self.offsets)
+        if item is None:
+            return thread_number
+        for comment in [item] + list(item.get('children', [])):
+            identifier = comment_id(comment.get('link'))
+            if identifier:
+                self.comment_ids[identifier] = thread_number
+            commenter = comment.get('commenter')
+            if commenter:
+                threads = self.commenters.setdefault(commenter, [])
+                if (not threads) or (threads[-1] != thread_number):
+                    threads.append(thread_number)
+        return thread_number
+
+
+    def save(self, filename):
+        with open(filename, 'w') as index_file:
+            json.dump({
+                'version': INDEX_VERSION,
+                'offsets': self.offsets,
+                'comment_ids': self.comment_ids,
+                'commenters': self.commenters,
+            }, index_file)
+
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename) as index_file:
+            contents = json.load(index_file)
+        if contents.get('version') != INDEX_VERSION:
+            raise Exception('The index file "{}" was written by an unsupported version of the index format.'.format(filename))
+        index = cls()
+        index.offsets = contents['offsets']
+        index.comment_ids = contents['comment_ids']
+        index.commenters = contents['commenters']
+        return index
+
+
+def skip_whitespace(data, position):
+    '''
+        skip_whitespace(data, position) -> Int
+        return the position of the first character at or after position that is not whitespace (or a comma, since
+        commas only separate the values we are stepping over)
+    '''
+    match = SEPARATOR_PATTERN.match(data, position)
+    return match.end()
+
+
+def skip_string(data, position):
+    '''
+        skip_string(data, position) -> Int
+        position is just after the opening quote of a JSON string. Return the position just after its closing quote.
+    '''
+    while True:
+        match = STRING_END_PATTERN.search(data, position)
+        if match is None:
+            raise Exception('The JSON file ends in the middle of a string.')
+        position = match.end()
+        if match.group() == b'\\':
+            # skip the escaped character (which could be a quote)
+            position += 1
+        else:
+            return position
+
+
+def skip_value(data, position):
+    '''
+        skip_value(data, position) -> Int
+        return the position just after the JSON value that starts at position. Only the characters that change the
+        nesting of the JSON are looked at, so the value is never parsed.
+    '''
+    first_character = data[position:position + 1]
+    if first_character == b'"':
+        return skip_string(data, position + 1)
+    if first_character not in (b'[', b'{'):
+        # a number, true, false or null
+        match = SCALAR_END_PATTERN.search(data, position)
+        return match.start() if match else len(data)
+    depth = 0
+    while True:
+        match = STRUCTURE_PATTERN.search(data, position)
+        if match is None:
+            raise Exception('The JSON file ends in the middle of a value.')
+        position = match.end()
+        character = match.group()
+        if character == b'"':
+            position = skip_string(data, position)
+        elif character in (b'[', b'{'):
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return position
+
+
+def scan_threads(data):
+    '''
+        scan_threads(data) -> Generator
+        data is a bytes-like object (i.e. an mmap) with the contents of a JSON output file, which is either a list of
+        threads or an object whose first value is the list of threads ({"comments": [...]}). Yields a (start, end)
+        pair of byte offsets for every element of that list, without parsing the elements.
+    '''
+    position = skip_whitespace(data, 0)
+    if data[position:position + 1] == b'{':
+        position = skip_whitespace(data, position + 1)
+        if data[position:position + 1] != b'"':
+            return
+        position = skip_whitespace(data, skip_string(data, position + 1))
+        if data[position:position + 1] != b':':
+            raise Exception('The JSON file is not in the format written by main.py.')
+        position = skip_whitespace(data, position + 1)
+    if data[position:position + 1] != b'[':
+        raise Exception('The JSON file is not in the format written by main.py.')
+    position += 1
+    while True:
+        position = skip_whitespace(data, position)
+        if (position >= len(data)) or (data[position:position + 1] == b']'):
+            return
+        end = skip_value(data, position)
+        yield (position, end)
+        position = end
+
+
+def map_file(output_file):
+    '''
+        map_file(output_file) -> (anyOf mmap.mmap Bytes)
+        memory map the open file for reading. An empty file (a scrape that wrote nothing) cannot be memory mapped, so
+        empty bytes are returned for it instead.
+    '''
+    if os.fstat(output_file.fileno()).st_size == 0:
+        return b''
+    return mmap.mmap(output_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def build_index(filename, index_file=None):
+    '''
+        build_index(filename, index_file=None) -> OutputIndex
+        build the index for an existing JSON output file, and save it to index_file (by default the name of the
+        JSON file with ".idx" added to the end). Every thread is parsed on its own, so the whole file is never
+        held in memory.
+    '''
+    index = OutputIndex()
+    with open(filename, 'rb') as output_file:
+        data = map_file(output_file)
+        if isinstance(data, mmap.mmap):
+            with data:
+                for (start, end) in scan_threads(data):
+                    index.add(start, end - start, json.loads(data[start:end]))
+    index.save(index_file or index_filename_for(filename))
+    return index
+
+
+class OutputReader:
+    '''
+        OutputReader(filename, index_file=None) -> OutputReader
+        A reader for a JSON output file that fetches individual threads through the index, by memory mapping the file
+        and only parsing the bytes of the threads that are asked for. If the index file (by default the name of the
+        JSON file with ".idx" added to the end) does not exist, it is built first with build_index.
+    '''
+    def __init__(self, filename, index_file=None):
+        self.filename = filename
+        self.index_file = index_file or index_filename_for(filename)
+        try:
+            self.index = OutputIndex.load(self.index_file)
+        except FileNotFoundError:
+            self.index = build_index(filename, self.index_file)
+        self.output_file = open(filename, 'rb')
+        self.data = map_file(self.output_file)
+
+
+    def __len__(self):
+        return len(self.index)
+
+
+    def thread(self, thread_number):
+        '''
+            thread(self, thread_number) -> (anyOf Dict None)
+            return the thread with the given thread number (starting from 1). Raises IndexError if there is no such thread.
+        '''
+        if (thread_number < 1) or (thread_number > len(self.index)):
+            raise IndexError(f'thread number {thread_number} is out of range')
+        (start, length) = self.index.offsets[thread_number - 1]
+        return json.loads(self.data[start:(start + length)])
+
+
+    def thread_with_comment(self, identifier):
+        '''
+            thread_with_comment(self, identifier) -> (anyOf Dict None)
+            return the thread containing the comment with the given comment ID (or link to the comment), or None if
+            there is no such comment in the file
+        '''
+        thread_number = self.index.comment_ids.get(comment_id(identifier) or identifier)
+        if thread_number is None:
+            return None
+        return self.thread(thread_number)
+
+
+    def threads_by_commenter(self, commenter):
+        '''
+            threads_by_commenter(self, commenter) -> Generator
+            yield every thread that the commenter made the main comment or a reply in
+        '''
+        for thread_number in self.index.commenters.get(commenter, []):
+            yield self.thread(thread_number)
+
+
+    def comments_by_commenter(self, commenter):
+        '''
+            comments_by_commenter(self, commenter) -> Generator
+            yield every comment (main comments and replies) made by the commenter
+        '''
+        for thread in self.threads_by_commenter(commenter):
+            for comment in [thread] + thread.get('children', []):
+                if comment.get('commenter') == commenter:
+                    yield comment
+
+
+    def sample(self, count, seed=None):
+        '''
+            sample(self, count, seed=None) -> List
+            return count threads chosen at random (without replacement) from the file
+        '''
+        thread_numbers = random.Random(seed).sample(range(1, len(self.index) + 1), min(count, len(self.index)))
+        return [self.thread(thread_number) for thread_number in thread_numbers]
+
+
+    def close(self):
+        if self.data is not None:
+            if isinstance(self.data, mmap.mmap):
+                self.data.close()
+            self.output_file.close()
+            self.data = None
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+if __name__ == '__main__':
+    for filename in sys.argv[1:]:
+        index = build_index(filename)
+        print(f'indexed {len(index)} threads in {filename}')
@@ -0,0 +1,197 @@
+'''
+This module separates driving the browser from the work done on the comment threads it returns. Without it, the
+iterator, the regular expression matching and any other filters all run on one thread, so the browser sits idle while
+Python works on a thread, and Python sits idle while the browser loads the next one. A Pipeline drives the iterator (and
+the browser along with it) on a producer thread of its own, which only reads comment threads and puts them on a bounded
+queue, while a pool of worker threads runs the processing steps (normalizing the text, matching the pattern and any
+filters passed in) on them. The threads come out of the pipeline in the order they were scraped, so a pipeline can stand
+in for the iterator anywhere (i.e. in write_behind, see iterators/sinks.py).
+
+Waiting on the browser releases the GIL, so the worker threads get to run while the producer waits on a page. For the
+matching to move off the browser thread, the iterator has to be created with defer_processing=True, so that it returns
+every comment thread and leaves the matching to the pipeline.
+'''
+import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+DEFAULT_WORKERS = 2
+DEFAULT_QUEUE_SIZE = 100
+
+
+def normalize_comment(comment):
+    '''
+        normalize_comment(comment) -> Dict
+        strip the leading and trailing whitespace from the commenter and the text of a comment
+    '''
+    for key in ('commenter', 'comment content'):
+        if isinstance(comment.get(key), str):
+            comment[key] = comment[key].strip()
+    return comment
+
+
+def normalize_thread(thread):
+    '''
+        normalize_thread(thread) -> Dict
+        normalize the main comment of a comment thread and all of its replies (see normalize_comment)
+    '''
+    normalize_comment(thread)
+    for child in thread.get('children') or []:
+        normalize_comment(child)
+    return thread
+
+
+def pattern_filter(pattern):
+    '''
+        pattern_filter(pattern) -> Function
+        return a processing step that keeps the comment threads where the main comment or one of the replies matches the
+        regular expression (case insensitive), and returns None for the others, the same way the iterators do
+    '''
+    compiled_pattern = re.compile(pattern, re.IGNORECASE)
+
+    def matches(thread):
+        texts = [thread.get('comment content') or ''] + [child.get('comment content') or '' for child in thread.get('children') or []]
+        return thread if any(compiled_pattern.search(text) for text in texts) else None
+    return matches
+
+
+class Pipeline:
+    '''
+        Pipeline(iterator, pattern=None, processors=None, workers=DEFAULT_WORKERS, queue_size=DEFAULT_QUEUE_SIZE, metrics=None) -> Pipeline
+        Iterates over iterator on a producer thread, and runs the processing steps on every comment thread in a pool of
+        worker threads, returning the results in the order the threads were scraped.
+
+        Parameters:
+
+            iterator - the iterator of comment threads. It is only ever used from the producer thread.
+
+            pattern - an optional regular expression that comment threads have to match (see pattern_filter). Threads that
+                    do not match come out as None, like they do from the iterators.
+
+            processors - a list of functions that are called in turn with each comment thread, after it is normalized and
+                    matched against the pattern. Each one returns the thread (changed or not), or None to leave it out of
+                    the output (None is returned in its place). They are called from the worker threads, so several comment
+                    threads can be processed at the same time, but each comment thread is only processed by one worker.
+
+            workers - the number of worker threads.
+
+            queue_size - the maximum number of comment threads scraped but not yet returned. The producer stops reading
+                    threads from the iterator when this many are waiting, so memory stays bounded if the consumer is slow.
+
+            metrics - an optional PerformanceMetrics instance (see iterators/metrics.py). The time spent processing each
+                    thread is recorded in the pipeline_process_seconds histogram, and the time the consumer spent waiting
+                    for the next thread in pipeline_wait_seconds.
+
+        An exception raised by the iterator or a processing step is raised again from the consumer, in the position of the
+        thread it was raised for. Closing the pipeline (or leaving the for loop over it early) stops the producer.
+    '''
+    def __init__(self, iterator, pattern=None, processors=None, workers=DEFAULT_WORKERS, queue_size=DEFAULT_QUEUE_SIZE, metrics=None):
+        if workers < 1:
+            raise Exception('A pipeline needs at least one worker, but workers was {}'.format(workers))
+        self.iterator = iterator
+        self.steps = [normalize_thread] + ([pattern_filter(pattern)] if pattern else []) + list(processors or [])
+        self.workers = workers
+        self.metrics = metrics
+        self.results = queue.Queue(maxsize=max(1, queue_size))
+        self.stopped = threading.Event()
+        self.executor = None
+        self.producer = None
+
+
+    def process(self, thread):
+        '''
+            process(self, thread) -> (anyOf Dict None)
+            run the processing steps on a comment thread (None stays None)
+        '''
+        started = time.perf_counter()
+        for step in self.steps:
+            if thread is None:
+                break
+            thread = step(thread)
+        if self.metrics is not None:
+            self.metrics.observe('pipeline_process_seconds', time.perf_counter() - started)
+        return thread
+
+
+    def put(self, result):
+        '''
+            put(self, result) -> Bool
+            put a result on the queue, giving up if the pipeline is closed while the queue is full. Returns whether it was put.
+        '''
+        while not self.stopped.is_set():
+            try:
+                self.results.put(result, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+    def produce(self):
+        '''
+            produce(self) -> None
+            the body of the producer thread: read comment threads from the iterator and hand them to the workers. The
+            futures go on the queue in the order the threads were read, which is the order the consumer returns them in.
+        '''
+        try:
+            for thread in self.iterator:
+                if not self.put(('thread', self.executor.submit(self.process, thread))):
+                    return
+        except BaseException as err:
+            self.put(('error', err))
+        else:
+            self.put(('end', None))
+
+
+    def start(self):
+        if self.producer is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='pipeline-worker')
+            self.producer = threading.Thread(target=self.produce, name='pipeline-producer', daemon=True)
+            self.producer.start()
+        return self
+
+
+    def close(self):
+        '''
+            close(self) -> None
+            stop the producer and the workers, and close the iterator (see ABCIterator.close) once the producer is done
+            with it. Comment threads that were scraped but not returned yet are dropped.
+        '''
+        self.stopped.set()
+        if self.producer is not None:
+            self.producer.join()
+            self.executor.shutdown(wait=True, cancel_futures=True)
+        if hasattr(self.iterator, 'close'):
+            self.iterator.close()
+
+
+    def __iter__(self):
+        if self.stopped.is_set():
+            return
+        self.start()
+        try:
+            while True:
+                started = time.perf_counter()
+                (kind, value) = self.results.get()
+                if kind == 'end':
+                    return
+                if kind == 'error':
+                    raise value
+                thread = value.result()
+                if self.metrics is not None:
+                    self.metrics.observe('pipeline_wait_seconds', time.perf_counter() - started)
+                yield thread
+        finally:
+            self.close()
+
+
+    def __enter__(self):
+        return self.start()
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
@@ -0,0 +1,249 @@
+'''
+This module provides the progress reporting for the YouTube comment iterators. Each iterator keeps a ProgressTracker in
+its progress attribute, which is updated after every comment thread with the number of comments and comment threads
+scraped so far. From those it works out the throughput (overall and recent), the fraction of the comments scraped
+(against the total number of comments on the video, or the limit if it is lower), an estimated time to completion and
+the time left on the time limit. A callback can be passed to the iterators to be told about every update, and
+ProgressPrinter is a callback that shows the progress on one line of the terminal (used by main.py --progress).
+'''
+import re
+import sys
+import time
+
+
+# the weight given to the most recent thread when working out the recent throughput
+RECENT_RATE_WEIGHT = 0.2
+COUNT_SUFFIXES = {'k': 1000, 'm': 1000000, 'b': 1000000000}
+
+
+def parse_comment_count(text):
+    '''
+        parse_comment_count(text) -> (anyOf Int None)
+        return the number of comments in text as shown by YouTube (i.e. "1,234", "1.2K" or "View 3M comments"),
+        or None if there is no number in the text
+    '''
+    if not text:
+        return None
+    match = re.search(r'(\d[\d,]*(?:\.\d+)?)\s*([kmb])?\b', text, re.IGNORECASE)
+    if match is None:
+        return None
+    number = float(match.group(1).replace(',', ''))
+    if match.group(2):
+        number *= COUNT_SUFFIXES[match.group(2).lower()]
+    return int(number)
+
+
+class ProgressTracker:
+    '''
+        ProgressTracker(callback=None) -> ProgressTracker
+        Tracks the progress of one scrape. The iterator calls start once scraping starts, and update after every
+        comment thread. callback (if it is not None) is called with the tracker after every update. The attributes are:
+
+            total_comments - the number of comments on the video as shown by YouTube (None if it is not known)
+            limit - the maximum number of comments that will be scraped (None if there is no limit)
+            time_limit - the time limit in seconds (None if there is no time limit)
+            comments, threads - the number of comments (including replies) and comment threads scraped so far
+            elapsed - the number of seconds since scraping started
+            comments_per_second, threads_per_second - the throughput since scraping started
+            recent_comments_per_second - the throughput over the most recent threads (it drops quickly when a scrape stalls)
+            seconds_since_last_thread - the number of seconds since the last comment thread was finished
+            fraction_done - the fraction of the target (the limit or the total number of comments, whichever is lower)
+                            that has been scraped, or None if there is no target
+            eta - the estimated number of seconds left (None if it cannot be estimated yet)
+            time_left - the number of seconds left on the time limit (None if there is no time limit)
+            time_to_first_comment - the number of seconds from creating the iterator to the first comment thread (None until
+                                    there is one)
+    '''
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.total_comments = None
+        self.limit = None
+        self.time_limit = None
+        self.comments = 0
+        self.threads = 0
+        self.start_time = None
+        self.last_update_time = None
+        self.recent_comments_per_second = 0.0
+        self.time_to_first_comment = None
+
+
+    def start(self, total_comments=None, limit=None, time_limit=None):
+        '''
+            start(self, total_comments=None, limit=None, time_limit=None) -> None
+            mark the start of scraping, with what is known about how much there is to scrape
+        '''
+        self.total_comments = total_comments
+        self.limit = limit
+        self.time_limit = time_limit
+        self.start_time = time.monotonic()
+        self.last_update_time = self.start_time
+
+
+    def record_first_comment(self, seconds):
+        '''
+            record_first_comment(self, seconds) -> None
+            record the number of seconds it took to get the first comment thread (counted by the iterator, from when it
+            was created)
+        '''
+        self.time_to_first_comment = seconds
+
+
+    def update(self, comments, threads):
+        '''
+            update(self, comments, threads) -> None
+            record the total number of comments and comment threads scraped so far, and call the callback
+        '''
+        if self.start_time is None:
+            self.start()
+        now = time.monotonic()
+        time_taken = now - self.last_update_time
+        new_comments = comments - self.comments
+        if time_taken > 0:
+            rate = new_comments / time_taken
+            if self.threads == 0:
+                self.recent_comments_per_second = rate
+            else:
+                self.recent_comments_per_second = (RECENT_RATE_WEIGHT * rate) + ((1 - RECENT_RATE_WEIGHT) * self.recent_comments_per_second)
+        self.comments = comments
+        self.threads = threads
+        self.last_update_time = now
+        if self.callback is not None:
+            self.callback(self)
+
+
+    @property
+    def elapsed(self):
+        if self.start_time is None:
+            return 0.0
+        return time.monotonic() - self.start_time
+
+
+    @property
+    def comments_per_second(self):
+        elapsed = self.elapsed
+        return (self.comments / elapsed) if elapsed > 0 else 0.0
+
+
+    @property
+    def threads_per_second(self):
+        elapsed = self.elapsed
+        return (self.threads / elapsed) if elapsed > 0 else 0.0
+
+
+    @property
+    def seconds_since_last_thread(self):
+        if self.last_update_time is None:
+            return 0.0
+        return time.monotonic() - self.last_update_time
+
+
+    @property
+    def target(self):
+        targets = [target for target in (self.total_comments, self.limit) if target]
+        return min(targets) if targets else None
+
+
+    @property
+    def fraction_done(self):
+        target = self.target
+        if not target:
+            return None
+        return min(1.0, self.comments / target)
+
+
+    @property
+    def time_left(self):
+        if self.time_limit is None:
+            return None
+        return max(0.0, self.time_limit - self.elapsed)
+
+
+    @property
+    def eta(self):
+        estimates = []
+        target = self.target
+        rate = self.comments_per_second
+        if target and rate > 0:
+            estimates.append(max(0.0, (target - self.comments) / rate))
+        if self.time_limit is not None:
+            estimates.append(self.time_left)
+        return min(estimates) if estimates else None
+
+
+    def snapshot(self):
+        '''
+            snapshot(self) -> Dict
+            return all of the progress information as a dictionary
+        '''
+        return {
+            'total_comments': self.total_comments,
+            'limit': self.limit,
+            'time_limit': self.time_limit,
+            'comments': self.comments,
+            'threads': self.threads,
+            'elapsed': self.elapsed,
+            'comments_per_second': self.comments_per_second,
+            'threads_per_second': self.threads_per_second,
+            'recent_comments_per_second': self.recent_comments_per_second,
+            'seconds_since_last_thread': self.seconds_since_last_thread,
+            'fraction_done': self.fraction_done,
+            'eta': self.eta,
+            'time_left': self.time_left,
+            'time_to_first_comment': self.time_to_first_comment,
+        }
+
+
+def format_seconds(seconds):
+    '''
+        format_seconds(seconds) -> Str
+        return the number of seconds in the format HH:MM:SS, or "--:--:--" if seconds is None
+    '''
+    if seconds is None:
+        return '--:--:--'
+    seconds = int(seconds)
+    return f'{seconds // 3600:02d}:{(seconds % 3600) // 60:02d}:{seconds % 60:02d}'
+
+
+class ProgressPrinter:
+    '''
+        ProgressPrinter(stream=None, interval=1.0) -> ProgressPrinter
+        A progress callback that shows the progress on a single line of stream (stderr by default), rewriting the line
+        at most once every interval seconds.
+    '''
+    def __init__(self, stream=None, interval=1.0):
+        self.stream = stream or sys.stderr
+        self.interval = interval
+        self.last_printed = None
+
+
+    def format(self, progress):
+        fraction = progress.fraction_done
+        percentage = f' ({fraction * 100:.1f}%)' if fraction is not None else ''
+        line = (
+            f'threads: {progress.threads} | comments: {progress.comments}{percentage} | '
+            f'{progress.comments_per_second:.2f} comments/s ({progress.recent_comments_per_second:.2f} recent), '
+            f'{progress.threads_per_second:.2f} threads/s | ETA: {format_seconds(progress.eta)}'
+        )
+        if progress.time_limit is not None:
+            line += f' | time left: {format_seconds(progress.time_left)}'
+        if progress.time_to_first_comment is not None:
+            line += f' | first comment: {progress.time_to_first_comment:.2f}s'
+        return line
+
+
+    def __call__(self, progress):
+        now = time.monotonic()
+        if (self.last_printed is not None) and ((now - self.last_printed) < self.interval):
+            return
+        self.last_printed = now
+        self.stream.write('\r' + self.format(progress) + '\033[K')
+        self.stream.flush()
+
+
+    def finish(self, progress):
+        '''
+            finish(self, progress) -> None
+            show the final progress and move on to the next line
+        '''
+        self.stream.write('\r' + self.format(progress) + '\033[K\n')
+        self.stream.flush()
@@ -0,0 +1,186 @@
+'''
+This module provides a token bucket rate limiter that the YouTube comment iterators consult before they load a page,
+before they wait for the next page of comment threads (a continuation), and before they expand replies. With several
+iterators running at once (i.e. the workers of the scheduler in jobs/scheduler.py), the requests they make add up, and
+YouTube starts throttling them or showing consent and captcha pages. The limiter caps the requests across all of them:
+
+    - a global rate (requests per second) shared by every request, and
+    - per-host rates (i.e. {"www.youtube.com": 2}) for the requests to each host.
+
+The buckets are kept in a small JSON file, locked while it is read and written (with fcntl, or msvcrt on Windows), so
+every process that uses the same file shares the same limits. Without a file, the buckets are only shared by the
+iterators in this process.
+'''
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+# the file the buckets are kept in when a rate is given on the command line without --rate-limit-file, so that every
+# scraper on the host shares the same limits by default
+DEFAULT_STATE_FILE = os.path.join(tempfile.gettempdir(), 'youtube-comment-scraper-rate-limit.json')
+GLOBAL_BUCKET = '*'
+
+
+@contextmanager
+def locked_file(filename):
+    '''
+        locked_file(filename) -> ContextManager
+        open the file (creating it if it does not exist) for reading and writing, and hold an exclusive lock on it
+        inside the with statement. The lock is released when the file is closed, even if the process dies.
+    '''
+    descriptor = os.open(filename, os.O_RDWR | os.O_CREAT, 0o666)
+    try:
+        if fcntl is not None:
+            fcntl.flock(descriptor, fcntl.LOCK_EX)
+        else:
+            # msvcrt.LK_LOCK retries for 10 seconds before giving up, so keep trying until the lock is taken
+            while True:
+                try:
+                    msvcrt.locking(descriptor, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        yield descriptor
+    finally:
+        if fcntl is None:
+            try:
+                os.lseek(descriptor, 0, os.SEEK_SET)
+                msvcrt.locking(descriptor, msvcrt.LK_UNLCK, 1)
+            except OSError:
+                pass
+        os.close(descriptor)
+
+
+def read_state(descriptor):
+    os.lseek(descriptor, 0, os.SEEK_SET)
+    contents = b''
+    while True:
+        chunk = os.read(descriptor, 65536)
+        if not chunk:
+            break
+        contents += chunk
+    try:
+        return json.loads(contents.decode('utf-8')) if contents else {}
+    except ValueError:
+        # a file left half-written by a process that died is started over
+        return {}
+
+
+def write_state(descriptor, state):
+    contents = json.dumps(state).encode('utf-8')
+    os.lseek(descriptor, 0, os.SEEK_SET)
+    os.write(descriptor, contents)
+    os.ftruncate(descriptor, len(contents))
+
+
+def parse_host_rates(host_rates):
+    '''
+        parse_host_rates(host_rates) -> Dict
+        return the per-host rates given on the command line as "HOST=RATE" strings (i.e. "www.youtube.com=2") as a
+        dictionary mapping each host to its rate
+    '''
+    rates = {}
+    for host_rate in host_rates or []:
+        (host, _, rate) = host_rate.partition('=')
+        try:
+            if not host.strip():
+                raise ValueError(host_rate)
+            rates[host.strip().lower()] = float(rate)
+        except ValueError:
+            raise Exception('Expected a per-host rate in the form HOST=RATE (i.e. www.youtube.com=2), but got {}'.format(host_rate))
+    return rates
+
+
+class RateLimiter:
+    '''
+        RateLimiter(rate=None, host_rates=None, burst=None, state_file=None) -> RateLimiter
+        A token bucket rate limiter. rate is the number of requests per second allowed across all hosts (None for no
+        global limit), and host_rates maps hosts to the number of requests per second allowed for each of them. burst
+        is the number of requests that can be made at once after a quiet period (by default, one second's worth of
+        requests, and at least 1). The buckets are shared through state_file by every process that uses it.
+    '''
+    def __init__(self, rate=None, host_rates=None, burst=None, state_file=None):
+        self.rate = rate
+        self.host_rates = {host.lower(): host_rate for (host, host_rate) in (host_rates or {}).items()}
+        for limit in [rate] + list(self.host_rates.values()):
+            if (limit is not None) and (limit <= 0):
+                raise Exception('Rates must be greater than 0, but got {}'.format(limit))
+        self.burst = burst
+        self.state_file = state_file
+        self.lock = threading.Lock()
+        self.state = {}
+
+
+    def buckets_for(self, host):
+        '''
+            buckets_for(self, host) -> List
+            return the (name, rate, capacity) of every bucket a request to the host takes a token from
+        '''
+        buckets = []
+        for (name, rate) in ((GLOBAL_BUCKET, self.rate), (host, self.host_rates.get(host))):
+            if rate is not None:
+                capacity = self.burst if self.burst is not None else max(1.0, rate)
+                buckets.append((name, rate, capacity))
+        return buckets
+
+
+    @staticmethod
+    def take_token(buckets, state, now):
+        '''
+            take_token(buckets, state, now) -> Float
+            refill the buckets in state up to the time now, and take a token from each of them if they all have one.
+            Returns 0 if the tokens were taken, and the number of seconds until they all have one otherwise.
+        '''
+        levels = {}
+        wait_time = 0.0
+        for (name, rate, capacity) in buckets:
+            (tokens, updated_at) = state.get(name, (capacity, now))
+            tokens = min(capacity, tokens + (max(0.0, now - updated_at) * rate))
+            levels[name] = tokens
+            if tokens < 1:
+                wait_time = max(wait_time, (1 - tokens) / rate)
+        if wait_time == 0:
+            for (name, tokens) in levels.items():
+                state[name] = (tokens - 1, now)
+        return wait_time
+
+
+    def try_acquire(self, host):
+        buckets = self.buckets_for(host)
+        if not buckets:
+            return 0.0
+        with self.lock:
+            if self.state_file is None:
+                return self.take_token(buckets, self.state, time.time())
+            with locked_file(self.state_file) as descriptor:
+                state = read_state(descriptor)
+                wait_time = self.take_token(buckets, state, time.time())
+                if wait_time == 0:
+                    write_state(descriptor, state)
+                return wait_time
+
+
+    def acquire(self, url):
+        '''
+            acquire(self, url) -> Float
+            block until a request to url (or a host name) is allowed by the global and per-host rates, and return the
+            number of seconds spent waiting
+        '''
+        host = (urlsplit(url).hostname or url).lower() if '://' in url else url.lower()
+        started = time.perf_counter()
+        while True:
+            wait_time = self.try_acquire(host)
+            if wait_time == 0:
+                return time.perf_counter() - started
+            time.sleep(wait_time)
@@ -0,0 +1,259 @@
+'''
+This module finds and kills the chromedriver and Chrome processes that no scraper owns any more. A scraper that is
+killed (or crashes) before it quits its driver leaves chromedriver running with init as its parent, along with the
+Chrome it started, and each of those browsers holds hundreds of megabytes for as long as the host is up. reap_orphans
+kills them, and reap_children kills the chromedriver processes the current process started and never quit (and their
+browsers), which is what install_reaper does when a scraper starts and when it exits.
+
+The processes are read from /proc, so this only does anything on Linux. Only processes of the current user are
+touched, and a Chrome process only counts if it was started by chromedriver (it has the --enable-automation flag), so
+browsers started by hand are left alone, and so are the browsers of scrapers that are still running. In a container
+where the scraper itself is PID 1, the processes it starts have PID 1 as their parent too, so PID 1 only counts as init
+when it is not a Python process.
+'''
+import atexit
+import logging
+import os
+import signal
+import time
+
+
+PROC_DIR = '/proc'
+DRIVER_NAMES = ('chromedriver',)
+# the names of Chrome's processes (as shown in /proc/PID/comm, which is cut at 15 characters)
+BROWSER_NAMES = ('chrome', 'chromium', 'chromium-browse', 'headless_shell')
+# the flag chromedriver starts Chrome with
+AUTOMATION_FLAG = '--enable-automation'
+# the processes orphans are handed to: init, or a systemd instance acting as a subreaper
+ORPHAN_PARENT_NAMES = ('systemd',)
+# the start of the names of the processes that may be scrapers (and so the live parents of chromedriver)
+SCRAPER_NAME_PREFIX = 'python'
+KILL_GRACE_PERIOD = 2.0
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessInfo:
+    '''
+        ProcessInfo(pid, parent, name, uid, command_line) -> ProcessInfo
+        A process read from /proc: its id, the id of its parent, its name, the user it runs as and its arguments
+    '''
+    def __init__(self, pid, parent, name, uid, command_line):
+        self.pid = pid
+        self.parent = parent
+        self.name = name
+        self.uid = uid
+        self.command_line = command_line
+
+
+def read_process(pid, proc_dir=PROC_DIR):
+    '''
+        read_process(pid, proc_dir=PROC_DIR) -> (anyOf ProcessInfo None)
+        read a process from /proc, or return None if it is gone (or cannot be read)
+    '''
+    path = os.path.join(proc_dir, str(pid))
+    try:
+        with open(os.path.join(path, 'stat')) as stat_file:
+            stat = stat_file.read()
+        uid = os.stat(path).st_uid
+        with open(os.path.join(path, 'cmdline'), 'rb') as cmdline_file:
+            command_line = [argument.decode('utf-8', 'replace') for argument in cmdline_file.read().split(b'\0') if argument]
+    except OSError:
+        return None
+    # the name is in parentheses and can hold spaces and parentheses itself, so the fields after it are found from the end
+    name = stat[stat.index('(') + 1:stat.rindex(')')]
+    parent = int(stat[stat.rindex(')') + 2:].split()[1])
+    return ProcessInfo(pid, parent, name, uid, command_line)
+
+
+def process_table(proc_dir=PROC_DIR):
+    '''
+        process_table(proc_dir=PROC_DIR) -> Dict
+        return every process in /proc, keyed by process id (an empty dictionary if there is no /proc)
+    '''
+    try:
+        entries = os.listdir(proc_dir)
+    except OSError:
+        return {}
+    processes = {}
+    for entry in entries:
+        if entry.isdigit():
+            process = read_process(int(entry), proc_dir)
+            if process is not None:
+                processes[process.pid] = process
+    return processes
+
+
+def descendants(processes, pid):
+    '''
+        descendants(processes, pid) -> List
+        return the ids of the children of the process pid, their children and so on, parents first
+    '''
+    children = {}
+    for process in processes.values():
+        children.setdefault(process.parent, []).append(process.pid)
+    found = []
+    waiting = list(children.get(pid, []))
+    while waiting:
+        child = waiting.pop(0)
+        found.append(child)
+        waiting.extend(children.get(child, []))
+    return found
+
+
+def is_scraper_process(process):
+    '''
+        is_scraper_process(process) -> Bool
+        return True for chromedriver, and for the main process of a Chrome started by chromedriver (Chrome's helper
+        processes have a --type argument)
+    '''
+    if process.name in DRIVER_NAMES:
+        return True
+    return (
+        (process.name in BROWSER_NAMES) and (AUTOMATION_FLAG in process.command_line) and
+        (not any(argument.startswith('--type=') for argument in process.command_line))
+    )
+
+
+def may_be_scraper(process):
+    '''
+        may_be_scraper(process) -> Bool
+        return True if the process is a Python interpreter (by its name or the program in its command line), which may
+        be a scraper driving browsers of its own
+    '''
+    program = os.path.basename(process.command_line[0]) if process.command_line else ''
+    return process.name.startswith(SCRAPER_NAME_PREFIX) or program.startswith(SCRAPER_NAME_PREFIX)
+
+
+def is_orphan(process, processes):
+    '''
+        is_orphan(process, processes) -> Bool
+        return True if the parent of the process is gone, which leaves it with init (or a systemd subreaper) as its
+        parent. A PID 1 that may be a scraper (i.e. main.py run as the command of a container) is not taken for init.
+    '''
+    if process.parent == 0:
+        return True
+    parent = processes.get(process.parent)
+    if parent is None:
+        return True
+    if parent.pid == 1:
+        return not may_be_scraper(parent)
+    return parent.name in ORPHAN_PARENT_NAMES
+
+
+def orphaned_browsers(processes, uid=None):
+    '''
+        orphaned_browsers(processes, uid=None) -> List
+        return the ids of the chromedriver and Chrome processes of the user uid (the current user by default) that are
+        orphans, and of all of their descendants
+    '''
+    uid = os.getuid() if uid is None else uid
+    pids = []
+    for process in processes.values():
+        if (process.uid == uid) and is_scraper_process(process) and is_orphan(process, processes):
+            pids += [process.pid] + descendants(processes, process.pid)
+    return list(dict.fromkeys(pids))
+
+
+def child_drivers(processes, pid=None):
+    '''
+        child_drivers(processes, pid=None) -> List
+        return the ids of the chromedriver processes started by the process pid (the current process by default), and
+        of all of their descendants (the browsers they started)
+    '''
+    pid = os.getpid() if pid is None else pid
+    pids = []
+    for process in processes.values():
+        if (process.parent == pid) and (process.name in DRIVER_NAMES):
+            pids += [process.pid] + descendants(processes, process.pid)
+    return pids
+
+
+def kill_processes(pids, grace_period=KILL_GRACE_PERIOD):
+    '''
+        kill_processes(pids, grace_period=KILL_GRACE_PERIOD) -> List
+        send SIGTERM to the processes, and SIGKILL to the ones still running grace_period seconds later. Returns the
+        ids of the processes that were signalled.
+    '''
+    signalled = []
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+            signalled.append(pid)
+        except (ProcessLookupError, PermissionError):
+            pass
+    deadline = time.monotonic() + grace_period
+    running = list(signalled)
+    while running and (time.monotonic() < deadline):
+        time.sleep(0.05)
+        running = [pid for pid in running if process_running(pid)]
+    for pid in running:
+        try:
+            os.kill(pid, getattr(signal, 'SIGKILL', signal.SIGTERM))
+        except (ProcessLookupError, PermissionError):
+            pass
+    return signalled
+
+
+def process_running(pid):
+    '''
+        process_running(pid) -> Bool
+        return False if the process is gone. Zombies (processes that exited but were not waited for yet) count as gone,
+        and children of this process that exited are waited for.
+    '''
+    try:
+        if os.waitpid(pid, os.WNOHANG)[0] == pid:
+            return False
+    except ChildProcessError:
+        pass
+    except OSError:
+        return False
+    try:
+        with open(os.path.join(PROC_DIR, str(pid), 'stat')) as stat_file:
+            return stat_file.read().rsplit(')', 1)[1].split()[0] != 'Z'
+    except OSError:
+        return False
+
+
+def reap_orphans(proc_dir=PROC_DIR, grace_period=KILL_GRACE_PERIOD):
+    '''
+        reap_orphans(proc_dir=PROC_DIR, grace_period=KILL_GRACE_PERIOD) -> List
+        kill the chromedriver and Chrome processes of the current user that were left behind by scrapers that are gone,
+        and return their ids
+    '''
+    killed = kill_processes(orphaned_browsers(process_table(proc_dir)), grace_period)
+    if killed:
+        logger.warning('killed %s orphaned chromedriver and Chrome processes: %s', len(killed), killed)
+    return killed
+
+
+def reap_children(proc_dir=PROC_DIR, grace_period=KILL_GRACE_PERIOD):
+    '''
+        reap_children(proc_dir=PROC_DIR, grace_period=KILL_GRACE_PERIOD) -> List
+        kill the chromedriver processes this process started that are still running (drivers that were never quit)
+        along with their browsers, and return their ids
+    '''
+    killed = kill_processes(child_drivers(process_table(proc_dir)), grace_period)
+    if killed:
+        logger.warning('killed %s chromedriver and Chrome processes that were never quit: %s', len(killed), killed)
+    return killed
+
+
+installed = False
+
+
+def install_reaper():
+    '''
+        install_reaper() -> None
+        kill the orphaned chromedriver and Chrome processes now, and the drivers this process leaves running when it
+        exits. Only the first call does anything.
+    '''
+    global installed
+    if installed:
+        return
+    installed = True
+    try:
+        reap_orphans()
+    except Exception as err:
+        logger.warning('failed to look for orphaned chromedriver processes: %s', err)
+    atexit.register(reap_children)
@@ -0,0 +1,148 @@
+'''
+This module lets the YouTube comment iterators carry on after the browser dies. On long runs Chrome or chromedriver
+sometimes goes away (a renderer crash, or the browser being killed for using too much memory), and every WebDriver
+command after that fails. Instead of ending the iteration, SessionRecovery starts a new browser session, opens the video
+again, and fast-forwards to the last comment thread the iterator returned, found by the comment id in its link.
+
+The fast-forward loads the threads by scrolling the last loaded thread into view from a script, one round-trip per
+batch of threads, without reading the threads or returning them again, so the consumer of the iterator sees the same
+stream of comment threads as if the browser had not died. The time each restart took is logged, and kept in the
+browser_restart_seconds metric (with browser_restarts_total counting them).
+'''
+import time
+
+from iterators.browser import create_driver, is_session_lost_error, session_alive
+from iterators.metrics import instrument_driver
+from iterators.output_index import comment_id
+
+
+DEFAULT_MAX_RESTARTS = 3
+# the number of seconds the fast-forward waits for more threads to load before it settles for the threads it has
+FAST_FORWARD_TIMEOUT = 20
+# the number of threads past the old position the fast-forward loads while looking for the last thread returned, before
+# taking it to be deleted
+FAST_FORWARD_SLACK = 100
+# Scrolls the last loaded comment thread into view (so the page loads the next ones), and returns the number of threads
+# loaded along with the position of the thread whose link points to the comment id in arguments[2] (0 if it is not loaded)
+FAST_FORWARD_SCRIPT = '''
+var threads = document.querySelectorAll(arguments[0]);
+var position = 0;
+if (arguments[2]) {
+    for (var i = 0; i < threads.length; i++) {
+        var link = threads[i].querySelector(arguments[1]);
+        if (link && link.href && (new URL(link.href, location.href).searchParams.get('lc') === arguments[2])) {
+            position = i + 1;
+            break;
+        }
+    }
+}
+if ((position === 0) && (threads.length > 0)) {
+    threads[threads.length - 1].scrollIntoView();
+}
+return [threads.length, position];
+'''
+
+
+class SessionRecovery:
+    '''
+        SessionRecovery -> SessionRecovery
+        The crash recovery shared by CommentIterator and YoutubeShortsIterator. The iterators set max_restarts,
+        restarts, last_thread_link and last_thread_position (along with profile_dir and fast_start, the options the
+        browser was started with) in __init__, call remember_thread with every thread they
+        return, and provide:
+
+            open_video(self) - open the video in self.driver and get the page ready for scraping (i.e. open the comments)
+            threads_selector, thread_link_selector - the CSS selectors for the comment threads, and for the link to the
+                                                     comment inside a thread
+
+        restart_if_crashed replaces the default of ThreadRetries (see iterators/thread_failures.py), so a thread that
+        fails because the browser died is scraped again in the new session instead of being counted as failed.
+    '''
+    def remember_thread(self, resulting_comment):
+        '''
+            remember_thread(self, resulting_comment) -> None
+            keep the link and position of the last thread returned, for fast-forwarding after a restart. Threads that do
+            not match the pattern (None) only move the position on.
+        '''
+        if resulting_comment is not None and comment_id(resulting_comment.get('link')):
+            self.last_thread_link = resulting_comment['link']
+            self.last_thread_position = self.comment_thread_count
+
+
+    def restart_if_crashed(self, err=None, fast_forward=True):
+        '''
+            restart_if_crashed(self, err=None, fast_forward=True) -> Bool
+            if err (or, without an error, a check of the session) shows that the browser session is gone, start a new
+            one, open the video again and (if fast_forward is True) fast-forward to where the scrape was. Returns True if
+            the session was restarted, and False if it is alive or has been restarted max_restarts times already.
+        '''
+        if not (((err is not None) and is_session_lost_error(err)) or (not session_alive(self.driver))):
+            return False
+        if self.restarts >= self.max_restarts:
+            self.logger.error('the browser session was lost, and has been restarted %s times already, so the scrape is ended', self.restarts)
+            return False
+        self.restarts += 1
+        started = time.perf_counter()
+        with self.metrics.phase('restart'):
+            self.start_new_session()
+            self.open_video()
+            if fast_forward:
+                self.fast_forward()
+        seconds = time.perf_counter() - started
+        self.metrics.increment('browser_restarts_total')
+        self.metrics.observe('browser_restart_seconds', seconds)
+        self.logger.error(
+            'the browser session was lost (%s), and a new one was started and fast-forwarded to comment thread %s in %.1f seconds',
+            err if err is not None else 'it stopped responding', self.comment_thread_count + 1, seconds
+        )
+        return True
+
+
+    def start_new_session(self):
+        '''
+            start_new_session(self) -> None
+            quit what is left of the old browser session, and start a new one in its place. The new session belongs to
+            the iterator, even if the old one was passed in (i.e. from a BrowserSessionPool, which drops sessions that
+            are returned to it dead).
+        '''
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self.driver = instrument_driver(
+            create_driver(trace=(self.tracer is not None), profile_dir=self.profile_dir, fast_start=self.fast_start), self.metrics
+        )
+        self.owns_driver = True
+        if self.tracer is not None:
+            self.tracer.driver = self.driver
+        # the threads read as HTML belong to the old page
+        self.html_reader = None
+        self.html_threads = []
+
+
+    def fast_forward(self):
+        '''
+            fast_forward(self) -> None
+            load comment threads in the new session until the last thread returned is loaded (found by the comment id in
+            its link), and move the position of the iterator to the thread after it. If that thread is not found (i.e. it
+            was deleted), the position is kept, and the threads up to it are loaded.
+        '''
+        linked_id = comment_id(self.last_thread_link)
+        target_count = self.comment_thread_count + 1
+        loaded = 0
+        deadline = time.monotonic() + FAST_FORWARD_TIMEOUT
+        while time.monotonic() < deadline:
+            (count, position) = self.driver.execute_script(FAST_FORWARD_SCRIPT, self.threads_selector, self.thread_link_selector, linked_id)
+            if position:
+                # threads that did not match the pattern were scraped after the last thread returned
+                self.comment_thread_count = position + (self.comment_thread_count - self.last_thread_position)
+                break
+            if count >= (target_count + (FAST_FORWARD_SLACK if linked_id else 0)):
+                break
+            if count > loaded:
+                loaded = count
+                deadline = time.monotonic() + FAST_FORWARD_TIMEOUT
+            time.sleep(0.2)
+        self.reply_count = 0
+        self.reset_elements()
+        self.update_selectors((self.comment_thread_count + 1), 1)
@@ -0,0 +1,364 @@
+'''
+This module provides sinks that the dictionaries returned by the YouTube comment iterators can be written to, and a
+write-behind writer that sits between an iterator and one or more sinks. The thread driving Selenium only puts
+dictionaries on a bounded queue, and a background thread takes them off the queue in batches and writes each batch to
+every sink. This way a slow disk does not hold up the scraping, and a slow page does not hold up the writing. Since
+every sink receives the same batches, a single scrape can be written to a JSON file, a SQLite database and stdout at
+the same time.
+'''
+import json
+import queue
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+
+
+class Sink(ABC):
+    '''
+        Sink() -> Sink
+        The base class for all sinks. A sink is opened once before the first batch is written, receives lists of
+        dictionaries through write_batch, is flushed by the writer according to its flush policy, and is closed once
+        after the last batch. Only write_batch has to be implemented.
+    '''
+    def open(self):
+        pass
+
+
+    @abstractmethod
+    def write_batch(self, items):
+        raise NotImplementedError(
+            "You should not see this exception message. Just in case, the problem is that the write_batch method has not been implemented"
+        )
+
+
+    def flush(self):
+        pass
+
+
+    def close(self):
+        pass
+
+
+class JSONFileSink(Sink):
+    '''
+        JSONFileSink(filename, key='comments', index_file=None) -> Sink
+        A sink that streams the dictionaries into a JSON file. If key is not None, the file contains a JSON object
+        with one key mapping to the list of dictionaries (i.e. {"comments": [...]}), which is the format main.py
+        has always written. If key is None, the file only contains the JSON list. Items are written as they arrive,
+        so the entire list is never held in memory. If index_file is not None, the byte offset of every item is
+        recorded while it is written, and an index (see iterators/output_index.py) is saved to index_file when the
+        sink is closed.
+    '''
+    def __init__(self, filename, key='comments', index_file=None):
+        self.filename = filename
+        self.key = key
+        self.index_file = index_file
+        self.index = None
+        self.output_file = None
+        self.items_written = 0
+        self.bytes_written = 0
+
+
+    def write_bytes(self, data):
+        '''
+            write_bytes(self, data) -> None
+            write the bytes to the output file and keep track of the offset we are at in the file
+        '''
+        self.output_file.write(data)
+        self.bytes_written += len(data)
+
+
+    def open(self):
+        if self.index_file:
+            from iterators.output_index import OutputIndex
+            self.index = OutputIndex()
+        self.output_file = open(self.filename, 'wb')
+        if self.key is None:
+            self.write_bytes(b'[')
+        else:
+            self.write_bytes('{{{}: ['.format(json.dumps(self.key)).encode('utf-8'))
+
+
+    def write_item(self, item):
+        '''
+            write_item(self, item) -> None
+            write a single dictionary to the file, preceded by a separator if it is not the first item
+        '''
+        if self.items_written:
+            self.write_bytes(b', ')
+        data = json.dumps(item).encode('utf-8')
+        if self.index is not None:
+            self.index.add(self.bytes_written, len(data), item)
+        self.write_bytes(data)
+        self.items_written += 1
+
+
+    def write_batch(self, items):
+        for item in items:
+            self.write_item(item)
+
+
+    def flush(self):
+        self.output_file.flush()
+
+
+    def close(self):
+        if self.output_file:
+            self.write_bytes(b']' if self.key is None else b']}')
+            self.output_file.close()
+            self.output_file = None
+            if self.index is not None:
+                self.index.save(self.index_file)
+
+
+class StdoutSink(Sink):
+    '''
+        StdoutSink(stream=None) -> Sink
+        A sink that writes every comment thread to stdout (or the stream passed in) as one line of JSON. Threads that
+        did not match the regular expression (i.e. None values) are skipped.
+    '''
+    def __init__(self, stream=None):
+        self.stream = stream
+
+
+    def open(self):
+        if self.stream is None:
+            self.stream = sys.stdout
+
+
+    def write_batch(self, items):
+        lines = [json.dumps(item) + '\n' for item in items if item is not None]
+        self.stream.write(''.join(lines))
+
+
+    def flush(self):
+        self.stream.flush()
+
+
+class SQLiteSink(Sink):
+    '''
+        SQLiteSink(filename, table='comments') -> Sink
+        A sink that writes comments into a SQLite database. Every comment (whether it is the main comment of a thread
+        or a reply) is a row in the table. Replies refer to the row of their main comment through the parent column,
+        and the thread column holds the position of the thread in the scrape (starting from 1). Threads that did not
+        match the regular expression (i.e. None values) are skipped, but they are still counted in the thread number.
+        Rows are committed once per batch.
+    '''
+    def __init__(self, filename, table='comments'):
+        self.filename = filename
+        self.table = table
+        self.connection = None
+        self.thread_number = 0
+
+
+    def open(self):
+        # imported here so that the sqlite3 module is only loaded when a SQLite sink is actually used
+        import sqlite3
+        self.connection = sqlite3.connect(self.filename, check_same_thread=False)
+        self.connection.execute(
+            f'CREATE TABLE IF NOT EXISTS {self.table} ('
+            'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+            'thread INTEGER NOT NULL, '
+            'parent INTEGER, '
+            'commenter TEXT, '
+            'content TEXT, '
+            'link TEXT)'
+        )
+        self.connection.commit()
+
+
+    def write_batch(self, items):
+        cursor = self.connection.cursor()
+        insert_statement = f'INSERT INTO {self.table} (thread, parent, commenter, content, link) VALUES (?, ?, ?, ?, ?)'
+        for item in items:
+            self.thread_number += 1
+            if item is None:
+                continue
+            cursor.execute(
+                insert_statement,
+                (self.thread_number, None, item.get('commenter'), item.get('comment content'), item.get('link'))
+            )
+            parent_id = cursor.lastrowid
+            cursor.executemany(insert_statement, [
+                (self.thread_number, parent_id, reply.get('commenter'), reply.get('comment content'), reply.get('link'))
+                for reply in item.get('children', [])
+            ])
+        self.connection.commit()
+
+
+    def close(self):
+        if self.connection:
+            self.connection.commit()
+            self.connection.close()
+            self.connection = None
+
+
+class WriteBehindWriter:
+    '''
+        WriteBehindWriter(sinks, max_queue_size=1000, batch_size=100, flush_interval=1.0) -> WriteBehindWriter
+        A writer that takes dictionaries from the thread calling put, and writes them to every sink in sinks on a
+        background thread.
+
+        Parameters:
+
+            sinks - a list of Sink instances that every dictionary is written to (in the same order for every sink).
+
+            max_queue_size - the maximum number of dictionaries waiting to be written. When the queue is full, put blocks
+                    till the background thread catches up (so memory use stays bounded if the sinks are slower than the scrape).
+
+            batch_size - the number of dictionaries written to the sinks at once. A batch is written as soon as it is full.
+
+            flush_interval - the maximum number of seconds a dictionary waits on the queue before it is written and the
+                    sinks are flushed, even if the batch is not full.
+
+        If a sink raises an exception, the background thread stops, and the exception is raised again from the next
+        call to put, or from close.
+    '''
+    # placed on the queue by close to tell the background thread there is nothing left to write
+    _END_OF_ITEMS = object()
+
+    def __init__(self, sinks, max_queue_size=1000, batch_size=100, flush_interval=1.0):
+        self.sinks = list(sinks)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.items = queue.Queue(maxsize=max(1, max_queue_size))
+        self.error = None
+        self.thread = None
+        self.closed = False
+
+
+    def start(self):
+        '''
+            start(self) -> WriteBehindWriter
+            open all of the sinks and start the background thread that writes to them
+        '''
+        if self.thread is None:
+            for sink in self.sinks:
+                sink.open()
+            self.thread = threading.Thread(target=self.write_items, name='write-behind-writer', daemon=True)
+            self.thread.start()
+        return self
+
+
+    def raise_error(self):
+        '''
+            raise_error(self) -> None
+            raise the exception that stopped the background thread again (if there was one) in the calling thread
+        '''
+        if self.error is not None:
+            raise self.error
+
+
+    def put(self, item):
+        '''
+            put(self, item) -> None
+            queue an item to be written to all of the sinks. This blocks while the queue is full.
+        '''
+        self.start()
+        while True:
+            self.raise_error()
+            try:
+                self.items.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+
+    def write_to_sinks(self, batch):
+        '''
+            write_to_sinks(self, batch) -> None
+            write the batch of items to every sink and flush each sink afterwards
+        '''
+        for sink in self.sinks:
+            sink.write_batch(batch)
+            sink.flush()
+
+
+    def write_items(self):
+        '''
+            write_items(self) -> None
+            the loop run by the background thread. Items are collected into a batch till the batch is full, the
+            flush interval has passed since the first item of the batch was taken off the queue, or close was called.
+            The batch is then written to all of the sinks.
+        '''
+        finished = False
+        try:
+            while not finished:
+                item = self.items.get()
+                if item is self._END_OF_ITEMS:
+                    break
+                batch = [item]
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    time_left = deadline - time.monotonic()
+                    if time_left <= 0:
+                        break
+                    try:
+                        item = self.items.get(timeout=time_left)
+                    except queue.Empty:
+                        break
+                    if item is self._END_OF_ITEMS:
+                        finished = True
+                        break
+                    batch.append(item)
+                self.write_to_sinks(batch)
+        except Exception as err:
+            self.error = err
+            # keep taking items off the queue so that a producer blocked in put wakes up and sees the error
+            while True:
+                try:
+                    self.items.get_nowait()
+                except queue.Empty:
+                    break
+
+
+    def close(self):
+        '''
+            close(self) -> None
+            write all of the remaining items, stop the background thread and close all of the sinks
+        '''
+        if self.closed:
+            return
+        self.closed = True
+        if self.thread is not None:
+            while self.thread.is_alive():
+                try:
+                    self.items.put(self._END_OF_ITEMS, timeout=0.5)
+                    break
+                except queue.Full:
+                    continue
+            self.thread.join()
+        for sink in self.sinks:
+            sink.close()
+        self.raise_error()
+
+
+    def __enter__(self):
+        return self.start()
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def write_behind(iterator, sinks, metrics=None, **kwargs):
+    '''
+        write_behind(iterator, sinks, metrics=None, **kwargs) -> Int
+        iterate over the iterator on the calling thread and write every item to all of the sinks through a
+        WriteBehindWriter (the keyword arguments are passed on to WriteBehindWriter). Returns the number of
+        items that were written. If metrics (a PerformanceMetrics instance from iterators/metrics.py) is passed
+        in, the time spent handing items to the writer (which is only noticeable if the queue is full) is
+        recorded as the "output" phase.
+    '''
+    count = 0
+    with WriteBehindWriter(sinks, **kwargs) as writer:
+        for item in iterator:
+            if metrics is None:
+                writer.put(item)
+            else:
+                with metrics.phase('output'):
+                    writer.put(item)
+            count += 1
+    return count
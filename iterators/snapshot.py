@@ -0,0 +1,330 @@
+'''
+This module extracts comments from the HTML of a YouTube comments section without a browser. It provides:
+
+    HTMLCommentExtractor - a parser (built on html.parser from the standard library) that turns the HTML of comment
+                           threads into the same dictionaries the iterators return
+    snapshots - capture_snapshot saves the HTML of the comments container of a running scrape to a JSON file (the
+                iterators do this when they are given snapshot_file), and load_snapshot/extract_snapshot read one back,
+                so the extraction can be tested and benchmarked in milliseconds without Chrome
+    HTMLCommentReader - the browser side of the iterators' extraction='html' mode, which reads every newly loaded comment
+                        thread with one script call (and expands the replies of a thread with another) and parses the
+                        HTML in Python, instead of querying the elements of every comment through WebDriver
+
+Usage: python -m iterators.snapshot SNAPSHOT [SNAPSHOT ...]
+prints the number of comment threads and comments in each snapshot, and how long the extraction took.
+'''
+import datetime
+import json
+import re
+import sys
+import time
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+
+SNAPSHOT_VERSION = 1
+THREAD_TAG = 'ytd-comment-thread-renderer'
+# the elements YouTube has used for a single comment (the main comment of a thread, or a reply)
+COMMENT_TAGS = ('ytd-comment-renderer', 'ytd-comment-view-model')
+# elements that have no end tag, so they are never put on the stack of open elements
+VOID_ELEMENTS = frozenset((
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source', 'track', 'wbr',
+))
+WHITESPACE = re.compile(r'\s+')
+# returns the outerHTML of the element holding the comment threads (or None if no comment thread has loaded)
+CONTAINER_HTML_SCRIPT = '''
+var thread = document.querySelector(arguments[0]);
+return thread ? thread.parentElement.outerHTML : null;
+'''
+# returns the outerHTML of every comment thread from the (0-based) position arguments[1] onwards, and scrolls the last
+# thread into view so that the next page of comment threads starts loading
+NEW_THREADS_SCRIPT = '''
+var threads = document.querySelectorAll(arguments[0]);
+var results = [];
+for (var i = arguments[1]; i < threads.length; i++) {
+    results.push(threads[i].outerHTML);
+}
+if (threads.length > arguments[1]) {
+    threads[threads.length - 1].scrollIntoView();
+}
+return results;
+'''
+# expands the replies of the comment thread at position arguments[1], clicks every "more replies" continuation until
+# all of the replies have loaded (or arguments[2] milliseconds have passed), and then returns the outerHTML of the
+# thread and hides the replies again
+EXPAND_REPLIES_SCRIPT = '''
+var thread = document.querySelectorAll(arguments[0])[arguments[1]];
+var timeout = arguments[2];
+var done = arguments[arguments.length - 1];
+if (!thread) {
+    done(null);
+    return;
+}
+var started = Date.now();
+var clicked = [];
+var stableChecks = 0;
+var moreReplies = thread.querySelector('#replies #more-replies button');
+if (moreReplies) {
+    moreReplies.click();
+}
+function check() {
+    var continuation = thread.querySelector('#replies ytd-continuation-item-renderer button');
+    var replies = thread.querySelectorAll('#replies ytd-comment-renderer, #replies ytd-comment-view-model').length;
+    if (continuation) {
+        stableChecks = 0;
+        if (clicked.indexOf(continuation) === -1) {
+            clicked.push(continuation);
+            continuation.click();
+        }
+    } else if (replies > 0) {
+        stableChecks += 1;
+    }
+    if ((stableChecks >= 3) || ((Date.now() - started) > timeout)) {
+        var html = thread.outerHTML;
+        var lessReplies = thread.querySelector('#replies #less-replies button');
+        if (lessReplies) {
+            lessReplies.click();
+        }
+        done(html);
+        return;
+    }
+    setTimeout(check, 100);
+}
+check();
+'''
+
+
+def normalize_text(text):
+    '''
+        normalize_text(text) -> Str
+        return text with the whitespace collapsed the way a browser renders it (line breaks from <br> are kept)
+    '''
+    return '\n'.join(' '.join(line.split()) for line in text.split('\n')).strip()
+
+
+class HTMLCommentExtractor(HTMLParser):
+    '''
+        HTMLCommentExtractor(base_url='') -> HTMLCommentExtractor
+        A parser for the HTML of YouTube comment threads. Feed it HTML (with feed, then call close), and the comment
+        threads found are in the threads attribute, as dictionaries with the keys 'commenter', 'comment content', 'link'
+        and 'children' (like the iterators return). Links are made absolute with base_url. The fields are read from
+        the same elements the iterators use: the text of #author-text (without its first character, i.e. the "@"),
+        the text of #content-text, and the link in the yt-formatted-string under #header-author.
+    '''
+    def __init__(self, base_url=''):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.threads = []
+        # the open elements, as (tag, id) pairs, and the number of open elements with each tag
+        self.stack = []
+        self.open_tags = {}
+        self.thread = None
+        self.thread_depth = None
+        self.thread_has_comment = False
+        self.replies_depth = None
+        self.comment = None
+        self.comment_depth = None
+        # the text being collected for a field of the current comment: [field, depth, list of strings]
+        self.captures = []
+
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_ELEMENTS:
+            if tag == 'br':
+                for capture in self.captures:
+                    capture[2].append('\n')
+            return
+        attributes = dict(attrs)
+        element_id = attributes.get('id')
+        parent = self.stack[-1] if self.stack else (None, None)
+        grandparent = self.stack[-2] if len(self.stack) > 1 else (None, None)
+        self.stack.append((tag, element_id))
+        self.open_tags[tag] = self.open_tags.get(tag, 0) + 1
+        depth = len(self.stack)
+        if tag == THREAD_TAG:
+            self.thread = {'commenter': '', 'comment content': '', 'link': '', 'children': []}
+            self.thread_depth = depth
+            self.thread_has_comment = False
+            self.threads.append(self.thread)
+        elif self.thread is None:
+            return
+        elif (element_id == 'replies') and (self.replies_depth is None):
+            self.replies_depth = depth
+        elif (tag in COMMENT_TAGS) and (self.comment is None):
+            if self.replies_depth is not None:
+                self.comment = {'commenter': '', 'comment content': '', 'link': ''}
+                self.thread['children'].append(self.comment)
+            elif not self.thread_has_comment:
+                self.thread_has_comment = True
+                self.comment = self.thread
+            else:
+                return
+            self.comment_depth = depth
+        elif self.comment is not None:
+            if (element_id == 'author-text') and (not self.comment['commenter']):
+                self.captures.append(['commenter', depth, []])
+            elif (element_id == 'content-text') and (not self.comment['comment content']):
+                self.captures.append(['comment content', depth, []])
+            elif (tag == 'a') and (parent[0] == 'yt-formatted-string') and (grandparent[1] == 'header-author') and (not self.comment['link']):
+                self.comment['link'] = urljoin(self.base_url, attributes.get('href') or '')
+
+
+    def handle_endtag(self, tag):
+        # end tags without an open element are ignored, and end tags that skip open elements close them as well
+        if (tag in VOID_ELEMENTS) or (not self.open_tags.get(tag)):
+            return
+        while self.stack:
+            (open_tag, _) = self.stack.pop()
+            self.open_tags[open_tag] -= 1
+            self.close_element(len(self.stack) + 1)
+            if open_tag == tag:
+                break
+
+
+    def close_element(self, depth):
+        for capture in [capture for capture in self.captures if capture[1] == depth]:
+            self.captures.remove(capture)
+            (field, _, parts) = capture
+            text = normalize_text(''.join(parts))
+            # the iterators drop the first character of the channel name (the "@")
+            self.comment[field] = text[1:] if field == 'commenter' else text
+        if depth == self.comment_depth:
+            self.comment = None
+            self.comment_depth = None
+        elif depth == self.replies_depth:
+            self.replies_depth = None
+        elif depth == self.thread_depth:
+            self.thread = None
+            self.thread_depth = None
+
+
+    def handle_data(self, data):
+        if self.captures:
+            data = WHITESPACE.sub(' ', data)
+            for capture in self.captures:
+                capture[2].append(data)
+
+
+def extract_threads(html, base_url=''):
+    '''
+        extract_threads(html, base_url='') -> List
+        return the comment threads in html (see HTMLCommentExtractor)
+    '''
+    extractor = HTMLCommentExtractor(base_url)
+    extractor.feed(html)
+    extractor.close()
+    return extractor.threads
+
+
+def capture_snapshot(driver, filename, thread_selector, kind):
+    '''
+        capture_snapshot(driver, filename, thread_selector, kind) -> Bool
+        save the HTML of the element holding the comment threads (found through thread_selector, the CSS selector of
+        the comment threads) on the page open in driver to filename, along with the URL of the page and the kind of
+        iterator ('regular' or 'shorts'). Returns False (and saves nothing) if no comment thread has loaded.
+    '''
+    html = driver.execute_script(CONTAINER_HTML_SCRIPT, thread_selector)
+    if html is None:
+        return False
+    snapshot = {
+        'version': SNAPSHOT_VERSION,
+        'kind': kind,
+        'url': driver.current_url,
+        'captured_at': datetime.datetime.now().isoformat(),
+        'html': html,
+    }
+    with open(filename, 'w') as snapshot_file:
+        json.dump(snapshot, snapshot_file)
+    return True
+
+
+def load_snapshot(filename):
+    '''
+        load_snapshot(filename) -> Dict
+        read a snapshot saved by capture_snapshot
+    '''
+    with open(filename) as snapshot_file:
+        snapshot = json.load(snapshot_file)
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        raise Exception('Unsupported snapshot version {} in {}'.format(snapshot.get('version'), filename))
+    return snapshot
+
+
+def extract_snapshot(snapshot):
+    '''
+        extract_snapshot(snapshot) -> List
+        return the comment threads in a snapshot (a dictionary from load_snapshot), with the links made absolute
+        against the URL the snapshot was captured from
+    '''
+    return extract_threads(snapshot['html'], snapshot.get('url', ''))
+
+
+class HTMLCommentReader:
+    '''
+        HTMLCommentReader(driver, thread_selector, reply_timeout=20) -> HTMLCommentReader
+        Reads the comment threads on the page open in driver (found through thread_selector, the CSS selector of the
+        comment threads) as HTML, and extracts them with HTMLCommentExtractor. reply_timeout is the maximum number of
+        seconds spent loading the replies of one thread.
+    '''
+    def __init__(self, driver, thread_selector, reply_timeout=20):
+        self.driver = driver
+        self.thread_selector = thread_selector
+        self.reply_timeout = reply_timeout
+        self.base_url = driver.current_url
+        # the replies are loaded inside one asynchronous script, which must be allowed to run for reply_timeout seconds
+        driver.set_script_timeout(reply_timeout + 10)
+
+
+    def new_threads(self, start):
+        '''
+            new_threads(self, start) -> List
+            return the comment threads that have loaded from the (0-based) position start onwards, as (thread, has_replies)
+            pairs, where has_replies is True if the replies of the thread have not been loaded yet
+        '''
+        results = []
+        for html in self.driver.execute_script(NEW_THREADS_SCRIPT, self.thread_selector, start):
+            threads = extract_threads(html, self.base_url)
+            if threads:
+                results.append((threads[0], 'id="more-replies"' in html))
+        return results
+
+
+    def wait_for_threads(self, start, timeout=20, poll_frequency=0.1):
+        '''
+            wait_for_threads(self, start, timeout=20, poll_frequency=0.1) -> List
+            wait up to timeout seconds for comment threads to load from the position start onwards, and return them
+            (see new_threads). An empty list is returned if none load in time.
+        '''
+        deadline = time.monotonic() + timeout
+        while True:
+            threads = self.new_threads(start)
+            if threads or (time.monotonic() >= deadline):
+                return threads
+            time.sleep(poll_frequency)
+
+
+    def thread_with_replies(self, position):
+        '''
+            thread_with_replies(self, position) -> (anyOf Dict None)
+            expand the replies of the comment thread at the (0-based) position, and return the thread with all of its
+            replies (or None if the thread is not on the page)
+        '''
+        html = self.driver.execute_async_script(EXPAND_REPLIES_SCRIPT, self.thread_selector, position, self.reply_timeout * 1000)
+        if html is None:
+            return None
+        threads = extract_threads(html, self.base_url)
+        return threads[0] if threads else None
+
+
+def main():
+    for filename in sys.argv[1:]:
+        snapshot = load_snapshot(filename)
+        started = time.perf_counter()
+        threads = extract_snapshot(snapshot)
+        milliseconds = (time.perf_counter() - started) * 1000
+        comments = sum(1 + len(thread['children']) for thread in threads)
+        print(f'{filename}: {len(threads)} comment threads, {comments} comments, extracted in {milliseconds:.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
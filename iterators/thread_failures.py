@@ -0,0 +1,269 @@
+'''
+This module keeps track of the comment threads an iterator failed to scrape. A thread that raises an unexpected error
+(i.e. a "more replies" click that does not go through, or an element that goes stale while it is read) is skipped and
+recorded here, and the iterator carries on with the next thread instead of ending the scrape. Once there are no threads
+left, the iterator retries the failed threads one at a time through their links: a link with the "lc" parameter opens
+the video with the linked comment thread shown first in the comments section. Each thread is tried at most max_attempts
+more times before it is given up on (lost).
+
+The outcome is kept per thread (the threads attribute) and summed up by stats(), which the iterators also log and add to
+their metrics as the thread_failures_total counter (with the outcome as the "status" label). ThreadRetries holds the
+part of this that is the same for both iterators.
+'''
+import datetime
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
+
+from selenium.webdriver.common.by import By
+
+from iterators.output_index import comment_id
+
+
+DEFAULT_RETRY_ATTEMPTS = 2
+# the number of threads in a row that can fail before the rest of the page is given up on (the failed threads are still
+# retried, since a fresh page load often gets past whatever broke the page)
+MAX_CONSECUTIVE_FAILURES = 5
+PENDING = 'pending'
+RECOVERED = 'recovered'
+LOST = 'lost'
+
+
+def link_with_comment(url, comment_id):
+    '''
+        link_with_comment(url, comment_id) -> Str
+        return url with its "lc" parameter set to comment_id (i.e. to open a YouTube Short with a comment highlighted)
+    '''
+    parts = urlsplit(url)
+    query = [(name, value) for (name, values) in parse_qs(parts.query).items() if name != 'lc' for value in values]
+    query.append(('lc', comment_id))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+
+
+class FailedThreads:
+    '''
+        FailedThreads(max_attempts=DEFAULT_RETRY_ATTEMPTS, max_consecutive=MAX_CONSECUTIVE_FAILURES) -> FailedThreads
+        The comment threads that failed to scrape, in the order they failed. Each one is a dictionary with the keys
+        'position' (the 1-based position of the thread on the page), 'link', 'error' (the last error), 'attempts' (the
+        number of retries so far) and 'status' (pending, recovered or lost). Threads without a link to retry them
+        through are lost straight away.
+    '''
+    def __init__(self, max_attempts=DEFAULT_RETRY_ATTEMPTS, max_consecutive=MAX_CONSECUTIVE_FAILURES):
+        self.max_attempts = max_attempts
+        self.max_consecutive = max_consecutive
+        self.threads = []
+        self.consecutive_failures = 0
+        self.retrying = False
+
+
+    def record(self, position, link, error):
+        '''
+            record(self, position, link, error) -> Dict
+            record that the thread at position failed with error, and return its entry
+        '''
+        thread = {
+            'position': position,
+            'link': link or '',
+            'error': repr(error),
+            'attempts': 0,
+            'status': PENDING if comment_id(link) and (self.max_attempts > 0) else LOST,
+        }
+        self.threads.append(thread)
+        self.consecutive_failures += 1
+        return thread
+
+
+    def succeeded(self):
+        self.consecutive_failures = 0
+
+
+    def too_many_in_a_row(self):
+        return self.consecutive_failures >= self.max_consecutive
+
+
+    def next_retry(self):
+        '''
+            next_retry(self) -> (anyOf Dict None)
+            return the pending thread that has been retried the fewest times, counting the attempt, or None if there
+            are none left
+        '''
+        pending = [thread for thread in self.threads if thread['status'] == PENDING]
+        if not pending:
+            return None
+        thread = min(pending, key=lambda thread: thread['attempts'])
+        thread['attempts'] += 1
+        return thread
+
+
+    def retry_failed(self, thread, error):
+        thread['error'] = repr(error)
+        if thread['attempts'] >= self.max_attempts:
+            thread['status'] = LOST
+
+
+    def recovered(self, thread):
+        thread['status'] = RECOVERED
+
+
+    def give_up(self):
+        '''
+            give_up(self) -> Int
+            mark the threads that are still pending as lost (i.e. when the time limit runs out before they are retried),
+            and return how many there were
+        '''
+        given_up = 0
+        for thread in self.threads:
+            if thread['status'] == PENDING:
+                thread['status'] = LOST
+                given_up += 1
+        return given_up
+
+
+    def stats(self):
+        '''
+            stats(self) -> Dict
+            return the number of threads that failed, that were retried, and that were recovered or lost (threads
+            still pending are counted under failed and retried only)
+        '''
+        return {
+            'failed': len(self.threads),
+            'retried': sum(1 for thread in self.threads if thread['attempts'] > 0),
+            'recovered': sum(1 for thread in self.threads if thread['status'] == RECOVERED),
+            'lost': sum(1 for thread in self.threads if thread['status'] == LOST),
+        }
+
+
+class ThreadRetries:
+    '''
+        ThreadRetries -> ThreadRetries
+        The failure isolation shared by CommentIterator and YoutubeShortsIterator. The iterators keep a FailedThreads in
+        their failed_threads attribute, call next_thread from __next__, and provide:
+
+            scrape_next_thread(self) - scrape the next comment thread (raising StopIteration once there are none left)
+            scrape_linked_thread(self, link) - open the link to a comment and scrape the thread it points to
+            time_to_stop_scraping(self) - whether the comment limit or the time limit has been reached
+
+        restart_if_crashed and remember_thread do nothing here, and are replaced by SessionRecovery (see
+        iterators/session_recovery.py) in iterators that restart the browser when it dies.
+    '''
+    def restart_if_crashed(self, err=None, fast_forward=True):
+        return False
+
+
+    def remember_thread(self, resulting_comment):
+        pass
+
+
+    def time_limit_passed(self):
+        return self.time_limit_exists and ((datetime.datetime.now() - self.start_time) > self.total_time_limit)
+
+
+    def next_thread(self):
+        '''
+            next_thread(self) -> (anyOf Dict None)
+            return the next comment thread. A thread that fails with an unexpected error is skipped and recorded in
+            failed_threads, and once there are no threads left, the failed threads are retried through their links.
+            StopIteration is raised when the retries are done too.
+        '''
+        while not self.failed_threads.retrying:
+            position = self.comment_thread_count + 1
+            comments_before = self.total_comments_parsed
+            try:
+                resulting_comment = self.scrape_next_thread()
+            except StopIteration:
+                # the next thread not showing up can also be the browser having died
+                if self.restart_if_crashed():
+                    self.total_comments_parsed = comments_before
+                else:
+                    self.failed_threads.retrying = True
+            except Exception as err:
+                if self.restart_if_crashed(err):
+                    self.total_comments_parsed = comments_before
+                else:
+                    self.skip_failed_thread(err, position, comments_before)
+            else:
+                self.failed_threads.succeeded()
+                self.remember_thread(resulting_comment)
+                return resulting_comment
+        return self.retry_failed_thread()
+
+
+    def failed_thread_link(self, position):
+        '''
+            failed_thread_link(self, position) -> Str
+            return the link to the comment thread at position, or an empty string if it cannot be read
+        '''
+        self.update_selectors(position, 1)
+        try:
+            return self.get_attribute(self.driver.find_element(By.CSS_SELECTOR, self.comment_link_selector), 'href') or ''
+        except Exception:
+            return ''
+
+
+    def skip_failed_thread(self, err, position, comments_before):
+        '''
+            skip_failed_thread(self, err, position, comments_before) -> None
+            record the thread at position as failed (with its link, if it can still be read), and move on to the next
+            thread, leaving out the comments counted for the failed one. If too many threads have failed in a row, the
+            rest of the page is given up on and the retries start.
+        '''
+        self.logger.exception(err)
+        thread = self.failed_threads.record(position, self.failed_thread_link(position), err)
+        self.metrics.increment('thread_failures_total', status='failed')
+        if thread['status'] == LOST:
+            self.metrics.increment('thread_failures_total', status='lost')
+        self.comment_thread_count = position
+        self.reply_count = 0
+        self.total_comments_parsed = comments_before
+        self.reset_elements()
+        self.update_selectors((position + 1), 1)
+        if self.failed_threads.too_many_in_a_row():
+            self.logger.error('%s comment threads in a row failed, so the rest of the page is skipped', self.failed_threads.consecutive_failures)
+            self.failed_threads.retrying = True
+
+
+    def retry_failed_thread(self):
+        '''
+            retry_failed_thread(self) -> (anyOf Dict None)
+            retry the failed threads through their links until one of them is scraped, and return it. StopIteration is
+            raised once every failed thread has been recovered or lost, or the comment limit or the time limit has been
+            reached (the threads still pending are then given up on).
+        '''
+        while True:
+            thread = None if self.time_to_stop_scraping() else self.failed_threads.next_retry()
+            if thread is None:
+                self.finish_retries()
+                raise StopIteration
+            comments_before = self.total_comments_parsed
+            position = self.comment_thread_count
+            try:
+                with self.metrics.phase('retry_thread'):
+                    resulting_comment = self.scrape_linked_thread(thread['link'])
+            except Exception as err:
+                self.logger.exception(err)
+                self.total_comments_parsed = comments_before
+                if self.restart_if_crashed(err, fast_forward=False):
+                    # the attempt is not counted, since the retry opens the link in the new session anyway
+                    thread['attempts'] -= 1
+                    continue
+                self.failed_threads.retry_failed(thread, err)
+                if thread['status'] == LOST:
+                    self.metrics.increment('thread_failures_total', status='lost')
+            else:
+                self.failed_threads.recovered(thread)
+                self.metrics.increment('thread_failures_total', status='recovered')
+                return resulting_comment
+            finally:
+                # the recovered thread already has its position, so it is not counted again
+                self.comment_thread_count = position
+                self.reply_count = 0
+                self.reset_elements()
+
+
+    def finish_retries(self):
+        given_up = self.failed_threads.give_up()
+        if given_up:
+            self.metrics.increment('thread_failures_total', amount=given_up, status='lost')
+        stats = self.failed_threads.stats()
+        if stats['lost']:
+            self.logger.error('comment threads failed: %s, retried: %s, recovered: %s, lost: %s', stats['failed'], stats['retried'], stats['recovered'], stats['lost'])
+        elif stats['failed']:
+            self.logger.debug('comment threads failed: %s, retried: %s, recovered: %s, lost: %s', stats['failed'], stats['retried'], stats['recovered'], stats['lost'])
@@ -0,0 +1,47 @@
+'''
+This module reads the state of the comment thread (or reply) an iterator is on with a single script call. The iterators
+used to ask "does this element exist?" one selector at a time, each one a WebDriver round-trip, and the Shorts iterator
+waited up to 5 seconds for every answer, so an element that is not there (a thread without replies, or a thread whose
+replies have all loaded) cost the full timeout. probe_thread_state answers all of those questions at once and right
+away, so the iterators only wait when something is actually loading (i.e. after clicking a "more replies" button).
+'''
+
+
+# Returns, for every name in arguments[0], whether an element matches its selector, and for every name in arguments[1],
+# the number of elements matching its selector
+THREAD_STATE_SCRIPT = '''
+var state = {};
+var present = arguments[0];
+var counted = arguments[1];
+Object.keys(present).forEach(function (name) {
+    state[name] = document.querySelector(present[name]) !== null;
+});
+Object.keys(counted).forEach(function (name) {
+    state[name] = document.querySelectorAll(counted[name]).length;
+});
+return state;
+'''
+
+
+class ThreadState:
+    '''
+        ThreadState(values) -> ThreadState
+        The state of the page read by probe_thread_state. Every name in values is an attribute, i.e. state.more_replies
+        is True if the "more replies" continuation of the thread is there, and state.rendered_replies is the number of
+        replies loaded.
+    '''
+    def __init__(self, values):
+        self.__dict__.update(values)
+
+
+    def __repr__(self):
+        return 'ThreadState({})'.format(', '.join(f'{name}={value!r}' for (name, value) in sorted(vars(self).items())))
+
+
+def probe_thread_state(driver, present, counted=None):
+    '''
+        probe_thread_state(driver, present, counted=None) -> ThreadState
+        return whether an element matching each selector in present (a dictionary of names and CSS selectors) is on the
+        page, and how many elements match each selector in counted, read with one script call and without waiting
+    '''
+    return ThreadState(driver.execute_script(THREAD_STATE_SCRIPT, present, counted or {}))
@@ -0,0 +1,158 @@
+'''
+This module records traces of a scrape for offline performance analysis. In trace mode, Chrome's performance log is
+turned on (see iterators/browser.py), which holds the network and page events along with Chrome's DevTools timeline
+(long tasks, layout, script execution and so on). TraceRecorder collects those, along with the WebDriver commands sent
+by the iterator and the phases of the scrape (from iterators/metrics.py), and writes them all to one file in the Trace
+Event Format. The file can be opened in chrome://tracing, https://ui.perfetto.dev or the DevTools performance panel.
+
+All of the events are placed on the wall clock, so the commands sent by the scraper line up with what the browser did
+in response to them.
+'''
+import json
+import time
+
+
+SCRAPER_PID = 1
+COMMANDS_TID = 1
+PHASES_TID = 2
+NETWORK_PID = 2
+# the number of seconds between reads of Chrome's performance log (reading it empties Chrome's buffer)
+COLLECT_INTERVAL = 5
+MICROSECONDS_PER_SECOND = 1000000
+
+
+class TraceRecorder:
+    '''
+        TraceRecorder(filename, driver, metrics) -> TraceRecorder
+        Records a trace of the scrape done with driver (a WebDriver started in trace mode) and writes it to filename
+        when save is called. The WebDriver commands and phases are taken from metrics (a PerformanceMetrics instance
+        that driver was instrumented with).
+    '''
+    def __init__(self, filename, driver, metrics):
+        self.filename = filename
+        self.driver = driver
+        self.events = []
+        # the difference between the wall clock and Chrome's clock, in microseconds (found from the network events)
+        self.clock_offset = None
+        # Chrome's own trace events waiting for the clock offset to be known
+        self.unaligned_events = []
+        self.requests = {}
+        self.collecting = False
+        self.last_collected = time.monotonic()
+        self.saved = False
+        metrics.command_listeners.append(self.record_command)
+        metrics.phase_listeners.append(self.record_phase)
+
+
+    def record_command(self, command, started, duration):
+        self.events.append({
+            'name': command, 'cat': 'webdriver', 'ph': 'X', 'pid': SCRAPER_PID, 'tid': COMMANDS_TID,
+            'ts': started * MICROSECONDS_PER_SECOND, 'dur': duration * MICROSECONDS_PER_SECOND,
+        })
+
+
+    def record_phase(self, name, started, duration):
+        self.events.append({
+            'name': name, 'cat': 'phase', 'ph': 'X', 'pid': SCRAPER_PID, 'tid': PHASES_TID,
+            'ts': started * MICROSECONDS_PER_SECOND, 'dur': duration * MICROSECONDS_PER_SECOND,
+        })
+        if (time.monotonic() - self.last_collected) >= COLLECT_INTERVAL:
+            self.collect()
+
+
+    def collect(self):
+        '''
+            collect(self) -> None
+            read the entries in Chrome's performance log and turn them into trace events
+        '''
+        if self.collecting:
+            return
+        self.collecting = True
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception:
+            entries = []
+        finally:
+            self.collecting = False
+            self.last_collected = time.monotonic()
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            self.add_log_message(message.get('method', ''), message.get('params', {}), entry.get('timestamp'))
+
+
+    def add_log_message(self, method, params, timestamp):
+        '''
+            add_log_message(self, method, params, timestamp) -> None
+            turn one message from the performance log into trace events. timestamp is the wall clock time (in
+            milliseconds) that ChromeDriver logged the message at.
+        '''
+        if method == 'Tracing.dataCollected':
+            for event in params.get('value', []):
+                if self.clock_offset is None:
+                    self.unaligned_events.append(event)
+                else:
+                    self.add_chrome_event(event)
+            return
+        if timestamp is None:
+            return
+        wall_time = timestamp * 1000
+        if ('timestamp' in params) and (self.clock_offset is None) and method.startswith('Network.'):
+            self.clock_offset = wall_time - (params['timestamp'] * MICROSECONDS_PER_SECOND)
+            for event in self.unaligned_events:
+                self.add_chrome_event(event)
+            self.unaligned_events = []
+        if 'timestamp' in params and self.clock_offset is not None:
+            wall_time = (params['timestamp'] * MICROSECONDS_PER_SECOND) + self.clock_offset
+        request_id = params.get('requestId')
+        if method == 'Network.requestWillBeSent':
+            self.requests[request_id] = (wall_time, params.get('request', {}).get('url', ''))
+        elif method in ('Network.loadingFinished', 'Network.loadingFailed'):
+            (started, url) = self.requests.pop(request_id, (None, ''))
+            if started is not None:
+                self.events.append({
+                    'name': url[:200] or request_id, 'cat': 'network', 'ph': 'X', 'pid': NETWORK_PID, 'tid': 1,
+                    'ts': started, 'dur': max(0, wall_time - started),
+                    'args': {'failed': method == 'Network.loadingFailed', 'bytes': params.get('encodedDataLength')},
+                })
+        elif method.startswith('Page.'):
+            self.events.append({
+                'name': method, 'cat': 'page', 'ph': 'i', 's': 'g', 'pid': NETWORK_PID, 'tid': 1, 'ts': wall_time,
+            })
+
+
+    def add_chrome_event(self, event):
+        '''
+            add_chrome_event(self, event) -> None
+            add one of Chrome's own trace events, moved onto the wall clock
+        '''
+        if 'ts' in event:
+            event = dict(event, ts=event['ts'] + self.clock_offset)
+        self.events.append(event)
+
+
+    def metadata_events(self):
+        return [
+            {'name': 'process_name', 'ph': 'M', 'pid': SCRAPER_PID, 'args': {'name': 'scraper'}},
+            {'name': 'thread_name', 'ph': 'M', 'pid': SCRAPER_PID, 'tid': COMMANDS_TID, 'args': {'name': 'WebDriver commands'}},
+            {'name': 'thread_name', 'ph': 'M', 'pid': SCRAPER_PID, 'tid': PHASES_TID, 'args': {'name': 'phases'}},
+            {'name': 'process_name', 'ph': 'M', 'pid': NETWORK_PID, 'args': {'name': 'network and page events'}},
+        ]
+
+
+    def save(self):
+        '''
+            save(self) -> None
+            read what is left in Chrome's performance log and write the trace to the file. This must be called before
+            the driver is quit. Only the first call writes the file.
+        '''
+        if self.saved:
+            return
+        self.saved = True
+        self.collect()
+        # Chrome's trace events that could not be placed on the wall clock are kept on Chrome's clock
+        events = self.metadata_events() + self.events + self.unaligned_events
+        with open(self.filename, 'w') as trace_file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, trace_file)
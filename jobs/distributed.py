@@ -0,0 +1,289 @@
+'''
+This module spreads scraping across several machines that share a job store (see jobs/store.py):
+
+    Coordinator - takes in jobs from a spool directory and/or a unix socket (like the scheduler in jobs/scheduler.py)
+                  and adds them to the store. It also reclaims the jobs of nodes whose leases expired, and logs how many
+                  jobs are in each state.
+    WorkerNode - leases jobs from the store and scrapes them with up to slots worker processes at once (one browser
+                 each), sending heartbeats for the jobs it holds. When a job is done, where its output was written and
+                 the metrics of the scrape are recorded in the store.
+
+Throughput grows by starting more worker nodes (i.e. "python main.py --worker-node --queue-db /shared/jobs.db" on
+every machine). Every worker process runs main.scrape_video with the existing iterators.
+'''
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import tempfile
+import threading
+import time
+import traceback
+
+from jobs.job_queue import DEFAULT_MAX_ATTEMPTS, DEFAULT_RETRY_DELAY, QUEUED
+from jobs.scheduler import JobIntake, job_options, kill_process_group, stop_process
+from jobs.store import DEFAULT_LEASE_SECONDS
+
+
+logger = logging.getLogger(__name__)
+
+
+def scrape_and_report(url, options):
+    '''
+        scrape_and_report(url, options) -> Dict
+        the default work done for a job on a worker node: scrape the video with main.scrape_video, and return where the
+        output was written (the host, and the absolute paths of the files) and the metrics of the scrape
+    '''
+    import main
+    options = dict(options)
+    metrics_file = None
+    if not options.get('metrics'):
+        (handle, metrics_file) = tempfile.mkstemp(suffix='.json', prefix='job-metrics-')
+        os.close(handle)
+        options.update(metrics=metrics_file, metrics_format='json')
+    started = time.time()
+    try:
+        threads = main.scrape_video(url, **options)
+        metrics = {'comment_threads_written': threads, 'seconds': time.time() - started}
+        if options.get('metrics_format', 'json') == 'json':
+            try:
+                with open(options['metrics']) as exported:
+                    exported_metrics = json.load(exported)
+                metrics.update(counters=exported_metrics['counters'], gauges=exported_metrics['gauges'])
+            except (OSError, ValueError, KeyError):
+                pass
+    finally:
+        if metrics_file and os.path.exists(metrics_file):
+            os.remove(metrics_file)
+    output = {'host': socket.gethostname(), 'output': os.path.abspath(options.get('output', 'comments.json'))}
+    for key in ('sqlite', 'summary', 'metrics', 'trace_file', 'snapshot_file', 'dedup_report'):
+        if options.get(key) and (options[key] != metrics_file):
+            output[key] = os.path.abspath(options[key])
+    return {'output': output, 'metrics': metrics}
+
+
+def run_reporting_worker(work, url, options, connection):
+    '''
+        run_reporting_worker(work, url, options, connection) -> None
+        the entry point of a worker process on a worker node. Like run_worker (see jobs/scheduler.py), it starts a
+        process group of its own and exits with an error code of 1 if work raises an exception. The result of
+        work(url, options) is sent back through connection.
+    '''
+    if hasattr(os, 'setpgrp'):
+        os.setpgrp()
+    try:
+        connection.send(work(url, options))
+    except BaseException:
+        traceback.print_exc()
+        os._exit(1)
+    finally:
+        connection.close()
+
+
+def default_node_id():
+    return f'{socket.gethostname()}-{os.getpid()}'
+
+
+class Coordinator(JobIntake):
+    '''
+        Coordinator(store, spool_dir=None, socket_path=None, poll_interval=5.0, default_timeout=None,
+                    default_max_attempts=DEFAULT_MAX_ATTEMPTS, status_interval=60.0) -> Coordinator
+        Adds the jobs from spool_dir and socket_path to store every poll_interval seconds, reclaims expired leases, and
+        logs the number of jobs in each state every status_interval seconds.
+    '''
+    def __init__(self, store, spool_dir=None, socket_path=None, poll_interval=5.0, default_timeout=None,
+                 default_max_attempts=DEFAULT_MAX_ATTEMPTS, status_interval=60.0):
+        super().__init__(store, spool_dir=spool_dir, socket_path=socket_path, default_timeout=default_timeout,
+                         default_max_attempts=default_max_attempts)
+        self.poll_interval = poll_interval
+        self.status_interval = status_interval
+        self.stopped = threading.Event()
+
+
+    def run(self):
+        '''
+            run(self) -> None
+            run the coordinator until stop is called (or SIGTERM/SIGINT is received, when run from the main thread)
+        '''
+        if self.spool_dir:
+            os.makedirs(self.spool_dir, exist_ok=True)
+        if self.socket_path:
+            self.start_socket_server()
+        if threading.current_thread() is threading.main_thread():
+            for signal_number in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(signal_number, lambda number, frame: self.stop())
+        last_status = None
+        try:
+            while not self.stopped.is_set():
+                self.scan_spool_dir()
+                reclaimed = self.job_queue.reclaim_expired()
+                if reclaimed:
+                    logger.info('reclaimed %s jobs whose leases expired', reclaimed)
+                if (last_status is None) or (time.monotonic() - last_status >= self.status_interval):
+                    last_status = time.monotonic()
+                    logger.info('jobs: %s', self.job_queue.counts())
+                self.stopped.wait(self.poll_interval)
+        finally:
+            self.close_socket_server()
+
+
+    def stop(self):
+        self.stopped.set()
+
+
+class WorkerNode:
+    '''
+        WorkerNode(store, slots=2, node_id=None, lease_seconds=DEFAULT_LEASE_SECONDS, poll_interval=5.0,
+                   retry_delay=DEFAULT_RETRY_DELAY, output_dir=None, work=scrape_and_report) -> WorkerNode
+        Leases jobs from store and runs up to slots of them at once, each in a worker process running
+        work(url, options) (which returns a dictionary with the keys output and metrics, recorded in the store). The
+        leases are renewed every lease_seconds / 3 seconds, and new jobs are looked for every poll_interval seconds.
+        Jobs that do not set an output file write to job-ID.json in output_dir (the current directory by default).
+        node_id names the node in the store (the host name and process id by default).
+    '''
+    def __init__(self, store, slots=2, node_id=None, lease_seconds=DEFAULT_LEASE_SECONDS, poll_interval=5.0,
+                 retry_delay=DEFAULT_RETRY_DELAY, output_dir=None, work=scrape_and_report):
+        if slots < 1:
+            raise Exception('A worker node needs at least one slot, but slots was {}'.format(slots))
+        self.store = store
+        self.slots = slots
+        self.node_id = node_id or default_node_id()
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = lease_seconds / 3
+        self.retry_delay = retry_delay
+        self.output_dir = output_dir
+        self.work = work
+        self.context = multiprocessing.get_context('spawn')
+        # {job id: (process, connection, job, deadline)}
+        self.running = {}
+        self.results = {}
+        self.last_heartbeat = 0
+        self.stopped = threading.Event()
+
+
+    def start_job(self, job):
+        options = job_options(job, self.output_dir)
+        (receiver, sender) = self.context.Pipe(duplex=False)
+        process = self.context.Process(
+            target=run_reporting_worker, args=(self.work, job['url'], options, sender), name=f'job-{job["id"]}', daemon=False
+        )
+        process.start()
+        # the parent's copy of the sending end is closed, so that reading from the pipe ends when the worker exits
+        sender.close()
+        deadline = (time.monotonic() + job['timeout']) if job['timeout'] else None
+        self.running[job['id']] = (process, receiver, job, deadline)
+        logger.info('%s started job %s (attempt %s of %s) for %s', self.node_id, job['id'], job['attempts'], job['max_attempts'], job['url'])
+
+
+    def send_heartbeats(self):
+        '''
+            send_heartbeats(self) -> None
+            renew the leases on the running jobs, and stop the workers of the jobs whose leases were lost (i.e. because
+            this node could not reach the store for longer than a lease, and the job was handed to another node)
+        '''
+        self.last_heartbeat = time.monotonic()
+        for (job_id, (process, receiver, job, deadline)) in list(self.running.items()):
+            if not self.store.heartbeat(job_id, self.node_id, self.lease_seconds):
+                logger.error('%s lost the lease on job %s, and stopped working on it', self.node_id, job_id)
+                stop_process(process)
+                receiver.close()
+                del self.running[job_id]
+                self.results.pop(job_id, None)
+
+
+    def read_result(self, job_id, receiver):
+        '''
+            read_result(self, job_id, receiver) -> None
+            keep the result the worker of the job sent through receiver, if it sent one that was not read yet
+        '''
+        if (job_id not in self.results) and receiver.poll():
+            try:
+                self.results[job_id] = receiver.recv()
+            except (EOFError, OSError):
+                self.results[job_id] = None
+
+
+    def check_workers(self):
+        '''
+            check_workers(self) -> None
+            record the result of every worker that has finished, and stop the workers that are past their timeout
+        '''
+        now = time.monotonic()
+        for (job_id, (process, receiver, job, deadline)) in list(self.running.items()):
+            # the result is read as soon as it is sent, since a worker sending a large result waits until it is read
+            self.read_result(job_id, receiver)
+            if process.is_alive() and ((deadline is None) or (now < deadline)):
+                continue
+            if process.is_alive():
+                stop_process(process)
+                error = 'timed out after {} seconds'.format(job['timeout'])
+            else:
+                process.join()
+                kill_process_group(process)
+                # a worker that sent its result and exited after the pipe was polled above is read from now
+                self.read_result(job_id, receiver)
+                error = None if process.exitcode == 0 else 'the worker exited with the code {}'.format(process.exitcode)
+            receiver.close()
+            del self.running[job_id]
+            result = self.results.pop(job_id, None)
+            if error is None:
+                result = result or {}
+                recorded = self.store.complete(job_id, self.node_id, output=result.get('output'), metrics=result.get('metrics'))
+                logger.info('%s finished job %s%s', self.node_id, job_id, '' if recorded else ', but had lost its lease')
+            else:
+                status = self.store.fail(job_id, self.node_id, error, retry_delay=self.retry_delay)
+                logger.error('job %s failed on %s (%s), and is now %s', job_id, self.node_id, error, status)
+
+
+    def dispatch(self):
+        '''
+            dispatch(self) -> None
+            check the running workers, renew the leases when they are due, and lease jobs while there are free slots
+        '''
+        self.check_workers()
+        if time.monotonic() - self.last_heartbeat >= self.heartbeat_interval:
+            self.send_heartbeats()
+        while len(self.running) < self.slots:
+            job = self.store.lease(self.node_id, self.lease_seconds)
+            if job is None:
+                break
+            self.start_job(job)
+
+
+    def run(self, until_idle=False):
+        '''
+            run(self, until_idle=False) -> None
+            run the node until stop is called (or SIGTERM/SIGINT is received, when run from the main thread). If
+            until_idle is True, the node also returns once it is running no jobs and no jobs are queued.
+        '''
+        if threading.current_thread() is threading.main_thread():
+            for signal_number in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(signal_number, lambda number, frame: self.stop())
+        try:
+            while not self.stopped.is_set():
+                self.dispatch()
+                if until_idle and (not self.running) and (self.store.counts()[QUEUED] == 0):
+                    break
+                self.stopped.wait(min(self.poll_interval, self.heartbeat_interval))
+        finally:
+            self.shutdown()
+
+
+    def stop(self):
+        self.stopped.set()
+
+
+    def shutdown(self):
+        '''
+            shutdown(self) -> None
+            stop the running workers and give their jobs back to the store (without counting the attempt)
+        '''
+        for (job_id, (process, receiver, job, deadline)) in list(self.running.items()):
+            stop_process(process)
+            receiver.close()
+            self.store.release(job_id, self.node_id)
+        self.running = {}
+        self.results = {}
@@ -0,0 +1,302 @@
+'''
+This module provides the persistent job queue used by the scheduler (see jobs/scheduler.py). Every job is a video to
+scrape: its URL, the options passed on to main.scrape_video (the same keys as a video in a config file), a priority,
+a timeout and a maximum number of attempts. The jobs are kept in a SQLite database, so they survive restarts of the
+scheduler, and several processes can add jobs to the same queue.
+
+A job goes through the states queued -> running -> done, or back to queued (after a delay) when an attempt fails and
+it has attempts left, or to failed once it has none left.
+
+Several schedulers on one machine can share a queue. A running job records the scheduler that claimed it (its owner,
+the host name and process id of the scheduler), so that a scheduler only queues its own jobs again when it stops, and
+only takes back the jobs of schedulers that are no longer running when it starts.
+
+SQLiteJobTable holds what the queue has in common with the SQLite job store of the worker nodes (see jobs/store.py):
+the columns of the jobs table, adding jobs and reading them.
+'''
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+STATES = (QUEUED, RUNNING, DONE, FAILED)
+DEFAULT_MAX_ATTEMPTS = 3
+# the number of seconds before the first retry of a failed job (doubled for every attempt after that)
+DEFAULT_RETRY_DELAY = 30
+# the columns of every SQLite jobs table, followed by the columns of the queue or store using it
+JOBS_TABLE = '''
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL,
+    options TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    timeout REAL,
+    max_attempts INTEGER NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    not_before REAL NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    error TEXT{}
+);
+CREATE INDEX IF NOT EXISTS jobs_by_priority ON jobs (status, priority DESC, id);
+'''
+
+
+def jobs_schema(extra_columns):
+    '''
+        jobs_schema(extra_columns) -> Str
+        return the SQL that creates the jobs table, with the extra columns (a list of column definitions) after the
+        columns every jobs table has
+    '''
+    return JOBS_TABLE.format(''.join(',\n    {}'.format(column) for column in extra_columns))
+
+
+def retry_time(now, attempts, retry_delay):
+    '''
+        retry_time(now, attempts, retry_delay) -> Float
+        return the time a job that failed on its attempts-th attempt is retried at (the delay doubles for every attempt)
+    '''
+    return now + (retry_delay * (2 ** (attempts - 1)))
+
+
+SCHEMA = jobs_schema(['owner TEXT'])
+
+
+def default_owner():
+    '''
+        default_owner() -> Str
+        return the owner id of this process: its host name and process id
+    '''
+    return '{}:{}'.format(socket.gethostname(), os.getpid())
+
+
+def owner_alive(owner):
+    '''
+        owner_alive(owner) -> Bool
+        return whether the scheduler with the owner id may still be running. Jobs without an owner (claimed before owners
+        were recorded) have none. The processes of other hosts cannot be checked, so they are assumed to be running.
+    '''
+    if not owner:
+        return False
+    (host, _, pid) = owner.rpartition(':')
+    if (host != socket.gethostname()) or (not pid.isdigit()):
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # i.e. the process belongs to another user
+        return True
+    return True
+
+
+class SQLiteJobTable:
+    '''
+        SQLiteJobTable(filename, schema) -> SQLiteJobTable
+        The jobs table of a SQLite database (created with schema if it does not exist), shared by JobQueue and
+        SQLiteJobStore (see jobs/store.py). Jobs are returned as dictionaries with the keys of the table, with the
+        columns in json_columns decoded from JSON, and counts reports the number of jobs in each of states.
+    '''
+    states = STATES
+    json_columns = ('options',)
+
+    def __init__(self, filename, schema):
+        self.filename = filename
+        self.lock = threading.Lock()
+        # the connection is shared by the threads of this process (under self.lock); other processes wait for each
+        # other's writes for up to 30 seconds. WAL mode does not work on network file systems, so the default rollback
+        # journal is kept.
+        self.connection = sqlite3.connect(filename, timeout=30, isolation_level=None, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        with self.lock:
+            self.connection.executescript(schema)
+
+
+    def job_from_row(self, row):
+        if row is None:
+            return None
+        job = dict(row)
+        for column in self.json_columns:
+            job[column] = json.loads(job[column]) if job[column] is not None else None
+        return job
+
+
+    def write(self, operation):
+        '''
+            write(self, operation) -> Any
+            run operation(connection, now) in a write transaction and return its result. BEGIN IMMEDIATE takes the
+            write lock of the database straight away, so the reads and writes of the operation are never interleaved
+            with those of another process.
+        '''
+        with self.lock:
+            self.connection.execute('BEGIN IMMEDIATE')
+            try:
+                result = operation(self.connection, time.time())
+                self.connection.execute('COMMIT')
+            except:
+                self.connection.execute('ROLLBACK')
+                raise
+        return result
+
+
+    def add(self, url, options=None, priority=0, timeout=None, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        '''
+            add(self, url, options=None, priority=0, timeout=None, max_attempts=DEFAULT_MAX_ATTEMPTS) -> Int
+            add a job for the video at url and return its id. Jobs with a higher priority run first. timeout is the
+            maximum number of seconds one attempt may take (None for no limit).
+        '''
+        if max_attempts < 1:
+            raise Exception('A job needs at least one attempt, but max_attempts was {}'.format(max_attempts))
+        return self.write(lambda connection, now: connection.execute(
+            'INSERT INTO jobs (url, options, priority, timeout, max_attempts, status, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (url, json.dumps(options or {}), priority, timeout, max_attempts, QUEUED, now)
+        ).lastrowid)
+
+
+    def get(self, job_id):
+        with self.lock:
+            return self.job_from_row(self.connection.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone())
+
+
+    def jobs(self, status=None):
+        '''
+            jobs(self, status=None) -> List
+            return all of the jobs (or the jobs with the given status), in the order they will run
+        '''
+        with self.lock:
+            if status is None:
+                rows = self.connection.execute('SELECT * FROM jobs ORDER BY priority DESC, id').fetchall()
+            else:
+                rows = self.connection.execute('SELECT * FROM jobs WHERE status = ? ORDER BY priority DESC, id', (status,)).fetchall()
+        return [self.job_from_row(row) for row in rows]
+
+
+    def counts(self):
+        '''
+            counts(self) -> Dict
+            return the number of jobs in each state
+        '''
+        with self.lock:
+            rows = self.connection.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall()
+        results = {status: 0 for status in self.states}
+        results.update({status: count for (status, count) in rows})
+        return results
+
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+class JobQueue(SQLiteJobTable):
+    '''
+        JobQueue(filename, owner=None) -> JobQueue
+        A job queue stored in the SQLite database filename (created if it does not exist). The jobs claimed through it
+        are recorded as owned by owner (default_owner() by default).
+    '''
+    def __init__(self, filename, owner=None):
+        super().__init__(filename, SCHEMA)
+        self.owner = owner or default_owner()
+        with self.lock:
+            # queues created before owners were recorded
+            columns = [row['name'] for row in self.connection.execute('PRAGMA table_info(jobs)')]
+            if 'owner' not in columns:
+                self.connection.execute('ALTER TABLE jobs ADD COLUMN owner TEXT')
+
+
+    def claim(self):
+        '''
+            claim(self) -> (anyOf Dict None)
+            mark the queued job with the highest priority (the oldest one among jobs with the same priority) that is
+            due to run as running, and return it. None is returned if no job is due. The write transaction makes sure
+            two schedulers never claim the same job.
+        '''
+        def claim_job(connection, now):
+            row = connection.execute(
+                'SELECT id FROM jobs WHERE status = ? AND not_before <= ? ORDER BY priority DESC, id LIMIT 1', (QUEUED, now)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                'UPDATE jobs SET status = ?, attempts = attempts + 1, started_at = ?, owner = ? WHERE id = ?',
+                (RUNNING, now, self.owner, row['id'])
+            )
+            return connection.execute('SELECT * FROM jobs WHERE id = ?', (row['id'],)).fetchone()
+        return self.job_from_row(self.write(claim_job))
+
+
+    def complete(self, job_id):
+        with self.lock:
+            self.connection.execute(
+                'UPDATE jobs SET status = ?, finished_at = ?, error = NULL WHERE id = ?', (DONE, time.time(), job_id)
+            )
+
+
+    def fail(self, job_id, error, retry_delay=DEFAULT_RETRY_DELAY):
+        '''
+            fail(self, job_id, error, retry_delay=DEFAULT_RETRY_DELAY) -> Str
+            record that an attempt of the job failed with the error message. The job is queued again (to run after
+            retry_delay * 2 ** (attempts - 1) seconds) if it has attempts left, and marked as failed otherwise. Returns
+            the new status of the job.
+        '''
+        now = time.time()
+        with self.lock:
+            row = self.connection.execute('SELECT attempts, max_attempts FROM jobs WHERE id = ?', (job_id,)).fetchone()
+            if row is None:
+                raise Exception('There is no job with the id {}'.format(job_id))
+            if row['attempts'] < row['max_attempts']:
+                status = QUEUED
+                not_before = retry_time(now, row['attempts'], retry_delay)
+            else:
+                status = FAILED
+                not_before = 0
+            self.connection.execute(
+                'UPDATE jobs SET status = ?, not_before = ?, finished_at = ?, error = ? WHERE id = ?',
+                (status, not_before, now, error, job_id)
+            )
+        return status
+
+
+    def requeue(self, job_ids):
+        '''
+            requeue(self, job_ids) -> Int
+            queue the jobs with the given ids again, if they are running and were claimed through this queue (i.e. the
+            jobs of a scheduler that is stopping), and return how many there were. Their attempts are not counted.
+        '''
+        with self.lock:
+            return sum(
+                self.connection.execute(
+                    'UPDATE jobs SET status = ?, attempts = MAX(attempts - 1, 0), owner = NULL WHERE id = ? AND status = ? AND owner = ?',
+                    (QUEUED, job_id, RUNNING, self.owner)
+                ).rowcount
+                for job_id in job_ids
+            )
+
+
+    def requeue_abandoned(self):
+        '''
+            requeue_abandoned(self) -> Int
+            queue the jobs left running by schedulers that are no longer running (i.e. that crashed) again, and return
+            how many there were. Their attempts are not counted. The jobs of running schedulers are left alone.
+        '''
+        with self.lock:
+            owners = [row['owner'] for row in self.connection.execute('SELECT DISTINCT owner FROM jobs WHERE status = ?', (RUNNING,))]
+            requeued = 0
+            for owner in owners:
+                if (owner == self.owner) or owner_alive(owner):
+                    continue
+                requeued += self.connection.execute(
+                    'UPDATE jobs SET status = ?, attempts = MAX(attempts - 1, 0), owner = NULL WHERE status = ? AND owner IS ?',
+                    (QUEUED, RUNNING, owner)
+                ).rowcount
+            return requeued
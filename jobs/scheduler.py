@@ -0,0 +1,357 @@
+'''
+This module provides the scheduler, a long-running process that scrapes videos from a persistent job queue (see
+jobs/job_queue.py) with several browser workers at once. Jobs can be added while the scheduler runs:
+
+    - by dropping a JSON file into the spool directory. Files ending in ".json" are read, added to the queue and deleted
+      (write the file under another name and rename it, so that it is never read half-written). Files that are not
+      valid jobs are renamed to end in ".rejected".
+    - by sending the same JSON to the scheduler's unix socket. The scheduler answers with {"ids": [...]} (the ids of
+      the jobs added) or {"error": "..."}.
+
+The JSON is either one job or {"videos": [job, ...]} (the format of the config file for main.py). A job is a JSON
+object with the url of the video, the options passed on to main.scrape_video (i.e. "output", "limit" or "pattern"),
+and optionally "priority" (jobs with a higher priority run first, 0 by default), "timeout" (the maximum number of
+seconds one attempt may take) and "max_attempts" (the number of times a failing job is tried).
+
+Every job runs in a worker process of its own (in its own process group, so that Chrome and chromedriver are stopped
+along with it when the job times out, and so that whatever it leaves running is killed when it exits).
+'''
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import socketserver
+import threading
+import time
+import traceback
+
+from jobs.job_queue import DEFAULT_MAX_ATTEMPTS, DEFAULT_RETRY_DELAY
+
+
+SCHEDULING_KEYS = ('priority', 'timeout', 'max_attempts')
+# the number of seconds a worker is given to exit after it is asked to stop, before it is killed
+STOP_GRACE_PERIOD = 5
+logger = logging.getLogger(__name__)
+
+
+def scrape_job(url, options):
+    '''
+        scrape_job(url, options) -> None
+        the default work done for a job: scrape the video with main.scrape_video
+    '''
+    import main
+    main.scrape_video(url, **options)
+
+
+def job_options(job, output_dir=None):
+    '''
+        job_options(job, output_dir=None) -> Dict
+        return the options a job is scraped with. A job that does not set an output file writes to job-ID.json in
+        output_dir (the current directory by default), so jobs running at once never write to the same file.
+    '''
+    options = dict(job['options'])
+    if not options.get('output'):
+        options['output'] = os.path.join(output_dir or '', f'job-{job["id"]}.json')
+    return options
+
+
+def run_worker(work, url, options):
+    '''
+        run_worker(work, url, options) -> None
+        the entry point of a worker process. The worker starts a process group of its own (so that it can be stopped
+        along with the browser it starts), runs work(url, options), and exits with an error code of 1 if work raises
+        an exception.
+    '''
+    if hasattr(os, 'setpgrp'):
+        os.setpgrp()
+    try:
+        work(url, options)
+    except BaseException:
+        traceback.print_exc()
+        os._exit(1)
+
+
+def stop_process(process, grace_period=STOP_GRACE_PERIOD):
+    '''
+        stop_process(process, grace_period=STOP_GRACE_PERIOD) -> None
+        stop a worker process along with its process group (the browser it started), killing it if it does not exit
+        within grace_period seconds
+    '''
+    for (signal_number, wait_time) in ((signal.SIGTERM, grace_period), (getattr(signal, 'SIGKILL', signal.SIGTERM), None)):
+        try:
+            if hasattr(os, 'killpg'):
+                os.killpg(process.pid, signal_number)
+            else:
+                process.terminate()
+        except (ProcessLookupError, PermissionError):
+            pass
+        process.join(wait_time)
+        if not process.is_alive():
+            return
+
+
+def kill_process_group(process):
+    '''
+        kill_process_group(process) -> None
+        kill what is left of the process group of a worker process that has exited (a browser or chromedriver that it
+        did not quit, i.e. because it crashed), so that it does not keep running after the job
+    '''
+    if hasattr(os, 'killpg'):
+        try:
+            os.killpg(process.pid, getattr(signal, 'SIGKILL', signal.SIGTERM))
+        except (ProcessLookupError, PermissionError):
+            pass
+
+
+def jobs_from_document(document, defaults=None):
+    '''
+        jobs_from_document(document, defaults=None) -> List
+        return the jobs in document (one job, or {"videos": [job, ...]}) as dictionaries with the keys url, options,
+        priority, timeout and max_attempts. defaults holds the values of the scheduling keys for jobs that leave them out.
+    '''
+    defaults = dict({'priority': 0, 'timeout': None, 'max_attempts': DEFAULT_MAX_ATTEMPTS}, **(defaults or {}))
+    entries = document['videos'] if (isinstance(document, dict) and ('videos' in document)) else [document]
+    jobs = []
+    for entry in entries:
+        if (not isinstance(entry, dict)) or (not isinstance(entry.get('url'), str)):
+            raise Exception('Every job must be a JSON object with a url, but got {}'.format(json.dumps(entry)[:200]))
+        options = {key: value for (key, value) in entry.items() if (key != 'url') and (key not in SCHEDULING_KEYS)}
+        job = {'url': entry['url'], 'options': options}
+        for key in SCHEDULING_KEYS:
+            job[key] = entry.get(key, defaults[key])
+        jobs.append(job)
+    return jobs
+
+
+class JobRequestHandler(socketserver.StreamRequestHandler):
+    '''
+        JobRequestHandler -> socketserver.StreamRequestHandler
+        reads one JSON document of jobs from a connection to the scheduler's socket, and answers with the ids of the
+        jobs added
+    '''
+    def handle(self):
+        try:
+            ids = self.server.intake.submit(json.loads(self.rfile.read().decode('utf-8')))
+            response = {'ids': ids}
+        except Exception as err:
+            response = {'error': str(err)}
+        self.wfile.write(json.dumps(response).encode('utf-8'))
+
+
+class JobSocketServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class JobIntake:
+    '''
+        JobIntake(job_queue, spool_dir=None, socket_path=None, default_timeout=None, default_max_attempts=DEFAULT_MAX_ATTEMPTS) -> JobIntake
+        Takes in new jobs from the spool directory and the socket (if they are given) and adds them to job_queue (a
+        JobQueue, or any job store with the same add method, see jobs/store.py). Jobs without a timeout or a maximum
+        number of attempts get default_timeout and default_max_attempts.
+    '''
+    def __init__(self, job_queue, spool_dir=None, socket_path=None, default_timeout=None, default_max_attempts=DEFAULT_MAX_ATTEMPTS):
+        self.job_queue = job_queue
+        self.spool_dir = spool_dir
+        self.socket_path = socket_path
+        self.defaults = {'timeout': default_timeout, 'max_attempts': default_max_attempts}
+        self.socket_server = None
+
+
+    def submit(self, document):
+        '''
+            submit(self, document) -> List
+            add the jobs in document (see jobs_from_document) to the queue, and return their ids
+        '''
+        jobs = jobs_from_document(document, self.defaults)
+        ids = [
+            self.job_queue.add(job['url'], job['options'], priority=job['priority'], timeout=job['timeout'], max_attempts=job['max_attempts'])
+            for job in jobs
+        ]
+        logger.info('added jobs %s', ids)
+        return ids
+
+
+    def scan_spool_dir(self):
+        '''
+            scan_spool_dir(self) -> List
+            add the jobs from every JSON file in the spool directory, and return the ids of the jobs added
+        '''
+        ids = []
+        if not self.spool_dir:
+            return ids
+        for filename in sorted(os.listdir(self.spool_dir)):
+            if not filename.endswith('.json'):
+                continue
+            path = os.path.join(self.spool_dir, filename)
+            try:
+                with open(path) as job_file:
+                    ids.extend(self.submit(json.load(job_file)))
+            except Exception as err:
+                logger.error('rejected the job file %s: %s', path, err)
+                os.replace(path, path + '.rejected')
+            else:
+                os.remove(path)
+        return ids
+
+
+    def start_socket_server(self):
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        self.socket_server = JobSocketServer(self.socket_path, JobRequestHandler)
+        self.socket_server.intake = self
+        threading.Thread(target=self.socket_server.serve_forever, name='job-socket', daemon=True).start()
+
+
+    def close_socket_server(self):
+        if self.socket_server is not None:
+            self.socket_server.shutdown()
+            self.socket_server.server_close()
+            self.socket_server = None
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+
+class Scheduler(JobIntake):
+    '''
+        Scheduler(job_queue, workers=2, spool_dir=None, socket_path=None, poll_interval=1.0, default_timeout=None,
+                  default_max_attempts=DEFAULT_MAX_ATTEMPTS, retry_delay=DEFAULT_RETRY_DELAY, output_dir=None,
+                  work=scrape_job) -> Scheduler
+        Runs the jobs in job_queue (a JobQueue) with up to workers worker processes at once, taking in new jobs from
+        spool_dir and socket_path (if they are given) every poll_interval seconds. Jobs without a timeout or a maximum
+        number of attempts get default_timeout and default_max_attempts, and failed attempts are retried after
+        retry_delay seconds (doubled for every attempt). Jobs that do not set an output file write to job-ID.json in
+        output_dir (see job_options). work(url, options) is what a worker process runs for a job.
+    '''
+    def __init__(self, job_queue, workers=2, spool_dir=None, socket_path=None, poll_interval=1.0, default_timeout=None,
+                 default_max_attempts=DEFAULT_MAX_ATTEMPTS, retry_delay=DEFAULT_RETRY_DELAY, output_dir=None, work=scrape_job):
+        if workers < 1:
+            raise Exception('The scheduler needs at least one worker, but workers was {}'.format(workers))
+        super().__init__(job_queue, spool_dir=spool_dir, socket_path=socket_path, default_timeout=default_timeout,
+                         default_max_attempts=default_max_attempts)
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self.output_dir = output_dir
+        self.work = work
+        # the worker processes run in a fresh interpreter, so no locks or threads of the scheduler are inherited
+        self.context = multiprocessing.get_context('spawn')
+        # {job id: (process, job, deadline)}
+        self.running = {}
+        self.stopped = threading.Event()
+
+
+    def start_job(self, job):
+        process = self.context.Process(
+            target=run_worker, args=(self.work, job['url'], job_options(job, self.output_dir)), name=f'job-{job["id"]}', daemon=False
+        )
+        process.start()
+        deadline = (time.monotonic() + job['timeout']) if job['timeout'] else None
+        self.running[job['id']] = (process, job, deadline)
+        logger.info('started job %s (attempt %s of %s) for %s', job['id'], job['attempts'], job['max_attempts'], job['url'])
+
+
+    def check_workers(self):
+        '''
+            check_workers(self) -> None
+            record the result of every worker that has finished, and stop the workers that are past their timeout
+        '''
+        now = time.monotonic()
+        for (job_id, (process, job, deadline)) in list(self.running.items()):
+            if process.is_alive() and ((deadline is None) or (now < deadline)):
+                continue
+            if process.is_alive():
+                stop_process(process)
+                error = 'timed out after {} seconds'.format(job['timeout'])
+            else:
+                process.join()
+                kill_process_group(process)
+                error = None if process.exitcode == 0 else 'the worker exited with the code {}'.format(process.exitcode)
+            del self.running[job_id]
+            if error is None:
+                self.job_queue.complete(job_id)
+                logger.info('job %s is done', job_id)
+            else:
+                status = self.job_queue.fail(job_id, error, retry_delay=self.retry_delay)
+                logger.error('job %s failed (%s), and is now %s', job_id, error, status)
+
+
+    def dispatch(self):
+        '''
+            dispatch(self) -> None
+            take in new jobs, check the running workers, and start queued jobs while there are free workers
+        '''
+        self.scan_spool_dir()
+        self.check_workers()
+        while len(self.running) < self.workers:
+            job = self.job_queue.claim()
+            if job is None:
+                break
+            self.start_job(job)
+
+
+    def run(self, until_idle=False):
+        '''
+            run(self, until_idle=False) -> None
+            run the scheduler until stop is called (or SIGTERM/SIGINT is received, when run from the main thread). If
+            until_idle is True, the scheduler also returns once no jobs are running or waiting to run.
+        '''
+        requeued = self.job_queue.requeue_abandoned()
+        if requeued:
+            logger.info('queued %s jobs left running by schedulers that are gone again', requeued)
+        if self.spool_dir:
+            os.makedirs(self.spool_dir, exist_ok=True)
+        if self.socket_path:
+            self.start_socket_server()
+        if threading.current_thread() is threading.main_thread():
+            for signal_number in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(signal_number, lambda number, frame: self.stop())
+        try:
+            while not self.stopped.is_set():
+                self.dispatch()
+                if until_idle and (not self.running) and (self.job_queue.counts()['queued'] == 0):
+                    break
+                self.stopped.wait(self.poll_interval)
+        finally:
+            self.shutdown()
+
+
+    def stop(self):
+        self.stopped.set()
+
+
+    def shutdown(self):
+        '''
+            shutdown(self) -> None
+            stop the running workers and queue their jobs again (without counting the attempt), and close the socket
+        '''
+        for (job_id, (process, job, deadline)) in list(self.running.items()):
+            stop_process(process)
+        # only the jobs of this scheduler, since other schedulers may be sharing the queue
+        self.job_queue.requeue(list(self.running))
+        self.running = {}
+        self.close_socket_server()
+
+
+def submit_jobs(document, socket_path=None, spool_dir=None):
+    '''
+        submit_jobs(document, socket_path=None, spool_dir=None) -> (anyOf List None)
+        send the jobs in document to a running scheduler, through its socket (returning the ids of the jobs added) or
+        its spool directory (returning None, since the jobs are only added once the scheduler reads the file)
+    '''
+    if socket_path:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(socket_path)
+            connection.sendall(json.dumps(document).encode('utf-8'))
+            connection.shutdown(socket.SHUT_WR)
+            response = json.loads(b''.join(iter(lambda: connection.recv(65536), b'')).decode('utf-8'))
+        if 'error' in response:
+            raise Exception('The scheduler rejected the jobs: {}'.format(response['error']))
+        return response['ids']
+    os.makedirs(spool_dir, exist_ok=True)
+    filename = os.path.join(spool_dir, f'{time.time_ns()}-{os.getpid()}.json')
+    with open(filename + '.tmp', 'w') as job_file:
+        json.dump(document, job_file)
+    os.replace(filename + '.tmp', filename)
+    return None
@@ -0,0 +1,366 @@
+'''
+This module provides the job stores used to spread scraping across several machines (see jobs/distributed.py). A
+job store holds the videos to scrape like the job queue of the scheduler (see jobs/job_queue.py), but the jobs are
+leased instead of claimed: a worker node that takes a job holds it for a limited number of seconds and has to renew
+the lease (send a heartbeat) while it works on it. The job of a node that dies or loses its connection to the store
+stops being renewed, and is handed to another node once its lease expires. When a job is done, the store records
+where its output was written and the metrics of the scrape.
+
+Two stores are provided:
+
+    SQLiteJobStore - a SQLite database, which can be put on storage shared by every node (i.e. an NFS mount with working
+                     file locks). Leases are timed with the clocks of the nodes, so the clocks should be kept in sync
+                     (i.e. with NTP), with leases much longer than the clocks can drift apart.
+    MemoryJobStore - a store kept in memory, for running nodes as threads of one process (i.e. in tests).
+
+Other stores can be added with register_job_store, and open_job_store picks the store for a location.
+
+A job goes through the states queued -> leased -> done, or back to queued when an attempt fails (after a delay) or
+its lease expires, as long as it has attempts left, and to failed once it has none left.
+'''
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+
+from jobs.job_queue import DEFAULT_MAX_ATTEMPTS, DEFAULT_RETRY_DELAY, DONE, FAILED, QUEUED, SQLiteJobTable, jobs_schema, retry_time
+
+
+LEASED = 'leased'
+STATES = (QUEUED, LEASED, DONE, FAILED)
+DEFAULT_LEASE_SECONDS = 60
+SCHEMA = jobs_schema(['lease_owner TEXT', 'lease_expires REAL', 'output TEXT', 'metrics TEXT'])
+JSON_COLUMNS = ('options', 'output', 'metrics')
+
+
+class JobStore(ABC):
+    '''
+        JobStore -> JobStore
+        The operations every job store provides. Jobs are returned as dictionaries with the keys of the jobs table in
+        SCHEMA, with options, output and metrics decoded from JSON. Every operation on a leased job takes the id of the
+        worker holding the lease, and does nothing (returning False or None) if that worker no longer holds it.
+    '''
+    @abstractmethod
+    def add(self, url, options=None, priority=0, timeout=None, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        '''
+            add(self, url, options=None, priority=0, timeout=None, max_attempts=DEFAULT_MAX_ATTEMPTS) -> Int
+            add a job for the video at url and return its id
+        '''
+
+    @abstractmethod
+    def lease(self, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS):
+        '''
+            lease(self, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS) -> (anyOf Dict None)
+            hand the queued job with the highest priority that is due to run to the worker for lease_seconds seconds,
+            and return it (None if no job is due). Expired leases are reclaimed first.
+        '''
+
+    @abstractmethod
+    def heartbeat(self, job_id, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS):
+        '''
+            heartbeat(self, job_id, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS) -> Bool
+            renew the worker's lease on the job for another lease_seconds seconds. Returns False if the lease was lost.
+        '''
+
+    @abstractmethod
+    def complete(self, job_id, worker_id, output=None, metrics=None):
+        '''
+            complete(self, job_id, worker_id, output=None, metrics=None) -> Bool
+            record that the job is done, with where its output was written and the metrics of the scrape
+        '''
+
+    @abstractmethod
+    def fail(self, job_id, worker_id, error, retry_delay=DEFAULT_RETRY_DELAY):
+        '''
+            fail(self, job_id, worker_id, error, retry_delay=DEFAULT_RETRY_DELAY) -> (anyOf Str None)
+            record that an attempt of the job failed. The job is queued again (after a delay) if it has attempts left,
+            and marked as failed otherwise. Returns the new status of the job.
+        '''
+
+    @abstractmethod
+    def release(self, job_id, worker_id):
+        '''
+            release(self, job_id, worker_id) -> Bool
+            give the job back without counting the attempt (i.e. when a worker node is shut down)
+        '''
+
+    @abstractmethod
+    def reclaim_expired(self):
+        '''
+            reclaim_expired(self) -> Int
+            queue the jobs whose leases have expired again (or mark them as failed if they have no attempts left), and
+            return how many there were
+        '''
+
+    @abstractmethod
+    def get(self, job_id):
+        pass
+
+    @abstractmethod
+    def jobs(self, status=None):
+        pass
+
+    @abstractmethod
+    def counts(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class SQLiteJobStore(SQLiteJobTable, JobStore):
+    '''
+        SQLiteJobStore(filename) -> SQLiteJobStore
+        A job store in the SQLite database filename (created if it does not exist), which can be shared by every node
+        that can reach the file
+    '''
+    states = STATES
+    json_columns = JSON_COLUMNS
+
+    def __init__(self, filename):
+        super().__init__(filename, SCHEMA)
+
+
+    @staticmethod
+    def reclaim(connection, now):
+        failed = connection.execute(
+            'UPDATE jobs SET status = ?, finished_at = ?, lease_owner = NULL, lease_expires = NULL, '
+            "error = 'the lease of ' || lease_owner || ' expired' WHERE status = ? AND lease_expires < ? AND attempts >= max_attempts",
+            (FAILED, now, LEASED, now)
+        ).rowcount
+        requeued = connection.execute(
+            'UPDATE jobs SET status = ?, not_before = ?, lease_owner = NULL, lease_expires = NULL, '
+            "error = 'the lease of ' || lease_owner || ' expired' WHERE status = ? AND lease_expires < ?",
+            (QUEUED, now, LEASED, now)
+        ).rowcount
+        return failed + requeued
+
+
+    def reclaim_expired(self):
+        return self.write(self.reclaim)
+
+
+    def lease(self, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS):
+        def lease_job(connection, now):
+            self.reclaim(connection, now)
+            row = connection.execute(
+                'SELECT id FROM jobs WHERE status = ? AND not_before <= ? ORDER BY priority DESC, id LIMIT 1', (QUEUED, now)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                'UPDATE jobs SET status = ?, attempts = attempts + 1, started_at = ?, lease_owner = ?, lease_expires = ? WHERE id = ?',
+                (LEASED, now, worker_id, now + lease_seconds, row['id'])
+            )
+            return connection.execute('SELECT * FROM jobs WHERE id = ?', (row['id'],)).fetchone()
+        return self.job_from_row(self.write(lease_job))
+
+
+    def update_leased(self, job_id, worker_id, assignments, parameters):
+        '''
+            update_leased(self, job_id, worker_id, assignments, parameters) -> Bool
+            run "UPDATE jobs SET assignments" on the job if the worker still holds its lease, and return whether it did
+        '''
+        return self.write(lambda connection, now: connection.execute(
+            f'UPDATE jobs SET {assignments} WHERE id = ? AND status = ? AND lease_owner = ?',
+            tuple(parameters(now)) + (job_id, LEASED, worker_id)
+        ).rowcount == 1)
+
+
+    def heartbeat(self, job_id, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS):
+        return self.update_leased(job_id, worker_id, 'lease_expires = ?', lambda now: (now + lease_seconds,))
+
+
+    def complete(self, job_id, worker_id, output=None, metrics=None):
+        return self.update_leased(
+            job_id, worker_id, 'status = ?, finished_at = ?, lease_owner = NULL, lease_expires = NULL, error = NULL, output = ?, metrics = ?',
+            lambda now: (DONE, now, json.dumps(output), json.dumps(metrics))
+        )
+
+
+    def fail(self, job_id, worker_id, error, retry_delay=DEFAULT_RETRY_DELAY):
+        def fail_job(connection, now):
+            row = connection.execute(
+                'SELECT attempts, max_attempts FROM jobs WHERE id = ? AND status = ? AND lease_owner = ?', (job_id, LEASED, worker_id)
+            ).fetchone()
+            if row is None:
+                return None
+            if row['attempts'] < row['max_attempts']:
+                (status, not_before) = (QUEUED, retry_time(now, row['attempts'], retry_delay))
+            else:
+                (status, not_before) = (FAILED, 0)
+            connection.execute(
+                'UPDATE jobs SET status = ?, not_before = ?, finished_at = ?, error = ?, lease_owner = NULL, lease_expires = NULL WHERE id = ?',
+                (status, not_before, now, error, job_id)
+            )
+            return status
+        return self.write(fail_job)
+
+
+    def release(self, job_id, worker_id):
+        return self.update_leased(
+            job_id, worker_id, 'status = ?, attempts = MAX(attempts - 1, 0), lease_owner = NULL, lease_expires = NULL', lambda now: (QUEUED,)
+        )
+
+
+class MemoryJobStore(JobStore):
+    '''
+        MemoryJobStore() -> MemoryJobStore
+        A job store kept in the memory of this process. It can only be shared by the nodes running in this process, so
+        it stands in for a shared store in tests and on a single machine.
+    '''
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.rows = {}
+        self.next_id = 1
+
+
+    def add(self, url, options=None, priority=0, timeout=None, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        if max_attempts < 1:
+            raise Exception('A job needs at least one attempt, but max_attempts was {}'.format(max_attempts))
+        with self.lock:
+            job_id = self.next_id
+            self.next_id += 1
+            self.rows[job_id] = {
+                'id': job_id, 'url': url, 'options': json.loads(json.dumps(options or {})), 'priority': priority,
+                'timeout': timeout, 'max_attempts': max_attempts, 'attempts': 0, 'status': QUEUED, 'not_before': 0,
+                'lease_owner': None, 'lease_expires': None, 'created_at': time.time(), 'started_at': None,
+                'finished_at': None, 'error': None, 'output': None, 'metrics': None,
+            }
+            return job_id
+
+
+    def copy(self, row):
+        return json.loads(json.dumps(row)) if row is not None else None
+
+
+    def reclaim(self, now):
+        reclaimed = 0
+        for row in self.rows.values():
+            if (row['status'] == LEASED) and (row['lease_expires'] < now):
+                row['error'] = 'the lease of {} expired'.format(row['lease_owner'])
+                if row['attempts'] >= row['max_attempts']:
+                    row.update(status=FAILED, finished_at=now)
+                else:
+                    row.update(status=QUEUED, not_before=now)
+                row.update(lease_owner=None, lease_expires=None)
+                reclaimed += 1
+        return reclaimed
+
+
+    def reclaim_expired(self):
+        with self.lock:
+            return self.reclaim(time.time())
+
+
+    def lease(self, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS):
+        now = time.time()
+        with self.lock:
+            self.reclaim(now)
+            due = [row for row in self.rows.values() if (row['status'] == QUEUED) and (row['not_before'] <= now)]
+            if not due:
+                return None
+            row = min(due, key=lambda row: (-row['priority'], row['id']))
+            row.update(status=LEASED, attempts=row['attempts'] + 1, started_at=now, lease_owner=worker_id, lease_expires=now + lease_seconds)
+            return self.copy(row)
+
+
+    def leased_row(self, job_id, worker_id):
+        row = self.rows.get(job_id)
+        if (row is None) or (row['status'] != LEASED) or (row['lease_owner'] != worker_id):
+            return None
+        return row
+
+
+    def heartbeat(self, job_id, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS):
+        with self.lock:
+            row = self.leased_row(job_id, worker_id)
+            if row is None:
+                return False
+            row['lease_expires'] = time.time() + lease_seconds
+            return True
+
+
+    def complete(self, job_id, worker_id, output=None, metrics=None):
+        with self.lock:
+            row = self.leased_row(job_id, worker_id)
+            if row is None:
+                return False
+            row.update(
+                status=DONE, finished_at=time.time(), lease_owner=None, lease_expires=None, error=None,
+                output=self.copy(output), metrics=self.copy(metrics)
+            )
+            return True
+
+
+    def fail(self, job_id, worker_id, error, retry_delay=DEFAULT_RETRY_DELAY):
+        now = time.time()
+        with self.lock:
+            row = self.leased_row(job_id, worker_id)
+            if row is None:
+                return None
+            if row['attempts'] < row['max_attempts']:
+                row.update(status=QUEUED, not_before=retry_time(now, row['attempts'], retry_delay))
+            else:
+                row.update(status=FAILED, not_before=0)
+            row.update(finished_at=now, error=error, lease_owner=None, lease_expires=None)
+            return row['status']
+
+
+    def release(self, job_id, worker_id):
+        with self.lock:
+            row = self.leased_row(job_id, worker_id)
+            if row is None:
+                return False
+            row.update(status=QUEUED, attempts=max(row['attempts'] - 1, 0), lease_owner=None, lease_expires=None)
+            return True
+
+
+    def get(self, job_id):
+        with self.lock:
+            return self.copy(self.rows.get(job_id))
+
+
+    def jobs(self, status=None):
+        with self.lock:
+            rows = [row for row in self.rows.values() if (status is None) or (row['status'] == status)]
+            return [self.copy(row) for row in sorted(rows, key=lambda row: (-row['priority'], row['id']))]
+
+
+    def counts(self):
+        results = {status: 0 for status in STATES}
+        with self.lock:
+            for row in self.rows.values():
+                results[row['status']] += 1
+        return results
+
+
+# the job stores open_job_store can open, by the prefix of their location
+JOB_STORES = {
+    'memory': lambda location: MemoryJobStore(),
+    'sqlite': SQLiteJobStore,
+}
+
+
+def register_job_store(scheme, factory):
+    '''
+        register_job_store(scheme, factory) -> None
+        let open_job_store open locations starting with "scheme:" with factory(rest of the location), i.e. a store
+        backed by a database server
+    '''
+    JOB_STORES[scheme] = factory
+
+
+def open_job_store(location):
+    '''
+        open_job_store(location) -> JobStore
+        open the job store at location: "memory" for a MemoryJobStore, "SCHEME:REST" for a registered store, and the
+        name of a SQLite database file (optionally starting with "sqlite:") otherwise
+    '''
+    (scheme, separator, rest) = location.partition(':')
+    if location == 'memory':
+        return JOB_STORES['memory'](location)
+    # a single letter before the colon is a Windows drive, not a scheme
+    if separator and (len(scheme) > 1) and (scheme in JOB_STORES):
+        return JOB_STORES[scheme](rest)
+    return SQLiteJobStore(location)
@@ -1,9 +1,17 @@
 import argparse
 import json
+import os
 import sys
 import re
-from iterators.factory import IteratorFactory
-from iterators.iterlist import IteratorAsList
+# The iterators (and Selenium along with them) and the sinks are imported inside the functions that use them, so that
+# "python main.py --help" and invalid arguments exit without paying for those imports. benchmarks/startup_benchmark.py
+# checks that this stays the case.
+
+
+# the options of scrape_video that name files or directories
+PATH_OPTIONS = (
+    'output', 'sqlite', 'summary', 'metrics', 'trace_file', 'snapshot_file', 'logfile', 'rate_limit_file', 'profile_dir', 'dedup_report'
+)
 
 
 def valid_arguments(argument_parser):
@@ -38,8 +46,41 @@ def valid_arguments(argument_parser):
         file=sys.stderr, flush=True
         )
         return False
+    elif (argument_parser.queue_size <= 0) or (argument_parser.batch_size <= 0) or (argument_parser.flush_interval <= 0):
+        print(
+            'Input for the --queue-size, --batch-size and --flush-interval parameters must be greater than 0. Exiting with an error code of 1.',
+            file=sys.stderr, flush=True
+        )
+        return False
+    elif (argument_parser.rate is not None) and (argument_parser.rate <= 0):
+        print('Input for the --rate parameter must be greater than 0. Exiting with an error code of 1.', file=sys.stderr, flush=True)
+        return False
+    elif (argument_parser.process_workers is not None) and (argument_parser.process_workers < 1):
+        print('Input for the --process-workers parameter must be greater than 0. Exiting with an error code of 1.', file=sys.stderr, flush=True)
+        return False
+    elif not (0 < argument_parser.dedup_threshold <= 1):
+        print('Input for the --dedup-threshold parameter must be greater than 0 and at most 1. Exiting with an error code of 1.', file=sys.stderr, flush=True)
+        return False
+    elif argument_parser.dedup_report and not argument_parser.dedup:
+        print('The --dedup-report parameter needs --dedup. Exiting with an error code of 1.', file=sys.stderr, flush=True)
+        return False
+    elif ((argument_parser.video_workers is not None) and (argument_parser.video_workers < 1)) or \
+         ((argument_parser.max_videos is not None) and (argument_parser.max_videos < 1)):
+        print('Input for the --video-workers and --max-videos parameters must be greater than 0. Exiting with an error code of 1.', file=sys.stderr, flush=True)
+        return False
+    elif (argument_parser.workers < 1) or (argument_parser.lease_seconds <= 0):
+        print('Input for the --workers and --lease-seconds parameters must be greater than 0. Exiting with an error code of 1.', file=sys.stderr, flush=True)
+        return False
+    elif (argument_parser.scheduler or argument_parser.coordinator or argument_parser.submit) and not (argument_parser.spool_dir or argument_parser.socket):
+        print(
+            'The scheduler (--scheduler), the coordinator (--coordinator) and --submit need a spool directory (--spool-dir) or a socket (--socket). Exiting with an error code of 1.',
+            file=sys.stderr, flush=True
+        )
+        return False
     url = argument_parser.url
     configfile = argument_parser.configfile
+    if argument_parser.scheduler or argument_parser.coordinator or argument_parser.worker_node:
+        return True
     if not (url or configfile):
         print((
             'You must specify a url with a YouTube video for the scraper to parse (with the --url argument), or you must specify '
@@ -48,9 +89,206 @@ def valid_arguments(argument_parser):
             file=sys.stderr, flush=True
         )
         return False
+    if (argument_parser.video_workers is not None) or (argument_parser.max_videos is not None):
+        # only imported here, so the other invalid arguments are still rejected without importing Selenium
+        from iterators.implementations.channel_iterator import ChannelIterator
+        if not (url and re.match(ChannelIterator.regex_pattern(), url)):
+            print(
+                'The --video-workers and --max-videos parameters are only for channel and playlist urls given with --url. Exiting with an error code of 1.',
+                file=sys.stderr, flush=True
+            )
+            return False
     return True
 
 
+def build_sinks(output='comments.json', buffer=False, sqlite=None, stdout=False, index=False, summary=None, url=None):
+    '''
+        build_sinks(output, buffer, sqlite, stdout, index, summary, url) -> List
+        Return the list of sinks that the comments for one video are written to. The JSON file is always written
+        (as a list of comment threads if buffer is True, and as a JSON object with the key "comments" otherwise),
+        along with an index of the JSON file if index is True. A SQLite database and stdout are written to as well
+        if they are specified, and a summary of the comments of the video at url (see iterators/aggregates.py) is
+        written to the file summary if it is specified.
+    '''
+    from iterators.sinks import JSONFileSink, SQLiteSink, StdoutSink
+    from iterators.output_index import index_filename_for
+    index_file = index_filename_for(output) if index else None
+    sinks = [JSONFileSink(output, key=(None if buffer else 'comments'), index_file=index_file)]
+    if sqlite:
+        sinks.append(SQLiteSink(sqlite))
+    if stdout:
+        sinks.append(StdoutSink())
+    if summary:
+        from iterators.aggregates import AggregateSink
+        sinks.append(AggregateSink(summary, video=url))
+    return sinks
+
+
+def export_metrics(iterator, metrics_file, metrics_format='json'):
+    '''
+        export_metrics(iterator, metrics_file, metrics_format) -> None
+        Write the performance metrics of the iterator (see iterators/metrics.py) to metrics_file, as JSON or in the
+        Prometheus text format. The number of comments and comment threads scraped are added as gauges first.
+    '''
+    metrics = getattr(iterator, 'metrics', None)
+    if metrics is None:
+        print(f'The iterator for this video does not collect performance metrics, so {metrics_file} was not written.', file=sys.stderr, flush=True)
+        return
+    metrics.set_gauge('comments_parsed', getattr(iterator, 'total_comments_parsed', 0))
+    metrics.set_gauge('comment_threads_parsed', getattr(iterator, 'comment_thread_count', 0))
+    metrics.export(metrics_file, format=metrics_format)
+
+
+def scrape_video(url, output='comments.json', buffer=False, sqlite=None, stdout=False, index=False, summary=None,
+                 queue_size=1000, batch_size=100, flush_interval=1.0, metrics=None, metrics_format='json', progress=False,
+                 rate=None, host_rates=None, rate_limit_file=None, dedup=None, dedup_threshold=0.6, dedup_report=None,
+                 process_workers=None, **iterator_kwargs):
+    '''
+        scrape_video(url, output, buffer, sqlite, stdout, index, summary, queue_size, batch_size, flush_interval, metrics, metrics_format, progress, rate, host_rates, rate_limit_file, dedup, dedup_threshold, dedup_report, process_workers, **iterator_kwargs) -> Int
+        Scrape the comments for the video at url and write them to all of the sinks built by build_sinks. The
+        writing happens on a background thread (see iterators/sinks.py), with queue_size, batch_size and flush_interval
+        controlling how the comments are queued and batched. If metrics is the name of a file, the performance metrics
+        of the scrape are written to it at the end (in the format given by metrics_format). If progress is True, the
+        progress of the scrape is shown on stderr. If rate or host_rates (a dictionary mapping hosts to rates) are given,
+        the requests of the iterator are limited to that many per second, shared through rate_limit_file with every other
+        scraper using the same file (see iterators/rate_limiter.py). If dedup is "tag" or "collapse", near-duplicate
+        comments (at least dedup_threshold similar) are tagged or left out before they are written (see iterators/dedup.py),
+        and if dedup_report is the name of a file, the clusters of near-duplicates and their sizes are written to it at the end.
+        If process_workers is given, the browser is driven on a thread of its own, and the comment threads are normalized
+        and matched against the pattern by that many worker threads (see iterators/pipeline.py). All other keyword
+        arguments are passed on to the iterator. Returns the number of comment threads written.
+    '''
+    from iterators.factory import IteratorFactory
+    from iterators.sinks import write_behind
+    progress_printer = None
+    if progress:
+        from iterators.progress import ProgressPrinter
+        progress_printer = ProgressPrinter()
+        iterator_kwargs['progress_callback'] = progress_printer
+    if rate or host_rates:
+        from iterators.rate_limiter import DEFAULT_STATE_FILE, RateLimiter
+        iterator_kwargs['rate_limiter'] = RateLimiter(rate=rate, host_rates=host_rates, state_file=(rate_limit_file or DEFAULT_STATE_FILE))
+    sinks = build_sinks(output=output, buffer=buffer, sqlite=sqlite, stdout=stdout, index=index, summary=summary, url=url)
+    if process_workers:
+        iterator_kwargs['defer_processing'] = True
+    iterator = IteratorFactory(url, **iterator_kwargs)
+    comments = iterator
+    pipeline = None
+    if process_workers:
+        from iterators.pipeline import Pipeline
+        comments = pipeline = Pipeline(
+            iterator, pattern=iterator_kwargs.get('pattern'), workers=process_workers, queue_size=queue_size,
+            metrics=getattr(iterator, 'metrics', None)
+        )
+    duplicate_filter = None
+    if dedup:
+        from iterators.dedup import NearDuplicateFilter
+        comments = duplicate_filter = NearDuplicateFilter(
+            comments, mode=dedup, threshold=dedup_threshold, metrics=getattr(iterator, 'metrics', None)
+        )
+    try:
+        return write_behind(
+            comments, sinks, metrics=getattr(iterator, 'metrics', None),
+            max_queue_size=queue_size, batch_size=batch_size, flush_interval=flush_interval
+        )
+    finally:
+        # the browser is quit even if writing the comments failed, so a long run of jobs does not leave browsers behind.
+        # The pipeline is closed first, since its producer thread may still be using the driver.
+        if pipeline is not None:
+            pipeline.close()
+        if hasattr(iterator, 'close'):
+            iterator.close()
+        if progress_printer and hasattr(iterator, 'progress'):
+            progress_printer.finish(iterator.progress)
+        if metrics:
+            export_metrics(iterator, metrics, metrics_format)
+        if duplicate_filter and dedup_report:
+            duplicate_filter.write_report(dedup_report)
+
+
+def run_scheduler(queue_db, workers, spool_dir=None, socket_path=None, job_timeout=None, max_attempts=3, output_dir=None):
+    '''
+        run_scheduler(queue_db, workers, spool_dir, socket_path, job_timeout, max_attempts, output_dir) -> None
+        Run the scheduler (see jobs/scheduler.py) until it is stopped with SIGTERM or SIGINT. Jobs are kept in the
+        SQLite database queue_db, taken in from spool_dir and socket_path, and scraped by up to workers browsers at once.
+        Jobs that do not set an output file write to job-ID.json in output_dir.
+    '''
+    from jobs.job_queue import JobQueue
+    from jobs.scheduler import Scheduler
+    job_queue = JobQueue(queue_db)
+    try:
+        Scheduler(
+            job_queue, workers=workers, spool_dir=spool_dir, socket_path=socket_path,
+            default_timeout=job_timeout, default_max_attempts=max_attempts, output_dir=output_dir
+        ).run()
+    finally:
+        job_queue.close()
+
+
+def run_coordinator(queue_db, spool_dir=None, socket_path=None, job_timeout=None, max_attempts=3):
+    '''
+        run_coordinator(queue_db, spool_dir, socket_path, job_timeout, max_attempts) -> None
+        Run the coordinator (see jobs/distributed.py) until it is stopped with SIGTERM or SIGINT. Jobs taken in from
+        spool_dir and socket_path are added to the job store at queue_db (see jobs/store.py) for the worker nodes.
+    '''
+    from jobs.store import open_job_store
+    from jobs.distributed import Coordinator
+    store = open_job_store(queue_db)
+    try:
+        Coordinator(store, spool_dir=spool_dir, socket_path=socket_path, default_timeout=job_timeout, default_max_attempts=max_attempts).run()
+    finally:
+        store.close()
+
+
+def run_worker_node(queue_db, workers, lease_seconds=60, node_id=None, output_dir=None):
+    '''
+        run_worker_node(queue_db, workers, lease_seconds, node_id, output_dir) -> None
+        Run a worker node (see jobs/distributed.py) until it is stopped with SIGTERM or SIGINT. The node leases jobs
+        from the job store at queue_db and scrapes up to workers of them at once. Jobs that do not set an output file
+        write to job-ID.json in output_dir.
+    '''
+    from jobs.store import open_job_store
+    from jobs.distributed import WorkerNode
+    store = open_job_store(queue_db)
+    try:
+        WorkerNode(store, slots=workers, node_id=node_id, lease_seconds=lease_seconds, output_dir=output_dir).run()
+    finally:
+        store.close()
+
+
+def given_options(options, parser):
+    '''
+        given_options(options, parser) -> Dict
+        return the options that were given on the command line, i.e. the ones whose values differ from the defaults of
+        parser
+    '''
+    return {key: value for (key, value) in options.items() if value != parser.get_default(key)}
+
+
+def submit_to_scheduler(document, spool_dir=None, socket_path=None, priority=0, job_timeout=None, max_attempts=3):
+    '''
+        submit_to_scheduler(document, spool_dir, socket_path, priority, job_timeout, max_attempts) -> None
+        Send the jobs in document (one video, or a config file's {"videos": [...]}) to a running scheduler. priority,
+        job_timeout and max_attempts are set on the jobs that do not set them themselves. Relative file names in the
+        jobs are made absolute here, since the scheduler runs in a directory of its own.
+    '''
+    from jobs.scheduler import submit_jobs
+    entries = document['videos'] if 'videos' in document else [document]
+    scheduling = {'priority': priority, 'timeout': job_timeout, 'max_attempts': max_attempts}
+    videos = []
+    for entry in entries:
+        video = dict({key: value for (key, value) in scheduling.items() if value is not None}, **entry)
+        for key in PATH_OPTIONS:
+            if video.get(key):
+                video[key] = os.path.abspath(video[key])
+        videos.append(video)
+    ids = submit_jobs({'videos': videos}, socket_path=socket_path, spool_dir=spool_dir)
+    if ids is None:
+        print(f'Submitted {len(videos)} jobs to the spool directory {spool_dir}.', file=sys.stderr, flush=True)
+    else:
+        print('Submitted the jobs {}.'.format(', '.join(str(job_id) for job_id in ids)), file=sys.stderr, flush=True)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description=(
@@ -89,11 +327,184 @@ def main():
     parser.add_argument(
         '-B', '--buffer',
         help=(
-            'Read in the dictionaries returned in each iteration and immediately write it to the json file. '
-            'This is highly recommended for videos with large numbers of comments (1000+ comments).'
+            'Write the JSON file as a list of comment threads instead of a JSON object with the key "comments". '
+            'Comments are always written to the output as they are read in, so large videos never have to fit in memory.'
         ),
         action='store_true'
     )
+    parser.add_argument(
+        '--sqlite', type=str, default=None, help='A SQLite database file that the comments are written to as well (in the table "comments").'
+    )
+    parser.add_argument(
+        '--stdout', help='Write every comment thread to stdout as one line of JSON as well.', action='store_true'
+    )
+    parser.add_argument(
+        '--index',
+        help=(
+            'Write an index of the JSON file (with ".idx" added to the end of its name) that maps thread numbers, comment IDs and '
+            'commenters to the position of their threads in the file. See iterators/output_index.py for reading threads through the index.'
+        ),
+        action='store_true'
+    )
+    parser.add_argument(
+        '--summary', type=str, default=None,
+        help=(
+            'A file to write a summary of the comments of each video to as JSON (the top commenters and keywords, the number of comments '
+            'at each reply depth, and histograms of comment lengths and replies per thread), kept without holding on to the comments.'
+        )
+    )
+    parser.add_argument(
+        '--queue-size', type=int, default=1000,
+        help='The maximum number of comment threads waiting to be written. Scraping pauses when this many are waiting. Defaults to 1000.'
+    )
+    parser.add_argument(
+        '--batch-size', type=int, default=100, help='The number of comment threads written to the outputs at once. Defaults to 100.'
+    )
+    parser.add_argument(
+        '--flush-interval', type=float, default=1.0,
+        help='The maximum number of seconds a comment thread waits before it is written to the outputs. Defaults to 1 second.'
+    )
+    parser.add_argument(
+        '--metrics', type=str, default=None,
+        help=(
+            'A file to write the performance metrics of the scrape to at the end of the run (the number and latency of WebDriver '
+            'commands, and the time spent in each phase of the scrape).'
+        )
+    )
+    parser.add_argument(
+        '--metrics-format', type=str, default='json', choices=['json', 'prometheus'],
+        help='The format the performance metrics are written in (JSON or the Prometheus text format). Defaults to json.'
+    )
+    parser.add_argument(
+        '--progress',
+        help='Show the progress of the scrape on stderr (throughput, the fraction of comments scraped, the estimated time left and the time left on the time limit).',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--dedup', type=str, default=None, choices=['tag', 'collapse'],
+        help=(
+            'Find near-duplicate comments (i.e. copies of the same spam comment) and tag them with the link of the first copy and the '
+            'number of copies so far ("tag"), or leave them out of the output ("collapse").'
+        )
+    )
+    parser.add_argument(
+        '--dedup-threshold', type=float, default=0.6,
+        help='How similar (from 0 to 1) two comments have to be to count as near-duplicates with --dedup. Defaults to 0.6.'
+    )
+    parser.add_argument(
+        '--dedup-report', type=str, default=None,
+        help=(
+            'A file to write the groups of near-duplicate comments found with --dedup to at the end of the scrape, as JSON: the link and '
+            'content of the first comment of each group and the number of comments in it, largest first.'
+        )
+    )
+    parser.add_argument(
+        '--process-workers', type=int, default=None,
+        help=(
+            'Drive the browser on a thread of its own, and normalize and match the comment threads against the pattern in this many '
+            'worker threads, so the browser keeps scrolling while the comments are processed. By default, everything runs on one thread.'
+        )
+    )
+    parser.add_argument(
+        '--trace', type=str, default=None, dest='trace_file', metavar='TRACE',
+        help=(
+            'The name of a file to write a trace of the scrape to, in the Chrome Trace Event Format (open it in chrome://tracing '
+            'or https://ui.perfetto.dev). The trace holds the WebDriver commands, the phases of the scrape and what the browser did.'
+        )
+    )
+    parser.add_argument(
+        '--extraction', type=str, default='webdriver', choices=['webdriver', 'html'],
+        help=(
+            'How comments are read from the page: webdriver reads the elements of every comment through WebDriver, html reads '
+            'the HTML of newly loaded comment threads with one script call and parses it in Python. Defaults to webdriver.'
+        )
+    )
+    parser.add_argument(
+        '--snapshot', type=str, default=None, dest='snapshot_file', metavar='SNAPSHOT',
+        help='The name of a file to save a snapshot of the HTML of the comments section to at the end of the scrape (see iterators/snapshot.py).'
+    )
+    parser.add_argument(
+        '--profile-dir', type=str, default=None,
+        help='A directory for Chrome to keep its profile in, so cookies and the HTTP cache are kept from one scrape to the next. Defaults to a new profile every time.'
+    )
+    parser.add_argument(
+        '--fast-start', action='store_true',
+        help='Start Chrome with autoplay blocked and sound muted, and go straight to the comments, to cut the time to the first comment.'
+    )
+    parser.add_argument(
+        '--video-workers', type=int, default=None,
+        help='For channel and playlist urls, the number of videos scraped at once (one browser each). Defaults to 2.'
+    )
+    parser.add_argument(
+        '--max-videos', type=int, default=None, help='For channel and playlist urls, the maximum number of videos to scrape. Defaults to all of them.'
+    )
+    parser.add_argument(
+        '--rate', type=float, default=None,
+        help=(
+            'The maximum number of requests per second (page loads, loads of more comments and reply expansions) across every '
+            'scraper sharing --rate-limit-file. Defaults to no limit.'
+        )
+    )
+    parser.add_argument(
+        '--host-rate', type=str, default=None, action='append', dest='host_rates', metavar='HOST=RATE',
+        help='The maximum number of requests per second to one host, i.e. www.youtube.com=2. Can be given more than once.'
+    )
+    parser.add_argument(
+        '--rate-limit-file', type=str, default=None,
+        help='The file the rate limits are shared through, by every scraper on the host that uses it. Defaults to a file in the temporary directory.'
+    )
+    parser.add_argument(
+        '--scheduler', action='store_true',
+        help=(
+            'Run as a scheduler that takes in jobs (videos to scrape) from --spool-dir and/or --socket, keeps them in a persistent '
+            'queue (--queue-db), and scrapes them with --workers browsers at once. See jobs/scheduler.py.'
+        )
+    )
+    parser.add_argument(
+        '--submit', action='store_true',
+        help='Send the video given by --url (with the other options), or the videos in --configfile, to a running scheduler instead of scraping them.'
+    )
+    parser.add_argument(
+        '--coordinator', action='store_true',
+        help=(
+            'Run as the coordinator of several worker nodes: jobs taken in from --spool-dir and/or --socket are added to the shared '
+            'job store (--queue-db), and the jobs of nodes that stopped sending heartbeats are handed out again. See jobs/distributed.py.'
+        )
+    )
+    parser.add_argument(
+        '--worker-node', action='store_true',
+        help='Run as a worker node that leases jobs from the shared job store (--queue-db) and scrapes --workers of them at once.'
+    )
+    parser.add_argument(
+        '--queue-db', type=str, default='jobs.db',
+        help=(
+            'The SQLite database the scheduler keeps its jobs in, or the job store shared by the coordinator and the worker nodes '
+            '(a SQLite database on shared storage). Defaults to jobs.db.'
+        )
+    )
+    parser.add_argument(
+        '--workers', type=int, default=2, help='The number of videos the scheduler or a worker node scrapes at once (one browser each). Defaults to 2.'
+    )
+    parser.add_argument(
+        '--lease-seconds', type=float, default=60,
+        help='The number of seconds a worker node holds a job without a heartbeat before it is handed to another node. Defaults to 60.'
+    )
+    parser.add_argument('--node-id', type=str, default=None, help='The name of a worker node in the job store. Defaults to the host name and process id.')
+    parser.add_argument(
+        '--output-dir', type=str, default=None,
+        help=(
+            'The directory the scheduler or a worker node writes the output of jobs that do not set one to (as job-ID.json). '
+            'Defaults to the directory it runs in.'
+        )
+    )
+    parser.add_argument('--spool-dir', type=str, default=None, help='A directory the scheduler reads jobs from (JSON files ending in ".json").')
+    parser.add_argument('--socket', type=str, default=None, help='A unix socket the scheduler takes in jobs from.')
+    parser.add_argument('--priority', type=int, default=0, help='The priority of submitted jobs (jobs with a higher priority run first). Defaults to 0.')
+    parser.add_argument(
+        '--job-timeout', type=float, default=None,
+        help='The maximum number of seconds one attempt of a job may take before its worker is stopped. Defaults to no limit.'
+    )
+    parser.add_argument('--max-attempts', type=int, default=3, help='The number of times a failing job is tried. Defaults to 3.')
     parser.add_argument(
         '-c', '--configfile', type=str, default=None,
         help=(
@@ -104,37 +515,65 @@ def main():
     arguments = parser.parse_args()
     if not valid_arguments(arguments):
         exit(1)
-    comments = {
-        'comments': []
-    }
+    # submitting jobs and coordinating worker nodes start no browsers, and may run next to scrapers that do
+    if not (arguments.submit or arguments.coordinator):
+        from iterators.reaper import install_reaper
+        install_reaper()
     kwargs = vars(arguments)
+    if kwargs['host_rates']:
+        from iterators.rate_limiter import parse_host_rates
+        try:
+            kwargs['host_rates'] = parse_host_rates(kwargs['host_rates'])
+        except Exception as err:
+            print(f'{err}. Exiting with an error code of 1.', file=sys.stderr, flush=True)
+            exit(1)
     url = kwargs.pop('url')
     config_file = kwargs.pop('configfile')
-    output = kwargs.pop('output')
-    buffer = kwargs.pop('buffer')
-    if not config_file:
-        with open(output, 'w') as output_file:
-            if not buffer:
-                for item in IteratorFactory(url, **kwargs):
-                    comments['comments'].append(item)
-                output_file.write(json.dumps(comments))
-            else:
-                json.dump(IteratorAsList(IteratorFactory(url, **kwargs)), output_file)
+    scheduling = {key: kwargs.pop(key) for key in (
+        'scheduler', 'coordinator', 'worker_node', 'submit', 'queue_db', 'workers', 'lease_seconds', 'node_id', 'output_dir',
+        'spool_dir', 'socket', 'priority', 'job_timeout', 'max_attempts'
+    )}
+    if scheduling['submit']:
+        # the defaults are left to the scheduler, which gives every job an output file of its own
+        kwargs = given_options(kwargs, parser)
+    # the channel options are only passed on when they are given, since the iterators for single videos do not take them
+    for (option, iterator_option) in (('video_workers', 'workers'), ('max_videos', 'max_videos')):
+        value = kwargs.pop(option, None)
+        if value is not None:
+            kwargs[iterator_option] = value
+    if scheduling['coordinator']:
+        run_coordinator(
+            scheduling['queue_db'], spool_dir=scheduling['spool_dir'], socket_path=scheduling['socket'],
+            job_timeout=scheduling['job_timeout'], max_attempts=scheduling['max_attempts']
+        )
+    elif scheduling['worker_node']:
+        run_worker_node(
+            scheduling['queue_db'], scheduling['workers'], lease_seconds=scheduling['lease_seconds'], node_id=scheduling['node_id'],
+            output_dir=scheduling['output_dir']
+        )
+    elif scheduling['scheduler']:
+        run_scheduler(
+            scheduling['queue_db'], scheduling['workers'], spool_dir=scheduling['spool_dir'], socket_path=scheduling['socket'],
+            job_timeout=scheduling['job_timeout'], max_attempts=scheduling['max_attempts'], output_dir=scheduling['output_dir']
+        )
+    elif scheduling['submit']:
+        if config_file:
+            with open(config_file) as configurations:
+                document = json.load(configurations)
+        else:
+            document = dict(kwargs, url=url)
+        submit_to_scheduler(
+            document, spool_dir=scheduling['spool_dir'], socket_path=scheduling['socket'], priority=scheduling['priority'],
+            job_timeout=scheduling['job_timeout'], max_attempts=scheduling['max_attempts']
+        )
+    elif not config_file:
+        scrape_video(url, **kwargs)
     else:
         with open(config_file) as configurations:
             settings = json.load(configurations)
             for video_info in settings['videos']:
                 url = video_info.pop('url')
-                output = video_info.pop('output')
-                buffer = video_info.get('buffer')
-                with open(output, 'w') as output_file:
-                    if not buffer:
-                        for item in IteratorFactory(url, **video_info):
-                            comments['comments'].append(item)
-                        output_file.write(json.dumps(comments))
-                    else:
-                        video_info.pop('buffer')
-                        json.dump(IteratorAsList(IteratorFactory(url, **video_info)), output_file)
+                scrape_video(url, **video_info)
 
 
 if __name__ == '__main__':
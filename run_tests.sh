@@ -4,15 +4,20 @@ SHORT_DURATION_TESTS=true
 LONG_DURATION_TESTS=true
 YOUTUBE_SHORT_TESTS=true
 REGULAR_YOUTUBE_TESTS=true
+ONLINE_TESTS=true
+# The test modules that do not need a browser or network access
+OFFLINE_TEST_MODULES="tests.output.test_sinks tests.output.test_output_index tests.factory.test_registry tests.factory.test_lazy_imports tests.instrumentation.test_metrics tests.instrumentation.test_progress tests.instrumentation.test_job_logging tests.instrumentation.test_tracing tests.fixture_server.test_fixture_server tests.instrumentation.test_scraping_benchmark tests.extraction.test_snapshot tests.jobs.test_job_queue tests.jobs.test_rate_limiter tests.youtube_channel.test_channel_iterator tests.jobs.test_store tests.resilience.test_thread_failures tests.resilience.test_session_recovery tests.browser.test_profiles tests.extraction.test_thread_state tests.output.test_aggregates tests.output.test_dedup tests.pipeline.test_pipeline tests.browser.test_async_iterator tests.resilience.test_reaper"
+# The test modules that run the iterators against the local fixture server (they need Chrome, but not network access)
+FIXTURE_TEST_MODULES="tests.fixture_server.test_fixture_scraping"
 
 function usage() {
 cat << EOF
-./run_tests.sh [ -h | [ -f | -l ] [ -r | -s ] ]
+./run_tests.sh [ -h | -o | [ -f | -l ] [ -r | -s ] ]
 
 Description:
 This is a bash script that serves as a test harness to run all unit-tests. By default all tests are run for long-duration and
-short-duration tests, for both regular YouTube videos and YouTube shorts. By specifying combinations of the options above, we
-can specify specific sets of tests that we want to run.
+short-duration tests, for both regular YouTube videos and YouTube shorts, along with the offline tests (tests that do not need a
+browser or network access). By specifying combinations of the options above, we can specify specific sets of tests that we want to run.
 
 Arguments supported:
 -h	Print this help message and exit.
@@ -25,6 +30,8 @@ Arguments supported:
 
 -s	Run the tests for YouTube Shorts only.
 
+-o	Run the offline tests only.
+
 Examples:
 ./run_tests.sh -h		# Print this help message and exit.
 ./run_tests.sh -f		# Run the short duration tests for YouTube shorts and regular YouTube videos.
@@ -35,6 +42,7 @@ Examples:
 ./run_tests.sh -ls		# Run the long duration tests for YouTube Shorts.
 ./run_tests.sh -fr		# Run the short duration tests for regular YouTube videos.
 ./run_tests.sh -lr		# Run the long duration tests for regular YouTube videos.
+./run_tests.sh -o		# Run the offline tests only.
 EOF
 }
 
@@ -43,7 +51,7 @@ OPTIND=1
 # The part of the script that parses arguments passed into the command line. The script uses getopts, which should be compatible across platforms,
 if [ ${#} -ne 0 ]
 then
-	while getopts "hflrs" arg_value
+	while getopts "hflrso" arg_value
 	do
 		case ${arg_value} in
 			h)
@@ -83,6 +91,9 @@ then
 					exit 1
 				fi
 				;;
+			o)
+				ONLINE_TESTS=false
+				;;
 			\?)
 				echo "Invalid usage. Run ./run_tests.sh -h for documentation on how to use this script" 1>&2
 				exit 1
@@ -95,6 +106,16 @@ fi
 # Ensure that we are in the virtual environment and all packages are installed before running the tests
 source ./env_setup.sh -c
 
+# The offline tests are always run, since they only take a few seconds
+use_correct_python_version -m unittest -v ${OFFLINE_TEST_MODULES}
+
+if [ ${ONLINE_TESTS} = "false" ]
+then
+	exit 0
+fi
+
+use_correct_python_version -m unittest -v ${FIXTURE_TEST_MODULES}
+
 if [ ${LONG_DURATION_TESTS} = "true" ]
 then
 	if [ ${YOUTUBE_SHORT_TESTS} = "true" ]
@@ -0,0 +1,199 @@
+import unittest
+import asyncio
+import threading
+import time
+from unittest import mock
+
+from iterators.async_iterator import AsyncIteratorAdapter
+from iterators.browser import BrowserSessionPool
+from iterators.implementations.abstract_base import ABCIterator
+from iterators.metrics import PerformanceMetrics, instrument_driver
+from tests.fake_driver import FakeDriver
+
+
+class NumberedDriver(FakeDriver):
+    '''
+        NumberedDriver() -> NumberedDriver
+        A FakeDriver numbered in the order the drivers were created, so tests can tell the sessions apart
+    '''
+    created = 0
+
+    def __init__(self):
+        super().__init__()
+        NumberedDriver.created += 1
+        self.number = NumberedDriver.created
+
+
+class FakeIterator(ABCIterator):
+    '''
+        FakeIterator(count, delay=0, driver=None) -> FakeIterator
+        An iterator that takes delay seconds to return each of count comment threads, blocking like Selenium does. Like
+        the real iterators, it only quits its driver if it was not passed one.
+    '''
+    def __init__(self, count, delay=0, driver=None):
+        self.count = count
+        self.delay = delay
+        self.owns_driver = driver is None
+        self.driver = driver or NumberedDriver()
+        self.returned = 0
+        self.threads_used = set()
+        self.quit = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        self.threads_used.add(threading.current_thread().name)
+        if self.returned >= self.count:
+            raise StopIteration
+        time.sleep(self.delay)
+        self.returned += 1
+        return {'commenter': 'someone', 'comment content': f'comment {self.returned}', 'link': '', 'children': []}
+
+    def quit_driver(self):
+        self.quit = True
+        if self.owns_driver:
+            self.driver.quit()
+
+    @staticmethod
+    def regex_pattern():
+        return r'^fake://'
+
+
+class BrowserSessionPoolTests(unittest.TestCase):
+    '''
+        BrowserSessionPoolTests(self, *args, **kwargs)
+        Tests that the pool starts sessions only when they are needed, lends them out one at a time, and replaces the
+        ones that die
+    '''
+    def test_sessions_are_reused(self):
+        with mock.patch('iterators.browser.create_driver', side_effect=lambda **options: NumberedDriver()) as create_driver:
+            pool = BrowserSessionPool(2, fast_start=True)
+            first = pool.acquire()
+            second = pool.acquire()
+            with self.assertRaises(Exception):
+                pool.acquire(timeout=0.05)
+            pool.release(first)
+            self.assertIs(pool.acquire(), first)
+            self.assertEqual(first.pages, ['about:blank'])
+            # a session that died while it was lent out is replaced
+            second.alive = False
+            pool.release(second)
+            third = pool.acquire()
+            self.assertNotIn(third, (first, second))
+            self.assertEqual(create_driver.call_count, 3)
+            self.assertEqual(create_driver.call_args.kwargs, {'trace': False, 'profile_dir': None, 'fast_start': True})
+            pool.release(first)
+            pool.close()
+            self.assertEqual(first.quit_count, 1)
+            pool.release(third)
+            self.assertEqual(third.quit_count, 1)
+            with self.assertRaises(Exception):
+                pool.acquire()
+        with self.assertRaises(Exception):
+            BrowserSessionPool(0)
+
+    def test_waiting_for_a_session(self):
+        with mock.patch('iterators.browser.create_driver', side_effect=lambda **options: NumberedDriver()):
+            pool = BrowserSessionPool(1)
+            driver = pool.acquire()
+            threading.Timer(0.05, pool.release, args=(driver,)).start()
+            self.assertIs(pool.acquire(timeout=5), driver)
+
+    def test_instrumenting_a_reused_driver(self):
+        driver = NumberedDriver()
+        (first, second) = (PerformanceMetrics(), PerformanceMetrics())
+        instrument_driver(driver, first)
+        instrument_driver(driver, second)
+        driver.execute('getTitle')
+        self.assertEqual(first.total('webdriver_commands_total'), 0)
+        self.assertEqual(second.total('webdriver_commands_total'), 1)
+
+
+class AsyncIteratorTests(unittest.TestCase):
+    '''
+        AsyncIteratorTests(self, *args, **kwargs)
+        Tests iterating over the iterators with async for: the iterators run on threads of their own without blocking
+        the event loop, sessions are borrowed from the pool and given back, and cancelling quits the driver.
+    '''
+    def test_async_for(self):
+        iterator = FakeIterator(3)
+
+        async def collect():
+            return [thread['comment content'] async for thread in iterator]
+        self.assertEqual(asyncio.run(collect()), ['comment 1', 'comment 2', 'comment 3'])
+        self.assertTrue(iterator.quit)
+        self.assertTrue(all(name.startswith('async-iterator') for name in iterator.threads_used))
+
+    def test_iterators_share_a_pool_without_blocking_the_loop(self):
+        iterators = []
+
+        def create_iterator(driver):
+            iterators.append(FakeIterator(5, delay=0.02, driver=driver))
+            return iterators[-1]
+
+        async def scrape(pool):
+            return len([thread async for thread in AsyncIteratorAdapter(create_iterator, pool=pool)])
+
+        async def run(pool):
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+            ticker = asyncio.ensure_future(tick())
+            counts = await asyncio.gather(*(scrape(pool) for _ in range(6)))
+            ticker.cancel()
+            return (counts, ticks)
+
+        with mock.patch('iterators.browser.create_driver', side_effect=lambda **options: NumberedDriver()) as create_driver:
+            with BrowserSessionPool(2) as pool:
+                started = time.perf_counter()
+                (counts, ticks) = asyncio.run(run(pool))
+                elapsed = time.perf_counter() - started
+                self.assertEqual(counts, [5] * 6)
+                self.assertEqual(create_driver.call_count, 2)
+                self.assertEqual(len(pool.idle), 2)
+        # 6 iterators of 0.1 seconds each, 2 at a time, while the event loop kept running
+        self.assertLess(elapsed, 0.55)
+        self.assertGreater(ticks, 10)
+        # the 6 iterators used the 2 sessions of the pool, which were quit once, when the pool was closed
+        self.assertEqual(len({iterator.driver.number for iterator in iterators}), 2)
+        self.assertTrue(all(iterator.driver.quit_count == 1 for iterator in iterators))
+
+    def test_cancelling_quits_the_driver(self):
+        iterator = FakeIterator(1000, delay=0.01)
+
+        async def consume():
+            async for _ in iterator.__aiter__():
+                pass
+
+        async def cancel_soon():
+            task = asyncio.ensure_future(consume())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+        asyncio.run(cancel_soon())
+        time.sleep(0.05)
+        self.assertTrue(iterator.quit)
+        self.assertEqual(iterator.driver.quit_count, 1)
+        self.assertLess(iterator.returned, 1000)
+
+    def test_leaving_the_context_gives_the_session_back(self):
+        with mock.patch('iterators.browser.create_driver', side_effect=lambda **options: NumberedDriver()):
+            pool = BrowserSessionPool(1)
+
+            async def first_thread():
+                async with AsyncIteratorAdapter(lambda driver: FakeIterator(10, driver=driver), pool=pool) as threads:
+                    async for thread in threads:
+                        return thread
+            self.assertEqual(asyncio.run(first_thread())['comment content'], 'comment 1')
+            self.assertEqual(len(pool.idle), 1)
+            self.assertEqual(pool.idle[0].quit_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import os
+import socket
+import tempfile
+
+from iterators.browser import CONSENT_COOKIE, MAX_PROFILE_SLOTS, chrome_options, free_profile_dir, profile_in_use, set_consent_cookie
+from tests.fake_driver import FakeDriver
+
+
+class ProfilesTests(unittest.TestCase):
+    '''
+        ProfilesTests(self, *args, **kwargs)
+        Tests the Chrome options for profile directories and fast starts, and the choice of a free profile directory.
+    '''
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.profile_dir = os.path.join(self.directory.name, 'profile')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def lock(self, directory, owner):
+        os.makedirs(directory, exist_ok=True)
+        os.symlink(owner, os.path.join(directory, 'SingletonLock'))
+
+    def test_chrome_options(self):
+        self.assertEqual(chrome_options().arguments, [])
+        options = chrome_options(profile_dir=self.profile_dir, fast_start=True)
+        self.assertIn(f'--user-data-dir={os.path.abspath(self.profile_dir)}', options.arguments)
+        self.assertIn('--autoplay-policy=user-gesture-required', options.arguments)
+        self.assertEqual(options.page_load_strategy, 'eager')
+        self.assertEqual(options.experimental_options['prefs']['profile.default_content_setting_values.sound'], 2)
+
+    def test_profiles_in_use_are_skipped(self):
+        self.assertEqual(free_profile_dir(self.profile_dir), self.profile_dir)
+        # a lock held by this process, as if Chrome were running with the profile
+        self.lock(self.profile_dir, f'{socket.gethostname()}-{os.getpid()}')
+        self.assertTrue(profile_in_use(self.profile_dir))
+        self.assertEqual(free_profile_dir(self.profile_dir + os.sep), self.profile_dir + '-2')
+        # a lock left behind by a Chrome that is no longer running
+        self.lock(self.profile_dir + '-2', f'{socket.gethostname()}-999999999')
+        self.assertFalse(profile_in_use(self.profile_dir + '-2'))
+        self.assertEqual(free_profile_dir(self.profile_dir), self.profile_dir + '-2')
+
+    def test_all_profiles_in_use(self):
+        for slot in range(1, MAX_PROFILE_SLOTS + 1):
+            self.lock(self.profile_dir if slot == 1 else f'{self.profile_dir}-{slot}', 'another-host-1')
+        with self.assertRaises(Exception):
+            free_profile_dir(self.profile_dir)
+
+    def test_consent_cookie(self):
+        driver = FakeDriver()
+        set_consent_cookie(driver, 'http://127.0.0.1:8000/watch?v=abc')
+        self.assertEqual(driver.cdp_commands, [])
+        set_consent_cookie(driver, 'https://www.youtube.com/shorts/abc')
+        self.assertEqual(driver.cdp_commands, [('Network.setCookie', CONSENT_COOKIE)])
+
+
+if __name__ == '__main__':
+    unittest.main()
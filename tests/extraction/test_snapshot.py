@@ -0,0 +1,119 @@
+import unittest
+import json
+import os
+import tempfile
+
+from fixtures.youtube_fixture_server import FixtureVideo
+from iterators.snapshot import HTMLCommentReader, capture_snapshot, extract_snapshot, extract_threads, load_snapshot
+from tests.fake_driver import FakeDriver
+
+
+def expanded_thread(video, thread_number):
+    '''
+        expanded_thread(video, thread_number) -> Str
+        return the HTML of a fixture comment thread with all of its replies loaded
+    '''
+    replies = ''.join(video.replies_page(thread_number, page)[0] for page in range(1 + (video.reply_counts[thread_number - 1] // video.reply_page_size)))
+    return video.render_thread(thread_number).replace('<div id="contents"></div>', f'<div id="contents">{replies}</div>')
+
+
+class SnapshotDriver(FakeDriver):
+    '''
+        SnapshotDriver(thread_htmls, expanded_htmls, url) -> SnapshotDriver
+        stands in for a WebDriver showing a page with the given comment threads. The scripts from iterators/snapshot.py
+        are answered from the HTML given, and every script call is recorded.
+    '''
+    def __init__(self, thread_htmls, expanded_htmls, url):
+        super().__init__()
+        self.thread_htmls = thread_htmls
+        self.expanded_htmls = expanded_htmls
+        self.current_url = url
+        self.script_calls = 0
+
+    def set_script_timeout(self, timeout):
+        self.script_timeout = timeout
+
+    def execute_script(self, script, thread_selector, start=None):
+        self.script_calls += 1
+        if start is None:
+            return '<div id="contents">' + ''.join(self.thread_htmls) + '</div>'
+        return self.thread_htmls[start:]
+
+    def execute_async_script(self, script, thread_selector, position, timeout):
+        self.script_calls += 1
+        return self.expanded_htmls[position]
+
+
+class HTMLCommentExtractorTests(unittest.TestCase):
+    '''
+        HTMLCommentExtractorTests(self, *args, **kwargs)
+        Tests that the HTML extractor returns the same comment threads as the iterators do, from the fixture server's
+        HTML and from hand-written HTML with the quirks of real pages.
+    '''
+    def test_fixture_threads(self):
+        video = FixtureVideo('abc', comments=30, replies='uniform', max_replies=25, reply_page_size=10)
+        html = '<div id="contents">' + ''.join(expanded_thread(video, number) for number in range(1, 31)) + '</div>'
+        self.assertEqual(extract_threads(html, 'http://fixture'), list(video.expected_comments('http://fixture')))
+
+    def test_text_and_malformed_html(self):
+        html = (
+            '<ytd-comment-thread-renderer><ytd-comment-renderer id="comment"><div id="header-author">'
+            '<h3><a id="author-text" href="/@someone"><span>\n   @someone\n  </span></a></h3>'
+            '<yt-formatted-string><a href="/watch?v=abc&amp;lc=Ug1">2 days ago</a></yt-formatted-string></div>'
+            '<yt-formatted-string id="content-text">first   line<br>second <b>bold</b> &amp; <img src="x.png"> line'
+            '</yt-formatted-string></ytd-comment-renderer><div id="replies"><div id="contents">'
+            '<ytd-comment-renderer><div id="header-author"><a id="author-text"><yt-formatted-string>@replier</yt-formatted-string></a>'
+            '<yt-formatted-string><a href="/watch?v=abc&lc=Ug1.2">1 day ago</a></yt-formatted-string></div>'
+            # the reply is missing its closing tags
+            '<yt-formatted-string id="content-text">a reply</div></div></ytd-comment-thread-renderer>'
+        )
+        [thread] = extract_threads(html, 'https://www.youtube.com/watch?v=abc')
+        self.assertEqual(thread['commenter'], 'someone')
+        self.assertEqual(thread['comment content'], 'first line\nsecond bold & line')
+        self.assertEqual(thread['link'], 'https://www.youtube.com/watch?v=abc&lc=Ug1')
+        self.assertEqual(thread['children'], [{'commenter': 'replier', 'comment content': 'a reply', 'link': 'https://www.youtube.com/watch?v=abc&lc=Ug1.2'}])
+
+    def test_no_threads(self):
+        self.assertEqual(extract_threads('<div id="contents"><p>Comments are turned off.</p></div>'), [])
+
+
+class SnapshotsTests(unittest.TestCase):
+    '''
+        SnapshotsTests(self, *args, **kwargs)
+        Tests capturing, loading and extracting snapshots, and reading comment threads through HTMLCommentReader
+    '''
+    def setUp(self):
+        self.video = FixtureVideo('abc', comments=8, replies='uniform', max_replies=12, seed=5)
+        self.thread_htmls = [self.video.render_thread(number) for number in range(1, 9)]
+        self.expanded_htmls = [expanded_thread(self.video, number) for number in range(1, 9)]
+        self.driver = SnapshotDriver(self.thread_htmls, self.expanded_htmls, 'http://fixture/watch?v=abc')
+
+    def test_capture_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'snapshot.json')
+            self.assertTrue(capture_snapshot(self.driver, filename, '#contents > ytd-comment-thread-renderer', 'regular'))
+            snapshot = load_snapshot(filename)
+            self.assertEqual((snapshot['kind'], snapshot['url']), ('regular', 'http://fixture/watch?v=abc'))
+            threads = extract_snapshot(snapshot)
+            self.assertEqual([thread['comment content'] for thread in threads], [thread['comment content'] for thread in self.video.expected_comments('')])
+            with open(filename, 'w') as snapshot_file:
+                json.dump(dict(snapshot, version=99), snapshot_file)
+            with self.assertRaises(Exception):
+                load_snapshot(filename)
+
+    def test_reader(self):
+        reader = HTMLCommentReader(self.driver, '#contents > ytd-comment-thread-renderer')
+        threads = reader.new_threads(0)
+        self.assertEqual(len(threads), 8)
+        self.assertEqual(self.driver.script_calls, 1)
+        for (position, ((thread, has_replies), expected)) in enumerate(zip(threads, self.video.expected_comments('http://fixture'))):
+            self.assertEqual(has_replies, bool(expected['children']))
+            if has_replies:
+                thread = reader.thread_with_replies(position)
+            self.assertEqual(thread, expected)
+        self.assertEqual(reader.new_threads(8), [])
+        self.assertEqual(reader.wait_for_threads(8, timeout=0.05, poll_frequency=0.01), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
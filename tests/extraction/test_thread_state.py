@@ -0,0 +1,53 @@
+import unittest
+
+from iterators.thread_state import THREAD_STATE_SCRIPT, ThreadState, probe_thread_state
+from tests.fake_driver import FakeDriver
+
+
+class FakePageDriver(FakeDriver):
+    '''
+        FakePageDriver(elements) -> FakePageDriver
+        A stand-in for a browser whose page holds elements (a dictionary of CSS selectors and the number of elements
+        matching them), which answers THREAD_STATE_SCRIPT the way the browser would.
+    '''
+    def __init__(self, elements):
+        super().__init__()
+        self.elements = elements
+        self.calls = 0
+
+    def execute_script(self, script, present, counted):
+        self.calls += 1
+        if script != THREAD_STATE_SCRIPT:
+            raise Exception('unexpected script')
+        state = {name: self.elements.get(selector, 0) > 0 for (name, selector) in present.items()}
+        state.update({name: self.elements.get(selector, 0) for (name, selector) in counted.items()})
+        return state
+
+
+class ThreadStateTests(unittest.TestCase):
+    '''
+        ThreadStateTests(self, *args, **kwargs)
+        Tests that the state of a comment thread is read with one script call, without waiting for missing elements.
+    '''
+    def test_probe(self):
+        driver = FakePageDriver({'#thread': 1, '#thread #more-replies': 1, '#thread ytd-comment-renderer': 3})
+        state = probe_thread_state(driver, {
+            'thread': '#thread',
+            'replies_button': '#thread #more-replies',
+            'next_reply': '#thread ytd-comment-renderer:nth-child(4)',
+        }, {'rendered_replies': '#thread ytd-comment-renderer'})
+        self.assertEqual(driver.calls, 1)
+        self.assertTrue(state.thread)
+        self.assertTrue(state.replies_button)
+        self.assertFalse(state.next_reply)
+        self.assertEqual(state.rendered_replies, 3)
+        self.assertEqual(repr(ThreadState({'thread': False})), 'ThreadState(thread=False)')
+
+    def test_missing_thread(self):
+        driver = FakePageDriver({})
+        state = probe_thread_state(driver, {'thread': '#thread'})
+        self.assertFalse(state.thread)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,19 @@
+import unittest
+
+from benchmarks.startup_benchmark import SHORT_LIVED_INVOCATIONS, forbidden_imports
+
+
+class LazyImportTests(unittest.TestCase):
+    '''
+        LazyImportTests(self, *args, **kwargs)
+        Tests that main.py does not import Selenium or the iterator implementations when it exits before scraping.
+        These tests do not need a browser.
+    '''
+    def test_short_lived_invocations(self):
+        for arguments in SHORT_LIVED_INVOCATIONS:
+            with self.subTest(arguments=arguments):
+                self.assertEqual(forbidden_imports(arguments), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import threading
+from unittest import mock
+
+from iterators.factory import IteratorFactory, IteratorRegistry
+from iterators.implementations.abstract_base import ABCIterator
+
+
+class ExampleSiteIterator(ABCIterator):
+    '''
+        ExampleSiteIterator(url, *args, **kwargs) -> Iterator
+        an iterator over nothing, used to check which class the factory picks for a url
+    '''
+    def __init__(self, url, *args, **kwargs):
+        self.url = url
+        self.kwargs = kwargs
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        raise StopIteration
+
+    @staticmethod
+    def regex_pattern():
+        return r'^https://example\.com/'
+
+
+class RegistryTests(unittest.TestCase):
+    '''
+        RegistryTests(self, *args, **kwargs)
+        Tests for the iterator registry used by IteratorFactory. These tests do not need a browser.
+    '''
+    def test_implementations_found_once(self):
+        registry = IteratorRegistry()
+        with mock.patch.object(IteratorRegistry, 'find_implementations', wraps=registry.find_implementations) as find:
+            threads = [
+                threading.Thread(target=registry.iterator_class_for, args=('https://www.youtube.com/watch?v=abc',))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            registry.iterator_class_for('https://www.youtube.com/shorts/abc')
+            self.assertEqual(find.call_count, 1)
+
+
+    def test_dispatch(self):
+        registry = IteratorRegistry()
+        self.assertEqual(registry.iterator_class_for('https://www.youtube.com/watch?v=abc').__name__, 'CommentIterator')
+        self.assertEqual(registry.iterator_class_for('https://www.youtube.com/shorts/abc').__name__, 'YoutubeShortsIterator')
+        self.assertIsNone(registry.iterator_class_for('https://example.com/post'))
+
+
+    def test_registered_class_used_by_factory(self):
+        # the factory is given a registry of its own, so the class is not left registered for the other tests
+        with mock.patch('iterators.factory.registry', IteratorRegistry()):
+            IteratorFactory.register(ExampleSiteIterator)
+            iterator = IteratorFactory('https://example.com/post', limit=5)
+            self.assertIsInstance(iterator, ExampleSiteIterator)
+            self.assertEqual(iterator.kwargs, {'limit': 5})
+            with self.assertRaises(Exception):
+                IteratorFactory('https://unsupported.example.org/')
+            with self.assertRaises(Exception):
+                IteratorFactory.register(object)
+        with self.assertRaises(Exception):
+            IteratorFactory('https://example.com/post')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+'''
+This module provides the stand-in for a Chrome session shared by the tests that do not need a browser. Tests that need
+the page to answer scripts in a certain way subclass FakeDriver and override execute_script (or the other commands).
+'''
+from selenium.common.exceptions import WebDriverException
+
+
+class FakeDriver:
+    '''
+        FakeDriver() -> FakeDriver
+        A stand-in for a Chrome session. It records the WebDriver commands sent through execute, the pages opened with
+        get, the Chrome DevTools commands sent with execute_cdp_cmd, and the number of times it was quit. Once it is quit
+        (or alive is set to False), scripts fail the way they do when Chrome has died.
+    '''
+    def __init__(self):
+        self.commands = []
+        self.cdp_commands = []
+        self.pages = []
+        self.alive = True
+        self.quit_count = 0
+
+    def execute(self, driver_command, params=None):
+        self.commands.append(driver_command)
+        return {'value': None}
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_commands.append((command, params))
+
+    def find_element(self, by, value):
+        # sent through execute, the same way the Selenium WebDriver does it
+        return self.execute('findElement', {'using': by, 'value': value})
+
+    def check_alive(self):
+        if not self.alive:
+            raise WebDriverException('invalid session id')
+
+    def execute_script(self, script, *args):
+        # 1 is what the liveness check of iterators/browser.py ("return 1;") expects
+        self.check_alive()
+        return 1
+
+    def get(self, url):
+        self.pages.append(url)
+
+    def quit(self):
+        self.alive = False
+        self.quit_count += 1
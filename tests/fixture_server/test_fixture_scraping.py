@@ -0,0 +1,89 @@
+import unittest
+import shutil
+
+from fixtures.youtube_fixture_server import FixtureServer
+
+
+CHROME_BINARIES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome')
+OPTIONS = {'comments': 12, 'page_size': 5, 'replies': 'uniform', 'max_replies': 12, 'reply_page_size': 5, 'latency': 0.2}
+
+
+@unittest.skipUnless(any(shutil.which(binary) for binary in CHROME_BINARIES), 'Chrome is not installed')
+class FixtureScrapingTests(unittest.TestCase):
+    '''
+        FixtureScrapingTests(self, *args, **kwargs)
+        Runs both iterators against the fixture server, and checks that they return exactly the comments the fixture
+        video was generated with. These tests need Chrome, but not network access.
+    '''
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FixtureServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test_regular_video(self):
+        from iterators.implementations.comment_iterator import CommentIterator
+        expected = list(self.server.video('regular', **OPTIONS).expected_comments(self.server.url))
+        self.assertEqual(list(CommentIterator(self.server.video_url('regular', **OPTIONS))), expected)
+
+    def test_regular_video_with_limit(self):
+        from iterators.implementations.comment_iterator import CommentIterator
+        options = dict(OPTIONS, replies='none')
+        expected = list(self.server.video('limited', **options).expected_comments(self.server.url, limit=7))
+        self.assertEqual(list(CommentIterator(self.server.video_url('limited', **options), limit=7)), expected)
+
+    def test_youtube_short(self):
+        from iterators.implementations.youtube_shorts_iterator import YoutubeShortsIterator
+        expected = list(self.server.video('short', **OPTIONS).expected_comments(self.server.url))
+        self.assertEqual(list(YoutubeShortsIterator(self.server.shorts_url('short', **OPTIONS))), expected)
+
+    def test_regular_video_html_extraction(self):
+        from iterators.implementations.comment_iterator import CommentIterator
+        expected = list(self.server.video('regular-html', **OPTIONS).expected_comments(self.server.url))
+        self.assertEqual(list(CommentIterator(self.server.video_url('regular-html', **OPTIONS), extraction='html')), expected)
+
+    def test_youtube_short_html_extraction(self):
+        from iterators.implementations.youtube_shorts_iterator import YoutubeShortsIterator
+        expected = list(self.server.video('short-html', **OPTIONS).expected_comments(self.server.url))
+        self.assertEqual(list(YoutubeShortsIterator(self.server.shorts_url('short-html', **OPTIONS), extraction='html')), expected)
+
+    def test_fast_start(self):
+        from iterators.implementations.comment_iterator import CommentIterator
+        from iterators.implementations.youtube_shorts_iterator import YoutubeShortsIterator
+        expected = list(self.server.video('fast', **OPTIONS).expected_comments(self.server.url))
+        iterator = CommentIterator(self.server.video_url('fast', **OPTIONS), fast_start=True)
+        self.assertEqual(list(iterator), expected)
+        self.assertIn('time_to_first_comment_seconds', iterator.metrics.to_dict()['gauges'])
+        expected = list(self.server.video('fast-short', **OPTIONS).expected_comments(self.server.url))
+        self.assertEqual(list(YoutubeShortsIterator(self.server.shorts_url('fast-short', **OPTIONS), fast_start=True)), expected)
+
+    def test_youtube_shorts_feed(self):
+        from iterators.implementations.youtube_shorts_iterator import YoutubeShortsIterator
+        options = dict(OPTIONS, replies='none', latency=0)
+        iterator = YoutubeShortsIterator(
+            self.server.shorts_url('feed', **options), limit=4, feed_urls=[self.server.shorts_url('feed-5', **options)],
+            follow_feed=True, max_shorts=4
+        )
+        threads = list(iterator)
+        for video_id in ('feed', 'feed-5', 'feed-6', 'feed-7'):
+            expected = [dict(thread, **{'short id': video_id}) for thread in self.server.video(video_id, **options).expected_comments(self.server.url, limit=4)]
+            self.assertEqual([thread for thread in threads if thread['short id'] == video_id], expected)
+        self.assertEqual(len(threads), 16)
+        self.assertEqual(iterator.metrics.counter_value('shorts_scraped_total'), 3)
+
+    def test_channel(self):
+        from iterators.implementations.comment_iterator import CommentIterator
+        from iterators.implementations.channel_iterator import ChannelIterator
+        options = dict(OPTIONS, replies='none', latency=0)
+        url = self.server.channel_url('channel', videos=3, video_page_size=2, **options)
+        threads = list(ChannelIterator(url, workers=2, iterator_class=CommentIterator))
+        for video_id in ('channel-1', 'channel-2', 'channel-3'):
+            video_url = self.server.video_url(video_id, **options)
+            expected = [dict(thread, **{'video url': video_url}) for thread in self.server.video(video_id, **options).expected_comments(self.server.url)]
+            self.assertEqual([thread for thread in threads if thread['video url'] == video_url], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+import re
+
+from fixtures.youtube_fixture_server import FixtureVideo, create_app, next_short_id, short_count
+
+
+class FixtureVideoTests(unittest.TestCase):
+    '''
+        FixtureVideoTests(self, *args, **kwargs)
+        Tests that the fixture videos generate the same comments for the same options, with the requested number of
+        comment threads, reply distribution and page sizes.
+    '''
+    def test_generation_is_deterministic(self):
+        first = list(FixtureVideo('abc', comments=30, replies='uniform', seed=3).expected_comments('http://fixture'))
+        second = list(FixtureVideo('abc', comments=30, replies='uniform', seed=3).expected_comments('http://fixture'))
+        other_seed = list(FixtureVideo('abc', comments=30, replies='uniform', seed=4).expected_comments('http://fixture'))
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other_seed)
+
+    def test_reply_distributions(self):
+        self.assertEqual(FixtureVideo('abc', comments=50, replies='none').total_comments, 50)
+        heavy = FixtureVideo('abc', comments=50, replies='heavy', max_replies=20)
+        self.assertTrue(all(10 <= count <= 20 for count in heavy.reply_counts))
+        self.assertEqual(heavy.total_comments, 50 + sum(heavy.reply_counts))
+        with self.assertRaises(Exception):
+            FixtureVideo('abc', replies='everything')
+
+    def test_expected_comments_match_the_format_of_the_iterators(self):
+        video = FixtureVideo('abc', comments=5, replies='heavy', max_replies=2)
+        [thread] = list(video.expected_comments('http://fixture', limit=1))
+        self.assertEqual(set(thread), {'commenter', 'comment content', 'link', 'children'})
+        self.assertTrue(thread['comment content'].startswith('thread 1:'))
+        self.assertTrue(thread['link'].startswith('http://fixture/watch?v=abc&lc='))
+        self.assertEqual(set(thread['children'][0]), {'commenter', 'comment content', 'link'})
+
+    def test_pages(self):
+        video = FixtureVideo('abc', comments=45, replies='heavy', max_replies=25, page_size=20, reply_page_size=10)
+        pages = [video.threads_page(page) for page in range(3)]
+        self.assertEqual([html.count('<ytd-comment-thread-renderer') for (html, _) in pages], [20, 20, 5])
+        self.assertEqual([has_more for (_, has_more) in pages], [True, True, False])
+        reply_count = video.reply_counts[0]
+        (replies, has_more) = video.replies_page(1, 0)
+        self.assertEqual(replies.count('<ytd-comment-renderer>'), 10)
+        self.assertTrue(has_more)
+        self.assertIn('<ytd-continuation-item-renderer data-page="1">', replies)
+        last_page = (reply_count - 1) // 10
+        (replies, has_more) = video.replies_page(1, last_page)
+        self.assertEqual(replies.count('<ytd-comment-renderer>'), reply_count - (last_page * 10))
+        self.assertFalse(has_more)
+        self.assertNotIn('ytd-continuation-item-renderer', replies)
+
+    def test_short_count(self):
+        self.assertEqual([short_count(number) for number in (987, 1000, 1234, 3450000)], ['987', '1K', '1.2K', '3.5M'])
+
+
+class FixtureServerTests(unittest.TestCase):
+    '''
+        FixtureServerTests(self, *args, **kwargs)
+        Tests the pages and continuation requests served by the fixture server
+    '''
+    def setUp(self):
+        self.client = create_app(comments=25, page_size=10).test_client()
+
+    def test_watch_page(self):
+        page = self.client.get('/watch?v=abc&replies=none').get_data(as_text=True)
+        self.assertIn('<div id="count"><yt-formatted-string><span>25</span>', page)
+        self.assertIn('<div id="title"><h1><yt-formatted-string>', page)
+        self.assertIn('data-video-id="abc"', page)
+
+    def test_shorts_page(self):
+        page = self.client.get('/shorts/abc?replies=none&comments=1500').get_data(as_text=True)
+        self.assertIn('aria-label="View 1,500 comments">1.5K</button>', page)
+        self.assertIn('id="watch-while-engagement-panel" hidden', page)
+
+    def test_shorts_feed(self):
+        page = self.client.get('/shorts/abc?replies=none').get_data(as_text=True)
+        self.assertIn('data-next-video-id="abc-1"', page)
+        self.assertIn('<ytd-reel-video-renderer is-active>', page)
+        self.assertIn('<div id="navigation-button-down">', page)
+        short = self.client.get('/fixture/short?v=abc-1&replies=none&comments=1500').get_json()
+        self.assertEqual(short['next_video_id'], 'abc-2')
+        self.assertIn('aria-label="View 1,500 comments">1.5K</button>', short['html'])
+        self.assertEqual(next_short_id('abc-9'), 'abc-10')
+
+    def test_linked_comments_are_shown_first(self):
+        video = FixtureVideo('abc', comments=25, replies='none', seed=3)
+        page = self.client.get(f'/watch?v=abc&replies=none&seed=3&lc={video.comment_id(17)}').get_data(as_text=True)
+        self.assertIn('<div id="contents" class="fixture-threads"><ytd-comment-thread-renderer data-thread="17">', page)
+        page = self.client.get(f'/shorts/abc?replies=none&seed=3&lc={video.comment_id(4, 2)}').get_data(as_text=True)
+        self.assertIn('<div id="contents" class="fixture-threads"><ytd-comment-thread-renderer data-thread="4">', page)
+        # comments that are not on the video are not shown
+        page = self.client.get('/watch?v=abc&lc=Ugx300000099').get_data(as_text=True)
+        self.assertIn('<div id="contents" class="fixture-threads"><ytd-continuation-item-renderer>', page)
+
+    def test_comment_continuations(self):
+        first = self.client.get('/fixture/comments?v=abc&page=0').get_json()
+        last = self.client.get('/fixture/comments?v=abc&page=2').get_json()
+        self.assertTrue(first['has_more'])
+        self.assertFalse(last['has_more'])
+        self.assertEqual(re.findall(r'data-thread="(\d+)"', last['html']), ['21', '22', '23', '24', '25'])
+
+    def test_reply_continuations(self):
+        video = FixtureVideo('abc', comments=25, page_size=10, replies='heavy', max_replies=4)
+        replies = self.client.get('/fixture/replies?v=abc&replies=heavy&max_replies=4&thread=3&page=0').get_json()
+        self.assertEqual(replies['html'].count('<ytd-comment-renderer>'), video.reply_counts[2])
+        self.assertFalse(replies['has_more'])
+
+    def test_invalid_options(self):
+        self.assertEqual(self.client.get('/watch?v=abc&replies=everything').status_code, 400)
+        self.assertEqual(self.client.get('/watch?v=abc&comments=many').status_code, 400)
+        self.assertEqual(self.client.get('/@someone/videos?videos=many').status_code, 400)
+
+    def test_channel_and_playlist_pages(self):
+        page = self.client.get('/@someone/videos?videos=3').get_data(as_text=True)
+        self.assertIn('data-kind="channel" data-list-id="someone"', page)
+        first = self.client.get('/fixture/videos?kind=channel&id=someone&videos=3&video_page_size=2&replies=none&page=0').get_json()
+        last = self.client.get('/fixture/videos?kind=channel&id=someone&videos=3&video_page_size=2&replies=none&page=1').get_json()
+        self.assertTrue(first['has_more'])
+        self.assertFalse(last['has_more'])
+        self.assertEqual(re.findall(r'href="([^"]+)"', first['html'] + last['html']), [
+            f'/watch?v=someone-{number}&amp;replies=none' for number in (1, 2, 3)
+        ])
+        playlist = self.client.get('/fixture/videos?kind=playlist&id=PL1&videos=1').get_json()
+        self.assertIn('<ytd-playlist-video-renderer><a id="video-title" href="/watch?v=PL1-1&amp;list=PL1&amp;index=1">', playlist['html'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import os
+import queue
+import tempfile
+from unittest import mock
+
+import iterators.job_logging as job_logging
+from iterators.job_logging import BoundedRepr, JobLogger
+
+
+class CountingRepr:
+    '''
+        CountingRepr() -> CountingRepr
+        counts how many times it has been formatted
+    '''
+    def __init__(self):
+        self.times_formatted = 0
+
+    def __repr__(self):
+        self.times_formatted += 1
+        return 'counted'
+
+
+class JobLoggingTests(unittest.TestCase):
+    '''
+        JobLoggingTests(self, *args, **kwargs)
+        Tests for the per-job loggers in iterators/job_logging.py. These tests do not need a browser.
+    '''
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.directory.name, 'debug.log')
+
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+    def read_log(self):
+        with open(self.log_file) as log_file:
+            return log_file.read().splitlines()
+
+
+    def test_jobs_sharing_a_file_write_each_line_once(self):
+        first_job = JobLogger(self.log_file, enabled_logging=True, name='tests')
+        second_job = JobLogger(self.log_file, enabled_logging=True, name='tests')
+        first_job.logger.debug('first job: %s', 1)
+        second_job.logger.debug('second job: %s', 2)
+        first_job.close()
+        second_job.logger.debug('second job again')
+        second_job.close()
+        lines = self.read_log()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].endswith('first job: 1'))
+        self.assertTrue(lines[2].endswith('second job again'))
+        self.assertEqual(job_logging.listeners, {})
+
+
+    def test_disabled_debug_is_not_formatted(self):
+        job = JobLogger(self.log_file, enabled_logging=False, name='tests')
+        value = CountingRepr()
+        job.logger.debug('value: %s', BoundedRepr(value))
+        job.logger.error('an error')
+        job.close()
+        self.assertEqual(value.times_formatted, 0)
+        self.assertEqual(len(self.read_log()), 1)
+
+
+    def test_large_values_are_bounded(self):
+        job = JobLogger(self.log_file, enabled_logging=True, name='tests')
+        thread = {'comment content': 'x' * 100000, 'children': [{'comment content': 'y' * 1000} for _ in range(1000)]}
+        job.logger.debug('comment info: %s', BoundedRepr(thread))
+        job.logger.debug('z' * 100000)
+        job.close()
+        lines = self.read_log()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(all(len(line) < job_logging.MAX_MESSAGE_LENGTH + 100 for line in lines))
+
+
+    def test_full_queue_drops_records(self):
+        with mock.patch.object(job_logging, 'MAX_QUEUED_RECORDS', 1):
+            job = JobLogger(self.log_file, enabled_logging=True, name='tests')
+            (listener, _) = job_logging.listeners[job.log_file]
+            # stop the listener thread, so that nothing is taken off the queue
+            listener.stop()
+            job.logger.debug('kept')
+            job.logger.debug('dropped')
+            self.assertEqual(job.dropped, 1)
+            listener.queue = queue.Queue()
+            listener.start()
+            job.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import json
+
+from iterators.metrics import Histogram, PerformanceMetrics, instrument_driver, timed_phase
+from tests.fake_driver import FakeDriver
+
+
+class PhasedScraper:
+    def __init__(self, driver):
+        self.metrics = PerformanceMetrics()
+        self.driver = instrument_driver(driver, self.metrics)
+
+    @timed_phase('go_to_next')
+    def go_to_next(self, replies):
+        self.driver.find_element('css selector', '#content-text')
+        for _ in range(replies):
+            self.iterate_child()
+
+    @timed_phase('iterate_child')
+    def iterate_child(self):
+        self.driver.find_element('css selector', '#replies')
+        self.driver.execute('executeScript')
+
+
+class MetricsTests(unittest.TestCase):
+    '''
+        MetricsTests(self, *args, **kwargs)
+        Tests for the performance metrics in iterators/metrics.py. These tests do not need a browser.
+    '''
+    def test_histogram_buckets(self):
+        histogram = Histogram((1, 5, 10))
+        for value in (0.5, 1, 3, 7, 100):
+            histogram.observe(value)
+        self.assertEqual(histogram.counts, [2, 1, 1, 1])
+        self.assertEqual(histogram.to_dict()['max'], 100)
+        self.assertEqual(histogram.to_dict()['buckets']['+Inf'], 1)
+
+
+    def test_commands_and_phases_counted(self):
+        driver = FakeDriver()
+        scraper = PhasedScraper(driver)
+        scraper.go_to_next(replies=2)
+        scraper.go_to_next(replies=0)
+        metrics = scraper.metrics
+        self.assertEqual(len(driver.commands), 6)
+        self.assertEqual(metrics.counter_value('webdriver_commands_total', command='findElement'), 4)
+        self.assertEqual(metrics.counter_value('webdriver_commands_total', command='executeScript'), 2)
+        self.assertEqual(metrics.counter_value('phase_calls_total', phase='go_to_next'), 2)
+        self.assertEqual(metrics.counter_value('phase_calls_total', phase='iterate_child'), 2)
+        per_thread = metrics.histograms[('phase_webdriver_commands', (('phase', 'go_to_next'),))]
+        self.assertEqual((per_thread.min, per_thread.max), (1, 5))
+
+
+    def test_command_listeners(self):
+        driver = FakeDriver()
+        scraper = PhasedScraper(driver)
+        heard = []
+        scraper.metrics.command_listeners.append(lambda command, started, duration: heard.append(command))
+        scraper.go_to_next(replies=1)
+        self.assertEqual(heard, ['findElement', 'findElement', 'executeScript'])
+
+
+    def test_exports(self):
+        scraper = PhasedScraper(FakeDriver())
+        scraper.go_to_next(replies=1)
+        scraper.metrics.set_gauge('comments_parsed', 2)
+        exported = json.loads(scraper.metrics.to_json())
+        self.assertEqual(exported['counters']['webdriver_commands_total']['command="findElement"'], 2)
+        self.assertEqual(exported['gauges']['comments_parsed'][''], 2)
+        self.assertEqual(exported['histograms']['phase_seconds']['phase="go_to_next"']['count'], 1)
+        text = scraper.metrics.to_prometheus()
+        self.assertIn('# TYPE scraper_webdriver_commands_total counter', text)
+        self.assertIn('scraper_webdriver_commands_total{command="findElement"} 2', text)
+        self.assertIn('scraper_comments_parsed 2', text)
+        self.assertIn('scraper_phase_seconds_bucket{phase="go_to_next",le="+Inf"} 1', text)
+        self.assertIn('scraper_phase_seconds_count{phase="go_to_next"} 1', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
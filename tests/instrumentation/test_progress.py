@@ -0,0 +1,98 @@
+import unittest
+import io
+from unittest import mock
+
+from iterators.progress import ProgressPrinter, ProgressTracker, format_seconds, parse_comment_count
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class ProgressTests(unittest.TestCase):
+    '''
+        ProgressTests(self, *args, **kwargs)
+        Tests for the progress reporting in iterators/progress.py. These tests do not need a browser.
+    '''
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch('iterators.progress.time.monotonic', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+    def test_parse_comment_count(self):
+        self.assertEqual(parse_comment_count('12,345'), 12345)
+        self.assertEqual(parse_comment_count('1.2K'), 1200)
+        self.assertEqual(parse_comment_count('View 3M comments'), 3000000)
+        self.assertIsNone(parse_comment_count('Comments'))
+        self.assertIsNone(parse_comment_count(None))
+
+
+    def test_throughput_and_eta(self):
+        updates = []
+        tracker = ProgressTracker(callback=updates.append)
+        tracker.start(total_comments=1000, limit=None, time_limit=None)
+        self.clock.now += 10
+        tracker.update(comments=100, threads=40)
+        self.assertEqual(len(updates), 1)
+        self.assertAlmostEqual(tracker.comments_per_second, 10)
+        self.assertAlmostEqual(tracker.threads_per_second, 4)
+        self.assertAlmostEqual(tracker.fraction_done, 0.1)
+        self.assertAlmostEqual(tracker.eta, 90)
+        self.assertIsNone(tracker.time_left)
+
+
+    def test_limit_and_time_limit(self):
+        tracker = ProgressTracker()
+        tracker.start(total_comments=1000, limit=200, time_limit=60)
+        self.clock.now += 10
+        tracker.update(comments=50, threads=50)
+        self.assertAlmostEqual(tracker.fraction_done, 0.25)
+        # 150 comments left at 5 per second is 30 seconds, which is less than the 50 seconds left on the time limit
+        self.assertAlmostEqual(tracker.eta, 30)
+        self.assertAlmostEqual(tracker.time_left, 50)
+        self.clock.now += 100
+        self.assertEqual(tracker.time_left, 0)
+
+
+    def test_recent_rate_drops_when_stalled(self):
+        tracker = ProgressTracker()
+        tracker.start()
+        for comments in range(10, 110, 10):
+            self.clock.now += 1
+            tracker.update(comments=comments, threads=comments)
+        self.assertAlmostEqual(tracker.recent_comments_per_second, 10)
+        self.clock.now += 60
+        tracker.update(comments=101, threads=101)
+        self.assertLess(tracker.recent_comments_per_second, 10)
+        self.assertIsNone(tracker.fraction_done)
+        self.assertIsNone(tracker.eta)
+
+
+    def test_printer(self):
+        stream = io.StringIO()
+        printer = ProgressPrinter(stream=stream, interval=5)
+        tracker = ProgressTracker(callback=printer)
+        tracker.start(total_comments=100, time_limit=3600)
+        self.clock.now += 2
+        tracker.update(comments=10, threads=5)
+        self.clock.now += 1
+        tracker.update(comments=20, threads=10)
+        self.assertEqual(stream.getvalue().count('\r'), 1)
+        self.assertIn('comments: 10 (10.0%)', stream.getvalue())
+        self.assertIn('time left: 00:59:58', stream.getvalue())
+        self.assertNotIn('first comment', stream.getvalue())
+        tracker.record_first_comment(1.5)
+        printer.finish(tracker)
+        self.assertIn('first comment: 1.50s', stream.getvalue())
+        self.assertEqual(tracker.snapshot()['time_to_first_comment'], 1.5)
+        self.assertEqual(format_seconds(3725), '01:02:05')
+
+
+if __name__ == '__main__':
+    unittest.main()
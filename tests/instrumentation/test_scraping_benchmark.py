@@ -0,0 +1,66 @@
+import unittest
+import os
+import subprocess
+import sys
+
+from benchmarks.scraping_benchmark import (
+    PROJECT_DIR, MemorySampler, child_processes, compare_with_baseline, compared_cases, fixture_options, process_rss
+)
+from fixtures.youtube_fixture_server import FixtureVideo
+
+
+def case(comments_per_second, time_to_first_comment, shape='flat'):
+    return {
+        'backend': 'regular', 'mode': 'default', 'scale': 100, 'shape': shape,
+        'comments_per_second': comments_per_second, 'time_to_first_comment': time_to_first_comment,
+        'commands_per_comment': 10.0, 'peak_python_rss': None, 'peak_browser_rss': None,
+    }
+
+
+class ScrapingBenchmarkTests(unittest.TestCase):
+    '''
+        ScrapingBenchmarkTests(self, *args, **kwargs)
+        Tests the parts of the scraping benchmark that do not need a browser: the fixture options for each scale and
+        shape, the memory measurements and the comparison with a baseline.
+    '''
+    def test_fixture_options_hold_enough_comments(self):
+        for shape in ('flat', 'replies'):
+            with self.subTest(shape=shape):
+                video = FixtureVideo('benchmark', **fixture_options(1000, shape, 0.0))
+                self.assertGreaterEqual(video.total_comments, 1000)
+
+    def test_compare_with_baseline(self):
+        baseline = {'cases': [case(100.0, 2.0), case(50.0, 2.0, shape='replies')]}
+        results = {'cases': [case(95.0, 2.1), case(40.0, 3.0, shape='replies'), case(1.0, 1.0, shape='other')]}
+        regressions = compare_with_baseline(results, baseline, tolerance=0.1)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith('regular/default/replies/100: comments_per_second'))
+        self.assertTrue(regressions[1].startswith('regular/default/replies/100: time_to_first_comment'))
+        self.assertEqual(compare_with_baseline(results, baseline, tolerance=0.6), [])
+        self.assertEqual(compared_cases(results, baseline), ['regular/default/flat/100', 'regular/default/replies/100'])
+
+    def test_missing_baseline_fails(self):
+        result = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.scraping_benchmark', '--baseline', os.path.join(PROJECT_DIR, 'benchmarks', 'missing.json')],
+            cwd=PROJECT_DIR, capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 1)
+        self.assertIn('There is no baseline', result.stderr)
+
+    @unittest.skipUnless(os.path.exists('/proc/self/statm'), '/proc is not available')
+    def test_memory_of_child_processes(self):
+        child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(5)'])
+        try:
+            self.assertIn(child.pid, child_processes(os.getpid()))
+            self.assertGreater(process_rss(os.getpid()), 0)
+            with MemorySampler(interval=0.01) as sampler:
+                pass
+            self.assertGreater(sampler.peak_python_rss, 0)
+            self.assertGreater(sampler.peak_browser_rss, 0)
+        finally:
+            child.kill()
+            child.wait()
+
+
+if __name__ == '__main__':
+    unittest.main()
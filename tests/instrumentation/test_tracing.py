@@ -0,0 +1,104 @@
+import unittest
+import json
+import os
+import tempfile
+
+from iterators.metrics import PerformanceMetrics, instrument_driver
+from iterators.tracing import TraceRecorder
+from tests.fake_driver import FakeDriver
+
+
+def log_entry(method, params, timestamp):
+    return {'message': json.dumps({'message': {'method': method, 'params': params}}), 'timestamp': timestamp, 'level': 'INFO'}
+
+
+class LoggingDriver(FakeDriver):
+    '''
+        LoggingDriver(entries) -> LoggingDriver
+        a FakeDriver standing in for a WebDriver started in trace mode. get_log returns the performance log entries it was given
+        (once, like Chrome, which empties its buffer when it is read).
+    '''
+    def __init__(self, entries):
+        super().__init__()
+        self.entries = entries
+
+    def get_log(self, log_type):
+        self.execute('getLog')
+        entries = self.entries
+        self.entries = []
+        return entries
+
+
+class TraceRecorderTests(unittest.TestCase):
+    '''
+        TraceRecorderTests(self, *args, **kwargs)
+        Tests that TraceRecorder turns the WebDriver commands, phases and Chrome's performance log into a trace in the
+        Trace Event Format, with every event on the wall clock.
+    '''
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, 'trace.json')
+        # Chrome's clock reads 700000 seconds when the wall clock reads 1700000000 seconds
+        entries = [
+            log_entry('Tracing.dataCollected', {'value': [{'name': 'Layout', 'ph': 'X', 'ts': 700001000000, 'dur': 500, 'pid': 7, 'tid': 3}]}, 1700000001500),
+            log_entry('Network.requestWillBeSent', {'requestId': '1', 'timestamp': 700000.0, 'request': {'url': 'https://www.youtube.com/youtubei/v1/next'}}, 1700000000000),
+            log_entry('Page.loadEventFired', {'timestamp': 700000.5}, 1700000000500),
+            log_entry('Network.loadingFinished', {'requestId': '1', 'timestamp': 700000.25, 'encodedDataLength': 1024}, 1700000000250),
+            {'message': 'not json', 'timestamp': 1700000000600},
+        ]
+        self.metrics = PerformanceMetrics()
+        self.driver = instrument_driver(LoggingDriver(entries), self.metrics)
+        self.recorder = TraceRecorder(self.filename, self.driver, self.metrics)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def load_trace(self):
+        self.recorder.save()
+        with open(self.filename) as trace_file:
+            return json.load(trace_file)
+
+    def events_named(self, trace, name):
+        return [event for event in trace['traceEvents'] if event['name'] == name]
+
+    def test_commands_and_phases(self):
+        with self.metrics.phase('go_to_next'):
+            self.driver.execute('findElement')
+        trace = self.load_trace()
+        self.assertEqual(trace['displayTimeUnit'], 'ms')
+        [command] = self.events_named(trace, 'findElement')
+        [phase] = self.events_named(trace, 'go_to_next')
+        self.assertEqual((command['ph'], command['cat']), ('X', 'webdriver'))
+        self.assertEqual((phase['ph'], phase['cat']), ('X', 'phase'))
+        self.assertLessEqual(phase['ts'], command['ts'])
+        self.assertGreaterEqual(phase['ts'] + phase['dur'], command['ts'] + command['dur'])
+
+    def test_network_page_and_timeline_events(self):
+        trace = self.load_trace()
+        [request] = self.events_named(trace, 'https://www.youtube.com/youtubei/v1/next')
+        self.assertEqual(request['ts'], 1700000000000000)
+        self.assertEqual(request['dur'], 250000)
+        self.assertEqual(request['args']['bytes'], 1024)
+        [load] = self.events_named(trace, 'Page.loadEventFired')
+        self.assertEqual((load['ph'], load['ts']), ('i', 1700000000500000))
+        # the timeline event arrived before the clock offset was known, and was moved once it was
+        [layout] = self.events_named(trace, 'Layout')
+        self.assertEqual(layout['ts'], 1700000001000000)
+        self.assertEqual(layout['pid'], 7)
+        self.assertEqual(self.recorder.unaligned_events, [])
+
+    def test_save_only_once(self):
+        self.recorder.save()
+        os.remove(self.filename)
+        self.recorder.save()
+        self.assertFalse(os.path.exists(self.filename))
+
+    def test_reading_the_log_is_not_recorded_recursively(self):
+        self.recorder.collect()
+        self.recorder.collect()
+        self.assertEqual(self.driver.commands, ['getLog', 'getLog'])
+        self.assertEqual(len(self.events_named(self.load_trace(), 'getLog')), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+import unittest
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from jobs.job_queue import DONE, FAILED, QUEUED, RUNNING, JobQueue, jobs_schema
+from jobs.scheduler import Scheduler, jobs_from_document, submit_jobs
+
+
+def record_job(url, options):
+    '''
+        record_job(url, options) -> None
+        the work done by the workers in these tests: write the url to options['record'], fail for urls with "fail" in
+        them, and sleep for options['sleep'] seconds
+    '''
+    time.sleep(options.get('sleep', 0))
+    if 'fail' in url:
+        raise Exception('failing on purpose')
+    with open(options['record'], 'a') as record:
+        record.write(url + '\n')
+
+
+def record_output(url, options):
+    with open(options['record'], 'a') as record:
+        record.write(options['output'] + '\n')
+
+
+class JobQueueTests(unittest.TestCase):
+    '''
+        JobQueueTests(self, *args, **kwargs)
+        Tests the persistent job queue: jobs are claimed by priority, failed jobs are retried with a backoff until
+        they run out of attempts, and jobs left running are queued again.
+    '''
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.queue = JobQueue(os.path.join(self.directory.name, 'jobs.db'))
+
+    def tearDown(self):
+        self.queue.close()
+        self.directory.cleanup()
+
+    def test_claims_by_priority_then_age(self):
+        first = self.queue.add('https://www.youtube.com/watch?v=first', {'limit': 10})
+        urgent = self.queue.add('https://www.youtube.com/watch?v=urgent', priority=5)
+        second = self.queue.add('https://www.youtube.com/watch?v=second')
+        claimed = [self.queue.claim()['id'] for _ in range(3)]
+        self.assertEqual(claimed, [urgent, first, second])
+        self.assertIsNone(self.queue.claim())
+        job = self.queue.get(first)
+        self.assertEqual(job['status'], RUNNING)
+        self.assertEqual(job['attempts'], 1)
+        self.assertEqual(job['options'], {'limit': 10})
+
+    def test_failed_jobs_are_retried_with_backoff(self):
+        job_id = self.queue.add('https://www.youtube.com/watch?v=retry', max_attempts=2)
+        self.queue.claim()
+        self.assertEqual(self.queue.fail(job_id, 'crashed', retry_delay=60), QUEUED)
+        # the retry is not due for another minute
+        self.assertIsNone(self.queue.claim())
+        self.assertGreater(self.queue.get(job_id)['not_before'], time.time() + 50)
+        self.queue.connection.execute('UPDATE jobs SET not_before = 0')
+        self.assertEqual(self.queue.claim()['attempts'], 2)
+        self.assertEqual(self.queue.fail(job_id, 'crashed again', retry_delay=60), FAILED)
+        self.assertIsNone(self.queue.claim())
+        self.assertEqual(self.queue.get(job_id)['error'], 'crashed again')
+        self.assertEqual(self.queue.counts()[FAILED], 1)
+
+    def test_running_jobs_are_requeued(self):
+        job_id = self.queue.add('https://www.youtube.com/watch?v=interrupted')
+        self.queue.claim()
+        self.assertEqual(self.queue.get(job_id)['owner'], self.queue.owner)
+        self.assertEqual(self.queue.requeue([job_id]), 1)
+        job = self.queue.get(job_id)
+        self.assertEqual((job['status'], job['attempts']), (QUEUED, 0))
+
+    def test_only_jobs_of_dead_schedulers_are_requeued(self):
+        # the id of a process that has exited
+        finished = subprocess.Popen([sys.executable, '-c', 'pass'])
+        finished.wait()
+        filename = os.path.join(self.directory.name, 'jobs.db')
+        dead = JobQueue(filename, owner='{}:{}'.format(socket.gethostname(), finished.pid))
+        live = JobQueue(filename, owner='{}:{}'.format(socket.gethostname(), os.getppid()))
+        remote = JobQueue(filename, owner='another-host:1')
+        try:
+            job_ids = [self.queue.add(f'https://www.youtube.com/watch?v={number}') for number in range(3)]
+            for queue in (dead, live, remote):
+                queue.claim()
+            # a stopping scheduler only queues its own jobs again
+            self.assertEqual(live.requeue(job_ids), 1)
+            live.claim()
+            self.assertEqual(self.queue.requeue_abandoned(), 1)
+            self.assertEqual([job['status'] for job in self.queue.jobs()], [QUEUED, RUNNING, RUNNING])
+            self.assertEqual(self.queue.get(job_ids[0])['owner'], None)
+        finally:
+            for queue in (dead, live, remote):
+                queue.close()
+
+    def test_queues_without_owners_are_upgraded(self):
+        filename = os.path.join(self.directory.name, 'old.db')
+        connection = sqlite3.connect(filename)
+        connection.executescript(jobs_schema([]))
+        connection.execute(
+            "INSERT INTO jobs (url, options, max_attempts, status, created_at) VALUES ('old', '{}', 1, 'running', 0)"
+        )
+        connection.commit()
+        connection.close()
+        queue = JobQueue(filename)
+        try:
+            self.assertEqual(queue.requeue_abandoned(), 1)
+        finally:
+            queue.close()
+
+    def test_queue_persists(self):
+        self.queue.add('https://www.youtube.com/watch?v=persisted', priority=2)
+        self.queue.close()
+        self.queue = JobQueue(os.path.join(self.directory.name, 'jobs.db'))
+        self.assertEqual([job['url'] for job in self.queue.jobs(QUEUED)], ['https://www.youtube.com/watch?v=persisted'])
+
+
+class SchedulerTests(unittest.TestCase):
+    '''
+        SchedulerTests(self, *args, **kwargs)
+        Tests that the scheduler takes in jobs from its spool directory and socket, and runs them in worker processes
+        with retries and timeouts.
+    '''
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.queue = JobQueue(os.path.join(self.directory.name, 'jobs.db'))
+        self.spool_dir = os.path.join(self.directory.name, 'spool')
+        self.record = os.path.join(self.directory.name, 'record.txt')
+
+    def tearDown(self):
+        self.queue.close()
+        self.directory.cleanup()
+
+    def scheduler(self, **kwargs):
+        return Scheduler(self.queue, spool_dir=self.spool_dir, poll_interval=0.05, retry_delay=0, work=record_job, **kwargs)
+
+    def recorded_urls(self):
+        if not os.path.exists(self.record):
+            return []
+        with open(self.record) as record:
+            return record.read().split()
+
+    def test_jobs_from_document(self):
+        jobs = jobs_from_document({'videos': [{'url': 'a', 'limit': 5, 'priority': 3}, {'url': 'b'}]}, {'timeout': 60})
+        self.assertEqual(jobs[0], {'url': 'a', 'options': {'limit': 5}, 'priority': 3, 'timeout': 60, 'max_attempts': 3})
+        self.assertEqual(jobs[1]['priority'], 0)
+        with self.assertRaises(Exception):
+            jobs_from_document({'limit': 5})
+
+    def test_spool_dir_jobs_run_with_retries(self):
+        os.makedirs(self.spool_dir)
+        submit_jobs(
+            {'videos': [{'url': 'ok-1', 'record': self.record}, {'url': 'fail-1', 'record': self.record, 'max_attempts': 2}]},
+            spool_dir=self.spool_dir
+        )
+        with open(os.path.join(self.spool_dir, 'broken.json'), 'w') as broken:
+            broken.write('{not json')
+        self.scheduler(workers=2).run(until_idle=True)
+        self.assertEqual(self.recorded_urls(), ['ok-1'])
+        self.assertEqual(sorted(os.listdir(self.spool_dir)), ['broken.json.rejected'])
+        failed = self.queue.jobs(FAILED)
+        self.assertEqual([(job['url'], job['attempts']) for job in failed], [('fail-1', 2)])
+        self.assertEqual(self.queue.counts()[DONE], 1)
+
+    def test_jobs_without_an_output_get_their_own(self):
+        output_dir = os.path.join(self.directory.name, 'outputs')
+        ids = [self.queue.add(f'video-{index}', {'record': self.record}) for index in range(2)]
+        ids.append(self.queue.add('video-2', {'record': self.record, 'output': 'chosen.json'}))
+        Scheduler(self.queue, workers=2, poll_interval=0.05, output_dir=output_dir, work=record_output).run(until_idle=True)
+        expected = [os.path.join(output_dir, f'job-{job_id}.json') for job_id in ids[:2]] + ['chosen.json']
+        self.assertEqual(sorted(self.recorded_urls()), sorted(expected))
+
+    def test_timed_out_jobs_are_stopped(self):
+        self.queue.add('slow', {'record': self.record, 'sleep': 30}, timeout=0.5, max_attempts=1)
+        started = time.monotonic()
+        self.scheduler(workers=1).run(until_idle=True)
+        self.assertLess(time.monotonic() - started, 20)
+        (job,) = self.queue.jobs()
+        self.assertEqual(job['status'], FAILED)
+        self.assertIn('timed out', job['error'])
+
+    def test_socket_jobs(self):
+        socket_path = os.path.join(self.directory.name, 'scheduler.sock')
+        scheduler = self.scheduler(workers=2, socket_path=socket_path)
+        thread = threading.Thread(target=scheduler.run)
+        thread.start()
+        try:
+            for _ in range(100):
+                if os.path.exists(socket_path):
+                    break
+                time.sleep(0.05)
+            ids = submit_jobs({'url': 'from-socket', 'record': self.record, 'priority': 1}, socket_path=socket_path)
+            self.assertEqual(len(ids), 1)
+            with self.assertRaises(Exception):
+                submit_jobs({'limit': 1}, socket_path=socket_path)
+            for _ in range(200):
+                if self.queue.get(ids[0])['status'] == DONE:
+                    break
+                time.sleep(0.05)
+        finally:
+            scheduler.stop()
+            thread.join()
+        self.assertEqual(self.recorded_urls(), ['from-socket'])
+        self.assertFalse(os.path.exists(socket_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
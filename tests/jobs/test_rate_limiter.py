@@ -0,0 +1,73 @@
+import unittest
+import multiprocessing
+import os
+import tempfile
+import time
+
+from iterators.rate_limiter import GLOBAL_BUCKET, RateLimiter, parse_host_rates
+
+
+def acquire_many(state_file, count, results):
+    '''
+        acquire_many(state_file, count, results) -> None
+        take count requests from a rate limiter sharing state_file in another process, and put the times they were
+        allowed at in results
+    '''
+    limiter = RateLimiter(rate=20, burst=1, state_file=state_file)
+    for _ in range(count):
+        limiter.acquire('https://www.youtube.com/watch?v=shared')
+        results.put(time.time())
+
+
+class RateLimiterTests(unittest.TestCase):
+    '''
+        RateLimiterTests(self, *args, **kwargs)
+        Tests the token bucket rate limiter: the global and per-host buckets, and sharing the buckets between
+        processes through a file.
+    '''
+    def test_take_token(self):
+        buckets = [(GLOBAL_BUCKET, 2.0, 2.0)]
+        state = {}
+        self.assertEqual(RateLimiter.take_token(buckets, state, 100.0), 0)
+        self.assertEqual(RateLimiter.take_token(buckets, state, 100.0), 0)
+        # the bucket is empty, and refills at 2 tokens per second
+        self.assertAlmostEqual(RateLimiter.take_token(buckets, state, 100.0), 0.5)
+        self.assertAlmostEqual(RateLimiter.take_token(buckets, state, 100.25), 0.25)
+        self.assertEqual(RateLimiter.take_token(buckets, state, 100.5), 0)
+
+    def test_per_host_rates(self):
+        limiter = RateLimiter(host_rates={'www.youtube.com': 1000}, burst=1)
+        self.assertEqual([name for (name, _, _) in limiter.buckets_for('www.youtube.com')], ['www.youtube.com'])
+        self.assertEqual(limiter.buckets_for('example.com'), [])
+        limiter = RateLimiter(rate=5, host_rates={'www.youtube.com': 1})
+        self.assertEqual([name for (name, _, _) in limiter.buckets_for('www.youtube.com')], [GLOBAL_BUCKET, 'www.youtube.com'])
+        limiter.acquire('https://WWW.youtube.com/watch?v=a')
+        started = time.perf_counter()
+        limiter.acquire('https://www.youtube.com/watch?v=b')
+        self.assertGreater(time.perf_counter() - started, 0.8)
+
+    def test_parse_host_rates(self):
+        self.assertEqual(parse_host_rates(['www.youtube.com=2', 'Example.com=0.5']), {'www.youtube.com': 2.0, 'example.com': 0.5})
+        for invalid in (['www.youtube.com'], ['=2'], ['www.youtube.com=fast']):
+            with self.assertRaises(Exception):
+                parse_host_rates(invalid)
+        with self.assertRaises(Exception):
+            RateLimiter(rate=0)
+
+    def test_shared_between_processes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            state_file = os.path.join(directory, 'rate.json')
+            context = multiprocessing.get_context('spawn')
+            results = context.Queue()
+            workers = [context.Process(target=acquire_many, args=(state_file, 5, results)) for _ in range(2)]
+            for worker in workers:
+                worker.start()
+            times = sorted(results.get(timeout=30) for _ in range(10))
+            for worker in workers:
+                worker.join()
+        # 10 requests at 20 per second with no burst take at least 9 / 20 seconds, whichever process makes them
+        self.assertGreater(times[-1] - times[0], 0.4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,270 @@
+import unittest
+import argparse
+import io
+import os
+import tempfile
+import time
+from contextlib import redirect_stderr
+
+from jobs.job_queue import DONE, FAILED, QUEUED
+from jobs.store import LEASED, MemoryJobStore, SQLiteJobStore, open_job_store
+from jobs.distributed import Coordinator, WorkerNode
+from main import given_options, submit_to_scheduler
+
+
+def report_job(url, options):
+    '''
+        report_job(url, options) -> Dict
+        the work done by the worker nodes in these tests: append the url to options['record'], and return an output
+        and metrics like main.scrape_video would have produced
+    '''
+    with open(options['record'], 'a') as record:
+        record.write(url + '\n')
+    return {'output': {'output': options.get('output'), 'url': url}, 'metrics': {'comment_threads_written': len(url)}}
+
+
+def report_at_once(url, options):
+    return {'output': {'url': url}, 'metrics': {'seconds': 0}}
+
+
+class LatePipe:
+    '''
+        LatePipe(connection) -> LatePipe
+        The receiving end of a worker's pipe that reports nothing to read the first time it is polled, as if the worker
+        sent its result just after the pipe was polled
+    '''
+    def __init__(self, connection):
+        self.connection = connection
+        self.polled = False
+
+    def poll(self):
+        if not self.polled:
+            self.polled = True
+            return False
+        return self.connection.poll()
+
+    def recv(self):
+        return self.connection.recv()
+
+    def close(self):
+        self.connection.close()
+
+
+class JobStoreTests:
+    '''
+        The tests every job store has to pass. Subclasses set up self.store.
+    '''
+    def test_leases_by_priority_then_age(self):
+        first = self.store.add('https://www.youtube.com/watch?v=first', {'limit': 10})
+        urgent = self.store.add('https://www.youtube.com/watch?v=urgent', priority=5)
+        second = self.store.add('https://www.youtube.com/watch?v=second')
+        leased = [self.store.lease('node-a')['id'] for _ in range(3)]
+        self.assertEqual(leased, [urgent, first, second])
+        self.assertIsNone(self.store.lease('node-a'))
+        job = self.store.get(first)
+        self.assertEqual(job['status'], LEASED)
+        self.assertEqual(job['lease_owner'], 'node-a')
+        self.assertEqual(job['attempts'], 1)
+        self.assertEqual(job['options'], {'limit': 10})
+        self.assertEqual(self.store.counts()[LEASED], 3)
+
+    def test_heartbeats_keep_the_lease(self):
+        job_id = self.store.add('https://www.youtube.com/watch?v=held')
+        self.store.lease('node-a', lease_seconds=0.2)
+        time.sleep(0.1)
+        self.assertTrue(self.store.heartbeat(job_id, 'node-a', lease_seconds=10))
+        time.sleep(0.2)
+        self.assertEqual(self.store.reclaim_expired(), 0)
+        self.assertFalse(self.store.heartbeat(job_id, 'node-b'))
+        self.assertTrue(self.store.complete(job_id, 'node-a', output={'output': 'held.json'}, metrics={'comment_threads_written': 3}))
+        job = self.store.get(job_id)
+        self.assertEqual(job['status'], DONE)
+        self.assertEqual(job['output'], {'output': 'held.json'})
+        self.assertEqual(job['metrics'], {'comment_threads_written': 3})
+        self.assertIsNone(job['lease_owner'])
+
+    def test_expired_leases_are_handed_to_another_node(self):
+        job_id = self.store.add('https://www.youtube.com/watch?v=lost')
+        self.store.lease('node-a', lease_seconds=0.05)
+        time.sleep(0.1)
+        job = self.store.lease('node-b')
+        self.assertEqual(job['id'], job_id)
+        self.assertEqual(job['attempts'], 2)
+        # the node that lost the lease can no longer report on the job
+        self.assertFalse(self.store.heartbeat(job_id, 'node-a'))
+        self.assertFalse(self.store.complete(job_id, 'node-a'))
+        self.assertIsNone(self.store.fail(job_id, 'node-a', 'too late'))
+        self.assertTrue(self.store.complete(job_id, 'node-b'))
+        self.assertEqual(self.store.get(job_id)['status'], DONE)
+
+    def test_expired_leases_without_attempts_left_fail(self):
+        job_id = self.store.add('https://www.youtube.com/watch?v=gone', max_attempts=1)
+        self.store.lease('node-a', lease_seconds=0.05)
+        time.sleep(0.1)
+        self.assertEqual(self.store.reclaim_expired(), 1)
+        job = self.store.get(job_id)
+        self.assertEqual(job['status'], FAILED)
+        self.assertIn('node-a', job['error'])
+
+    def test_failed_jobs_are_retried_with_backoff(self):
+        job_id = self.store.add('https://www.youtube.com/watch?v=retry', max_attempts=2)
+        self.store.lease('node-a')
+        self.assertEqual(self.store.fail(job_id, 'node-a', 'crashed', retry_delay=60), QUEUED)
+        self.assertIsNone(self.store.lease('node-b'))
+        self.assertGreater(self.store.get(job_id)['not_before'], time.time() + 50)
+        self.store.add('https://www.youtube.com/watch?v=other')
+        self.assertNotEqual(self.store.lease('node-b')['id'], job_id)
+        job_id = self.store.add('https://www.youtube.com/watch?v=retry-now', max_attempts=2)
+        self.store.lease('node-a')
+        self.assertEqual(self.store.fail(job_id, 'node-a', 'crashed', retry_delay=0), QUEUED)
+        self.assertEqual(self.store.lease('node-b')['attempts'], 2)
+        self.assertEqual(self.store.fail(job_id, 'node-b', 'crashed again', retry_delay=0), FAILED)
+        self.assertEqual(self.store.get(job_id)['error'], 'crashed again')
+
+    def test_released_jobs_do_not_use_an_attempt(self):
+        job_id = self.store.add('https://www.youtube.com/watch?v=released', max_attempts=1)
+        self.store.lease('node-a')
+        self.assertFalse(self.store.release(job_id, 'node-b'))
+        self.assertTrue(self.store.release(job_id, 'node-a'))
+        job = self.store.lease('node-b')
+        self.assertEqual(job['id'], job_id)
+        self.assertEqual(job['attempts'], 1)
+
+
+class MemoryJobStoreTests(JobStoreTests, unittest.TestCase):
+    '''
+        MemoryJobStoreTests(self, *args, **kwargs)
+        Tests the in-memory job store used as a stand-in for a shared store.
+    '''
+    def setUp(self):
+        self.store = MemoryJobStore()
+
+    def tearDown(self):
+        self.store.close()
+
+
+class SQLiteJobStoreTests(JobStoreTests, unittest.TestCase):
+    '''
+        SQLiteJobStoreTests(self, *args, **kwargs)
+        Tests the SQLite job store, including two connections (as on two machines) sharing the same database.
+    '''
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, 'jobs.db')
+        self.store = SQLiteJobStore(self.filename)
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def test_connections_share_the_jobs(self):
+        other = open_job_store('sqlite:' + self.filename)
+        try:
+            self.assertIsInstance(other, SQLiteJobStore)
+            job_ids = [self.store.add(f'https://www.youtube.com/watch?v={index}') for index in range(4)]
+            leased = [self.store.lease('node-a')['id'], other.lease('node-b')['id'], other.lease('node-b')['id'], self.store.lease('node-a')['id']]
+            self.assertEqual(sorted(leased), job_ids)
+            self.assertIsNone(other.lease('node-b'))
+            self.assertTrue(other.complete(leased[1], 'node-b', output={'host': 'b'}))
+            self.assertEqual(self.store.get(leased[1])['output'], {'host': 'b'})
+        finally:
+            other.close()
+
+    def test_open_job_store(self):
+        self.assertIsInstance(open_job_store('memory'), MemoryJobStore)
+        store = open_job_store(os.path.join(self.directory.name, 'other.db'))
+        self.assertIsInstance(store, SQLiteJobStore)
+        store.close()
+
+
+class WorkerNodeTests(unittest.TestCase):
+    '''
+        WorkerNodeTests(self, *args, **kwargs)
+        Tests that worker nodes sharing a SQLite job store do every job once, and record its output and metrics.
+    '''
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, 'jobs.db')
+        self.record = os.path.join(self.directory.name, 'record.txt')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_nodes_share_the_jobs(self):
+        store = SQLiteJobStore(self.filename)
+        urls = [f'https://www.youtube.com/watch?v=video{index}' for index in range(5)]
+        job_ids = [store.add(url, {'record': self.record}) for url in urls]
+        nodes = [
+            WorkerNode(
+                open_job_store(self.filename), slots=2, node_id=node_id, poll_interval=0.05, output_dir=self.directory.name, work=report_job
+            )
+            for node_id in ('node-a', 'node-b')
+        ]
+        try:
+            # the nodes take turns dispatching, as two machines polling the same store would
+            deadline = time.monotonic() + 60
+            while (store.counts()[DONE] < len(urls)) and (time.monotonic() < deadline):
+                for node in nodes:
+                    node.dispatch()
+                time.sleep(0.05)
+        finally:
+            for node in nodes:
+                node.shutdown()
+                node.store.close()
+        with open(self.record) as record:
+            self.assertEqual(sorted(record.read().split()), sorted(urls))
+        for (job_id, url) in zip(job_ids, urls):
+            job = store.get(job_id)
+            self.assertEqual(job['status'], DONE)
+            self.assertEqual(job['attempts'], 1)
+            self.assertEqual(job['output'], {'output': os.path.join(self.directory.name, f'job-{job_id}.json'), 'url': url})
+            self.assertEqual(job['metrics'], {'comment_threads_written': len(url)})
+        store.close()
+
+    def test_result_sent_just_before_exiting(self):
+        store = SQLiteJobStore(self.filename)
+        job_id = store.add('https://www.youtube.com/watch?v=quick', {})
+        node = WorkerNode(store, slots=1, node_id='node-a', poll_interval=0.05, work=report_at_once)
+        try:
+            node.dispatch()
+            (process, receiver, job, deadline) = node.running[job_id]
+            process.join(timeout=60)
+            # the worker has sent its result and exited, but the pipe was polled before the result arrived
+            node.running[job_id] = (process, LatePipe(receiver), job, deadline)
+            node.check_workers()
+        finally:
+            node.shutdown()
+        job = store.get(job_id)
+        self.assertEqual(job['status'], DONE)
+        self.assertEqual(job['output'], {'url': 'https://www.youtube.com/watch?v=quick'})
+        self.assertEqual(job['metrics'], {'seconds': 0})
+        store.close()
+
+    def test_submitted_jobs_get_their_own_output(self):
+        parser = argparse.ArgumentParser()
+        parser.add_argument('-o', '--output', type=str, default='comments.json')
+        parser.add_argument('--limit', type=int, default=None)
+        self.assertEqual(given_options(vars(parser.parse_args(['--limit', '5'])), parser), {'limit': 5})
+        spool_dir = os.path.join(self.directory.name, 'spool')
+        output_dir = os.path.join(self.directory.name, 'outputs')
+        os.makedirs(spool_dir)
+        urls = [f'https://www.youtube.com/watch?v=video{index}' for index in range(3)]
+        with redirect_stderr(io.StringIO()):
+            submit_to_scheduler({'videos': [{'url': url, 'record': self.record} for url in urls[:2]]}, spool_dir=spool_dir)
+            submit_to_scheduler({'url': urls[2], 'record': self.record, 'output': 'relative.json'}, spool_dir=spool_dir)
+        store = SQLiteJobStore(self.filename)
+        Coordinator(store, spool_dir=spool_dir).scan_spool_dir()
+        node = WorkerNode(store, slots=2, node_id='node-a', poll_interval=0.05, output_dir=output_dir, work=report_job)
+        node.run(until_idle=True)
+        outputs = {job['url']: (job['id'], job['output']['output']) for job in store.jobs(DONE)}
+        self.assertEqual(sorted(outputs), urls)
+        for url in urls[:2]:
+            (job_id, output) = outputs[url]
+            self.assertEqual(output, os.path.join(output_dir, f'job-{job_id}.json'))
+        # relative file names are resolved where the job was submitted, not where it runs
+        self.assertEqual(outputs[urls[2]][1], os.path.abspath('relative.json'))
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+import json
+import os
+import random
+import tempfile
+from collections import Counter
+
+from iterators.aggregates import AggregateSink, CommentAggregates, CountMinSketch, SpaceSaving, keywords_in
+from iterators.sinks import write_behind
+
+
+def make_thread(commenter, content, replies=()):
+    '''
+        make_thread(commenter, content, replies) -> Dict
+        return a dictionary shaped like the dictionaries returned by the iterators, with replies given as (commenter, content) pairs
+    '''
+    return {
+        'commenter': commenter,
+        'comment content': content,
+        'link': 'https://www.youtube.com/watch?v=abc&lc=thread',
+        'children': [
+            {'commenter': reply_commenter, 'comment content': reply_content, 'link': 'https://www.youtube.com/watch?v=abc&lc=reply'}
+            for (reply_commenter, reply_content) in replies
+        ]
+    }
+
+
+class SketchesTests(unittest.TestCase):
+    '''
+        SketchesTests(self, *args, **kwargs)
+        Tests that the Space-Saving counter and the count-min sketch find the frequent items and stay within their
+        error bounds while keeping a fixed amount of state.
+    '''
+    def stream(self):
+        generator = random.Random(7)
+        # a few heavy hitters in a long tail of rare items
+        items = [f'heavy {number}' for number in range(5) for _ in range(200 * (number + 1))]
+        items += [f'rare {generator.randrange(5000)}' for _ in range(5000)]
+        generator.shuffle(items)
+        return items
+
+    def test_space_saving_finds_the_heavy_hitters(self):
+        items = self.stream()
+        counter = SpaceSaving(50)
+        for item in items:
+            counter.add(item)
+        self.assertEqual(len(counter.counts), 50)
+        real_counts = Counter(items)
+        top = counter.top(5)
+        self.assertEqual([item for (item, _, _) in top], [f'heavy {number}' for number in range(4, -1, -1)])
+        for (item, count, error) in top:
+            self.assertTrue(real_counts[item] <= count <= real_counts[item] + error)
+        with self.assertRaises(Exception):
+            SpaceSaving(0)
+
+    def test_count_min_sketch_never_underestimates(self):
+        items = self.stream()
+        sketch = CountMinSketch(width=512, depth=4)
+        for item in items:
+            sketch.add(item)
+        real_counts = Counter(items)
+        bound = 2 * len(items) / 512
+        for (item, count) in real_counts.items():
+            self.assertGreaterEqual(sketch.estimate(item), count)
+        self.assertLess(sum(sketch.estimate(item) - count > bound for (item, count) in real_counts.items()), len(real_counts) / 10)
+        self.assertEqual(sketch.estimate('never added'), min(row[position] for (row, position) in zip(sketch.rows, sketch.positions('never added'))))
+        self.assertEqual(sketch.total, len(items))
+
+
+class CommentAggregatesTests(unittest.TestCase):
+    '''
+        CommentAggregatesTests(self, *args, **kwargs)
+        Tests the summary of the comment threads of a video, and the sink that writes one per video
+    '''
+    def test_summary(self):
+        aggregates = CommentAggregates(video='https://www.youtube.com/watch?v=abc', top=2, tracked_keywords=['Guitar'])
+        aggregates.add(make_thread('alice', 'The guitar solo is amazing', [('bob', 'That guitar solo!'), ('alice', 'agreed, amazing')]))
+        aggregates.add(make_thread('carol', 'First'))
+        aggregates.add(make_thread('alice', ''))
+        summary = aggregates.summary()
+        self.assertEqual((summary['comments'], summary['threads'], summary['replies']), (5, 3, 2))
+        self.assertEqual(summary['depths'], {'0': 3, '1': 2})
+        self.assertEqual(summary['top_commenters'], [{'commenter': 'alice', 'count': 3, 'error': 0}, {'commenter': 'bob', 'count': 1, 'error': 0}])
+        self.assertEqual(summary['top_keywords'][0], {'keyword': 'amazing', 'count': 2})
+        self.assertEqual(summary['tracked_keywords'], {'guitar': 2})
+        self.assertEqual(summary['replies_per_thread']['buckets']['0'], 2)
+        self.assertEqual(summary['replies_per_thread']['buckets']['2'], 1)
+        self.assertEqual(summary['comment_length']['count'], 5)
+        self.assertEqual(summary['comment_length']['max'], len('The guitar solo is amazing'))
+        json.dumps(summary)
+
+    def test_keywords(self):
+        self.assertEqual(list(keywords_in("Don't stop, it's THE best 2024 song ever!! A fan's view")), ['stop', 'best', 'song', 'ever', "fan's", 'view'])
+
+    def test_sink_writes_a_summary_per_video(self):
+        threads = [
+            dict(make_thread('alice', 'first video'), **{'video url': 'https://www.youtube.com/watch?v=one'}),
+            None,
+            dict(make_thread('bob', 'second video'), **{'video url': 'https://www.youtube.com/watch?v=two'}),
+            dict(make_thread('carol', 'first video again'), **{'video url': 'https://www.youtube.com/watch?v=one'}),
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'summary.json')
+            write_behind(iter(threads), [AggregateSink(filename, video='https://www.youtube.com/@someone/videos')], batch_size=2)
+            with open(filename) as summary_file:
+                summary = json.load(summary_file)
+        self.assertEqual([video['video'] for video in summary['videos']], [
+            'https://www.youtube.com/watch?v=one', 'https://www.youtube.com/watch?v=two'
+        ])
+        self.assertEqual([video['threads'] for video in summary['videos']], [2, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
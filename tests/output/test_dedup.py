@@ -0,0 +1,137 @@
+import unittest
+import random
+
+from iterators.dedup import MinHasher, NearDuplicateFilter, NearDuplicateIndex, normalize, shingles, similarity
+from iterators.metrics import PerformanceMetrics
+
+
+SPAM = 'Check out my channel for FREE gift cards, link in my bio!!'
+
+
+def make_thread(number, content, replies=(), video=None):
+    '''
+        make_thread(number, content, replies, video) -> Dict
+        return a dictionary shaped like the dictionaries returned by the iterators, with replies given as their contents
+    '''
+    thread = {
+        'commenter': f'commenter {number}',
+        'comment content': content,
+        'link': f'https://www.youtube.com/watch?v=abc&lc=thread{number}',
+        'children': [
+            {'commenter': f'replier {reply}', 'comment content': reply_content, 'link': f'https://www.youtube.com/watch?v=abc&lc=thread{number}.{reply}'}
+            for (reply, reply_content) in enumerate(replies)
+        ]
+    }
+    if video:
+        thread['video url'] = video
+    return thread
+
+
+def variant(text, generator):
+    '''
+        variant(text, generator) -> Str
+        return the text with one character changed and a random number added, like spam bots do to get past filters
+    '''
+    position = generator.randrange(len(text))
+    return text[:position] + generator.choice('xyz') + text[position + 1:] + f' {generator.randrange(1000)}'
+
+
+class MinHashTests(unittest.TestCase):
+    '''
+        MinHashTests(self, *args, **kwargs)
+        Tests that MinHash signatures estimate the similarity of comments
+    '''
+    def test_similarity_estimates(self):
+        hasher = MinHasher(128)
+        first = shingles(normalize(SPAM))
+        second = shingles(normalize(SPAM.replace('FREE', 'free!!! ').replace('bio', 'b1o')))
+        jaccard = len(first & second) / len(first | second)
+        estimate = similarity(hasher.signature(first), hasher.signature(second))
+        self.assertLess(abs(estimate - jaccard), 0.15)
+        unrelated = shingles(normalize('The bridge at 2:31 is the best part of the whole song'))
+        self.assertLess(similarity(hasher.signature(first), hasher.signature(unrelated)), 0.2)
+        self.assertEqual(shingles('abc'), {'abc'})
+
+
+class NearDuplicateIndexTests(unittest.TestCase):
+    '''
+        NearDuplicateIndexTests(self, *args, **kwargs)
+        Tests that near-duplicates are grouped into clusters, that different comments are not, and that the number of
+        clusters kept is bounded
+    '''
+    def test_clusters(self):
+        generator = random.Random(3)
+        index = NearDuplicateIndex()
+        self.assertIsNone(index.add(SPAM, link='first'))
+        for copy in range(20):
+            cluster = index.add(variant(SPAM, generator), link=f'copy {copy}')
+            self.assertIsNotNone(cluster)
+            self.assertEqual((cluster.link, cluster.count), ('first', copy + 2))
+        self.assertEqual(index.add(SPAM.upper()).count, 22)
+        self.assertIsNone(index.add('I have been listening to this song on repeat for a week'))
+        # short comments and comments on other videos are never duplicates
+        self.assertIsNone(index.add('nice video'))
+        self.assertIsNone(index.add('nice video'))
+        self.assertIsNone(index.add(SPAM, video='https://www.youtube.com/watch?v=other'))
+        self.assertEqual([cluster.count for cluster in index.largest_clusters()], [22])
+
+    def test_clusters_are_bounded(self):
+        generator = random.Random(5)
+        index = NearDuplicateIndex(max_clusters=10)
+        words = ['never', 'gonna', 'give', 'you', 'up', 'let', 'down', 'run', 'around', 'and', 'desert']
+        for _ in range(300):
+            index.add(' '.join(generator.choice(words) for _ in range(12)))
+        self.assertLessEqual(len(index.clusters), 10)
+        self.assertGreater(index.evicted, 0)
+        live_keys = set(index.clusters)
+        self.assertTrue(all(key in live_keys for key in index.buckets.values()))
+        with self.assertRaises(Exception):
+            NearDuplicateIndex(num_perm=64, bands=10)
+
+
+class NearDuplicateFilterTests(unittest.TestCase):
+    '''
+        NearDuplicateFilterTests(self, *args, **kwargs)
+        Tests tagging and collapsing near-duplicates in a stream of comment threads
+    '''
+    def threads(self):
+        generator = random.Random(7)
+        return [
+            make_thread(1, SPAM, replies=[variant(SPAM, generator), 'I have been listening to this song on repeat for a week']),
+            None,
+            make_thread(2, 'The guitar solo at the end gives me chills every time'),
+            make_thread(3, variant(SPAM, generator)),
+            make_thread(4, SPAM, video='https://www.youtube.com/watch?v=other'),
+        ]
+
+    def test_tag(self):
+        metrics = PerformanceMetrics()
+        threads = list(NearDuplicateFilter(self.threads(), mode='tag', metrics=metrics))
+        self.assertEqual(len(threads), 5)
+        self.assertIsNone(threads[1])
+        self.assertNotIn('duplicate of', threads[0])
+        self.assertEqual(threads[0]['children'][0]['duplicate of'], threads[0]['link'])
+        self.assertEqual(threads[0]['children'][0]['duplicate count'], 2)
+        self.assertNotIn('duplicate of', threads[0]['children'][1])
+        self.assertEqual((threads[3]['duplicate of'], threads[3]['duplicate count']), (threads[0]['link'], 3))
+        self.assertNotIn('duplicate of', threads[4])
+        self.assertEqual(metrics.counter_value('near_duplicate_comments_total'), 2)
+        self.assertEqual(metrics.counter_value('phase_calls_total', phase='deduplication'), 4)
+
+    def test_collapse(self):
+        stream = NearDuplicateFilter(self.threads(), mode='collapse')
+        threads = list(stream)
+        self.assertEqual([thread['link'][-1] if thread else None for thread in threads], ['1', None, '2', '4'])
+        self.assertEqual(len(threads[0]['children']), 1)
+        self.assertEqual(stream.duplicates, 2)
+        self.assertEqual([(cluster.link, cluster.count) for cluster in stream.largest_clusters()], [(threads[0]['link'], 3)])
+        # the counts collapsing leaves out of the output are kept in the report
+        report = stream.report()
+        self.assertEqual((report['mode'], report['near duplicates'], report['clusters dropped']), ('collapse', 2, 0))
+        self.assertEqual(report['clusters'], [{'video': None, 'link': threads[0]['link'], 'comment content': SPAM, 'count': 3}])
+        with self.assertRaises(Exception):
+            NearDuplicateFilter([], mode='remove')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import json
+import os
+import tempfile
+
+from iterators.sinks import JSONFileSink, write_behind
+from iterators.output_index import OutputIndex, OutputReader, build_index, comment_id, index_filename_for
+from tests.output.test_sinks import make_thread
+
+
+class OutputIndexTests(unittest.TestCase):
+    '''
+        OutputIndexTests(self, *args, **kwargs)
+        Tests for the output index and the random-access reader in iterators/output_index.py. These tests do not
+        need a browser.
+    '''
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.directory.name, 'comments.json')
+        self.threads = [make_thread(number, replies=(number % 4)) for number in range(40)]
+        self.threads[3] = None
+        # brackets, quotes and escapes inside strings must not confuse the scan
+        self.threads[7]['comment content'] = 'tricky ] } [ { "quoted" \\ text é'
+
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+    def test_comment_id(self):
+        self.assertEqual(comment_id('https://www.youtube.com/watch?v=abc&lc=UgxYz.123'), 'UgxYz.123')
+        self.assertIsNone(comment_id('https://www.youtube.com/watch?v=abc'))
+        self.assertIsNone(comment_id(''))
+
+
+    def test_index_written_with_output(self):
+        index_file = index_filename_for(self.output)
+        write_behind(iter(self.threads), [JSONFileSink(self.output, index_file=index_file)], batch_size=6)
+        with OutputReader(self.output) as reader:
+            self.assertEqual(len(reader), len(self.threads))
+            for (position, thread) in enumerate(self.threads):
+                self.assertEqual(reader.thread(position + 1), thread)
+
+
+    def test_index_built_afterwards_matches(self):
+        for key in ('comments', None):
+            index_file = index_filename_for(self.output)
+            write_behind(iter(self.threads), [JSONFileSink(self.output, key=key, index_file=index_file)])
+            written = OutputIndex.load(index_file)
+            os.remove(index_file)
+            built = build_index(self.output)
+            self.assertEqual(built.offsets, written.offsets)
+            self.assertEqual(built.comment_ids, written.comment_ids)
+            self.assertEqual(built.commenters, written.commenters)
+
+
+    def test_index_for_indented_file(self):
+        with open(self.output, 'w') as output_file:
+            json.dump({'comments': self.threads}, output_file, indent=4)
+        with OutputReader(self.output) as reader:
+            self.assertEqual([reader.thread(number) for number in range(1, len(reader) + 1)], self.threads)
+
+
+    def test_empty_file(self):
+        # a scrape that wrote nothing leaves an empty output file
+        open(self.output, 'w').close()
+        self.assertEqual(len(build_index(self.output)), 0)
+        os.remove(index_filename_for(self.output))
+        with OutputReader(self.output) as reader:
+            self.assertEqual(len(reader), 0)
+            self.assertIsNone(reader.thread_with_comment('abc'))
+            self.assertEqual(reader.sample(5), [])
+            with self.assertRaises(IndexError):
+                reader.thread(1)
+
+
+    def test_lookups(self):
+        write_behind(iter(self.threads), [JSONFileSink(self.output)])
+        with OutputReader(self.output) as reader:
+            self.assertEqual(reader.thread_with_comment('thread10'), self.threads[10])
+            self.assertEqual(reader.thread_with_comment('thread10.reply1'), self.threads[10])
+            self.assertEqual(
+                reader.thread_with_comment('https://www.youtube.com/watch?v=abc&lc=thread13.reply0'), self.threads[13]
+            )
+            self.assertIsNone(reader.thread_with_comment('missing'))
+            replies = list(reader.comments_by_commenter('replier 2'))
+            expected = [thread for thread in self.threads if thread and len(thread['children']) > 2]
+            self.assertEqual(len(replies), len(expected))
+            self.assertEqual(list(reader.threads_by_commenter('commenter 5')), [self.threads[5]])
+            sample = reader.sample(5, seed=1)
+            self.assertEqual(len(sample), 5)
+            self.assertTrue(all(thread in self.threads for thread in sample))
+            with self.assertRaises(IndexError):
+                reader.thread(len(self.threads) + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
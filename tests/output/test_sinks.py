@@ -0,0 +1,147 @@
+import unittest
+import io
+import json
+import os
+import sqlite3
+import tempfile
+import time
+
+from iterators.sinks import JSONFileSink, SQLiteSink, StdoutSink, Sink, WriteBehindWriter, write_behind
+
+
+def make_thread(number, replies=0):
+    '''
+        make_thread(number, replies) -> Dict
+        return a dictionary shaped like the dictionaries returned by the iterators, with the given number of replies
+    '''
+    return {
+        'commenter': f'commenter {number}',
+        'comment content': f'comment number {number}',
+        'link': f'https://www.youtube.com/watch?v=abc&lc=thread{number}',
+        'children': [
+            {
+                'commenter': f'replier {reply}',
+                'comment content': f'reply {reply} to comment {number}',
+                'link': f'https://www.youtube.com/watch?v=abc&lc=thread{number}.reply{reply}',
+            }
+            for reply in range(replies)
+        ]
+    }
+
+
+class SlowSink(Sink):
+    '''
+        SlowSink(delay) -> Sink
+        a sink that sleeps for delay seconds on every batch, and records the batches it received
+    '''
+    def __init__(self, delay):
+        self.delay = delay
+        self.batches = []
+
+    def write_batch(self, items):
+        time.sleep(self.delay)
+        self.batches.append(list(items))
+
+
+class FailingSink(Sink):
+    def write_batch(self, items):
+        raise ValueError('disk is full')
+
+
+class SinkTests(unittest.TestCase):
+    '''
+        SinkTests(self, *args, **kwargs)
+        Tests for the sinks and the write-behind writer in iterators/sinks.py. These tests do not need a browser.
+    '''
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.threads = [make_thread(number, replies=(number % 3)) for number in range(25)]
+        self.threads[4] = None
+
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+    def path(self, filename):
+        return os.path.join(self.directory.name, filename)
+
+
+    def test_json_file_matches_json_dumps(self):
+        output = self.path('comments.json')
+        write_behind(iter(self.threads), [JSONFileSink(output)], batch_size=7)
+        with open(output) as output_file:
+            self.assertEqual(output_file.read(), json.dumps({'comments': self.threads}))
+
+
+    def test_json_file_without_key(self):
+        output = self.path('comments.json')
+        write_behind(iter(self.threads), [JSONFileSink(output, key=None)])
+        with open(output) as output_file:
+            self.assertEqual(json.load(output_file), self.threads)
+
+
+    def test_empty_iterator(self):
+        output = self.path('comments.json')
+        self.assertEqual(write_behind(iter([]), [JSONFileSink(output)]), 0)
+        with open(output) as output_file:
+            self.assertEqual(json.load(output_file), {'comments': []})
+
+
+    def test_fan_out_to_all_sinks(self):
+        output = self.path('comments.json')
+        database = self.path('comments.db')
+        stream = io.StringIO()
+        sinks = [JSONFileSink(output), SQLiteSink(database), StdoutSink(stream)]
+        self.assertEqual(write_behind(iter(self.threads), sinks), len(self.threads))
+        with open(output) as output_file:
+            self.assertEqual(json.load(output_file)['comments'], self.threads)
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(lines, [thread for thread in self.threads if thread is not None])
+        connection = sqlite3.connect(database)
+        total_rows = connection.execute('SELECT COUNT(*) FROM comments').fetchone()[0]
+        expected_rows = sum(1 + len(thread['children']) for thread in self.threads if thread is not None)
+        self.assertEqual(total_rows, expected_rows)
+        replies = connection.execute(
+            'SELECT reply.content FROM comments AS reply JOIN comments AS parent ON reply.parent = parent.id '
+            'WHERE parent.thread = 6 ORDER BY reply.id'
+        ).fetchall()
+        self.assertEqual([row[0] for row in replies], ['reply 0 to comment 5', 'reply 1 to comment 5'])
+        connection.close()
+
+
+    def test_batches_respect_batch_size(self):
+        sink = SlowSink(0)
+        write_behind(iter(range(10)), [sink], batch_size=4, flush_interval=10)
+        self.assertTrue(all(len(batch) <= 4 for batch in sink.batches))
+        self.assertEqual([item for batch in sink.batches for item in batch], list(range(10)))
+
+
+    def test_flush_interval_writes_partial_batch(self):
+        sink = SlowSink(0)
+        writer = WriteBehindWriter([sink], batch_size=100, flush_interval=0.05).start()
+        writer.put('first')
+        time.sleep(0.5)
+        self.assertEqual(sink.batches, [['first']])
+        writer.close()
+
+
+    def test_backpressure_blocks_producer(self):
+        sink = SlowSink(0.2)
+        writer = WriteBehindWriter([sink], max_queue_size=2, batch_size=1).start()
+        started = time.monotonic()
+        for item in range(6):
+            writer.put(item)
+        elapsed = time.monotonic() - started
+        writer.close()
+        self.assertGreater(elapsed, 0.4)
+        self.assertEqual([batch[0] for batch in sink.batches], list(range(6)))
+
+
+    def test_sink_errors_are_raised_in_producer(self):
+        with self.assertRaises(ValueError):
+            write_behind(iter(range(1000)), [FailingSink()], max_queue_size=2, batch_size=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+import unittest
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from unittest import mock
+
+from iterators.metrics import PerformanceMetrics
+from iterators.pipeline import Pipeline, normalize_thread, pattern_filter
+
+
+def make_thread(number, content=None, replies=()):
+    '''
+        make_thread(number, content, replies) -> Dict
+        return a dictionary shaped like the dictionaries returned by the iterators, with replies given as their contents
+    '''
+    return {
+        'commenter': f'commenter {number}',
+        'comment content': content if content is not None else f'comment number {number}',
+        'link': f'https://www.youtube.com/watch?v=abc&lc=thread{number}',
+        'children': [
+            {'commenter': f'replier {reply}', 'comment content': reply_content, 'link': f'https://www.youtube.com/watch?v=abc&lc=thread{number}.{reply}'}
+            for (reply, reply_content) in enumerate(replies)
+        ]
+    }
+
+
+class SlowIterator:
+    '''
+        SlowIterator(count, delay, fail_at=None) -> SlowIterator
+        a stand-in for an iterator driving a browser, which takes delay seconds to return each of count threads, and
+        raises an exception instead of returning thread number fail_at. The threads it was used from are recorded.
+    '''
+    def __init__(self, count, delay, fail_at=None):
+        self.count = count
+        self.delay = delay
+        self.fail_at = fail_at
+        self.returned = 0
+        self.threads_used = set()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        self.threads_used.add(threading.current_thread().name)
+        if self.returned >= self.count:
+            raise StopIteration
+        time.sleep(self.delay)
+        self.returned += 1
+        if self.returned == self.fail_at:
+            raise Exception('the browser went away')
+        return make_thread(self.returned, content=f'  comment number {self.returned}  ')
+
+
+def slow_filter(delay):
+    '''
+        slow_filter(delay) -> Function
+        return a processing step that takes delay seconds and leaves out every third thread
+    '''
+    def process(thread):
+        time.sleep(delay)
+        return None if thread['link'].endswith(('3', '6', '9')) else thread
+    return process
+
+
+class PipelineTests(unittest.TestCase):
+    '''
+        PipelineTests(self, *args, **kwargs)
+        Tests that the pipeline drives the iterator on a thread of its own, processes the threads in worker threads at
+        the same time as the iterator reads the next ones, and returns them in order.
+    '''
+    def test_threads_come_out_in_order(self):
+        iterator = SlowIterator(10, 0.01)
+        metrics = PerformanceMetrics()
+        threads = list(Pipeline(iterator, processors=[slow_filter(0.05)], workers=4, metrics=metrics))
+        self.assertEqual([thread['link'][-1] if thread else None for thread in threads], ['1', '2', None, '4', '5', None, '7', '8', None, '0'])
+        self.assertEqual(threads[0]['comment content'], 'comment number 1')
+        self.assertEqual(iterator.threads_used, {'pipeline-producer'})
+        self.assertEqual(metrics.to_dict()['histograms']['pipeline_process_seconds']['']['count'], 10)
+
+    def test_processing_overlaps_the_iterator(self):
+        # serially, this takes 10 * (0.05 + 0.05) seconds
+        started = time.perf_counter()
+        threads = list(Pipeline(SlowIterator(10, 0.05), processors=[slow_filter(0.05)], workers=2))
+        self.assertEqual(len(threads), 10)
+        self.assertLess(time.perf_counter() - started, 0.8)
+
+    def test_pattern(self):
+        threads = [make_thread(1, 'a great GUITAR solo'), make_thread(2, 'nothing here', replies=['the guitar!']), make_thread(3, 'nothing')]
+        self.assertEqual([thread['link'][-1] if thread else None for thread in Pipeline(iter(threads + [None]), pattern='guitar')], ['1', '2', None, None])
+        matches = pattern_filter('guitar')
+        self.assertIsNone(matches(make_thread(4, 'no', replies=['no'])))
+        self.assertEqual(normalize_thread(make_thread(5, ' text ', replies=['\nreply\n']))['children'][0]['comment content'], 'reply')
+
+    def test_errors_are_raised_in_order(self):
+        pipeline = Pipeline(SlowIterator(10, 0, fail_at=4), workers=2)
+        links = []
+        with self.assertRaises(Exception):
+            for thread in pipeline:
+                links.append(thread['link'][-1])
+        self.assertEqual(links, ['1', '2', '3'])
+
+        def failing_step(thread):
+            raise ValueError('bad thread')
+        with self.assertRaises(ValueError):
+            list(Pipeline(SlowIterator(3, 0), processors=[failing_step]))
+        with self.assertRaises(Exception):
+            Pipeline(iter([]), workers=0)
+
+    def test_closing_stops_the_producer(self):
+        iterator = SlowIterator(1000, 0.001)
+        pipeline = Pipeline(iterator, queue_size=5)
+        for (number, thread) in enumerate(pipeline, start=1):
+            if number == 3:
+                break
+        self.assertFalse(pipeline.producer.is_alive())
+        self.assertLess(iterator.returned, 20)
+        self.assertEqual(list(pipeline), [])
+
+
+class ClosingIterator(SlowIterator):
+    '''
+        ClosingIterator(threads) -> ClosingIterator
+        an iterator over the given threads that records whether it was closed, and whether the thread driving it was
+        still running at that point
+    '''
+    def __init__(self, threads):
+        super().__init__(len(threads), 0)
+        self.threads = threads
+        self.closed_while_driven = None
+
+    def __next__(self):
+        self.threads_used.add(threading.current_thread().name)
+        if self.returned >= self.count:
+            raise StopIteration
+        self.returned += 1
+        return self.threads[self.returned - 1]
+
+    def close(self):
+        self.closed_while_driven = any(thread.name == 'pipeline-producer' for thread in threading.enumerate())
+
+
+class ScrapeVideoTests(unittest.TestCase):
+    '''
+        ScrapeVideoTests(self, *args, **kwargs)
+        Tests that main.scrape_video runs the pipeline and the near-duplicate filter together, and closes the pipeline
+        before the iterator
+    '''
+    def test_pipeline_with_dedup(self):
+        import main
+        spam = 'Check out my channel for FREE gift cards, link in my bio!!'
+        iterator = ClosingIterator([
+            make_thread(1, 'a great guitar solo'), make_thread(2, 'nothing here'), make_thread(3, spam + ' guitar'),
+            make_thread(4, spam + ' guitar!')
+        ])
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        output = os.path.join(directory, 'comments.json')
+        report = os.path.join(directory, 'duplicates.json')
+        with mock.patch('iterators.factory.IteratorFactory', return_value=iterator) as factory:
+            main.scrape_video(
+                'https://www.youtube.com/watch?v=abc', output=output, pattern='guitar', process_workers=2, dedup='collapse',
+                dedup_report=report
+            )
+        self.assertTrue(factory.call_args.kwargs['defer_processing'])
+        with open(output) as output_file:
+            threads = json.load(output_file)['comments']
+        self.assertEqual([thread['link'][-1] for thread in threads if thread], ['1', '3'])
+        self.assertEqual(iterator.threads_used, {'pipeline-producer'})
+        self.assertFalse(iterator.closed_while_driven)
+        with open(report) as report_file:
+            clusters = json.load(report_file)['clusters']
+        self.assertEqual([(cluster['link'][-1], cluster['count']) for cluster in clusters], [('3', 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
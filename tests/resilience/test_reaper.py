@@ -0,0 +1,146 @@
+import unittest
+import gc
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from unittest import mock
+
+from iterators.implementations.comment_iterator import CommentIterator
+from iterators.implementations.youtube_shorts_iterator import YoutubeShortsIterator
+from iterators.reaper import child_drivers, descendants, orphaned_browsers, process_table, reap_children
+from tests.fake_driver import FakeDriver
+
+
+class IteratorLifecycleTests(unittest.TestCase):
+    '''
+        IteratorLifecycleTests(self, *args, **kwargs)
+        Tests that the iterators quit their browser exactly once when they are closed, used as context managers or
+        garbage collected, even if they were never iterated over, and that a driver passed in is left running
+    '''
+    def create(self, iterator_class, module, url, **kwargs):
+        driver = FakeDriver()
+        with mock.patch(f'iterators.implementations.{module}.create_driver', return_value=driver):
+            return (iterator_class(url, **kwargs), driver)
+
+    def test_close(self):
+        for (iterator_class, module, url) in (
+            (CommentIterator, 'comment_iterator', 'https://www.youtube.com/watch?v=abc'),
+            (YoutubeShortsIterator, 'youtube_shorts_iterator', 'https://www.youtube.com/shorts/abc'),
+        ):
+            (iterator, driver) = self.create(iterator_class, module, url)
+            iterator.close()
+            iterator.close()
+            self.assertEqual(driver.quit_count, 1)
+            self.assertEqual(list(iterator), [])
+
+    def test_context_manager_and_finalizer(self):
+        (iterator, driver) = self.create(CommentIterator, 'comment_iterator', 'https://www.youtube.com/watch?v=abc')
+        with self.assertRaises(ValueError):
+            with iterator:
+                raise ValueError('the block failed')
+        self.assertEqual(driver.quit_count, 1)
+        (iterator, driver) = self.create(CommentIterator, 'comment_iterator', 'https://www.youtube.com/watch?v=abc')
+        del iterator
+        gc.collect()
+        self.assertEqual(driver.quit_count, 1)
+
+    def test_borrowed_driver_is_not_quit(self):
+        driver = FakeDriver()
+        with CommentIterator('https://www.youtube.com/watch?v=abc', driver=driver):
+            pass
+        self.assertEqual(driver.quit_count, 0)
+
+
+class OrphansTests(unittest.TestCase):
+    '''
+        OrphansTests(self, *args, **kwargs)
+        Tests that only chromedriver and automated Chrome processes whose parent is gone are picked out, along with
+        their descendants, from a process table read from a directory laid out like /proc
+    '''
+    def setUp(self):
+        self.proc_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.proc_dir)
+
+    def add_process(self, pid, parent, name, *arguments):
+        path = os.path.join(self.proc_dir, str(pid))
+        os.mkdir(path)
+        with open(os.path.join(path, 'stat'), 'w') as stat_file:
+            stat_file.write(f'{pid} ({name}) S {parent} {pid} {pid} 0 -1 4194304')
+        with open(os.path.join(path, 'cmdline'), 'wb') as cmdline_file:
+            cmdline_file.write(b''.join(argument.encode('utf-8') + b'\0' for argument in (name,) + arguments))
+
+    def test_orphans(self):
+        self.add_process(1, 0, 'init')
+        self.add_process(10, 1, 'python3', 'main.py')
+        # a scraper that is still running
+        self.add_process(11, 10, 'chromedriver', '--port=9515')
+        self.add_process(12, 11, 'chrome', '--enable-automation')
+        # a scraper that crashed, leaving its driver and browser behind
+        self.add_process(20, 1, 'chromedriver', '--port=9516')
+        self.add_process(21, 20, 'chrome', '--enable-automation', '--headless')
+        self.add_process(22, 21, 'chrome', '--type=renderer', '--enable-automation')
+        # a browser whose driver was killed on its own
+        self.add_process(30, 1, 'chrome', '--enable-automation')
+        self.add_process(31, 30, 'chrome', '--type=gpu-process')
+        # browsers started by hand, and a process with a name that needs careful parsing
+        self.add_process(40, 1, 'chrome')
+        self.add_process(41, 1, 'chrome', '--type=renderer', '--enable-automation')
+        self.add_process(50, 1, 'my (odd) name')
+        processes = process_table(self.proc_dir)
+        self.assertEqual(processes[50].name, 'my (odd) name')
+        self.assertEqual(processes[21].command_line, ['chrome', '--enable-automation', '--headless'])
+        self.assertEqual(descendants(processes, 20), [21, 22])
+        self.assertEqual(sorted(orphaned_browsers(processes)), [20, 21, 22, 30, 31])
+        self.assertEqual(orphaned_browsers(processes, uid=os.getuid() + 1), [])
+        self.assertEqual(child_drivers(processes, pid=10), [11, 12])
+        self.assertEqual(process_table(os.path.join(self.proc_dir, 'missing')), {})
+
+    def test_scraper_as_pid_1(self):
+        # in a container running main.py as its command, the scraper is PID 1 and its drivers are not orphans
+        self.add_process(1, 0, 'python3', '/usr/local/bin/python3', 'main.py', '--scheduler')
+        self.add_process(7, 1, 'chromedriver', '--port=9515')
+        self.add_process(8, 7, 'chrome', '--enable-automation')
+        self.add_process(9, 1, 'chrome', '--enable-automation')
+        self.assertEqual(orphaned_browsers(process_table(self.proc_dir)), [])
+        shutil.rmtree(os.path.join(self.proc_dir, '1'))
+        self.add_process(1, 0, 'tini', '/sbin/tini', '--', 'python3', 'main.py')
+        self.assertEqual(sorted(orphaned_browsers(process_table(self.proc_dir))), [7, 8, 9])
+
+
+@unittest.skipUnless(os.path.isdir('/proc/self') and hasattr(os, 'getuid'), 'needs /proc')
+class ReapChildrenTests(unittest.TestCase):
+    '''
+        ReapChildrenTests(self, *args, **kwargs)
+        Tests that a chromedriver process started by this process and never quit is killed, along with its children
+    '''
+    def test_reap_children(self):
+        directory = tempfile.mkdtemp()
+        try:
+            driver_path = os.path.join(directory, 'chromedriver')
+            shutil.copy(shutil.which('sleep') or '/bin/sleep', driver_path)
+            driver = subprocess.Popen([driver_path, '60'])
+            unrelated = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])
+            try:
+                deadline = time.monotonic() + 5
+                while (driver.pid not in child_drivers(process_table())) and (time.monotonic() < deadline):
+                    time.sleep(0.05)
+                with self.assertLogs('iterators.reaper', level='WARNING'):
+                    self.assertEqual(reap_children(grace_period=1), [driver.pid])
+                driver.wait(timeout=5)
+                self.assertIsNone(unrelated.poll())
+            finally:
+                for process in (driver, unrelated):
+                    if process.poll() is None:
+                        process.kill()
+                        process.wait()
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
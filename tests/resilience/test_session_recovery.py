@@ -0,0 +1,180 @@
+import unittest
+from unittest import mock
+
+from selenium.common.exceptions import WebDriverException
+
+from iterators.browser import is_session_lost_error, session_alive
+from iterators.metrics import PerformanceMetrics
+from iterators.session_recovery import FAST_FORWARD_SCRIPT, SessionRecovery
+from iterators.output_index import comment_id
+from iterators.thread_failures import FailedThreads, ThreadRetries
+from tests.fake_driver import FakeDriver
+
+
+class FakeLogger:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class CrashingDriver(FakeDriver):
+    '''
+        CrashingDriver(links, crash_at=None, page_size=4) -> CrashingDriver
+        A stand-in for a browser showing a video with comment threads linking to links. Reading the thread at position
+        crash_at kills the session, after which every command fails like it does when Chrome has died. The fast-forward
+        script loads page_size more threads per call.
+    '''
+    def __init__(self, links, crash_at=None, page_size=4):
+        super().__init__()
+        self.links = links
+        self.crash_at = crash_at
+        self.page_size = page_size
+        self.loaded = 0
+        self.fast_forward_calls = 0
+        self.opened = 0
+
+    def execute_script(self, script, *args):
+        self.check_alive()
+        if script != FAST_FORWARD_SCRIPT:
+            return 1
+        self.fast_forward_calls += 1
+        self.loaded = min(len(self.links), self.loaded + self.page_size)
+        linked_id = args[2]
+        for (index, link) in enumerate(self.links[:self.loaded]):
+            if linked_id and (comment_id(link) == linked_id):
+                return [self.loaded, index + 1]
+        return [self.loaded, 0]
+
+    def read_thread(self, position):
+        self.check_alive()
+        if position == self.crash_at:
+            self.alive = False
+            raise WebDriverException('invalid session id')
+        return {'link': self.links[position - 1]}
+
+
+class FakeRecoveringIterator(SessionRecovery, ThreadRetries):
+    '''
+        FakeRecoveringIterator(driver, pattern_misses=(), max_restarts=3) -> FakeRecoveringIterator
+        An iterator over the threads shown by driver that uses SessionRecovery and ThreadRetries without a browser. The
+        threads at the positions in pattern_misses do not match the pattern (None is returned for them).
+    '''
+    def __init__(self, driver, pattern_misses=(), max_restarts=3):
+        self.driver = driver
+        self.pattern_misses = pattern_misses
+        self.failed_threads = FailedThreads()
+        self.metrics = PerformanceMetrics()
+        self.logger = FakeLogger()
+        self.tracer = None
+        self.profile_dir = None
+        self.fast_start = False
+        self.comment_thread_count = 0
+        self.total_comments_parsed = 0
+        self.reply_count = 0
+        self.time_limit_exists = False
+        self.threads_selector = 'ytd-comment-thread-renderer'
+        self.thread_link_selector = '#header-author a'
+        self.comment_link_selector = None
+        self.max_restarts = max_restarts
+        self.restarts = 0
+        self.last_thread_link = None
+        self.last_thread_position = 0
+        self.selector_position = 1
+
+    def update_selectors(self, count, child_count):
+        self.selector_position = count
+
+    def reset_elements(self):
+        pass
+
+    def time_to_stop_scraping(self):
+        return self.time_limit_passed()
+
+    def get_attribute(self, element, attribute):
+        return ''
+
+    def open_video(self, url=None):
+        self.driver.check_alive()
+        self.driver.opened += 1
+
+    def scrape_next_thread(self):
+        position = self.comment_thread_count + 1
+        if position > len(self.driver.links):
+            raise StopIteration
+        self.total_comments_parsed += 1
+        resulting_comment = self.driver.read_thread(position)
+        self.comment_thread_count += 1
+        return None if position in self.pattern_misses else resulting_comment
+
+    def scrape_linked_thread(self, link):
+        return {'link': link}
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.next_thread()
+
+
+class SessionRecoveryTests(unittest.TestCase):
+    '''
+        SessionRecoveryTests(self, *args, **kwargs)
+        Tests that a browser that dies is replaced by a new one, fast-forwarded to the last thread returned, without the
+        consumer of the iterator seeing the crash.
+    '''
+    def links(self, count):
+        return [f'https://www.youtube.com/watch?v=abc&lc=Ugx{number}' for number in range(1, count + 1)]
+
+    def test_session_errors(self):
+        self.assertTrue(is_session_lost_error(WebDriverException('invalid session id')))
+        self.assertTrue(is_session_lost_error(WebDriverException('unknown error: session deleted because of page crash')))
+        self.assertTrue(is_session_lost_error(ConnectionRefusedError()))
+        self.assertFalse(is_session_lost_error(WebDriverException('element click intercepted')))
+        driver = CrashingDriver(self.links(1))
+        self.assertTrue(session_alive(driver))
+        driver.quit()
+        self.assertFalse(session_alive(driver))
+
+    def test_crash_is_recovered_without_repeating_threads(self):
+        links = self.links(12)
+        new_driver = CrashingDriver(links)
+        iterator = FakeRecoveringIterator(CrashingDriver(links, crash_at=7))
+        with mock.patch('iterators.session_recovery.create_driver', return_value=new_driver):
+            scraped = [thread['link'] for thread in iterator]
+        self.assertEqual(scraped, links)
+        self.assertIs(iterator.driver, new_driver)
+        self.assertEqual(new_driver.opened, 1)
+        # the fast-forward loaded 4 threads per round-trip until thread 6 was loaded
+        self.assertEqual(new_driver.fast_forward_calls, 2)
+        self.assertEqual(iterator.restarts, 1)
+        self.assertEqual(iterator.failed_threads.stats()['failed'], 0)
+        self.assertEqual(iterator.total_comments_parsed, 12)
+        self.assertEqual(iterator.metrics.counter_value('browser_restarts_total'), 1)
+
+    def test_fast_forward_skips_threads_that_did_not_match(self):
+        links = self.links(10)
+        iterator = FakeRecoveringIterator(CrashingDriver(links, crash_at=6), pattern_misses={4, 5})
+        with mock.patch('iterators.session_recovery.create_driver', return_value=CrashingDriver(links)):
+            scraped = [thread['link'] if thread else None for thread in iterator]
+        self.assertEqual(scraped, links[:3] + [None, None] + links[5:])
+
+    def test_new_threads_at_the_top_are_skipped(self):
+        links = self.links(10)
+        # two new threads showed up at the top of the page by the time the browser was restarted
+        new_links = ['https://www.youtube.com/watch?v=abc&lc=new1', 'https://www.youtube.com/watch?v=abc&lc=new2'] + links
+        iterator = FakeRecoveringIterator(CrashingDriver(links, crash_at=5))
+        with mock.patch('iterators.session_recovery.create_driver', return_value=CrashingDriver(new_links)):
+            scraped = [thread['link'] for thread in iterator]
+        self.assertEqual(scraped, links)
+        self.assertEqual(iterator.comment_thread_count, 12)
+
+    def test_restarts_are_bounded(self):
+        links = self.links(6)
+        iterator = FakeRecoveringIterator(CrashingDriver(links, crash_at=2), max_restarts=1)
+        with mock.patch('iterators.session_recovery.create_driver', return_value=CrashingDriver(links, crash_at=4)):
+            scraped = [thread['link'] for thread in iterator]
+        self.assertEqual(scraped, links[:3])
+        self.assertEqual(iterator.restarts, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
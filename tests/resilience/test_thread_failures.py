@@ -0,0 +1,148 @@
+import unittest
+
+from iterators.metrics import PerformanceMetrics
+from iterators.thread_failures import LOST, PENDING, RECOVERED, FailedThreads, ThreadRetries, link_with_comment
+
+
+class FakeLogger:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class FakeThreadIterator(ThreadRetries):
+    '''
+        FakeThreadIterator(threads, failures, retry_failures, retry_attempts=2, max_consecutive=5, limit=None) -> FakeThreadIterator
+        An iterator over the threads (a list of links) that uses ThreadRetries without a browser. failures is the set of
+        positions whose first scrape fails, retry_failures maps links to the number of retries that fail, and limit is
+        the maximum number of comments scraped.
+    '''
+    def __init__(self, threads, failures, retry_failures=None, retry_attempts=2, max_consecutive=5, limit=None):
+        self.threads = threads
+        self.failures = failures
+        self.retry_failures = dict(retry_failures or {})
+        self.failed_threads = FailedThreads(max_attempts=retry_attempts, max_consecutive=max_consecutive)
+        self.metrics = PerformanceMetrics()
+        self.logger = FakeLogger()
+        self.comment_thread_count = 0
+        self.total_comments_parsed = 0
+        self.reply_count = 0
+        self.time_limit_exists = False
+        self.limit = len(threads) if limit is None else limit
+        self.selector_position = None
+        self.comment_link_selector = None
+
+    def update_selectors(self, count, child_count):
+        self.selector_position = count
+
+    def reset_elements(self):
+        pass
+
+    @property
+    def driver(self):
+        return self
+
+    def find_element(self, by, selector):
+        return self.threads[self.selector_position - 1]
+
+    def get_attribute(self, element, attribute):
+        return element
+
+    def time_to_stop_scraping(self):
+        return self.total_comments_parsed >= self.limit
+
+    def scrape_next_thread(self):
+        position = self.comment_thread_count + 1
+        if (position > len(self.threads)) or self.time_to_stop_scraping():
+            raise StopIteration
+        self.total_comments_parsed += 1
+        if position in self.failures:
+            raise Exception('the replies button could not be clicked')
+        self.comment_thread_count += 1
+        return {'link': self.threads[position - 1]}
+
+    def scrape_linked_thread(self, link):
+        self.total_comments_parsed += 1
+        if self.retry_failures.get(link, 0) > 0:
+            self.retry_failures[link] -= 1
+            raise Exception('the replies button could not be clicked again')
+        return {'link': link}
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.next_thread()
+
+
+class FailedThreadsTests(unittest.TestCase):
+    '''
+        FailedThreadsTests(self, *args, **kwargs)
+        Tests the bookkeeping of the failed threads and the helpers for comment links.
+    '''
+    def test_links(self):
+        self.assertEqual(link_with_comment('https://www.youtube.com/shorts/abc', 'Ugx1'), 'https://www.youtube.com/shorts/abc?lc=Ugx1')
+        self.assertEqual(link_with_comment('https://www.youtube.com/shorts/abc?lc=old&x=1', 'Ugx1'), 'https://www.youtube.com/shorts/abc?x=1&lc=Ugx1')
+
+    def test_threads_without_links_are_lost(self):
+        failed_threads = FailedThreads(max_attempts=2)
+        self.assertEqual(failed_threads.record(1, '', Exception('stale'))['status'], LOST)
+        self.assertEqual(failed_threads.record(2, '/watch?v=abc&lc=Ugx2', Exception('stale'))['status'], PENDING)
+        self.assertEqual(failed_threads.stats(), {'failed': 2, 'retried': 0, 'recovered': 0, 'lost': 1})
+        self.assertEqual(failed_threads.give_up(), 1)
+        self.assertIsNone(failed_threads.next_retry())
+
+
+class ThreadRetriesTests(unittest.TestCase):
+    '''
+        ThreadRetriesTests(self, *args, **kwargs)
+        Tests that failed threads are skipped without ending the scrape, and retried through their links at the end.
+    '''
+    def links(self, count):
+        return [f'https://www.youtube.com/watch?v=abc&lc=Ugx{number}' for number in range(1, count + 1)]
+
+    def test_failed_threads_are_skipped_and_recovered(self):
+        links = self.links(6)
+        iterator = FakeThreadIterator(links, failures={2, 5})
+        scraped = [thread['link'] for thread in iterator]
+        self.assertEqual(scraped, [links[0], links[2], links[3], links[5], links[1], links[4]])
+        self.assertEqual(iterator.failed_threads.stats(), {'failed': 2, 'retried': 2, 'recovered': 2, 'lost': 0})
+        self.assertEqual(iterator.comment_thread_count, 6)
+        self.assertEqual(iterator.total_comments_parsed, 6)
+        self.assertEqual(iterator.metrics.counter_value('thread_failures_total', status='recovered'), 2)
+
+    def test_retries_are_bounded(self):
+        links = self.links(4)
+        iterator = FakeThreadIterator(links, failures={1, 3}, retry_failures={links[0]: 1, links[2]: 5}, retry_attempts=2)
+        scraped = [thread['link'] for thread in iterator]
+        self.assertEqual(scraped, [links[1], links[3], links[0]])
+        self.assertEqual(iterator.failed_threads.stats(), {'failed': 2, 'retried': 2, 'recovered': 1, 'lost': 1})
+        self.assertEqual([thread['status'] for thread in iterator.failed_threads.threads], [RECOVERED, LOST])
+        self.assertEqual(iterator.failed_threads.threads[1]['attempts'], 2)
+        self.assertEqual(iterator.metrics.counter_value('thread_failures_total', status='lost'), 1)
+
+    def test_too_many_failures_in_a_row_skip_to_the_retries(self):
+        links = self.links(10)
+        iterator = FakeThreadIterator(links, failures={3, 4, 5}, max_consecutive=3)
+        scraped = [thread['link'] for thread in iterator]
+        # threads 6 to 10 are never reached, and the failed ones are recovered through their links
+        self.assertEqual(scraped, [links[0], links[1], links[2], links[3], links[4]])
+        self.assertEqual(iterator.failed_threads.stats(), {'failed': 3, 'retried': 3, 'recovered': 3, 'lost': 0})
+
+    def test_retries_stop_at_the_limit(self):
+        links = self.links(6)
+        iterator = FakeThreadIterator(links, failures={1, 2}, limit=3)
+        scraped = [thread['link'] for thread in iterator]
+        # the limit is reached before the failed threads are retried, so they are given up on
+        self.assertEqual(scraped, [links[2], links[3], links[4]])
+        self.assertEqual(iterator.total_comments_parsed, 3)
+        self.assertEqual(iterator.failed_threads.stats(), {'failed': 2, 'retried': 0, 'recovered': 0, 'lost': 2})
+
+        iterator = FakeThreadIterator(links, failures={2}, limit=3)
+        scraped = [thread['link'] for thread in iterator]
+        self.assertEqual(scraped, [links[0], links[2], links[3]])
+        self.assertEqual(iterator.total_comments_parsed, 3)
+        self.assertEqual(iterator.failed_threads.stats(), {'failed': 1, 'retried': 0, 'recovered': 0, 'lost': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import unittest
+import os
+import tempfile
+import threading
+from unittest import mock
+
+from benchmarks.startup_benchmark import run_python
+from iterators.factory import IteratorRegistry
+from iterators.implementations.channel_iterator import ChannelIterator, discover_video_urls, normalize_video_url, per_video_filename
+from tests.fake_driver import FakeDriver
+
+
+class ListPageDriver(FakeDriver):
+    '''
+        ListPageDriver(pages, wait_for=None) -> ListPageDriver
+        stands in for a WebDriver showing a channel tab or playlist that loads the given pages of video links, one page
+        per continuation. If wait_for (a threading.Event) is given, the last page is only loaded once it is set.
+    '''
+    def __init__(self, pages, wait_for=None):
+        super().__init__()
+        self.video_pages = pages
+        self.loaded_pages = 1
+        self.wait_for = wait_for
+
+    def execute_script(self, script, selector, position, continuation_selector):
+        links = [link for page in self.video_pages[:self.loaded_pages] for link in page]
+        has_more = self.loaded_pages < len(self.video_pages)
+        if has_more and ((self.wait_for is None) or (self.loaded_pages < len(self.video_pages) - 1) or self.wait_for.is_set()):
+            # scrolling to the continuation item loads the next page
+            self.loaded_pages += 1
+        return {'urls': links[position:], 'count': len(links), 'has_more': has_more}
+
+
+class FakeVideoIterator:
+    '''
+        FakeVideoIterator(video_url, limit=3, **kwargs) -> Iterator
+        returns limit comment threads for the video, and fails for videos with "broken" in their links
+    '''
+    started = threading.Event()
+
+    def __init__(self, video_url, limit=3, **kwargs):
+        self.video_url = video_url
+        self.kwargs = kwargs
+        self.remaining = limit
+        self.quit_called = False
+        FakeVideoIterator.started.set()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if 'broken' in self.video_url:
+            raise Exception('this video is broken')
+        if self.remaining == 0:
+            raise StopIteration
+        self.remaining -= 1
+        return {'commenter': 'someone', 'comment content': f'comment {self.remaining}', 'link': '', 'children': []}
+
+    def quit_driver(self):
+        self.quit_called = True
+
+
+class ChannelIteratorTests(unittest.TestCase):
+    '''
+        ChannelIteratorTests(self, *args, **kwargs)
+        Tests the channel and playlist iterator without a browser: the urls it handles, finding the videos page by
+        page, and scraping them with several workers while more videos are being found.
+    '''
+    def setUp(self):
+        # the iterator logs the videos that fail, which should not end up in the debug.log of the repository
+        self.directory = tempfile.TemporaryDirectory()
+        self.logfile = os.path.join(self.directory.name, 'debug.log')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_dispatch(self):
+        registry = IteratorRegistry()
+        for url in (
+            'https://www.youtube.com/@somebody/videos', 'https://www.youtube.com/@somebody/shorts',
+            'https://www.youtube.com/channel/UC123/streams', 'https://www.youtube.com/playlist?list=PL123'
+        ):
+            self.assertEqual(registry.iterator_class_for(url).__name__, 'ChannelIterator')
+        self.assertEqual(registry.iterator_class_for('https://www.youtube.com/watch?v=abc&list=PL123').__name__, 'CommentIterator')
+
+    def test_channel_options_need_a_channel_url(self):
+        for (url, option) in (('https://www.youtube.com/watch?v=abc', '--video-workers'), ('https://www.youtube.com/shorts/abc', '--max-videos')):
+            result = run_python('main.py', '--url', url, option, '3')
+            self.assertEqual(result.returncode, 1)
+            self.assertIn('only for channel and playlist urls', result.stderr)
+
+    def test_video_urls(self):
+        self.assertEqual(
+            normalize_video_url('https://www.youtube.com/watch?v=abc&list=PL123&index=4&t=30s'), 'https://www.youtube.com/watch?v=abc'
+        )
+        self.assertEqual(per_video_filename('traces/trace.json', 'https://www.youtube.com/watch?v=abc'), 'traces/trace-abc.json')
+        self.assertEqual(per_video_filename('snapshot', 'https://www.youtube.com/shorts/xyz'), 'snapshot-xyz')
+
+    def test_discovery_is_lazy(self):
+        pages = [['https://www.youtube.com/watch?v=1', 'https://www.youtube.com/watch?v=2'], ['https://www.youtube.com/watch?v=2&index=2', 'https://www.youtube.com/watch?v=3']]
+        driver = ListPageDriver(pages)
+        continuations = []
+        urls = discover_video_urls(driver, 'https://www.youtube.com/@somebody/videos', poll_interval=0, before_continuation=lambda: continuations.append(1))
+        self.assertEqual(next(urls), 'https://www.youtube.com/watch?v=1')
+        self.assertEqual(driver.loaded_pages, 2)
+        self.assertEqual(list(urls), ['https://www.youtube.com/watch?v=2', 'https://www.youtube.com/watch?v=3'])
+        self.assertEqual(len(continuations), 1)
+        self.assertEqual(list(discover_video_urls(ListPageDriver(pages), 'url', max_videos=1, poll_interval=0)), ['https://www.youtube.com/watch?v=1'])
+
+    def test_videos_are_scraped_while_more_are_found(self):
+        # the last page of videos is only loaded once a worker has started scraping, so the scrape can only finish if
+        # scraping starts before all of the videos are found
+        FakeVideoIterator.started.clear()
+        pages = [
+            ['https://www.youtube.com/watch?v=1', 'https://www.youtube.com/watch?v=broken'],
+            ['https://www.youtube.com/watch?v=3', 'https://www.youtube.com/watch?v=4'],
+        ]
+        driver = ListPageDriver(pages, wait_for=FakeVideoIterator.started)
+        with mock.patch('iterators.implementations.channel_iterator.create_driver', return_value=driver):
+            iterator = ChannelIterator(
+                'https://www.youtube.com/@somebody/videos', workers=2, iterator_class=FakeVideoIterator, limit=2, queue_size=1,
+                logfile=self.logfile
+            )
+            threads = list(iterator)
+        self.assertEqual(len(threads), 6)
+        self.assertEqual(sorted({thread['video url'] for thread in threads}), [
+            'https://www.youtube.com/watch?v=1', 'https://www.youtube.com/watch?v=3', 'https://www.youtube.com/watch?v=4'
+        ])
+        self.assertEqual(iterator.videos['https://www.youtube.com/watch?v=broken']['status'], 'failed')
+        self.assertEqual(iterator.videos['https://www.youtube.com/watch?v=4'], {'status': 'done', 'comment threads': 2, 'error': None})
+        self.assertEqual(iterator.metrics.counter_value('videos_discovered_total'), 4)
+        self.assertEqual(iterator.total_comments_parsed, 6)
+        self.assertEqual(driver.quit_count, 1)
+
+    def test_stopping_early(self):
+        pages = [[f'https://www.youtube.com/watch?v={number}' for number in range(20)]]
+        with mock.patch('iterators.implementations.channel_iterator.create_driver', return_value=ListPageDriver(pages)):
+            iterator = ChannelIterator(
+                'https://www.youtube.com/playlist?list=PL1', workers=3, iterator_class=FakeVideoIterator, limit=50, queue_size=2,
+                logfile=self.logfile
+            )
+            first = next(iterator)
+            iterator.quit_driver()
+        self.assertIn('video url', first)
+        self.assertEqual(list(iterator), [])
+        self.assertLess(sum(video['status'] == 'done' for video in iterator.videos.values()), 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1 @@
+"""Index interaction code"""
@@ -0,0 +1,36 @@
+# ***********************************************************
+# ******* WARNING: AUTOGENERATED! ALL EDITS WILL BE LOST ******
+# *************************************************************
+# isort: skip
+from ._instrumentation import Instrument
+from ._ki import LOCALS_KEY_KI_PROTECTION_ENABLED
+from ._run import _NO_SEND, GLOBAL_RUN_CONTEXT
+
+# fmt: off
+
+
+async def wait_readable(fd):
+    locals()[LOCALS_KEY_KI_PROTECTION_ENABLED] = True
+    try:
+        return await GLOBAL_RUN_CONTEXT.runner.io_manager.wait_readable(fd)
+    except AttributeError:
+        raise RuntimeError("must be called from async context")
+
+
+async def wait_writable(fd):
+    locals()[LOCALS_KEY_KI_PROTECTION_ENABLED] = True
+    try:
+        return await GLOBAL_RUN_CONTEXT.runner.io_manager.wait_writable(fd)
+    except AttributeError:
+        raise RuntimeError("must be called from async context")
+
+
+def notify_closing(fd):
+    locals()[LOCALS_KEY_KI_PROTECTION_ENABLED] = True
+    try:
+        return GLOBAL_RUN_CONTEXT.runner.io_manager.notify_closing(fd)
+    except AttributeError:
+        raise RuntimeError("must be called from async context")
+
+
+# fmt: on
@@ -0,0 +1,2 @@
+# This isn't really a package, everything in here is a standalone script. This
+# __init__.py is just to fool setup.py into actually installing the things.
@@ -0,0 +1,20 @@
+from ._impl import (
+    CloseReason,
+    ConnectionClosed,
+    ConnectionRejected,
+    ConnectionTimeout,
+    connect_websocket,
+    connect_websocket_url,
+    DisconnectionTimeout,
+    Endpoint,
+    HandshakeError,
+    open_websocket,
+    open_websocket_url,
+    WebSocketConnection,
+    WebSocketRequest,
+    WebSocketServer,
+    wrap_client_stream,
+    wrap_server_stream,
+    serve_websocket,
+)
+from ._version import __version__